@@ -0,0 +1,91 @@
+"""
+Benchmark do tempo de ciclo: percentis exatos (ordenando todos os tempos)
+vs sketches por semana, e o relatório a partir do cache do SQLite.
+
+Uso:
+    poetry run python benchmarks/bench_cycle_time.py [N]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils.cycle_time import (
+    PERCENTILES,
+    cycle_days,
+    cycle_time_report,
+    sketch_tasks,
+    summarize_cycle_time,
+)
+from phd_progress_tracker.utils.database import Database
+
+CATEGORIES = ["Escrita", "Pesquisa", "Análise", "Coleta de Dados", "Geral"]
+
+
+def make_tasks(n):
+    """Gera n tarefas concluídas ao longo de três anos."""
+    rng = random.Random(0)
+    priorities = list(TaskPriority)
+    start = datetime(2024, 1, 1)
+    tasks = []
+    for i in range(n):
+        created = start + timedelta(minutes=rng.randrange(3 * 365 * 24 * 60))
+        tasks.append(
+            Task(
+                id=f"t{i}",
+                title=f"Tarefa {i}",
+                description="",
+                deadline=date(2027, 1, 1),
+                status=TaskStatus.COMPLETED,
+                priority=priorities[i % len(priorities)],
+                category=CATEGORIES[i % len(CATEGORIES)],
+                created_at=created,
+                completed_at=created + timedelta(hours=rng.lognormvariate(3, 1)),
+            )
+        )
+    return tasks
+
+
+def timed(label, fn):
+    """Imprime o tempo (ms) de uma execução e retorna o resultado."""
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {label:<36} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def exact(tasks):
+    """Percentis exatos, ordenando todos os tempos de ciclo."""
+    values = sorted(cycle_days(t.created_at, t.completed_at) for t in tasks)
+    return [values[max(0, int(q * len(values) + 0.5) - 1)] for q in PERCENTILES]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    tasks = make_tasks(n)
+    print(f"{n} tarefas concluídas")
+
+    percentiles = timed("exato (sort)", lambda: exact(tasks))
+    print(f"  {'exato':<36} {percentiles}")
+    weeks = timed("sketches por semana (1 passada)", lambda: sketch_tasks(tasks))
+    report = timed("mesclar semanas", lambda: summarize_cycle_time(weeks))
+    overall = report.overall
+    print(f"  {'sketch':<36} {[overall.p50, overall.p90, overall.p99]}")
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        db = Database(data_dir=data_dir)
+        db.save_tasks(tasks)
+        timed("SQLite, cache vazio", lambda: cycle_time_report(db))
+        timed("SQLite, cache pronto", lambda: cycle_time_report(db))
+        task = tasks[0]
+        task.completed_at += timedelta(hours=1)
+        db.update_task(task)
+        timed("SQLite, uma semana invalidada", lambda: cycle_time_report(db))
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark de esquemas de ID: uuid4 aleatório vs IDs ordenados pelo tempo,
+em tabelas com rowid e WITHOUT ROWID.
+
+Mede inserções uma a uma (como fazem a API e o CLI), o tamanho final do
+arquivo e uma busca por ID.
+
+Uso:
+    poetry run python benchmarks/bench_ids.py [N]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+from phd_progress_tracker.models.task import Task
+from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.ids import new_id
+
+
+def make_tasks(n, id_factory):
+    """Gera n tarefas com IDs criados por id_factory."""
+    today = date.today()
+    return [
+        Task(
+            id=id_factory(),
+            title=f"Tarefa {i}",
+            description="Descrição de benchmark",
+            deadline=today + timedelta(days=i % 730),
+        )
+        for i in range(n)
+    ]
+
+
+def run(label, tasks, without_rowid):
+    """Insere as tarefas uma a uma e imprime tempo, tamanho e busca."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(data_dir=tmp, without_rowid=without_rowid)
+        start = time.perf_counter()
+        for task in tasks:
+            db.add_task(task)
+        insert_ms = (time.perf_counter() - start) * 1000
+
+        ids = [t.id for t in tasks[:: max(1, len(tasks) // 1000)]]
+        start = time.perf_counter()
+        for task_id in ids:
+            db.get_task(task_id)
+        lookup_ms = (time.perf_counter() - start) * 1000
+        db.close()
+
+        size_kb = os.path.getsize(db.db_path) / 1024
+    print(
+        f"  {label:<30} insert {insert_ms:9.1f} ms  "
+        f"get x{len(ids)} {lookup_ms:7.1f} ms  arquivo {size_kb:9.0f} KiB"
+    )
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print(f"{n} tarefas")
+    random_ids = make_tasks(n, lambda: str(uuid.uuid4()))
+    ordered_ids = make_tasks(n, new_id)
+    for without_rowid in (False, True):
+        layout = "WITHOUT ROWID" if without_rowid else "rowid"
+        run(f"uuid4, {layout}", random_ids, without_rowid)
+        run(f"ordenado, {layout}", ordered_ids, without_rowid)
+
+
+if __name__ == "__main__":
+    main()
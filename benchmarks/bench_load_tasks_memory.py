@@ -0,0 +1,108 @@
+"""
+Benchmark de memória de Database.load_tasks.
+
+Compara o Task com ``__slots__`` (e categorias internadas) com um
+``@dataclass`` comum equivalente, construído a partir das mesmas linhas.
+
+Uso:
+    poetry run python benchmarks/bench_load_tasks_memory.py [N ...]
+"""
+
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from phd_progress_tracker.models.task import Task
+from phd_progress_tracker.utils.database import Database
+
+CATEGORIES = ("Geral", "Coleta de Dados", "Análise", "Escrita", "Revisão")
+
+
+@dataclass
+class PlainTask:
+    """Task sem slots, como era antes (referência de comparação)."""
+
+    id: str
+    title: str
+    description: str
+    deadline: date
+    status: str
+    priority: str
+    category: str
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+
+
+def populate(db, n):
+    """Grava n tarefas no banco."""
+    today = date.today()
+    now = datetime.now()
+    db.save_tasks(
+        [
+            Task(
+                id=f"task-{i:08d}",
+                title=f"Tarefa {i}",
+                description="",
+                deadline=today + timedelta(days=i % 1460),
+                category=CATEGORIES[i % len(CATEGORIES)],
+                created_at=now - timedelta(minutes=i),
+            )
+            for i in range(n)
+        ]
+    )
+
+
+def load_plain(db):
+    """Carrega as linhas em PlainTask, sem compartilhar datas nem categorias."""
+    with db._get_connection() as conn:
+        rows = conn.execute(f"SELECT {Database.TASK_COLUMNS} FROM tasks").fetchall()
+    return [
+        PlainTask(
+            id=row["id"],
+            title=row["title"],
+            description=row["description"],
+            deadline=datetime.fromisoformat(row["deadline"]).date(),
+            status=row["status"],
+            priority=row["priority"],
+            category=row["category"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+        )
+        for row in rows
+    ]
+
+
+def measure(label, load, n):
+    """Mede memória retida, pico e tempo de uma função de carga."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {label:<22} retida {current / 2**20:8.1f} MiB "
+        f"({current / n:6.0f} B/tarefa)  pico {peak / 2**20:8.1f} MiB  "
+        f"{elapsed:6.2f} s"
+    )
+    del result
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Database(data_dir=tmp)
+            populate(db, n)
+            print(f"{n} tarefas")
+            measure("@dataclass comum", lambda: load_plain(db), n)
+            measure("Task (slots)", db.load_tasks, n)
+
+
+if __name__ == "__main__":
+    main()
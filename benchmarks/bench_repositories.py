@@ -0,0 +1,69 @@
+"""
+Benchmark do custo de armazenamento: SQLite em arquivo, SQLite em memória e
+MemoryRepository.
+
+Uso:
+    poetry run python benchmarks/bench_repositories.py [N]
+"""
+
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from phd_progress_tracker.models.task import Task
+from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
+
+
+def make_tasks(n):
+    """Gera n tarefas com deadlines espalhados por dois anos."""
+    today = date.today()
+    return [
+        Task(
+            id=f"task-{i:08d}",
+            title=f"Tarefa {i}",
+            description="Descrição de benchmark",
+            deadline=today + timedelta(days=i % 730),
+            category=("Escrita", "Análise", "Revisão")[i % 3],
+        )
+        for i in range(n)
+    ]
+
+
+def timed(label, fn):
+    """Executa fn e imprime o tempo gasto."""
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {label:<28} {(time.perf_counter() - start) * 1000:10.1f} ms")
+    return result
+
+
+def run(name, repo, tasks):
+    """Mede as operações principais de um repositório."""
+    print(name)
+    timed("save_tasks", lambda: repo.save_tasks(tasks))
+    timed("load_tasks", repo.load_tasks)
+    ids = [t.id for t in tasks[:: max(1, len(tasks) // 1000)]]
+    timed(f"get_task x{len(ids)}", lambda: [repo.get_task(i) for i in ids])
+    end = date.today() + timedelta(days=7)
+    timed(
+        "tasks_by_deadline (7 dias)", lambda: repo.tasks_by_deadline(date.today(), end)
+    )
+    extra = make_tasks(len(tasks) + 1000)[-1000:]
+    timed("add_task x1000", lambda: [repo.add_task(t) for t in extra])
+    repo.close()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tasks = make_tasks(n)
+    print(f"{n} tarefas")
+    with tempfile.TemporaryDirectory() as tmp:
+        run("sqlite (arquivo)", Database(data_dir=tmp), tasks)
+        run("sqlite (:memory:)", Database(data_dir=tmp, db_path=":memory:"), tasks)
+    run("memory", MemoryRepository(), tasks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark do formato de transporte: JSON (lista de objetos, como a API
+devolve hoje) vs MessagePack em colunas.
+
+Mede o tamanho do payload (cru e com gzip) e o tempo de codificação.
+
+Uso:
+    poetry run python benchmarks/bench_wire.py [N]
+"""
+
+import gzip
+import json
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+
+from phd_progress_tracker.api.schemas import TaskResponse
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils import wire
+from phd_progress_tracker.utils.ids import new_id
+
+CATEGORIES = ["Escrita", "Pesquisa", "Análise", "Coleta de Dados", "Geral"]
+FIELDS = list(TaskResponse.model_fields)
+
+
+def make_tasks(n):
+    """Gera n tarefas variadas."""
+    today = date.today()
+    statuses = list(TaskStatus)
+    priorities = list(TaskPriority)
+    return [
+        Task(
+            id=new_id(),
+            title=f"Tarefa {i}",
+            description="Descrição de benchmark",
+            deadline=today + timedelta(days=i % 365),
+            status=statuses[i % len(statuses)],
+            priority=priorities[i % len(priorities)],
+            category=CATEGORIES[i % len(CATEGORIES)],
+            created_at=datetime.now(),
+        )
+        for i in range(n)
+    ]
+
+
+def timed(encode, repeat=5):
+    """Melhor tempo (ms) de ``repeat`` execuções e o resultado."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = encode()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, payload
+
+
+def report(label, encode):
+    """Imprime tempo de codificação e tamanhos de um formato."""
+    ms, payload = timed(encode)
+    print(
+        f"  {label:<28} encode {ms:8.1f} ms  "
+        f"{len(payload) / 1024:8.0f} KiB  gzip {len(gzip.compress(payload)) / 1024:6.0f} KiB"
+    )
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    tasks = make_tasks(n)
+    print(f"{n} tarefas")
+
+    report(
+        "JSON (objetos)",
+        lambda: json.dumps(
+            jsonable_encoder([TaskResponse.model_validate(t) for t in tasks])
+        ).encode(),
+    )
+    if wire.HAS_MSGPACK:
+        report("msgpack colunar (C)", lambda: wire.encode_columns(tasks, FIELDS))
+    has_msgpack, wire.HAS_MSGPACK = wire.HAS_MSGPACK, False
+    report("msgpack colunar (Python)", lambda: wire.encode_columns(tasks, FIELDS))
+    wire.HAS_MSGPACK = has_msgpack
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Shared FastAPI dependencies.
+"""
+
+from datetime import date
+from typing import Callable, Iterator, List, Optional, Type
+
+from fastapi import Depends, Header, HTTPException, Query
+from pydantic import BaseModel
+
+from phd_progress_tracker.config import settings
+from phd_progress_tracker.utils.repository import Repository
+from phd_progress_tracker.utils.tenancy import (
+    TenantDatabasePool,
+    TenantLimitError,
+    UnknownTenantError,
+    validate_tenant_id,
+)
+from phd_progress_tracker.utils.wire import MEDIA_TYPE as MSGPACK
+
+# One SQLite file per tenant, with a bounded number of them kept open
+database_pool = TenantDatabasePool(
+    data_dir=settings.data_dir, backend=settings.storage_backend
+)
+
+
+def get_tenant_id(x_tenant_id: Optional[str] = Header(None)) -> Optional[str]:
+    """
+    Read the tenant identifier from the ``X-Tenant-ID`` header.
+    Requests without the header use the default (single-user) database.
+    """
+    if x_tenant_id is None:
+        return None
+    try:
+        return validate_tenant_id(x_tenant_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+def get_db(tenant_id: Optional[str] = Depends(get_tenant_id)) -> Iterator[Repository]:
+    """
+    Dependency to get the repository of the requesting tenant.
+    The storage backend is selected by ``PHD_STORAGE_BACKEND``.
+    Databases are pooled and leased for the duration of the request, so
+    eviction never closes one in use. Tenants must be provisioned first
+    (``phd tenant create``); unknown ones get a 404.
+    """
+    try:
+        entry = database_pool.acquire(tenant_id)
+    except UnknownTenantError as e:
+        raise HTTPException(status_code=404, detail="Unknown tenant") from e
+    except TenantLimitError as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+    try:
+        yield entry.repo
+    finally:
+        database_pool.release(entry)
+
+
+def get_today(
+    as_of: Optional[date] = Query(
+        None, description="Reference date for date-dependent values (default: today)"
+    ),
+) -> date:
+    """
+    Resolve "today" once per request.
+    Passing ``?as_of=YYYY-MM-DD`` evaluates the request as of that date.
+    """
+    return as_of or date.today()
+
+
+def field_selector(model: Type[BaseModel]) -> Callable[..., Optional[List[str]]]:
+    """
+    Build a dependency that parses ``?fields=id,title`` against ``model``.
+    Returns None when the parameter is absent (full objects are returned).
+    """
+    allowed = list(model.model_fields)
+
+    def get_fields(
+        fields: Optional[str] = Query(
+            None, description=f"Comma-separated subset of: {', '.join(allowed)}"
+        ),
+    ) -> Optional[List[str]]:
+        if fields is None:
+            return None
+        selected = list(
+            dict.fromkeys(f.strip() for f in fields.split(",") if f.strip())
+        )
+        unknown = [f for f in selected if f not in allowed]
+        if unknown or not selected:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {unknown}" if unknown else "No fields given",
+            )
+        return selected
+
+    return get_fields
+
+
+def wants_msgpack(accept: Optional[str] = Header(None)) -> bool:
+    """
+    Content negotiation for the compact binary format.
+    True when the ``Accept`` header lists ``application/msgpack``.
+    """
+    if accept is None:
+        return False
+    return any(part.split(";")[0].strip() == MSGPACK for part in accept.split(","))
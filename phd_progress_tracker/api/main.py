@@ -2,10 +2,43 @@
 FastAPI application entry point.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from phd_progress_tracker.api.routes import tasks, milestones, dashboard
+from phd_progress_tracker.api.routes import (
+    analytics,
+    bootstrap,
+    calendar,
+    dashboard,
+    milestones,
+    plan,
+    tasks,
+    timeline,
+)
+from phd_progress_tracker.config import settings
+from phd_progress_tracker.utils.forecast import forecast_pool
+from phd_progress_tracker.utils.task_frame import HAS_NUMPY
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the forecast process pool once at startup, bounded by
+    ``PHD_FORECAST_WORKERS``, and shut it down with the server.
+    """
+    pool = None
+    if HAS_NUMPY and settings.forecast_workers > 0:
+        pool = forecast_pool(settings.forecast_workers)
+    app.state.forecast_pool = pool
+    try:
+        yield
+    finally:
+        app.state.forecast_pool = None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
 
 app = FastAPI(
     title="PhD Progress Tracker API",
@@ -13,6 +46,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS middleware for frontend communication
@@ -28,6 +62,11 @@ app.add_middleware(
 app.include_router(tasks.router)
 app.include_router(milestones.router)
 app.include_router(dashboard.router)
+app.include_router(calendar.router)
+app.include_router(bootstrap.router)
+app.include_router(analytics.router)
+app.include_router(timeline.router)
+app.include_router(plan.router)
 
 
 @app.get("/")
@@ -0,0 +1,196 @@
+"""
+Analytics API routes.
+"""
+
+from datetime import date
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from phd_progress_tracker.api.dependencies import get_db
+from phd_progress_tracker.api.schemas import (
+    ActivityDayResponse,
+    ActivityYearResponse,
+    BurndownResponse,
+    CrunchResponse,
+    CycleTimeResponse,
+    CycleTimeStatsResponse,
+    ThroughputWeekResponse,
+)
+from phd_progress_tracker.models.task import TaskPriority
+from phd_progress_tracker.utils.activity import activity_report
+from phd_progress_tracker.utils.burndown import MAX_POINTS, burndown_report
+from phd_progress_tracker.utils.crunch import (
+    DEFAULT_DAYS,
+    DEFAULT_MIN_PRIORITY,
+    DEFAULT_WINDOW_DAYS,
+    MAX_DAYS,
+    crunch_report,
+)
+from phd_progress_tracker.utils.cycle_time import cycle_time_report
+from phd_progress_tracker.utils.planner import Capacity
+from phd_progress_tracker.utils.repository import Repository
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+@router.get("/cycle-time", response_model=CycleTimeResponse)
+def get_cycle_time(
+    start: Optional[date] = Query(
+        None, alias="from", description="First day (rounded to its week)"
+    ),
+    end: Optional[date] = Query(
+        None, alias="to", description="Last day (rounded to its week)"
+    ),
+    db: Repository = Depends(get_db),
+):
+    """
+    Get p50/p90/p99 cycle time (created → completed, in days) overall, per
+    category and per priority, plus completions per week and category.
+
+    Computed from per-week quantile sketches, so percentiles are approximate
+    (exact for small groups). Without ``from``/``to`` the period spans all
+    completed tasks.
+    """
+    try:
+        report = cycle_time_report(db, start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return CycleTimeResponse(
+        start=report.start,
+        end=report.end,
+        overall=(
+            CycleTimeStatsResponse.model_validate(report.overall)
+            if report.overall
+            else None
+        ),
+        by_category={
+            category: CycleTimeStatsResponse.model_validate(stats)
+            for category, stats in report.by_category.items()
+        },
+        by_priority={
+            priority.value: CycleTimeStatsResponse.model_validate(stats)
+            for priority, stats in report.by_priority.items()
+        },
+        throughput=[
+            ThroughputWeekResponse(
+                week_start=week,
+                completed=sum(by_category.values()),
+                by_category=by_category,
+            )
+            for week, by_category in report.throughput
+        ],
+    )
+
+
+@router.get("/burndown", response_model=BurndownResponse)
+def get_burndown(
+    start: Optional[date] = Query(
+        None, alias="from", description="First day (default: 90 days before to)"
+    ),
+    end: Optional[date] = Query(
+        None, alias="to", description="Last day (default: today)"
+    ),
+    granularity: Literal["day", "week", "month"] = Query(
+        "day", description="Finest resolution; coarsened for long ranges"
+    ),
+    window: Optional[int] = Query(
+        None, ge=1, le=52, description="Periods in the rolling velocity average"
+    ),
+    max_points: int = Query(MAX_POINTS, ge=10, le=1000),
+    db: Repository = Depends(get_db),
+):
+    """
+    Get created/completed/open tasks per period (burndown and burnup) and
+    the rolling velocity (completions per period).
+
+    Ranges that would exceed ``max_points`` periods are downsampled to weeks
+    or months; the response tells which ``granularity`` and ``window`` were used.
+    """
+    try:
+        series = burndown_report(db, start, end, granularity, window, max_points)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return BurndownResponse.model_validate(series)
+
+
+@router.get("/activity", response_model=List[ActivityYearResponse])
+def get_activity(
+    first_year: Optional[int] = Query(
+        None, ge=1970, le=9999, description="First year (default: last_year)"
+    ),
+    last_year: Optional[int] = Query(
+        None, ge=1970, le=9999, description="Last year (default: current year)"
+    ),
+    db: Repository = Depends(get_db),
+):
+    """
+    Get tasks created and completed per day, for an activity heatmap.
+
+    Only days with activity are listed. Each year is aggregated once and
+    cached; later writes adjust the cached days incrementally.
+    """
+    try:
+        years = activity_report(db, first_year, last_year)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return [
+        ActivityYearResponse(
+            year=year.year,
+            created=year.created,
+            completed=year.completed,
+            days=[
+                ActivityDayResponse(day=day, created=created, completed=completed)
+                for day, (created, completed) in year.days.items()
+            ],
+        )
+        for year in years
+    ]
+
+
+@router.get("/crunch", response_model=CrunchResponse)
+def get_crunch(
+    start: Optional[date] = Query(
+        None, alias="from", description="First day analysed (default: today)"
+    ),
+    days: int = Query(DEFAULT_DAYS, ge=1, le=MAX_DAYS, description="Days analysed"),
+    threshold: float = Query(
+        Capacity.daily_hours, gt=0, le=24, description="Hours per day that fit"
+    ),
+    window_days: int = Query(
+        DEFAULT_WINDOW_DAYS,
+        ge=1,
+        le=90,
+        description="Working days before each deadline",
+    ),
+    min_priority: TaskPriority = Query(
+        DEFAULT_MIN_PRIORITY, description="Lowest priority taken into account"
+    ),
+    default_effort: float = Query(
+        Capacity.default_effort,
+        gt=0,
+        description="Effort (hours) assumed for tasks without estimate",
+    ),
+    db: Repository = Depends(get_db),
+):
+    """
+    Get the upcoming periods where deadlines pile up beyond daily capacity.
+
+    Each open task spreads its effort over the ``window_days`` days up to its
+    deadline; a sweep line over those windows finds where the summed load
+    exceeds ``threshold`` hours per day, with the peak load and the tasks
+    involved.
+    """
+    try:
+        report = crunch_report(
+            db,
+            start,
+            days,
+            threshold=threshold,
+            window_days=window_days,
+            min_priority=min_priority,
+            default_effort=default_effort,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return CrunchResponse.model_validate(report)
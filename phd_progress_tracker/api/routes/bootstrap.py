@@ -0,0 +1,45 @@
+"""
+Bootstrap API route: initial page data in a single round trip.
+"""
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+
+from phd_progress_tracker.api.dependencies import get_db, get_today
+from phd_progress_tracker.api.routes.dashboard import build_dashboard
+from phd_progress_tracker.api.schemas import BootstrapResponse
+from phd_progress_tracker.utils.repository import Repository
+
+router = APIRouter(prefix="/bootstrap", tags=["bootstrap"])
+
+
+@router.get("", response_model=BootstrapResponse)
+def get_bootstrap(
+    task_limit: int = Query(50, ge=1, le=500, description="Size of the task page"),
+    milestone_limit: int = Query(5, ge=1, le=100),
+    db: Repository = Depends(get_db),
+    today: date = Depends(get_today),
+):
+    """
+    Get dashboard stats, the first page of tasks (by deadline) and the next
+    open milestones, all read from one consistent snapshot.
+
+    ``cursor`` is the storage revision of that snapshot; it changes on every
+    write, so clients can tell whether their data is still current.
+    """
+    with db.read_transaction():
+        cursor = db.revision()
+        dashboard = build_dashboard(db, today, use_index=False)
+        tasks = db.tasks_by_deadline(limit=task_limit + 1)
+        milestones = db.milestones_by_date(
+            start=today, achieved=False, limit=milestone_limit
+        )
+
+    return BootstrapResponse(
+        dashboard=dashboard,
+        tasks=tasks[:task_limit],
+        has_more_tasks=len(tasks) > task_limit,
+        milestones=milestones,
+        cursor=cursor,
+    )
@@ -0,0 +1,32 @@
+"""
+Calendar API routes.
+"""
+
+from datetime import date
+from typing import List, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from phd_progress_tracker.api.dependencies import get_db
+from phd_progress_tracker.api.schemas import CalendarBucketResponse
+from phd_progress_tracker.utils.calendar_view import build_calendar
+from phd_progress_tracker.utils.repository import Repository
+
+router = APIRouter(prefix="/calendar", tags=["calendar"])
+
+
+@router.get("", response_model=List[CalendarBucketResponse])
+def get_calendar(
+    start: date = Query(..., alias="from", description="First day of the window"),
+    end: date = Query(..., alias="to", description="Last day of the window"),
+    granularity: Literal["day", "week", "month"] = "day",
+    db: Repository = Depends(get_db),
+):
+    """
+    Get tasks and milestones in a date window, bucketed by day, week or month.
+    Only buckets containing at least one item are returned.
+    """
+    try:
+        return build_calendar(db, start, end, granularity)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
@@ -6,55 +6,45 @@ from datetime import date, timedelta
 
 from fastapi import APIRouter, Depends
 
+from phd_progress_tracker.api.dependencies import get_db, get_today
 from phd_progress_tracker.api.schemas import DashboardResponse
-from phd_progress_tracker.models.task import TaskStatus
-from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.repository import Repository
+from phd_progress_tracker.utils.task_frame import summarize_repository, upcoming_tasks
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
-def get_db() -> Database:
+def build_dashboard(
+    db: Repository, today: date, use_index: bool = True
+) -> DashboardResponse:
     """
-    Dependency to get database instance.
-    For production, this should use a singleton or connection pool.
-    """
-    db = Database()
-    try:
-        yield db
-    finally:
-        db.close()
+    Compute the dashboard statistics as of ``today``.
 
+    For the real "today", upcoming deadlines come from the incrementally
+    maintained deadline index unless ``use_index`` is False (e.g. inside a
+    read transaction, where everything must come from the same snapshot).
+    """
+    # Vectorized over a TaskFrame when NumPy is installed
+    summary = summarize_repository(db, today)
 
-@router.get("", response_model=DashboardResponse)
-def get_dashboard(db: Database = Depends(get_db)):
-    """Get dashboard statistics."""
-    tasks = db.load_tasks()
-
-    # Calculate statistics
-    total_tasks = len(tasks)
-    completed_tasks = sum(1 for t in tasks if t.status == TaskStatus.COMPLETED)
-    pending_tasks = sum(1 for t in tasks if t.status != TaskStatus.COMPLETED)
-    overdue_tasks = sum(1 for t in tasks if t.is_overdue())
-
-    # Get upcoming deadlines (next 7 days)
-    today = date.today()
-    seven_days_later = today + timedelta(days=7)
-    upcoming_deadlines = [
-        t
-        for t in tasks
-        if (
-            t.status != TaskStatus.COMPLETED
-            and t.deadline <= seven_days_later
-            and t.deadline >= today
+    # Get upcoming deadlines (next 7 days), already sorted by deadline
+    if use_index and today == date.today():
+        upcoming_deadlines = db.deadline_index().due_between(
+            today, today + timedelta(days=7)
         )
-    ]
-    # Sort by deadline
-    upcoming_deadlines.sort(key=lambda t: t.deadline)
+    else:
+        upcoming_deadlines = upcoming_tasks(db, days=7, today=today)
 
     return DashboardResponse(
-        total_tasks=total_tasks,
-        completed_tasks=completed_tasks,
-        pending_tasks=pending_tasks,
-        overdue_tasks=overdue_tasks,
+        total_tasks=summary.total,
+        completed_tasks=summary.completed,
+        pending_tasks=summary.pending,
+        overdue_tasks=summary.overdue,
         upcoming_deadlines=upcoming_deadlines,
     )
+
+
+@router.get("", response_model=DashboardResponse)
+def get_dashboard(db: Repository = Depends(get_db), today: date = Depends(get_today)):
+    """Get dashboard statistics, optionally as of a past or future date."""
+    return build_dashboard(db, today)
@@ -2,46 +2,82 @@
 Milestone API routes.
 """
 
-import uuid
-from typing import List
-
-from fastapi import APIRouter, HTTPException, Depends
-
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from phd_progress_tracker.api.dependencies import (
+    MSGPACK,
+    field_selector,
+    get_db,
+    wants_msgpack,
+)
 from phd_progress_tracker.api.schemas import (
+    ForecastResponse,
     MilestoneCreate,
     MilestoneUpdate,
     MilestoneResponse,
 )
 from phd_progress_tracker.models.milestone import Milestone
-from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.forecast import (
+    DEFAULT_HISTORY_DAYS,
+    DEFAULT_TRIALS,
+    ForecastUnavailable,
+    forecast_milestone,
+)
+from phd_progress_tracker.utils.ids import new_id
+from phd_progress_tracker.utils.repository import Repository
+from phd_progress_tracker.utils.wire import encode_columns
 
 router = APIRouter(prefix="/milestones", tags=["milestones"])
 
-
-def get_db() -> Database:
-    """
-    Dependency to get database instance.
-    For production, this should use a singleton or connection pool.
-    """
-    db = Database()
-    try:
-        yield db
-    finally:
-        db.close()
+# ?fields=id,title,... restricts both the SQL projection and the response
+milestone_fields = field_selector(MilestoneResponse)
 
 
 @router.get("", response_model=List[MilestoneResponse])
-def list_milestones(db: Database = Depends(get_db)):
-    """List all milestones."""
-    milestones = db.load_milestones()
+def list_milestones(
+    start: Optional[date] = Query(
+        None, alias="from", description="Earliest target date (inclusive)"
+    ),
+    end: Optional[date] = Query(
+        None, alias="to", description="Latest target date (inclusive)"
+    ),
+    achieved: Optional[bool] = Query(None, description="Filter by achievement"),
+    fields: Optional[List[str]] = Depends(milestone_fields),
+    msgpack: bool = Depends(wants_msgpack),
+    db: Repository = Depends(get_db),
+):
+    """
+    List milestones, optionally with only the requested fields.
+    With any filter, results come from an indexed range scan ordered by target date.
+    ``Accept: application/msgpack`` selects the columnar binary format.
+    """
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    if fields is not None:
+        rows = db.load_milestone_columns(fields, start, end, achieved)
+        if msgpack:
+            return Response(encode_columns(rows, fields), media_type=MSGPACK)
+        return JSONResponse(jsonable_encoder(rows))
+    if start is None and end is None and achieved is None:
+        milestones = db.load_milestones()
+    else:
+        milestones = db.milestones_by_date(start, end, achieved)
+    if msgpack:
+        columns = list(MilestoneResponse.model_fields)
+        return Response(encode_columns(milestones, columns), media_type=MSGPACK)
     return milestones
 
 
 @router.post("", response_model=MilestoneResponse, status_code=201)
-def create_milestone(milestone_data: MilestoneCreate, db: Database = Depends(get_db)):
+def create_milestone(milestone_data: MilestoneCreate, db: Repository = Depends(get_db)):
     """Create a new milestone."""
-    # Generate unique ID
-    milestone_id = str(uuid.uuid4())
+    # Generate unique, time-ordered ID
+    milestone_id = new_id()
 
     # Create new milestone
     milestone = Milestone(
@@ -53,38 +89,90 @@ def create_milestone(milestone_data: MilestoneCreate, db: Database = Depends(get
     )
 
     # Save to database
-    milestones = db.load_milestones()
-    milestones.append(milestone)
-    db.save_milestones(milestones)
+    db.add_milestone(milestone)
 
     return milestone
 
 
 @router.get("/{milestone_id}", response_model=MilestoneResponse)
-def get_milestone(milestone_id: str, db: Database = Depends(get_db)):
-    """Get a single milestone by ID."""
-    milestones = db.load_milestones()
-    for milestone in milestones:
-        if milestone.id == milestone_id:
-            return milestone
-    raise HTTPException(status_code=404, detail="Milestone not found")
+def get_milestone(
+    milestone_id: str,
+    fields: Optional[List[str]] = Depends(milestone_fields),
+    db: Repository = Depends(get_db),
+):
+    """Get a single milestone by ID, optionally with only the requested fields."""
+    if fields is not None:
+        milestone = db.get_milestone_columns(milestone_id, fields)
+    else:
+        milestone = db.get_milestone(milestone_id)
+    if milestone is None:
+        raise HTTPException(status_code=404, detail="Milestone not found")
+    if fields is not None:
+        return JSONResponse(jsonable_encoder(milestone))
+    return milestone
+
+
+@router.get("/{milestone_id}/forecast", response_model=ForecastResponse)
+def forecast(
+    milestone_id: str,
+    request: Request,
+    trials: int = Query(
+        DEFAULT_TRIALS, ge=100, le=2_000_000, description="Number of simulated runs"
+    ),
+    seed: Optional[int] = Query(
+        None, ge=0, description="Seed for a reproducible run (default: random)"
+    ),
+    history_days: int = Query(
+        DEFAULT_HISTORY_DAYS,
+        ge=7,
+        le=3650,
+        description="Days of completion history to resample",
+    ),
+    db: Repository = Depends(get_db),
+):
+    """
+    Forecast when the open tasks will be done, by Monte Carlo simulation.
+    Daily throughput from the last ``history_days`` days is resampled; the
+    response has the probability of finishing by the milestone's target date
+    and the p50/p85/p95 completion dates. The seed used is always returned.
+    Runs on the process pool shared by all requests (or in-process when the
+    app has none); requests never start processes of their own.
+    """
+    milestone = db.get_milestone(milestone_id)
+    if milestone is None:
+        raise HTTPException(status_code=404, detail="Milestone not found")
+    pool = getattr(request.app.state, "forecast_pool", None)
+    try:
+        result = forecast_milestone(
+            db, milestone, trials, seed, history_days, workers=1, pool=pool
+        )
+    except ForecastUnavailable as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    p50, p85, p95 = result.percentiles.values()
+    return ForecastResponse(
+        milestone_id=milestone.id,
+        target_date=milestone.target_date,
+        remaining=result.remaining,
+        trials=result.trials,
+        seed=result.seed,
+        history_start=result.history_start,
+        history_end=result.history_end,
+        daily_throughput=result.daily_throughput,
+        probability=result.probability,
+        p50=p50,
+        p85=p85,
+        p95=p95,
+    )
 
 
 @router.patch("/{milestone_id}", response_model=MilestoneResponse)
 def update_milestone(
     milestone_id: str,
     milestone_data: MilestoneUpdate,
-    db: Database = Depends(get_db),
+    db: Repository = Depends(get_db),
 ):
     """Update an existing milestone."""
-    milestones = db.load_milestones()
-
-    # Find milestone
-    milestone = None
-    for m in milestones:
-        if m.id == milestone_id:
-            milestone = m
-            break
+    milestone = db.get_milestone(milestone_id)
 
     if milestone is None:
         raise HTTPException(status_code=404, detail="Milestone not found")
@@ -100,27 +188,15 @@ def update_milestone(
         milestone.is_achieved = milestone_data.is_achieved
 
     # Save changes
-    db.save_milestones(milestones)
+    db.update_milestone(milestone)
 
     return milestone
 
 
 @router.delete("/{milestone_id}", status_code=204)
-def delete_milestone(milestone_id: str, db: Database = Depends(get_db)):
+def delete_milestone(milestone_id: str, db: Repository = Depends(get_db)):
     """Delete a milestone."""
-    milestones = db.load_milestones()
-
-    # Find and remove milestone
-    milestone = None
-    for m in milestones:
-        if m.id == milestone_id:
-            milestone = m
-            break
-
-    if milestone is None:
+    if not db.delete_milestone(milestone_id):
         raise HTTPException(status_code=404, detail="Milestone not found")
 
-    milestones.remove(milestone)
-    db.save_milestones(milestones)
-
     return None
@@ -0,0 +1,100 @@
+"""
+Plan API routes.
+"""
+
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from phd_progress_tracker.api.dependencies import get_db
+from phd_progress_tracker.api.schemas import (
+    PlanDayResponse,
+    PlannedTaskResponse,
+    PlanResponse,
+    PlanSlotResponse,
+)
+from phd_progress_tracker.utils.planner import (
+    DEFAULT_DAYS,
+    MAX_DAYS,
+    MAX_EFFORT_HOURS,
+    Capacity,
+    PlannedTask,
+    build_plan,
+)
+from phd_progress_tracker.utils.repository import Repository
+
+router = APIRouter(prefix="/plan", tags=["plan"])
+
+
+def _planned_task(planned: PlannedTask) -> PlannedTaskResponse:
+    return PlannedTaskResponse(
+        task_id=planned.task.id,
+        title=planned.task.title,
+        deadline=planned.task.deadline,
+        effort_hours=planned.effort,
+        estimated=planned.estimated,
+        start=planned.start,
+        finish=planned.finish,
+        late=planned.late,
+    )
+
+
+@router.get("", response_model=PlanResponse)
+def get_plan(
+    start: Optional[date] = Query(
+        None, alias="from", description="First day of the plan (default: today)"
+    ),
+    days: int = Query(DEFAULT_DAYS, ge=1, le=MAX_DAYS, description="Days returned"),
+    hours: float = Query(6.0, gt=0, le=24, description="Working hours per day"),
+    default_effort: float = Query(
+        2.0,
+        gt=0,
+        le=MAX_EFFORT_HOURS,
+        description="Effort (hours) assumed for tasks without estimate",
+    ),
+    weekends: bool = Query(False, description="Also plan work on weekends"),
+    db: Repository = Depends(get_db),
+):
+    """
+    Get a day-by-day schedule of the open tasks.
+
+    Tasks are taken earliest-deadline-first and packed into days of
+    ``hours`` capacity: a task that fits in one day goes whole into the first
+    day with room, larger ones (or ones that would otherwise finish late)
+    are split over the first free days. Replanning after a change reuses
+    the part of the previous plan that comes before the changed task.
+    """
+    try:
+        capacity = Capacity(hours, default_effort, weekends)
+        plan = build_plan(db, start, days, capacity)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return PlanResponse(
+        start=plan.start,
+        end=plan.days[-1].day,
+        daily_hours=capacity.daily_hours,
+        weekends=capacity.weekends,
+        total_tasks=len(plan.tasks),
+        total_hours=sum(planned.effort for planned in plan.tasks),
+        finish=plan.finish,
+        days=[
+            PlanDayResponse(
+                day=day.day,
+                capacity=day.capacity,
+                used=day.used,
+                slots=[
+                    PlanSlotResponse(
+                        task_id=slot.task.id,
+                        title=slot.task.title,
+                        hours=slot.hours,
+                        deadline=slot.task.deadline,
+                        priority=slot.task.priority,
+                    )
+                    for slot in day.slots
+                ],
+            )
+            for day in plan.days
+        ],
+        late=[_planned_task(planned) for planned in plan.late],
+    )
@@ -2,43 +2,215 @@
 Task API routes.
 """
 
-import uuid
-from datetime import datetime
-from typing import List
+from datetime import date, datetime, timedelta
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 
-from phd_progress_tracker.api.schemas import TaskCreate, TaskUpdate, TaskResponse
-from phd_progress_tracker.models.task import Task, TaskStatus
-from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.api.dependencies import (
+    MSGPACK,
+    field_selector,
+    get_db,
+    wants_msgpack,
+)
+from phd_progress_tracker.api.schemas import (
+    BlockersResponse,
+    DependencyCreate,
+    RankedTaskResponse,
+    StalledTaskResponse,
+    TaskCreate,
+    TaskEventResponse,
+    TaskFacetsResponse,
+    TaskResponse,
+    TaskSlackResponse,
+    TaskUpdate,
+    TimeInStatusResponse,
+)
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils.dependencies import dependency_graph
+from phd_progress_tracker.utils.ids import new_id
+from phd_progress_tracker.utils.planner import MAX_EFFORT_HOURS, Capacity
+from phd_progress_tracker.utils.ranking import DEFAULT_K, ScoreWeights, next_tasks
+from phd_progress_tracker.utils.repository import HistoryRepository, Repository
+from phd_progress_tracker.utils.task_filter import TaskFilter
+from phd_progress_tracker.utils.wire import encode_columns
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# ?fields=id,title,... restricts both the SQL projection and the response
+task_fields = field_selector(TaskResponse)
 
-def get_db() -> Database:
-    """
-    Dependency to get database instance.
-    For production, this should use a singleton or connection pool.
-    """
-    db = Database()
+
+def get_task_filter(
+    status: Optional[TaskStatus] = Query(None, description="Exact status"),
+    priority: Optional[TaskPriority] = Query(None, description="Exact priority"),
+    category: Optional[str] = Query(None, description="Category (case-insensitive)"),
+    deadline_from: Optional[date] = Query(
+        None, alias="from", description="Earliest deadline (inclusive)"
+    ),
+    deadline_to: Optional[date] = Query(
+        None, alias="to", description="Latest deadline (inclusive)"
+    ),
+) -> TaskFilter:
+    """Task filters shared by the list and facets endpoints."""
+    return TaskFilter(status, priority, category, deadline_from, deadline_to)
+
+
+def get_score_weights(
+    priority_weight: float = Query(ScoreWeights.priority, description="Priority"),
+    deadline_weight: float = Query(
+        ScoreWeights.deadline, description="Deadline proximity"
+    ),
+    age_weight: float = Query(ScoreWeights.age, description="Task age"),
+    in_progress_weight: float = Query(
+        ScoreWeights.in_progress, description="Bonus for tasks in progress"
+    ),
+    blocked_weight: float = Query(
+        ScoreWeights.blocked, description="Bonus (negative: penalty) for blocked"
+    ),
+) -> ScoreWeights:
+    """Ranking weights for the next-tasks endpoint."""
+    return ScoreWeights(
+        priority=priority_weight,
+        deadline=deadline_weight,
+        age=age_weight,
+        in_progress=in_progress_weight,
+        blocked=blocked_weight,
+    )
+
+
+def get_capacity(
+    hours: float = Query(6.0, gt=0, le=24, description="Working hours per day"),
+    default_effort: float = Query(
+        2.0,
+        gt=0,
+        le=MAX_EFFORT_HOURS,
+        description="Effort (hours) assumed for tasks without estimate",
+    ),
+) -> Capacity:
+    """Durations used by the dependency schedule."""
     try:
-        yield db
-    finally:
-        db.close()
+        return Capacity(hours, default_effort)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @router.get("", response_model=List[TaskResponse])
-def list_tasks(db: Database = Depends(get_db)):
-    """List all tasks."""
-    tasks = db.load_tasks()
+def list_tasks(
+    filters: TaskFilter = Depends(get_task_filter),
+    fields: Optional[List[str]] = Depends(task_fields),
+    msgpack: bool = Depends(wants_msgpack),
+    db: Repository = Depends(get_db),
+):
+    """
+    List tasks, optionally filtered and with only the requested fields.
+
+    With ``Accept: application/msgpack`` the list is sent column by column
+    in MessagePack (see ``utils/wire.py``) instead of JSON.
+    """
+    if fields is not None:
+        rows = db.load_task_columns(fields, filters)
+        if msgpack:
+            return Response(encode_columns(rows, fields), media_type=MSGPACK)
+        return JSONResponse(jsonable_encoder(rows))
+    if not filters.is_empty():
+        tasks = db.find_tasks(filters)
+    else:
+        tasks = db.load_tasks()
+    if msgpack:
+        columns = list(TaskResponse.model_fields)
+        return Response(encode_columns(tasks, columns), media_type=MSGPACK)
     return tasks
 
 
+@router.get("/facets", response_model=TaskFacetsResponse)
+def get_task_facets(
+    response: Response,
+    filters: TaskFilter = Depends(get_task_filter),
+    if_none_match: Optional[str] = Header(None),
+    db: Repository = Depends(get_db),
+):
+    """
+    Count tasks by status, priority, category and deadline month.
+
+    Accepts the same filters as ``GET /tasks``. The ETag is the storage
+    revision, so clients can revalidate with ``If-None-Match``.
+    """
+    revision, facets = db.task_facets(filters)
+    etag = f'W/"{revision}"'
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return TaskFacetsResponse(
+        revision=revision,
+        status={TaskStatus[k].value: n for k, n in facets["status"].items()},
+        priority={TaskPriority[k].value: n for k, n in facets["priority"].items()},
+        category=facets["category"],
+        month=facets["month"],
+    )
+
+
+@router.get("/stalled", response_model=List[StalledTaskResponse])
+def list_stalled_tasks(
+    days: int = Query(14, ge=0, description="Minimum days in the current status"),
+    status: List[TaskStatus] = Query(
+        [TaskStatus.IN_PROGRESS, TaskStatus.BLOCKED],
+        description="Statuses to check (repeatable)",
+    ),
+    db: Repository = Depends(get_db),
+):
+    """List tasks that have been in one of ``status`` for more than ``days`` days."""
+    if not isinstance(db, HistoryRepository):
+        raise HTTPException(
+            status_code=501,
+            detail="Status history is not supported by this storage backend",
+        )
+    now = datetime.now()
+    return [
+        StalledTaskResponse(
+            task=TaskResponse.model_validate(task),
+            since=since,
+            days=(now - since).days,
+        )
+        for task, since in db.stalled_tasks(days, status, now)
+    ]
+
+
+@router.get("/next", response_model=List[RankedTaskResponse])
+def list_next_tasks(
+    k: int = Query(DEFAULT_K, ge=1, le=100, description="Number of tasks"),
+    weights: ScoreWeights = Depends(get_score_weights),
+    db: Repository = Depends(get_db),
+):
+    """
+    Rank open tasks by priority, deadline proximity, age and status and
+    return the top ``k``, each with its score and weighted parts.
+    """
+    return next_tasks(db, k, weights)
+
+
+@router.get("/critical-path", response_model=List[TaskSlackResponse])
+def get_critical_path(
+    capacity: Capacity = Depends(get_capacity),
+    db: Repository = Depends(get_db),
+):
+    """
+    Get the chain of open tasks with the least slack, first prerequisite first.
+
+    Each task takes ``effort / hours`` days (``default_effort`` when not
+    estimated) after its open prerequisites; slack is how many days it can
+    slip before its own deadline, or a dependent's, is missed.
+    """
+    return dependency_graph(db, capacity).critical_path()
+
+
 @router.post("", response_model=TaskResponse, status_code=201)
-def create_task(task_data: TaskCreate, db: Database = Depends(get_db)):
+def create_task(task_data: TaskCreate, db: Repository = Depends(get_db)):
     """Create a new task."""
-    # Generate unique ID
-    task_id = str(uuid.uuid4())
+    # Generate unique, time-ordered ID
+    task_id = new_id()
 
     # Create new task
     task = Task(
@@ -50,37 +222,37 @@ def create_task(task_data: TaskCreate, db: Database = Depends(get_db)):
         priority=task_data.priority,
         category=task_data.category,
         created_at=datetime.now(),
+        effort_hours=task_data.effort_hours,
     )
 
     # Save to database
-    tasks = db.load_tasks()
-    tasks.append(task)
-    db.save_tasks(tasks)
+    db.add_task(task)
 
     return task
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-def get_task(task_id: str, db: Database = Depends(get_db)):
-    """Get a single task by ID."""
-    tasks = db.load_tasks()
-    for task in tasks:
-        if task.id == task_id:
-            return task
-    raise HTTPException(status_code=404, detail="Task not found")
+def get_task(
+    task_id: str,
+    fields: Optional[List[str]] = Depends(task_fields),
+    db: Repository = Depends(get_db),
+):
+    """Get a single task by ID, optionally with only the requested fields."""
+    if fields is not None:
+        task = db.get_task_columns(task_id, fields)
+    else:
+        task = db.get_task(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if fields is not None:
+        return JSONResponse(jsonable_encoder(task))
+    return task
 
 
 @router.patch("/{task_id}", response_model=TaskResponse)
-def update_task(task_id: str, task_data: TaskUpdate, db: Database = Depends(get_db)):
+def update_task(task_id: str, task_data: TaskUpdate, db: Repository = Depends(get_db)):
     """Update an existing task."""
-    tasks = db.load_tasks()
-
-    # Find task
-    task = None
-    for t in tasks:
-        if t.id == task_id:
-            task = t
-            break
+    task = db.get_task(task_id)
 
     if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -103,29 +275,128 @@ def update_task(task_id: str, task_data: TaskUpdate, db: Database = Depends(get_
         task.priority = task_data.priority
     if task_data.category is not None:
         task.category = task_data.category
+    if task_data.effort_hours is not None:
+        task.effort_hours = task_data.effort_hours
 
-    # Save changes
-    db.save_tasks(tasks)
+    # Save changes in one write with the derived ones: a task moved out of
+    # BLOCKED while a prerequisite is open is blocked again, and completing
+    # (or reopening) a prerequisite unblocks (or blocks) its dependents
+    if not db.update_task(task, refresh_blocked=True):
+        raise HTTPException(status_code=404, detail="Task not found")
 
-    return task
+    return db.get_task(task.id) or task
 
 
-@router.delete("/{task_id}", status_code=204)
-def delete_task(task_id: str, db: Database = Depends(get_db)):
-    """Delete a task."""
-    tasks = db.load_tasks()
+def _blockers(db: Repository, task: Task, capacity: Capacity) -> BlockersResponse:
+    graph = dependency_graph(db, capacity)
+    return BlockersResponse(
+        task_id=task.id,
+        dependencies=db.dependencies(task.id),
+        blockers=graph.blockers(task.id),
+        schedule=graph.slack(task.id),
+    )
+
+
+@router.get("/{task_id}/blockers", response_model=BlockersResponse)
+def get_task_blockers(
+    task_id: str,
+    capacity: Capacity = Depends(get_capacity),
+    db: Repository = Depends(get_db),
+):
+    """
+    Get the prerequisites of a task: all of their IDs, the ones still open
+    (with their slack) and the task's own place in the dependency schedule
+    (``null`` once it is completed).
+    """
+    task = db.get_task(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return _blockers(db, task, capacity)
 
-    # Find and remove task
-    task = None
-    for t in tasks:
-        if t.id == task_id:
-            task = t
-            break
 
+@router.post(
+    "/{task_id}/dependencies", response_model=BlockersResponse, status_code=201
+)
+def add_task_dependency(
+    task_id: str,
+    dependency: DependencyCreate,
+    capacity: Capacity = Depends(get_capacity),
+    db: Repository = Depends(get_db),
+):
+    """
+    Make a task depend on another one.
+
+    Rejected with 409 if it would close a cycle. A task waiting on an open
+    prerequisite moves to ``BLOCKED``.
+    """
+    task = db.get_task(task_id)
     if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
+    if db.get_task(dependency.depends_on) is None:
+        raise HTTPException(status_code=404, detail="Prerequisite not found")
+    try:
+        db.add_dependency(task.id, dependency.depends_on, refresh_blocked=True)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return _blockers(db, task, capacity)
 
-    tasks.remove(task)
-    db.save_tasks(tasks)
+
+@router.delete("/{task_id}/dependencies/{depends_on}", status_code=204)
+def remove_task_dependency(
+    task_id: str, depends_on: str, db: Repository = Depends(get_db)
+):
+    """Remove a dependency; a task left without open prerequisites is unblocked."""
+    if not db.remove_dependency(task_id, depends_on, refresh_blocked=True):
+        raise HTTPException(status_code=404, detail="Dependency not found")
+    return None
+
+
+@router.get("/{task_id}/history", response_model=List[TaskEventResponse])
+def get_task_history(task_id: str, db: Repository = Depends(get_db)):
+    """
+    Get the change history of a task, oldest first.
+
+    Deleted tasks keep their history. Undo and redo show up as ``undone``
+    and ``redone`` events whose ``ref`` is the event they reverted;
+    ``automatic`` events are status changes derived from dependencies,
+    which undo skips and recomputes.
+    """
+    if not isinstance(db, HistoryRepository):
+        raise HTTPException(
+            status_code=501,
+            detail="Task history is not supported by this storage backend",
+        )
+    events = db.task_history(task_id)
+    if not events and db.get_task(task_id) is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return events
+
+
+@router.get("/{task_id}/time-in-status", response_model=TimeInStatusResponse)
+def get_time_in_status(task_id: str, db: Repository = Depends(get_db)):
+    """Get how many days a task spent in each status (the current one counts up to now)."""
+    if not isinstance(db, HistoryRepository):
+        raise HTTPException(
+            status_code=501,
+            detail="Status history is not supported by this storage backend",
+        )
+    task = db.get_task(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    durations = db.time_in_status(task.id)
+    return TimeInStatusResponse(
+        task_id=task.id,
+        days={
+            status.value: round(duration / timedelta(days=1), 2)
+            for status, duration in durations.items()
+        },
+    )
+
+
+@router.delete("/{task_id}", status_code=204)
+def delete_task(task_id: str, db: Repository = Depends(get_db)):
+    """Delete a task; its dependents no longer wait for it."""
+    if not db.delete_task(task_id, refresh_blocked=True):
+        raise HTTPException(status_code=404, detail="Task not found")
 
     return None
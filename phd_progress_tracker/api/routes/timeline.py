@@ -0,0 +1,69 @@
+"""
+Timeline API routes.
+"""
+
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from phd_progress_tracker.api.dependencies import get_db
+from phd_progress_tracker.api.schemas import (
+    MilestoneResponse,
+    TimelineBarResponse,
+    TimelineResponse,
+    TimelineSummaryResponse,
+)
+from phd_progress_tracker.utils.burndown import MAX_POINTS
+from phd_progress_tracker.utils.repository import Repository
+from phd_progress_tracker.utils.timeline import build_timeline
+
+router = APIRouter(prefix="/timeline", tags=["timeline"])
+
+
+@router.get("", response_model=TimelineResponse)
+def get_timeline(
+    start: date = Query(..., alias="from", description="First day of the window"),
+    end: date = Query(..., alias="to", description="Last day of the window"),
+    resolution: Literal["auto", "day", "week", "month"] = Query(
+        "auto", description="Column size; auto picks the finest within max_columns"
+    ),
+    max_columns: int = Query(MAX_POINTS, ge=10, le=1000),
+    db: Repository = Depends(get_db),
+):
+    """
+    Get Gantt data for a window: task bars (created → completed or deadline)
+    clipped to the window, with lanes assigned server-side, and milestones.
+
+    Only tasks intersecting the window are loaded. At week/month resolution,
+    tasks shorter than one column are summed into per-period summary bars.
+    """
+    try:
+        timeline = build_timeline(db, start, end, resolution, max_columns)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return TimelineResponse(
+        start=timeline.start,
+        end=timeline.end,
+        resolution=timeline.resolution,
+        lanes=timeline.lanes,
+        bars=[
+            TimelineBarResponse(
+                id=bar.task.id,
+                title=bar.task.title,
+                status=bar.task.status,
+                category=bar.task.category,
+                start=bar.start,
+                end=bar.end,
+                lane=bar.lane,
+                clipped_start=bar.clipped_start,
+                clipped_end=bar.clipped_end,
+            )
+            for bar in timeline.bars
+        ],
+        milestones=[MilestoneResponse.model_validate(m) for m in timeline.milestones],
+        summaries=[
+            TimelineSummaryResponse.model_validate(summary)
+            for summary in timeline.summaries
+        ],
+    )
@@ -3,11 +3,13 @@ Pydantic schemas for API request/response validation.
 """
 
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from phd_progress_tracker.models.task import TaskPriority, TaskStatus
+from phd_progress_tracker.utils.history import EventKind
+from phd_progress_tracker.utils.planner import MAX_EFFORT_HOURS
 
 # Task Schemas
 
@@ -20,6 +22,7 @@ class TaskCreate(BaseModel):
     deadline: date
     category: str = "Geral"
     priority: TaskPriority = TaskPriority.MEDIUM
+    effort_hours: Optional[float] = Field(None, gt=0, le=MAX_EFFORT_HOURS)
 
 
 class TaskUpdate(BaseModel):
@@ -31,6 +34,7 @@ class TaskUpdate(BaseModel):
     status: Optional[TaskStatus] = None
     priority: Optional[TaskPriority] = None
     category: Optional[str] = None
+    effort_hours: Optional[float] = Field(None, gt=0, le=MAX_EFFORT_HOURS)
 
 
 class TaskResponse(BaseModel):
@@ -47,6 +51,93 @@ class TaskResponse(BaseModel):
     category: str
     created_at: datetime
     completed_at: Optional[datetime] = None
+    effort_hours: Optional[float] = None
+
+
+class TaskFacetsResponse(BaseModel):
+    """Schema for grouped task counts (filter sidebar)."""
+
+    revision: int
+    status: dict[str, int]
+    priority: dict[str, int]
+    category: dict[str, int]
+    month: dict[str, int]
+
+
+class TaskEventResponse(BaseModel):
+    """
+    Schema for one entry of a task's history.
+
+    ``before``/``after`` hold only the fields the event changed (the full
+    task for creations and deletions); ``before`` is null for a creation and
+    ``after`` for a deletion.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    seq: int
+    kind: str
+    at: datetime
+    ref: int
+    before: Optional[dict[str, Any]] = None
+    after: Optional[dict[str, Any]] = None
+
+    @field_validator("kind", mode="before")
+    @classmethod
+    def _kind_name(cls, value: Any) -> Any:
+        return value.name.lower() if isinstance(value, EventKind) else value
+
+
+class StalledTaskResponse(BaseModel):
+    """Schema for a task that has been in its current status for too long."""
+
+    task: TaskResponse
+    since: datetime
+    days: int
+
+
+class RankedTaskResponse(BaseModel):
+    """Schema for a task in the "work on next" ranking, with its score."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    task: TaskResponse
+    score: float
+    parts: dict[str, float]
+
+
+class TimeInStatusResponse(BaseModel):
+    """Schema for the total time (in days) a task spent in each status."""
+
+    task_id: str
+    days: dict[str, float]
+
+
+class DependencyCreate(BaseModel):
+    """Schema for adding a prerequisite to a task."""
+
+    depends_on: str = Field(..., min_length=1)
+
+
+class TaskSlackResponse(BaseModel):
+    """Schema for an open task's place in the dependency schedule."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    task: TaskResponse
+    earliest_finish: date
+    latest_finish: date
+    slack: float
+    critical: bool
+
+
+class BlockersResponse(BaseModel):
+    """Schema for the prerequisites of a task and its own slack."""
+
+    task_id: str
+    dependencies: list[str]
+    blockers: list[TaskSlackResponse]
+    schedule: Optional[TaskSlackResponse]
 
 
 # Milestone Schemas
@@ -81,6 +172,132 @@ class MilestoneResponse(BaseModel):
     is_achieved: bool
 
 
+class ForecastResponse(BaseModel):
+    """Schema for a Monte Carlo completion forecast of a milestone."""
+
+    milestone_id: str
+    target_date: date
+    remaining: int
+    trials: int
+    seed: int
+    history_start: date
+    history_end: date
+    daily_throughput: float
+    probability: float
+    p50: Optional[date]
+    p85: Optional[date]
+    p95: Optional[date]
+
+
+# Calendar Schema
+
+
+class CalendarBucketResponse(BaseModel):
+    """Schema for one day/week/month of the calendar view."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    start: date
+    end: date
+    tasks: list[TaskResponse]
+    milestones: list[MilestoneResponse]
+
+
+# Timeline Schemas
+
+
+class TimelineBarResponse(BaseModel):
+    """Schema for one task bar of the timeline, clipped to the window."""
+
+    id: str
+    title: str
+    status: TaskStatus
+    category: str
+    start: date
+    end: date
+    lane: int
+    clipped_start: bool
+    clipped_end: bool
+
+
+class TimelineSummaryResponse(BaseModel):
+    """Schema for tasks too short for the resolution, summed per period."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    start: date
+    end: date
+    count: int
+    completed: int
+    by_category: dict[str, int]
+
+
+class TimelineResponse(BaseModel):
+    """Schema for the timeline of a window at the resolution actually used."""
+
+    start: date
+    end: date
+    resolution: Literal["day", "week", "month"]
+    lanes: int
+    bars: list[TimelineBarResponse]
+    milestones: list[MilestoneResponse]
+    summaries: list[TimelineSummaryResponse]
+
+
+# Plan Schemas
+
+
+class PlanSlotResponse(BaseModel):
+    """Schema for the hours planned for one task on one day."""
+
+    task_id: str
+    title: str
+    hours: float
+    deadline: date
+    priority: TaskPriority
+
+
+class PlanDayResponse(BaseModel):
+    """Schema for one day of the plan."""
+
+    day: date
+    capacity: float
+    used: float
+    slots: list[PlanSlotResponse]
+
+
+class PlannedTaskResponse(BaseModel):
+    """Schema for when the plan works on a task and whether it finishes late."""
+
+    task_id: str
+    title: str
+    deadline: date
+    effort_hours: float
+    estimated: bool
+    start: date
+    finish: date
+    late: bool
+
+
+class PlanResponse(BaseModel):
+    """
+    Schema for a capacity-based plan.
+
+    ``days`` covers only the requested window; ``late`` lists every open
+    task the plan finishes after its deadline, inside the window or not.
+    """
+
+    start: date
+    end: date
+    daily_hours: float
+    weekends: bool
+    total_tasks: int
+    total_hours: float
+    finish: Optional[date] = None
+    days: list[PlanDayResponse]
+    late: list[PlannedTaskResponse]
+
+
 # Dashboard Schema
 
 
@@ -92,3 +309,115 @@ class DashboardResponse(BaseModel):
     pending_tasks: int
     overdue_tasks: int
     upcoming_deadlines: list[TaskResponse]
+
+
+# Bootstrap Schema
+
+
+class BootstrapResponse(BaseModel):
+    """Schema for everything the web dashboard needs on page load."""
+
+    dashboard: DashboardResponse
+    tasks: list[TaskResponse]
+    has_more_tasks: bool
+    milestones: list[MilestoneResponse]
+    cursor: int
+
+
+# Analytics Schemas
+
+
+class CycleTimeStatsResponse(BaseModel):
+    """Schema for cycle-time percentiles (in days) of a group of tasks."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    count: int
+    p50: float
+    p90: float
+    p99: float
+
+
+class ThroughputWeekResponse(BaseModel):
+    """Schema for the tasks completed in one week (Monday to Sunday)."""
+
+    week_start: date
+    completed: int
+    by_category: dict[str, int]
+
+
+class CycleTimeResponse(BaseModel):
+    """Schema for cycle-time percentiles and weekly throughput of a period."""
+
+    start: Optional[date]
+    end: Optional[date]
+    overall: Optional[CycleTimeStatsResponse]
+    by_category: dict[str, CycleTimeStatsResponse]
+    by_priority: dict[str, CycleTimeStatsResponse]
+    throughput: list[ThroughputWeekResponse]
+
+
+class BurndownPointResponse(BaseModel):
+    """Schema for one period of the burndown/burnup series."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    start: date
+    created: int
+    completed: int
+    total: int
+    done: int
+    open: int
+    velocity: float
+
+
+class BurndownResponse(BaseModel):
+    """Schema for a burndown/burnup series and the resolution actually used."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    granularity: Literal["day", "week", "month"]
+    window: int
+    points: list[BurndownPointResponse]
+
+
+class ActivityDayResponse(BaseModel):
+    """Schema for the tasks created and completed on one day."""
+
+    day: date
+    created: int
+    completed: int
+
+
+class ActivityYearResponse(BaseModel):
+    """Schema for the daily activity of one year (only days with activity)."""
+
+    year: int
+    created: int
+    completed: int
+    days: list[ActivityDayResponse]
+
+
+class CrunchIntervalResponse(BaseModel):
+    """Schema for a period whose daily load exceeds the threshold."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    start: date
+    end: date
+    days: int
+    peak_load: float
+    hours: float
+    tasks: list[TaskResponse]
+
+
+class CrunchResponse(BaseModel):
+    """Schema for the overloaded periods of the analysed window."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    start: date
+    end: date
+    threshold: float
+    window_days: int
+    intervals: list[CrunchIntervalResponse]
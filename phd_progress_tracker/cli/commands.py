@@ -2,27 +2,78 @@
 Comandos CLI para o PhD Progress Tracker.
 """
 
-import uuid
-from datetime import date
-from typing import Optional
+import os
+from datetime import date, datetime
+from typing import List, Optional
 import typer
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 from rich.panel import Panel
 from rich.layout import Layout
 from rich import box
 
 from phd_progress_tracker.models.task import Task, TaskStatus, TaskPriority
 from phd_progress_tracker.models.milestone import Milestone
-from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.config import settings
+from phd_progress_tracker.utils.activity import (
+    METRICS,
+    activity_report,
+    heatmap_grid,
+    intensity,
+)
+from phd_progress_tracker.utils.burndown import burndown_report
+from phd_progress_tracker.utils.crunch import crunch_report
+from phd_progress_tracker.utils.cycle_time import cycle_time_report
 from phd_progress_tracker.utils.date_helper import (
     format_days_remaining,
     parse_date_input,
 )
+from phd_progress_tracker.utils.dependencies import TaskSlack, dependency_graph
+from phd_progress_tracker.utils.forecast import (
+    DEFAULT_HISTORY_DAYS,
+    DEFAULT_TRIALS,
+    ForecastUnavailable,
+    forecast_milestone,
+)
+from phd_progress_tracker.utils.history import EventKind
+from phd_progress_tracker.utils.ids import new_id
+from phd_progress_tracker.utils.planner import (
+    DEFAULT_DAYS,
+    MAX_DAYS,
+    MAX_EFFORT_HOURS,
+    Capacity,
+    build_plan,
+)
+from phd_progress_tracker.utils.ranking import DEFAULT_K, ScoreWeights, next_tasks
+from phd_progress_tracker.utils.repository import HistoryRepository, open_repository
+from phd_progress_tracker.utils.snapshot import SNAPSHOT_FILENAME, build_snapshot
+from phd_progress_tracker.utils.task_filter import FACETS
+from phd_progress_tracker.utils.task_frame import summarize_repository, upcoming_tasks
+from phd_progress_tracker.utils.tenancy import TenantDatabasePool
 
 app = typer.Typer()
 console = Console()
-db = Database()
+db = open_repository(settings.data_dir, settings.storage_backend)
+
+
+def _resolve_today(as_of: Optional[str]) -> date:
+    """Resolve a data de referência uma única vez por comando."""
+    if as_of is None:
+        return date.today()
+    try:
+        return parse_date_input(as_of)
+    except ValueError as e:
+        console.print(f"[red]Erro: {e}[/red]")
+        raise typer.Exit(1)
+
+
+def _check_effort(effort: Optional[float]) -> None:
+    """Valida o esforço estimado informado na linha de comando."""
+    if effort is not None and not 0 < effort <= MAX_EFFORT_HOURS:
+        raise ValueError(
+            f"Effort must be between 0 and {MAX_EFFORT_HOURS:g} hours, got {effort}"
+        )
 
 
 @app.command("add")
@@ -38,33 +89,36 @@ def add_task(
     priority: str = typer.Option(
         "MEDIUM", "--priority", "-p", help="LOW, MEDIUM, HIGH, CRITICAL"
     ),
+    effort: Optional[float] = typer.Option(
+        None, "--effort", "-e", help="Esforço estimado em horas"
+    ),
 ):
     """
     Adiciona nova tarefa ao tracker.
 
     Exemplos:
         phd add "Revisar literatura" --deadline 2026-03-01 --category "PhD"
-        phd add "Análise de dados" --deadline +14d --priority HIGH
+        phd add "Análise de dados" --deadline +14d --priority HIGH --effort 6
     """
     try:
         deadline_date = parse_date_input(deadline)
         priority_enum = TaskPriority[priority.upper()]
+        _check_effort(effort)
     except (ValueError, KeyError) as e:
         console.print(f"[red]Erro: {e}[/red]")
         raise typer.Exit(1)
 
     task = Task(
-        id=str(uuid.uuid4())[:8],
+        id=new_id(),
         title=title,
         description=description,
         deadline=deadline_date,
         category=category,
         priority=priority_enum,
+        effort_hours=effort,
     )
 
-    tasks = db.load_tasks()
-    tasks.append(task)
-    db.save_tasks(tasks)
+    db.add_task(task)
 
     console.print(
         f"[green]✓[/green] Tarefa '{title}' adicionada com sucesso! (ID: {task.id})"
@@ -79,10 +133,14 @@ def list_tasks(
     category: Optional[str] = typer.Option(
         None, "--category", "-c", help="Filtrar por categoria"
     ),
+    as_of: Optional[str] = typer.Option(
+        None, "--as-of", help="Data de referência para os prazos (padrão: hoje)"
+    ),
 ):
     """
     Lista todas as tarefas.
     """
+    today = _resolve_today(as_of)
     tasks = db.load_tasks()
 
     # Filtros
@@ -105,7 +163,7 @@ def list_tasks(
     table.add_column("Prioridade", style="red")
 
     for task in sorted(tasks, key=lambda t: t.deadline):
-        days_text, color = format_days_remaining(task.days_remaining())
+        days_text, color = format_days_remaining(task.days_remaining(today))
 
         # Emoji por status
         status_emoji = {
@@ -136,17 +194,20 @@ def edit_task(
     deadline: Optional[str] = typer.Option(
         None, "--deadline", "-d", help="Nova data limite (YYYY-MM-DD ou +Nd)"
     ),
+    effort: Optional[float] = typer.Option(
+        None, "--effort", "-e", help="Novo esforço estimado em horas"
+    ),
 ):
     """
-    Edita o título e/ou prazo de uma tarefa existente.
+    Edita o título, prazo e/ou esforço estimado de uma tarefa existente.
 
     Exemplos:
         phd edit <ID> --title "Novo Título"
         phd edit <ID> --deadline "2026-06-30"
         phd edit <ID> -t "Revisar Cap. 3" -d "+7d"
+        phd edit <ID> --effort 4.5
     """
-    tasks = db.load_tasks()
-    task_found = next((t for t in tasks if t.id == task_id), None)
+    task_found = db.get_task(task_id)
 
     if not task_found:
         console.print(f"[red]Tarefa com ID '{task_id}' não encontrada.[/red]")
@@ -166,11 +227,20 @@ def edit_task(
             console.print(f"[red]Erro ao processar o prazo: {e}[/red]")
             raise typer.Exit(1)
 
+    if effort is not None:
+        try:
+            _check_effort(effort)
+        except ValueError as e:
+            console.print(f"[red]Erro: {e}[/red]")
+            raise typer.Exit(1)
+        task_found.effort_hours = effort
+        updated_fields.append("esforço")
+
     if not updated_fields:
         console.print("[yellow]Nenhum campo para atualizar foi fornecido.[/yellow]")
         raise typer.Exit(0)
 
-    db.save_tasks(tasks)
+    db.update_task(task_found)
     console.print(
         f"[green]✓[/green] Tarefa '{task_found.id}' atualizada com sucesso! "
         f"Campos alterados: {', '.join(updated_fields)}."
@@ -180,38 +250,50 @@ def edit_task(
 @app.command("complete")
 def complete_task(task_id: str = typer.Argument(..., help="ID da tarefa")):
     """Marca tarefa como concluída."""
-    tasks = db.load_tasks()
-    task = next((t for t in tasks if t.id == task_id), None)
+    task = db.get_task(task_id)
 
     if not task:
         console.print(f"[red]Tarefa {task_id} não encontrada.[/red]")
         raise typer.Exit(1)
 
+    blocked = [
+        dependent.id
+        for dependent in map(db.get_task, db.dependents(task.id))
+        if dependent is not None and dependent.status == TaskStatus.BLOCKED
+    ]
     task.complete()
-    db.save_tasks(tasks)
+    # Conclusão e desbloqueio dos dependentes na mesma escrita
+    db.update_task(task, refresh_blocked=True)
     console.print(f"[green]✓[/green] Tarefa '{task.title}' concluída! 🎉")
+    for unblocked in map(db.get_task, blocked):
+        if unblocked is not None and unblocked.status != TaskStatus.BLOCKED:
+            console.print(f"[green]🔓[/green] '{unblocked.title}' desbloqueada.")
 
 
 @app.command("dashboard")
-def show_dashboard():
+def show_dashboard(
+    as_of: Optional[str] = typer.Option(
+        None, "--as-of", help="Exibe o dashboard como estava/estará nesta data"
+    ),
+):
     """
     Exibe dashboard completo com visão geral do progresso.
     """
-    tasks = db.load_tasks()
-    milestones = db.load_milestones()
+    today = _resolve_today(as_of)
+    summary = summarize_repository(db, today)
+    # Só os três primeiros por data alvo, direto da consulta ordenada
+    milestones = db.milestones_by_date(limit=3)
 
-    # Estatísticas
-    total = len(tasks)
-    completed = len([t for t in tasks if t.status == TaskStatus.COMPLETED])
-    in_progress = len([t for t in tasks if t.status == TaskStatus.IN_PROGRESS])
-    overdue = len([t for t in tasks if t.is_overdue()])
+    # Sobrecarga: períodos em que os prazos de alta prioridade se acumulam
+    crunches = crunch_report(db, today).intervals[:3]
 
-    # Layout
+    # Layout (o aviso de sobrecarga só aparece quando há sobrecarga)
     layout = Layout()
     layout.split_column(
         Layout(name="header", size=3),
         Layout(name="stats", size=8),
         Layout(name="urgent", size=10),
+        *([Layout(name="crunch", size=len(crunches) + 2)] if crunches else []),
         Layout(name="milestones", size=10),
     )
 
@@ -219,32 +301,26 @@ def show_dashboard():
     layout["header"].update(
         Panel(
             "[bold cyan]PhD Progress Tracker[/bold cyan] 📊",
-            subtitle=f"Data: {date.today().strftime('%d/%m/%Y')}",
+            subtitle=f"Data: {today.strftime('%d/%m/%Y')}",
         )
     )
 
-    # Stats
+    # Stats (vetorizadas com TaskFrame quando NumPy está instalado)
     stats_table = Table(show_header=False, box=box.SIMPLE)
     stats_table.add_column("Métrica", style="bold")
     stats_table.add_column("Valor", style="cyan")
-    stats_table.add_row("Total de Tarefas", str(total))
-    stats_table.add_row("Concluídas", f"[green]{completed}[/green]")
-    stats_table.add_row("Em Progresso", f"[yellow]{in_progress}[/yellow]")
-    stats_table.add_row("Atrasadas", f"[red]{overdue}[/red]")
+    stats_table.add_row("Total de Tarefas", str(summary.total))
+    stats_table.add_row("Concluídas", f"[green]{summary.completed}[/green]")
+    stats_table.add_row("Em Progresso", f"[yellow]{summary.in_progress}[/yellow]")
+    stats_table.add_row("Atrasadas", f"[red]{summary.overdue}[/red]")
 
-    if total > 0:
-        progress_pct = (completed / total) * 100
-        stats_table.add_row("Progresso", f"{progress_pct:.1f}%")
+    if summary.total > 0:
+        stats_table.add_row("Progresso", f"{summary.progress_pct:.1f}%")
 
     layout["stats"].update(Panel(stats_table, title="📈 Estatísticas"))
 
     # Tarefas urgentes (próximos 7 dias)
-    urgent_tasks = [
-        t
-        for t in tasks
-        if 0 <= t.days_remaining() <= 7 and t.status != TaskStatus.COMPLETED
-    ]
-    urgent_tasks = sorted(urgent_tasks, key=lambda t: t.deadline)[:5]
+    urgent_tasks = upcoming_tasks(db, days=7, today=today, limit=5)
 
     if urgent_tasks:
         urgent_table = Table(box=box.SIMPLE)
@@ -252,7 +328,7 @@ def show_dashboard():
         urgent_table.add_column("Prazo", style="yellow")
 
         for task in urgent_tasks:
-            days_text, color = format_days_remaining(task.days_remaining())
+            days_text, color = format_days_remaining(task.days_remaining(today))
             urgent_table.add_row(task.title, f"[{color}]{days_text}[/{color}]")
 
         layout["urgent"].update(Panel(urgent_table, title="⚠️  Tarefas Urgentes"))
@@ -263,6 +339,19 @@ def show_dashboard():
             )
         )
 
+    if crunches:
+        lines = [
+            f"[red]{interval.start.strftime('%d/%m')}–"
+            f"{interval.end.strftime('%d/%m')}[/red]: "
+            f"até {interval.peak_load:.1f}h/dia, {len(interval.tasks)} tarefa(s) — "
+            + ", ".join(task.title for task in interval.tasks[:3])
+            + ("…" if len(interval.tasks) > 3 else "")
+            for interval in crunches
+        ]
+        layout["crunch"].update(
+            Panel("\n".join(lines), title="🔥 Sobrecarga à vista", border_style="red")
+        )
+
     # Milestones
     if milestones:
         milestone_table = Table(box=box.SIMPLE)
@@ -270,8 +359,8 @@ def show_dashboard():
         milestone_table.add_column("Data Alvo", style="cyan")
         milestone_table.add_column("Tempo Restante", style="yellow")
 
-        for milestone in sorted(milestones, key=lambda m: m.target_date)[:3]:
-            days = milestone.days_until()
+        for milestone in milestones:
+            days = milestone.days_until(today)
             days_text, color = format_days_remaining(days)
             status = "✅" if milestone.is_achieved else "🎯"
 
@@ -304,14 +393,839 @@ def add_milestone(
         raise typer.Exit(1)
 
     milestone = Milestone(
-        id=str(uuid.uuid4())[:8],
+        id=new_id(),
         title=title,
         description=description,
         target_date=target,
     )
 
-    milestones = db.load_milestones()
-    milestones.append(milestone)
-    db.save_milestones(milestones)
+    db.add_milestone(milestone)
 
     console.print(f"[green]✓[/green] Marco '{title}' adicionado!")
+
+
+@app.command("migrate-ids")
+def migrate_ids():
+    """
+    Converte IDs antigos para IDs ordenados pelo tempo.
+
+    Os IDs antigos continuam aceitos pelos comandos e pela API.
+    """
+    if not isinstance(db, HistoryRepository):
+        console.print("[yellow]Migração não suportada por este armazenamento.[/yellow]")
+        raise typer.Exit(1)
+
+    migrated = db.migrate_ids()
+    if migrated:
+        console.print(
+            f"[green]✓[/green] {migrated} IDs migrados; os antigos continuam válidos."
+        )
+    else:
+        console.print("[green]Todos os IDs já estão no formato novo.[/green]")
+
+
+EVENT_LABELS = {
+    EventKind.CREATED: "criação",
+    EventKind.UPDATED: "edição",
+    EventKind.COMPLETED: "conclusão",
+    EventKind.DELETED: "remoção",
+}
+
+
+def _move_history(redo: bool) -> None:
+    if not isinstance(db, HistoryRepository):
+        console.print(
+            "[yellow]Histórico não suportado por este armazenamento.[/yellow]"
+        )
+        raise typer.Exit(1)
+
+    event = db.redo() if redo else db.undo()
+    if event is None:
+        console.print(
+            f"[yellow]Nada para {'refazer' if redo else 'desfazer'}.[/yellow]"
+        )
+        return
+    state = event.after if event.after is not None else event.before
+    title = state.get("title") or getattr(db.get_task(event.task_id), "title", "")
+    label = f"'{title}'" if title else event.task_id
+    console.print(
+        f"[green]✓[/green] {'Refeita' if redo else 'Desfeita'}: "
+        f"{EVENT_LABELS[event.kind]} da tarefa {label}."
+    )
+
+
+@app.command("undo")
+def undo():
+    """
+    Desfaz a última alteração em tarefas (add, edit, complete ou remoção pela API).
+
+    Pode ser repetido para voltar mais passos.
+    """
+    _move_history(redo=False)
+
+
+@app.command("redo")
+def redo():
+    """Refaz a última alteração desfeita com 'phd undo'."""
+    _move_history(redo=True)
+
+
+@app.command("stalled")
+def show_stalled(
+    days: int = typer.Option(
+        14, "--days", "-d", min=0, help="Dias mínimos no status atual"
+    ),
+    status: Optional[List[str]] = typer.Option(
+        None,
+        "--status",
+        "-s",
+        help="Status a verificar (padrão: IN_PROGRESS e BLOCKED; pode repetir)",
+    ),
+):
+    """
+    Lista tarefas paradas no mesmo status há mais de N dias.
+
+    Exemplos:
+        phd stalled --days 7
+        phd stalled --status TODO --days 30
+    """
+    if not isinstance(db, HistoryRepository):
+        console.print(
+            "[yellow]Histórico de status não suportado por este armazenamento.[/yellow]"
+        )
+        raise typer.Exit(1)
+
+    try:
+        statuses = (
+            [TaskStatus[s.upper()] for s in status]
+            if status
+            else [TaskStatus.IN_PROGRESS, TaskStatus.BLOCKED]
+        )
+    except KeyError as e:
+        console.print(f"[red]Erro: status inválido {e}.[/red]")
+        raise typer.Exit(1)
+
+    now = datetime.now()
+    stalled = db.stalled_tasks(days, statuses, now)
+    if not stalled:
+        console.print(f"[green]Nenhuma tarefa parada há mais de {days} dias.[/green]")
+        return
+
+    table = Table(title=f"🐢 Tarefas paradas há mais de {days} dias", box=box.ROUNDED)
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Título", style="white")
+    table.add_column("Status", style="green")
+    table.add_column("Desde", style="yellow")
+    table.add_column("Dias", style="red", justify="right")
+    for task, since in stalled:
+        table.add_row(
+            task.id,
+            task.title,
+            task.status.value,
+            since.strftime("%d/%m/%Y"),
+            str((now - since).days),
+        )
+
+    console.print(table)
+
+
+@app.command("next")
+def show_next(
+    k: int = typer.Option(DEFAULT_K, "--k", "-k", min=1, help="Número de tarefas"),
+    priority_weight: float = typer.Option(
+        ScoreWeights.priority, "--priority-weight", help="Peso da prioridade"
+    ),
+    deadline_weight: float = typer.Option(
+        ScoreWeights.deadline, "--deadline-weight", help="Peso da proximidade do prazo"
+    ),
+    age_weight: float = typer.Option(
+        ScoreWeights.age, "--age-weight", help="Peso da idade da tarefa"
+    ),
+    in_progress_weight: float = typer.Option(
+        ScoreWeights.in_progress,
+        "--in-progress-weight",
+        help="Bônus de tarefas em progresso",
+    ),
+    blocked_weight: float = typer.Option(
+        ScoreWeights.blocked,
+        "--blocked-weight",
+        help="Bônus (negativo: penalidade) de tarefas bloqueadas",
+    ),
+):
+    """
+    Sugere no que trabalhar agora: as k tarefas abertas de maior pontuação.
+
+    A pontuação combina prioridade, proximidade do prazo, idade e status
+    (em progresso sobe, bloqueada desce).
+
+    Exemplos:
+        phd next
+        phd next -k 10 --deadline-weight 6
+    """
+    weights = ScoreWeights(
+        priority=priority_weight,
+        deadline=deadline_weight,
+        age=age_weight,
+        in_progress=in_progress_weight,
+        blocked=blocked_weight,
+    )
+    today = date.today()
+    ranked = next_tasks(db, k, weights, today)
+    if not ranked:
+        console.print("[green]Nenhuma tarefa aberta![/green]")
+        return
+
+    table = Table(title="🎯 No que trabalhar agora", box=box.ROUNDED)
+    table.add_column("#", style="dim", justify="right")
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Título", style="white")
+    table.add_column("Prioridade", style="magenta")
+    table.add_column("Prazo", style="yellow")
+    table.add_column("Status", style="green")
+    table.add_column("Pontos", style="bold", justify="right")
+    for position, item in enumerate(ranked, start=1):
+        days_text, color = format_days_remaining(item.task.days_remaining(today))
+        table.add_row(
+            str(position),
+            item.task.id,
+            item.task.title,
+            item.task.priority.value,
+            f"[{color}]{days_text}[/{color}]",
+            item.task.status.value,
+            f"{item.score:.2f}",
+        )
+    console.print(table)
+
+
+WEEKDAY_ABBR = "Seg Ter Qua Qui Sex Sáb Dom".split()
+
+
+def _format_hours(hours: float) -> str:
+    """Horas como "2h30"."""
+    minutes = round(hours * 60)
+    return (
+        f"{minutes // 60}h{minutes % 60:02d}" if minutes % 60 else f"{minutes // 60}h"
+    )
+
+
+@app.command("plan")
+def show_plan(
+    start: Optional[str] = typer.Option(
+        None, "--from", "-f", help="Primeiro dia do plano (YYYY-MM-DD ou +Nd)"
+    ),
+    days: int = typer.Option(
+        DEFAULT_DAYS, "--days", "-n", min=1, max=MAX_DAYS, help="Dias exibidos"
+    ),
+    hours: float = typer.Option(
+        Capacity.daily_hours, "--hours", "-H", help="Horas de trabalho por dia"
+    ),
+    default_effort: float = typer.Option(
+        Capacity.default_effort,
+        "--default-effort",
+        help="Esforço (horas) assumido para tarefas sem estimativa",
+    ),
+    weekends: bool = typer.Option(
+        False, "--weekends", help="Também planeja trabalho nos fins de semana"
+    ),
+):
+    """
+    Monta um plano dia a dia das tarefas abertas.
+
+    As tarefas são encaixadas por prazo mais próximo primeiro, respeitando
+    as horas disponíveis por dia; tarefas maiores que um dia são divididas.
+    O esforço vem de ``phd add/edit --effort``.
+
+    Exemplos:
+        phd plan
+        phd plan --from +7d -n 21 --hours 4 --weekends
+    """
+    first = _resolve_today(start)
+    try:
+        capacity = Capacity(hours, default_effort, weekends)
+        plan = build_plan(db, first, days, capacity)
+    except ValueError as e:
+        console.print(f"[red]Erro: {e}[/red]")
+        raise typer.Exit(1)
+    if not plan.tasks:
+        console.print("[green]Nenhuma tarefa aberta![/green]")
+        return
+
+    table = Table(
+        title=f"🗓️  Plano ({_format_hours(capacity.daily_hours)} por dia)",
+        box=box.ROUNDED,
+    )
+    table.add_column("Dia", style="cyan", no_wrap=True)
+    table.add_column("Tarefa", style="white")
+    table.add_column("Horas", style="bold", justify="right")
+    table.add_column("Prazo", style="yellow")
+    for day in plan.days:
+        if not day.slots:
+            continue
+        for i, slot in enumerate(day.slots):
+            days_text, color = format_days_remaining(
+                (slot.task.deadline - day.day).days
+            )
+            table.add_row(
+                (
+                    f"{WEEKDAY_ABBR[day.day.weekday()]} {day.day.strftime('%d/%m')}"
+                    if i == 0
+                    else ""
+                ),
+                slot.task.title,
+                _format_hours(slot.hours),
+                f"[{color}]{days_text}[/{color}]",
+            )
+        table.add_section()
+    console.print(table)
+
+    finish = plan.finish.strftime("%d/%m/%Y")
+    console.print(f"Todas as {len(plan.tasks)} tarefas abertas terminam em {finish}.")
+    late = plan.late
+    if late:
+        console.print(
+            f"[red]⚠️  {len(late)} tarefa(s) terminam depois do prazo com esta "
+            "capacidade:[/red]"
+        )
+        for planned in late[:5]:
+            console.print(
+                f"  [red]•[/red] {planned.task.title} — prazo "
+                f"{planned.task.deadline.strftime('%d/%m/%Y')}, "
+                f"termina {planned.finish.strftime('%d/%m/%Y')}"
+            )
+
+
+def _slack_table(title: str, rows: List[TaskSlack]) -> Table:
+    """Tabela de tarefas com término mais cedo, limite e folga."""
+    table = Table(title=title, box=box.ROUNDED)
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Título", style="white")
+    table.add_column("Status", style="green")
+    table.add_column("Termina em", style="yellow")
+    table.add_column("Limite", style="yellow")
+    table.add_column("Folga", style="bold", justify="right")
+    for row in rows:
+        color = "red" if row.critical else "green"
+        table.add_row(
+            row.task.id,
+            row.task.title,
+            row.task.status.value,
+            row.earliest_finish.strftime("%d/%m/%Y"),
+            row.latest_finish.strftime("%d/%m/%Y"),
+            f"[{color}]{row.slack:.1f}d[/{color}]",
+        )
+    return table
+
+
+@app.command("depends")
+def manage_dependencies(
+    task_id: Optional[str] = typer.Argument(
+        None, help="ID da tarefa (sem ID: mostra o caminho crítico)"
+    ),
+    on: Optional[List[str]] = typer.Option(
+        None, "--on", "-o", help="Pré-requisito a adicionar (pode repetir)"
+    ),
+    remove: Optional[List[str]] = typer.Option(
+        None, "--remove", "-r", help="Pré-requisito a remover (pode repetir)"
+    ),
+    hours: float = typer.Option(
+        Capacity.daily_hours, "--hours", "-H", help="Horas de trabalho por dia"
+    ),
+    default_effort: float = typer.Option(
+        Capacity.default_effort,
+        "--default-effort",
+        help="Esforço (horas) assumido para tarefas sem estimativa",
+    ),
+):
+    """
+    Gerencia as dependências entre tarefas e mostra o caminho crítico.
+
+    Uma tarefa com pré-requisito aberto fica bloqueada e volta para "A Fazer"
+    quando todos eles são concluídos. Dependências que fechariam um ciclo
+    são recusadas. A folga é quantos dias a tarefa pode atrasar sem estourar
+    o próprio prazo nem o das tarefas que dependem dela.
+
+    Exemplos:
+        phd depends
+        phd depends <ID> --on <ID_PRÉ-REQUISITO>
+        phd depends <ID> --remove <ID_PRÉ-REQUISITO>
+    """
+    try:
+        capacity = Capacity(hours, default_effort)
+    except ValueError as e:
+        console.print(f"[red]Erro: {e}[/red]")
+        raise typer.Exit(1)
+
+    if task_id is None:
+        if on or remove:
+            console.print("[red]Informe a tarefa para --on/--remove.[/red]")
+            raise typer.Exit(1)
+        path = dependency_graph(db, capacity).critical_path()
+        if not path:
+            console.print("[green]Nenhuma tarefa aberta![/green]")
+            return
+        console.print(_slack_table("🧭 Caminho crítico", path))
+        return
+
+    task = db.get_task(task_id)
+    if not task:
+        console.print(f"[red]Tarefa {task_id} não encontrada.[/red]")
+        raise typer.Exit(1)
+
+    status = task.status
+    for depends_on in on or []:
+        try:
+            added = db.add_dependency(task.id, depends_on, refresh_blocked=True)
+        except ValueError as e:
+            console.print(f"[red]Erro: {e}[/red]")
+            raise typer.Exit(1)
+        if added:
+            console.print(f"[green]✓[/green] '{task.title}' depende de {depends_on}.")
+    for depends_on in remove or []:
+        if db.remove_dependency(task.id, depends_on, refresh_blocked=True):
+            console.print(f"[green]✓[/green] Dependência de {depends_on} removida.")
+        else:
+            console.print(
+                f"[yellow]'{task.title}' não depende de {depends_on}.[/yellow]"
+            )
+    task = db.get_task(task.id) or task
+    if task.status != status:
+        console.print(f"Status de '{task.title}': {task.status.value}.")
+
+    prerequisites = [db.get_task(i) for i in db.dependencies(task.id)]
+    if not prerequisites:
+        console.print(f"'{task.title}' não tem pré-requisitos.")
+    else:
+        table = Table(title=f"🔗 Pré-requisitos de '{task.title}'", box=box.ROUNDED)
+        table.add_column("ID", style="cyan", no_wrap=True)
+        table.add_column("Título", style="white")
+        table.add_column("Status", style="green")
+        for prerequisite in prerequisites:
+            table.add_row(
+                prerequisite.id, prerequisite.title, prerequisite.status.value
+            )
+        console.print(table)
+
+    schedule = dependency_graph(db, capacity).slack(task.id)
+    if schedule is not None:
+        color = "red" if schedule.critical else "green"
+        console.print(
+            f"Termina no mínimo em {schedule.earliest_finish.strftime('%d/%m/%Y')}; "
+            f"limite {schedule.latest_finish.strftime('%d/%m/%Y')} "
+            f"([{color}]folga {schedule.slack:.1f}d[/{color}])."
+        )
+
+
+FORECAST_LABELS = {0.5: "p50", 0.85: "p85", 0.95: "p95"}
+
+
+@app.command("forecast")
+def show_forecast(
+    milestone_id: str = typer.Argument(..., help="ID do marco"),
+    trials: int = typer.Option(
+        DEFAULT_TRIALS, "--trials", "-n", min=100, help="Número de simulações"
+    ),
+    seed: Optional[int] = typer.Option(
+        None, "--seed", min=0, help="Semente para repetir uma execução"
+    ),
+    history_days: int = typer.Option(
+        DEFAULT_HISTORY_DAYS,
+        "--history",
+        "-H",
+        min=7,
+        help="Dias de histórico de conclusões usados na simulação",
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-j", min=1, help="Processos (padrão: todos os núcleos)"
+    ),
+):
+    """
+    Chance de concluir as tarefas abertas até a data de um marco (Monte Carlo).
+
+    Reamostra as conclusões por dia do histórico recente para simular
+    quando as tarefas abertas terminam. A mesma semente repete o resultado.
+
+    Exemplos:
+        phd forecast 01J0ABC...
+        phd forecast 01J0ABC... --trials 500000 --seed 42
+    """
+    milestone = db.get_milestone(milestone_id)
+    if milestone is None:
+        console.print(f"[red]Marco {milestone_id} não encontrado.[/red]")
+        raise typer.Exit(1)
+
+    try:
+        result = forecast_milestone(
+            db, milestone, trials, seed, history_days, workers=workers
+        )
+    except ForecastUnavailable:
+        console.print(
+            "[yellow]Previsão disponível apenas com NumPy "
+            "(poetry install --extras numpy).[/yellow]"
+        )
+        raise typer.Exit(1)
+
+    color = (
+        "green"
+        if result.probability >= 0.85
+        else "yellow" if result.probability >= 0.5 else "red"
+    )
+    table = Table(show_header=False, box=box.SIMPLE)
+    table.add_column("Métrica", style="bold")
+    table.add_column("Valor", style="cyan")
+    table.add_row("Data alvo", milestone.target_date.strftime("%d/%m/%Y"))
+    table.add_row("Tarefas abertas", str(result.remaining))
+    table.add_row(
+        "Vazão histórica",
+        f"{result.daily_throughput:.2f} tarefas/dia "
+        f"(desde {result.history_start.strftime('%d/%m/%Y')})",
+    )
+    table.add_row(
+        "Chance de concluir a tempo",
+        f"[bold {color}]{result.probability:.1%}[/bold {color}]",
+    )
+    for q, day in result.percentiles.items():
+        table.add_row(
+            f"Conclusão ({FORECAST_LABELS[q]})",
+            day.strftime("%d/%m/%Y") if day else "[red]sem previsão[/red]",
+        )
+
+    console.print(
+        Panel(
+            table,
+            title=f"🔮 Previsão: {milestone.title}",
+            subtitle=f"{result.trials} simulações, semente {result.seed}",
+        )
+    )
+
+
+snapshot_app = typer.Typer(help="Snapshot colunar somente leitura para análises.")
+app.add_typer(snapshot_app, name="snapshot")
+
+
+@snapshot_app.command("build")
+def build_snapshot_file(
+    output: Optional[str] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help=f"Arquivo de saída (padrão: <dados>/{SNAPSHOT_FILENAME})",
+    ),
+):
+    """
+    Grava tarefas e marcos em um arquivo colunar para ser mapeado em memória.
+
+    Scripts de análise abrem o arquivo com
+    phd_progress_tracker.utils.snapshot.Snapshot, sem consultar o banco.
+    """
+    path = output or os.path.join(settings.data_dir, SNAPSHOT_FILENAME)
+    revision = build_snapshot(db, path)
+    size_kb = os.path.getsize(path) / 1024
+    console.print(
+        f"[green]✓[/green] Snapshot gravado em {path} "
+        f"(revisão {revision}, {size_kb:.1f} KiB)"
+    )
+
+
+tenant_app = typer.Typer(help="Tenants da API (cabeçalho X-Tenant-ID).")
+app.add_typer(tenant_app, name="tenant")
+
+
+@tenant_app.command("create")
+def create_tenant(tenant_id: str = typer.Argument(..., help="ID do tenant")):
+    """
+    Provisiona um tenant, com banco próprio em <dados>/tenants/<ID>/.
+
+    A API só atende tenants já provisionados.
+    """
+    if settings.storage_backend == "memory":
+        console.print(
+            "[yellow]No armazenamento em memória os tenants são criados "
+            "pela própria API.[/yellow]"
+        )
+        raise typer.Exit(1)
+    pool = TenantDatabasePool(settings.data_dir)
+    try:
+        created = pool.create(tenant_id)
+    except ValueError as e:
+        console.print(f"[red]Erro: {e}[/red]")
+        raise typer.Exit(1)
+    if created:
+        console.print(f"[green]✓[/green] Tenant '{tenant_id}' criado.")
+    else:
+        console.print(f"[yellow]Tenant '{tenant_id}' já existe.[/yellow]")
+
+
+stats_app = typer.Typer(help="Estatísticas das tarefas.", invoke_without_command=True)
+app.add_typer(stats_app, name="stats")
+
+FACET_LABELS = {
+    "status": "Status",
+    "priority": "Prioridade",
+    "category": "Categoria",
+    "month": "Mês do Prazo",
+}
+
+
+@stats_app.callback()
+def show_stats(
+    ctx: typer.Context,
+    by: str = typer.Option(
+        "category", "--by", "-b", help="status, priority, category ou month"
+    ),
+):
+    """
+    Conta tarefas agrupadas por status, prioridade, categoria ou mês.
+
+    Exemplos:
+        phd stats --by category
+        phd stats --by month
+    """
+    if ctx.invoked_subcommand is not None:
+        return
+    if by not in FACETS:
+        console.print(
+            f"[red]Erro: agrupamento inválido '{by}' "
+            f"(use {', '.join(FACETS)}).[/red]"
+        )
+        raise typer.Exit(1)
+
+    _, facets = db.task_facets()
+    counts = facets[by]
+    if not counts:
+        console.print("[yellow]Nenhuma tarefa encontrada.[/yellow]")
+        return
+
+    labels = {"status": TaskStatus, "priority": TaskPriority}
+    total = sum(counts.values())
+    table = Table(title=f"📊 Tarefas por {FACET_LABELS[by]}", box=box.ROUNDED)
+    table.add_column(FACET_LABELS[by], style="magenta")
+    table.add_column("Tarefas", style="cyan", justify="right")
+    table.add_column("%", style="green", justify="right")
+    for key, count in counts.items():
+        label = labels[by][key].value if by in labels else key
+        table.add_row(label, str(count), f"{count / total * 100:.1f}%")
+
+    console.print(table)
+
+
+@stats_app.command("cycle-time")
+def show_cycle_time(
+    start: Optional[str] = typer.Option(
+        None, "--from", help="Início do período (YYYY-MM-DD ou +Nd)"
+    ),
+    end: Optional[str] = typer.Option(
+        None, "--to", help="Fim do período (YYYY-MM-DD ou +Nd)"
+    ),
+    weeks: int = typer.Option(
+        12, "--weeks", "-w", min=1, help="Semanas exibidas na tabela de vazão"
+    ),
+):
+    """
+    Tempo de ciclo (criação → conclusão) e tarefas concluídas por semana.
+
+    Mostra p50/p90/p99 em dias, no geral, por categoria e por prioridade.
+    O período é arredondado para semanas inteiras (segunda a domingo).
+
+    Exemplos:
+        phd stats cycle-time
+        phd stats cycle-time --from 2026-01-01 --to 2026-03-31
+    """
+    try:
+        report = cycle_time_report(
+            db,
+            parse_date_input(start) if start else None,
+            parse_date_input(end) if end else None,
+        )
+    except ValueError as e:
+        console.print(f"[red]Erro: {e}[/red]")
+        raise typer.Exit(1)
+
+    if report.overall is None:
+        console.print("[yellow]Nenhuma tarefa concluída no período.[/yellow]")
+        return
+
+    period = f"{report.start.strftime('%d/%m/%Y')} a {report.end.strftime('%d/%m/%Y')}"
+    table = Table(title=f"⏱️ Tempo de ciclo em dias ({period})", box=box.ROUNDED)
+    table.add_column("Grupo", style="magenta")
+    table.add_column("Tarefas", style="cyan", justify="right")
+    for name in ("p50", "p90", "p99"):
+        table.add_column(name, style="green", justify="right")
+
+    def add_row(label, stats, end_section=False):
+        table.add_row(
+            label,
+            str(stats.count),
+            f"{stats.p50:.1f}",
+            f"{stats.p90:.1f}",
+            f"{stats.p99:.1f}",
+            end_section=end_section,
+        )
+
+    add_row("[bold]Geral[/bold]", report.overall, end_section=True)
+    for i, (category, stats) in enumerate(report.by_category.items()):
+        add_row(category, stats, end_section=i == len(report.by_category) - 1)
+    for priority, stats in report.by_priority.items():
+        add_row(priority.value, stats)
+    console.print(table)
+
+    throughput = Table(title="📦 Concluídas por semana", box=box.ROUNDED)
+    throughput.add_column("Semana", style="yellow")
+    throughput.add_column("Concluídas", style="cyan", justify="right")
+    throughput.add_column("Por categoria", style="white")
+    for week, by_category in report.throughput[-weeks:]:
+        throughput.add_row(
+            week.strftime("%d/%m/%Y"),
+            str(sum(by_category.values())),
+            ", ".join(f"{c}: {n}" for c, n in by_category.items()),
+        )
+    console.print(throughput)
+
+
+BURNDOWN_BAR_WIDTH = 30
+PERIOD_FORMATS = {"day": "%d/%m", "week": "%d/%m/%Y", "month": "%m/%Y"}
+PERIOD_LABELS = {"day": "dia", "week": "semana", "month": "mês"}
+
+
+@stats_app.command("burndown")
+def show_burndown(
+    start: Optional[str] = typer.Option(
+        None, "--from", help="Início (YYYY-MM-DD ou +Nd; padrão: 90 dias antes do fim)"
+    ),
+    end: Optional[str] = typer.Option(
+        None, "--to", help="Fim (YYYY-MM-DD ou +Nd; padrão: hoje)"
+    ),
+    granularity: str = typer.Option(
+        "day", "--granularity", "-g", help="day, week ou month (a mais fina aceita)"
+    ),
+    window: Optional[int] = typer.Option(
+        None, "--window", "-w", min=1, help="Períodos da média de velocidade"
+    ),
+    max_points: int = typer.Option(
+        30, "--max-points", min=5, help="Máximo de linhas antes de agrupar"
+    ),
+):
+    """
+    Gráfico de burnup (concluídas x total) e abertas por período, com velocidade.
+
+    Intervalos longos são agrupados por semana ou mês automaticamente.
+
+    Exemplos:
+        phd stats burndown
+        phd stats burndown --from 2026-01-01 --granularity week
+    """
+    try:
+        series = burndown_report(
+            db,
+            parse_date_input(start) if start else None,
+            parse_date_input(end) if end else None,
+            granularity,
+            window,
+            max_points,
+        )
+    except ValueError as e:
+        console.print(f"[red]Erro: {e}[/red]")
+        raise typer.Exit(1)
+
+    scale = max((p.total for p in series.points), default=0) or 1
+    table = Table(
+        title=f"📉 Burndown por {PERIOD_LABELS[series.granularity]}",
+        caption=(
+            "[green]█[/green] concluídas  [red]░[/red] abertas  "
+            f"(velocidade: média de {series.window} períodos)"
+        ),
+        box=box.ROUNDED,
+    )
+    table.add_column("Período", style="yellow", no_wrap=True)
+    table.add_column("Progresso", no_wrap=True)
+    table.add_column("Abertas", style="red", justify="right")
+    table.add_column("Concluídas", style="green", justify="right")
+    table.add_column("Velocidade", style="cyan", justify="right")
+    for point in series.points:
+        done = round(point.done / scale * BURNDOWN_BAR_WIDTH)
+        pending = round(point.total / scale * BURNDOWN_BAR_WIDTH) - done
+        table.add_row(
+            point.start.strftime(PERIOD_FORMATS[series.granularity]),
+            f"[green]{'█' * done}[/green][red]{'░' * pending}[/red]",
+            str(point.open),
+            str(point.done),
+            f"{point.velocity:.1f}",
+        )
+    console.print(table)
+
+
+HEATMAP_COLORS = ["grey23", "dark_green", "green4", "green3", "bright_green"]
+HEATMAP_DAYS = ["Seg", "", "Qua", "", "Sex", "", ""]
+MONTH_ABBR = "Jan Fev Mar Abr Mai Jun Jul Ago Set Out Nov Dez".split()
+METRIC_LABELS = {
+    "completed": "concluídas",
+    "created": "criadas",
+    "all": "criadas + concluídas",
+}
+
+
+def _render_heatmap(year: int, counts) -> Text:
+    """Mapa de um ano: uma coluna por semana, uma linha por dia da semana."""
+    grid = heatmap_grid(year, counts)
+    peak = max(counts.values(), default=0)
+    offset = date(year, 1, 1).weekday()
+    months = [" "] * len(grid[0])
+    for month, name in enumerate(MONTH_ABBR, start=1):
+        column = (date(year, month, 1).timetuple().tm_yday - 1 + offset) // 7
+        for i, char in enumerate(name):
+            if column + i < len(months):
+                months[column + i] = char
+    text = Text("    " + "".join(months) + "\n", style="dim")
+    for label, row in zip(HEATMAP_DAYS, grid):
+        text.append(f"{label:<4}", style="dim")
+        for count in row:
+            if count is None:
+                text.append(" ")
+            else:
+                text.append("■", style=HEATMAP_COLORS[intensity(count, peak)])
+        text.append("\n")
+    text.rstrip()
+    return text
+
+
+@stats_app.command("activity")
+def show_activity(
+    year: Optional[int] = typer.Option(
+        None, "--year", "-y", help="Último ano exibido (padrão: o atual)"
+    ),
+    years: int = typer.Option(1, "--years", "-n", min=1, help="Número de anos"),
+    metric: str = typer.Option(
+        "completed", "--metric", "-m", help="completed, created ou all"
+    ),
+):
+    """
+    Mapa de atividade por dia (estilo GitHub), um painel por ano.
+
+    Exemplos:
+        phd stats activity
+        phd stats activity --years 3 --metric all
+    """
+    if metric not in METRICS:
+        console.print(f"[red]Erro: métrica inválida '{metric}'.[/red]")
+        raise typer.Exit(1)
+    last = year or date.today().year
+    try:
+        report = activity_report(db, last - years + 1, last)
+    except ValueError as e:
+        console.print(f"[red]Erro: {e}[/red]")
+        raise typer.Exit(1)
+
+    legend = Text("menos ")
+    for color in HEATMAP_COLORS:
+        legend.append("■", style=color)
+    legend.append(" mais")
+    for activity in report:
+        counts = activity.counts(metric)
+        console.print(
+            Panel(
+                _render_heatmap(activity.year, counts),
+                title=f"🗓️ {activity.year}: {sum(counts.values())} "
+                f"{METRIC_LABELS[metric]}",
+                subtitle=legend,
+                expand=False,
+            )
+        )
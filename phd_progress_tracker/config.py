@@ -0,0 +1,48 @@
+"""
+Configuração do PhD Progress Tracker via variáveis de ambiente.
+"""
+
+import os
+from dataclasses import dataclass
+
+STORAGE_BACKENDS = ("sqlite", "memory")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Configurações da aplicação.
+
+    Attributes:
+        data_dir: Diretório onde os dados são salvos (PHD_DATA_DIR)
+        storage_backend: "sqlite" (padrão) ou "memory" (PHD_STORAGE_BACKEND)
+        forecast_workers: Processos do pool de previsão da API; 0 simula no
+            próprio processo (PHD_FORECAST_WORKERS)
+    """
+
+    data_dir: str = "data"
+    storage_backend: str = "sqlite"
+    forecast_workers: int = 2
+
+    def __post_init__(self) -> None:
+        if self.storage_backend not in STORAGE_BACKENDS:
+            raise ValueError(
+                f"Unknown storage backend {self.storage_backend!r}; "
+                f"expected one of {', '.join(STORAGE_BACKENDS)}"
+            )
+        if self.forecast_workers < 0:
+            raise ValueError(
+                f"forecast_workers must not be negative, got {self.forecast_workers}"
+            )
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Lê as configurações das variáveis de ambiente."""
+        return cls(
+            data_dir=os.environ.get("PHD_DATA_DIR", "data"),
+            storage_backend=os.environ.get("PHD_STORAGE_BACKEND", "sqlite").lower(),
+            forecast_workers=int(os.environ.get("PHD_FORECAST_WORKERS", "2")),
+        )
+
+
+settings = Settings.from_env()
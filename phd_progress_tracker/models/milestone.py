@@ -4,9 +4,10 @@ Modelo para marcos importantes da dissertação.
 
 from dataclasses import dataclass
 from datetime import date
+from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Milestone:
     """
     Representa um marco importante da dissertação.
@@ -23,9 +24,9 @@ class Milestone:
     target_date: date
     is_achieved: bool = False
 
-    def days_until(self) -> int:
-        """Retorna dias até o marco."""
-        delta = self.target_date - date.today()
+    def days_until(self, today: Optional[date] = None) -> int:
+        """Retorna dias até o marco, a partir da data de referência (padrão: hoje)."""
+        delta = self.target_date - (today or date.today())
         return delta.days
 
     def to_dict(self) -> dict:
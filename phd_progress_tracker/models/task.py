@@ -2,6 +2,7 @@
 Modelos de dados para tarefas e marcos da PhD.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Optional
@@ -26,11 +27,14 @@ class TaskPriority(Enum):
     CRITICAL = "Crítica"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Representa uma tarefa da PhD.
 
+    Usa ``__slots__`` (sem ``__dict__`` por instância), o que reduz bastante
+    a memória ao carregar muitas tarefas.
+
     Attributes:
         id: Identificador único da tarefa
         title: Título da tarefa
@@ -41,6 +45,7 @@ class Task:
         category: Categoria (ex: "Coleta de Dados", "Análise", "Escrita")
         created_at: Data de criação
         completed_at: Data de conclusão (se concluída)
+        effort_hours: Esforço estimado em horas (opcional, usado no planejamento)
     """
 
     id: str
@@ -52,15 +57,31 @@ class Task:
     category: str = "Geral"
     created_at: datetime = field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
+    effort_hours: Optional[float] = None
+
+    def days_remaining(self, today: Optional[date] = None) -> int:
+        """
+        Retorna dias restantes até o deadline.
 
-    def days_remaining(self) -> int:
-        """Retorna dias restantes até o deadline."""
-        delta = self.deadline - date.today()
+        Args:
+            today: Data de referência (padrão: hoje). Cálculos em lote devem
+                resolver a data uma única vez e repassá-la aqui.
+        """
+        delta = self.deadline - (today or date.today())
         return delta.days
 
-    def is_overdue(self) -> bool:
-        """Verifica se tarefa está atrasada."""
-        return self.days_remaining() < 0 and self.status != TaskStatus.COMPLETED
+    def is_completed_as_of(self, today: Optional[date] = None) -> bool:
+        """Verifica se a tarefa já estava concluída na data de referência."""
+        if self.status != TaskStatus.COMPLETED:
+            return False
+        return self.completed_at is None or self.completed_at.date() <= (
+            today or date.today()
+        )
+
+    def is_overdue(self, today: Optional[date] = None) -> bool:
+        """Verifica se tarefa está atrasada na data de referência (padrão: hoje)."""
+        today = today or date.today()
+        return self.days_remaining(today) < 0 and not self.is_completed_as_of(today)
 
     def complete(self) -> None:
         """Marca tarefa como concluída."""
@@ -81,6 +102,7 @@ class Task:
             "completed_at": (
                 self.completed_at.isoformat() if self.completed_at else None
             ),
+            "effort_hours": self.effort_hours,
         }
 
     @classmethod
@@ -93,11 +115,12 @@ class Task:
             deadline=date.fromisoformat(data["deadline"]),
             status=TaskStatus[data["status"]],
             priority=TaskPriority[data["priority"]],
-            category=data["category"],
+            category=sys.intern(data["category"]),
             created_at=datetime.fromisoformat(data["created_at"]),
             completed_at=(
                 datetime.fromisoformat(data["completed_at"])
                 if data["completed_at"]
                 else None
             ),
+            effort_hours=data.get("effort_hours"),
         )
@@ -0,0 +1,126 @@
+"""
+Mapa de atividade (estilo GitHub): tarefas criadas e concluídas por dia.
+
+As contagens vêm de ``created_at`` e ``completed_at`` e são pedidas por ano
+inteiro. No SQLite, cada ano é agregado uma única vez (``GROUP BY`` no dia) e
+fica em cache; escritas depois disso só somam ou subtraem nos dias que
+afetaram, então anos encerrados nunca são recalculados e o ano corrente é
+mantido incrementalmente (ver ``Database.activity_counts``).
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from phd_progress_tracker.models.task import Task, TaskStatus
+
+METRICS = ("completed", "created", "all")
+# Anos por consulta
+MAX_YEARS = 20
+# Intensidades do mapa, de 0 (nada) a LEVELS (o dia mais ativo)
+LEVELS = 4
+
+# dia -> (criadas, concluídas); só dias com alguma atividade
+DayCounts = Dict[date, Tuple[int, int]]
+
+
+def activity_dates(task: Task) -> Tuple[Optional[date], Optional[date]]:
+    """Dia de criação e dia de conclusão (None se não concluída) de uma tarefa."""
+    completed = (
+        task.completed_at.date()
+        if task.status == TaskStatus.COMPLETED and task.completed_at is not None
+        else None
+    )
+    return task.created_at.date(), completed
+
+
+def count_activity(tasks: Iterable[Task], first_year: int, last_year: int) -> DayCounts:
+    """Conta criações e conclusões por dia nos anos pedidos, em uma passada."""
+    counts: Dict[date, List[int]] = {}
+    for task in tasks:
+        for column, day in enumerate(activity_dates(task)):
+            if day is not None and first_year <= day.year <= last_year:
+                counts.setdefault(day, [0, 0])[column] += 1
+    return {day: (created, completed) for day, (created, completed) in counts.items()}
+
+
+@dataclass(frozen=True)
+class ActivityYear:
+    """Contagens diárias de um ano."""
+
+    year: int
+    days: DayCounts
+
+    @property
+    def created(self) -> int:
+        """Tarefas criadas no ano."""
+        return sum(created for created, _ in self.days.values())
+
+    @property
+    def completed(self) -> int:
+        """Tarefas concluídas no ano."""
+        return sum(completed for _, completed in self.days.values())
+
+    def counts(self, metric: str = "completed") -> Dict[date, int]:
+        """Contagem por dia de uma métrica ("completed", "created" ou "all")."""
+        if metric == "created":
+            return {day: c for day, (c, _) in self.days.items() if c}
+        if metric == "completed":
+            return {day: d for day, (_, d) in self.days.items() if d}
+        return {day: c + d for day, (c, d) in self.days.items()}
+
+
+def activity_report(
+    repo,
+    first_year: Optional[int] = None,
+    last_year: Optional[int] = None,
+    today: Optional[date] = None,
+) -> List[ActivityYear]:
+    """
+    Contagens diárias de ``first_year`` a ``last_year`` (padrão: ano corrente).
+
+    Raises:
+        ValueError: Se first_year > last_year ou o intervalo passar de MAX_YEARS
+    """
+    current = (today or date.today()).year
+    last_year = last_year or current
+    first_year = first_year or last_year
+    if first_year > last_year:
+        raise ValueError(
+            f"first_year ({first_year}) must not be after last_year ({last_year})"
+        )
+    if last_year - first_year >= MAX_YEARS:
+        raise ValueError(f"At most {MAX_YEARS} years per request")
+    counts = repo.activity_counts(first_year, last_year)
+    years: Dict[int, DayCounts] = {
+        year: {} for year in range(first_year, last_year + 1)
+    }
+    for day in sorted(counts):
+        years[day.year][day] = counts[day]
+    return [ActivityYear(year, days) for year, days in years.items()]
+
+
+def intensity(count: int, peak: int) -> int:
+    """Nível de 0 a ``LEVELS`` de um dia, relativo ao dia mais ativo."""
+    if count <= 0 or peak <= 0:
+        return 0
+    return min(LEVELS, math.ceil(LEVELS * count / peak))
+
+
+def heatmap_grid(year: int, counts: Dict[date, int]) -> List[List[Optional[int]]]:
+    """
+    Grade do mapa: 7 linhas (segunda a domingo) por uma coluna por semana.
+
+    Células fora do ano são None; as demais têm a contagem do dia.
+    """
+    first = date(year, 1, 1)
+    start = first - timedelta(days=first.weekday())
+    weeks = (date(year, 12, 31) - start).days // 7 + 1
+    grid: List[List[Optional[int]]] = [[None] * weeks for _ in range(7)]
+    day = first
+    while day.year == year:
+        offset = (day - start).days
+        grid[offset % 7][offset // 7] = counts.get(day, 0)
+        day += timedelta(days=1)
+    return grid
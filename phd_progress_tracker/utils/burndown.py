@@ -0,0 +1,206 @@
+"""
+Séries de burndown/burnup: tarefas criadas, concluídas e abertas por período.
+
+Cada ponto traz as contagens do período (dia, semana ou mês), os acumulados
+(total criado e total concluído, incluindo o que veio antes do intervalo) e a
+velocidade: a média móvel de conclusões por período nos últimos ``window``
+períodos. As séries são derivadas de ``created_at``/``completed_at`` das
+tarefas atuais; no SQLite, com funções de janela (ver ``Database.burndown``).
+
+Intervalos longos são reduzidos automaticamente: a granularidade pedida é a
+mais fina aceita e sobe para semana ou mês até caber em ``max_points``.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Iterable, List, Optional, Tuple
+
+from phd_progress_tracker.models.task import Task, TaskStatus
+
+GRANULARITIES = ("day", "week", "month")
+MAX_POINTS = 120
+# Períodos da média móvel de velocidade, por granularidade
+DEFAULT_WINDOWS = {"day": 7, "week": 4, "month": 3}
+# Intervalo padrão quando ``start`` não é informado
+DEFAULT_DAYS = 90
+
+
+@dataclass(frozen=True)
+class BurndownPoint:
+    """
+    Um período da série.
+
+    Attributes:
+        start: Primeiro dia do período
+        created: Tarefas criadas no período
+        completed: Tarefas concluídas no período
+        total: Tarefas criadas até o fim do período (burnup: escopo)
+        done: Tarefas concluídas até o fim do período (burnup: feito)
+        velocity: Média de conclusões por período na janela móvel
+    """
+
+    start: date
+    created: int
+    completed: int
+    total: int
+    done: int
+    velocity: float
+
+    @property
+    def open(self) -> int:
+        """Tarefas abertas no fim do período (burndown)."""
+        return self.total - self.done
+
+
+def bucket_start(day: date, granularity: str) -> date:
+    """Primeiro dia do período que contém ``day``."""
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def shift_bucket(start: date, granularity: str, n: int) -> date:
+    """Início do período ``n`` períodos depois (ou antes, se negativo) de ``start``."""
+    if granularity == "week":
+        return start + timedelta(weeks=n)
+    if granularity == "month":
+        months = start.year * 12 + start.month - 1 + n
+        return date(months // 12, months % 12 + 1, 1)
+    return start + timedelta(days=n)
+
+
+def count_buckets(start: date, end: date, granularity: str) -> int:
+    """Número de períodos de ``start`` a ``end`` (inclusive)."""
+    first, last = bucket_start(start, granularity), bucket_start(end, granularity)
+    if granularity == "week":
+        return (last - first).days // 7 + 1
+    if granularity == "month":
+        return (last.year - first.year) * 12 + last.month - first.month + 1
+    return (last - first).days + 1
+
+
+def choose_granularity(
+    start: date, end: date, granularity: str = "day", max_points: int = MAX_POINTS
+) -> str:
+    """A granularidade mais fina, a partir da pedida, com até ``max_points`` períodos."""
+    finest = GRANULARITIES.index(granularity)
+    candidates = GRANULARITIES[finest:]
+    for candidate in candidates:
+        if count_buckets(start, end, candidate) <= max_points:
+            return candidate
+    return candidates[-1]
+
+
+def series_bounds(
+    start: date, end: date, granularity: str, window: int
+) -> Tuple[date, date]:
+    """
+    Primeiro e último período da série calculada.
+
+    A série começa ``window - 1`` períodos antes de ``start`` para que a
+    velocidade do primeiro ponto visível já use a janela inteira.
+    """
+    first = shift_bucket(bucket_start(start, granularity), granularity, 1 - window)
+    return first, bucket_start(end, granularity)
+
+
+def burndown_from_tasks(
+    tasks: Iterable[Task], start: date, end: date, granularity: str, window: int
+) -> List[BurndownPoint]:
+    """
+    Implementação de referência em Python (usada pelo backend em memória).
+
+    Uma passada pelas tarefas distribui criações e conclusões nos períodos;
+    acumulados e médias móveis são somas prefixadas.
+    """
+    first, last = series_bounds(start, end, granularity, window)
+    starts = [first]
+    while starts[-1] < last:
+        starts.append(shift_bucket(starts[-1], granularity, 1))
+    index = {day: i for i, day in enumerate(starts)}
+    created = [0] * len(starts)
+    completed = [0] * len(starts)
+    base_total = base_done = 0
+
+    for task in tasks:
+        day = task.created_at.date()
+        if day < first:
+            base_total += 1
+        elif day <= end:
+            created[index[bucket_start(day, granularity)]] += 1
+        if task.status != TaskStatus.COMPLETED or task.completed_at is None:
+            continue
+        day = task.completed_at.date()
+        if day < first:
+            base_done += 1
+        elif day <= end:
+            completed[index[bucket_start(day, granularity)]] += 1
+
+    totals = list(accumulate(created, initial=base_total))[1:]
+    dones = list(accumulate(completed, initial=base_done))[1:]
+    prefix = list(accumulate(completed, initial=0))
+    visible = index[bucket_start(start, granularity)]
+    return [
+        BurndownPoint(
+            start=starts[i],
+            created=created[i],
+            completed=completed[i],
+            total=totals[i],
+            done=dones[i],
+            velocity=(prefix[i + 1] - prefix[max(0, i + 1 - window)])
+            / min(window, i + 1),
+        )
+        for i in range(visible, len(starts))
+    ]
+
+
+@dataclass(frozen=True)
+class BurndownSeries:
+    """Série pronta para exibir, com a granularidade e a janela usadas."""
+
+    granularity: str
+    window: int
+    points: List[BurndownPoint]
+
+
+def burndown_report(
+    repo,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    granularity: str = "day",
+    window: Optional[int] = None,
+    max_points: int = MAX_POINTS,
+) -> BurndownSeries:
+    """
+    Série de burndown/burnup de um repositório.
+
+    Args:
+        repo: Repositório de origem
+        start: Primeiro dia (padrão: ``DEFAULT_DAYS`` dias antes de ``end``)
+        end: Último dia (padrão: hoje)
+        granularity: Granularidade mais fina aceita ("day", "week" ou "month")
+        window: Períodos da média móvel (padrão: ``DEFAULT_WINDOWS``)
+        max_points: Máximo de pontos antes de subir a granularidade
+
+    Raises:
+        ValueError: Se start > end, a granularidade for desconhecida ou a
+            janela não for positiva
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(
+            f"Unknown granularity: {granularity!r} (expected one of {GRANULARITIES})"
+        )
+    end = end or date.today()
+    start = start or end - timedelta(days=DEFAULT_DAYS - 1)
+    if start > end:
+        raise ValueError(f"start ({start}) must not be after end ({end})")
+    if window is not None and window < 1:
+        raise ValueError(f"window must be positive, got {window}")
+    granularity = choose_granularity(start, end, granularity, max_points)
+    window = window or DEFAULT_WINDOWS[granularity]
+    return BurndownSeries(
+        granularity, window, repo.burndown(start, end, granularity, window)
+    )
@@ -0,0 +1,86 @@
+"""
+Visão de calendário: tarefas e milestones agrupados por dia, semana ou mês.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task
+
+GRANULARITIES = ("day", "week", "month")
+
+
+@dataclass
+class CalendarBucket:
+    """
+    Um período do calendário com seus itens, ambos ordenados por data.
+
+    Attributes:
+        start: Primeiro dia do período
+        end: Último dia do período (inclusive)
+        tasks: Tarefas com prazo no período
+        milestones: Milestones com data alvo no período
+    """
+
+    start: date
+    end: date
+    tasks: List[Task] = field(default_factory=list)
+    milestones: List[Milestone] = field(default_factory=list)
+
+
+def bucket_bounds(day: date, granularity: str) -> Tuple[date, date]:
+    """
+    Retorna o primeiro e o último dia do período que contém ``day``.
+    Semanas começam na segunda-feira (ISO 8601).
+
+    Raises:
+        ValueError: Se a granularidade for desconhecida
+    """
+    if granularity == "day":
+        return day, day
+    if granularity == "week":
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=6)
+    if granularity == "month":
+        start = day.replace(day=1)
+        next_month = (start + timedelta(days=32)).replace(day=1)
+        return start, next_month - timedelta(days=1)
+    raise ValueError(
+        f"Unknown granularity: {granularity!r} (expected one of {GRANULARITIES})"
+    )
+
+
+def build_calendar(
+    db, start: date, end: date, granularity: str = "day"
+) -> List[CalendarBucket]:
+    """
+    Agrupa tarefas e milestones da janela [start, end] em períodos.
+
+    Usa as consultas por intervalo do repositório (índices em ``deadline`` e
+    ``target_date`` no SQLite), então o custo depende só dos itens da janela.
+    Apenas períodos com algum item são retornados.
+
+    Raises:
+        ValueError: Se start > end ou a granularidade for desconhecida
+    """
+    if start > end:
+        raise ValueError("Calendar start must not be after end")
+    bucket_bounds(start, granularity)  # valida a granularidade antes do I/O
+
+    buckets: Dict[date, CalendarBucket] = {}
+
+    def bucket_for(day: date) -> CalendarBucket:
+        bucket_start, bucket_end = bucket_bounds(day, granularity)
+        bucket = buckets.get(bucket_start)
+        if bucket is None:
+            bucket = buckets[bucket_start] = CalendarBucket(bucket_start, bucket_end)
+        return bucket
+
+    for task in db.tasks_by_deadline(start, end):
+        bucket_for(task.deadline).tasks.append(task)
+    for milestone in db.milestones_by_date(start, end):
+        bucket_for(milestone.target_date).milestones.append(milestone)
+
+    return [buckets[key] for key in sorted(buckets)]
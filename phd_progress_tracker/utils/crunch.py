@@ -0,0 +1,180 @@
+"""
+Detecção de sobrecarga ("crunch"): períodos em que a carga das tarefas
+abertas passa do que cabe em um dia.
+
+Cada tarefa aberta ocupa uma janela de trabalho de ``window_days`` dias que
+termina no prazo (sem começar antes de hoje; atrasadas contam como devidas
+hoje) e distribui o seu esforço igualmente pelos dias da janela. Uma
+varredura (sweep line) sobre os inícios e fins das janelas, ordenados uma
+única vez, acumula a carga em horas por dia; os trechos em que ela passa de
+``threshold`` viram intervalos de sobrecarga, com o pico e as tarefas
+envolvidas. O custo é O(n log n) pela ordenação dos eventos.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from phd_progress_tracker.models.task import Task, TaskPriority
+from phd_progress_tracker.utils.planner import Capacity
+
+DEFAULT_DAYS = 60
+# Dias por consulta
+MAX_DAYS = 366
+DEFAULT_WINDOW_DAYS = 7
+DEFAULT_MIN_PRIORITY = TaskPriority.HIGH
+
+_PRIORITY_LEVELS = {priority: level for level, priority in enumerate(TaskPriority)}
+# Folga na comparação com o limite (a carga é uma soma de frações)
+_EPSILON = 1e-9
+
+# Janela de uma tarefa: (primeiro dia, último dia, horas por dia)
+Window = Tuple[date, date, float]
+# Trecho sobrecarregado: (início, fim, pico, horas, índices das janelas)
+Overload = Tuple[date, date, float, float, List[int]]
+
+
+def task_window(task: Task, today: date, window_days: int) -> Tuple[date, date]:
+    """Primeiro e último dia da janela de trabalho de uma tarefa."""
+    end = max(task.deadline, today)
+    return max(end - timedelta(days=window_days - 1), today), end
+
+
+def sweep_overloads(windows: Sequence[Window], threshold: float) -> List[Overload]:
+    """
+    Trechos em que a soma das cargas das janelas passa de ``threshold``.
+
+    As janelas são intervalos de dias inclusivos. Cada trecho traz o pico
+    (horas por dia), o total de horas e as janelas que o cruzam, na ordem
+    em que foram dadas.
+    """
+    events: List[Tuple[date, int, int]] = []
+    for i, (start, end, _) in enumerate(windows):
+        # Fins antes de inícios no mesmo dia
+        events.append((start, 1, i))
+        events.append((end + timedelta(days=1), 0, i))
+    events.sort()
+
+    overloads: List[Overload] = []
+    active: Dict[int, None] = {}
+    load = 0.0
+    current: Optional[list] = None
+    k = 0
+    while k < len(events):
+        day = events[k][0]
+        started = []
+        while k < len(events) and events[k][0] == day:
+            _, is_start, i = events[k]
+            if is_start:
+                active[i] = None
+                started.append(i)
+                load += windows[i][2]
+            else:
+                del active[i]
+                load -= windows[i][2]
+            k += 1
+        if not active:
+            load = 0.0
+
+        if load > threshold + _EPSILON:
+            span = (events[k][0] - day).days
+            if current is None:
+                current = [day, load, 0.0, dict(active)]
+            else:
+                current[1] = max(current[1], load)
+                current[3].update(dict.fromkeys(started))
+            current[2] += load * span
+        elif current is not None:
+            start, peak, hours, members = current
+            overloads.append(
+                (start, day - timedelta(days=1), peak, hours, sorted(members))
+            )
+            current = None
+    return overloads
+
+
+@dataclass(frozen=True)
+class CrunchInterval:
+    """
+    Período sobrecarregado.
+
+    Attributes:
+        start: Primeiro dia
+        end: Último dia
+        peak_load: Maior carga diária no período (horas)
+        hours: Carga total no período (horas)
+        tasks: Tarefas cujas janelas cruzam o período, por prazo
+    """
+
+    start: date
+    end: date
+    peak_load: float
+    hours: float
+    tasks: List[Task]
+
+    @property
+    def days(self) -> int:
+        """Duração em dias."""
+        return (self.end - self.start).days + 1
+
+
+@dataclass(frozen=True)
+class CrunchReport:
+    """Períodos sobrecarregados de ``start`` a ``end``."""
+
+    start: date
+    end: date
+    threshold: float
+    window_days: int
+    intervals: List[CrunchInterval]
+
+
+def crunch_report(
+    repo,
+    today: Optional[date] = None,
+    days: int = DEFAULT_DAYS,
+    threshold: float = Capacity.daily_hours,
+    window_days: int = DEFAULT_WINDOW_DAYS,
+    min_priority: TaskPriority = DEFAULT_MIN_PRIORITY,
+    default_effort: float = Capacity.default_effort,
+) -> CrunchReport:
+    """
+    Períodos sobrecarregados nos próximos ``days`` dias.
+
+    Args:
+        repo: Repositório de origem
+        today: Primeiro dia analisado (padrão: hoje)
+        days: Dias analisados
+        threshold: Carga diária (horas) acima da qual há sobrecarga
+        window_days: Dias de trabalho antes de cada prazo
+        min_priority: Prioridade mínima das tarefas consideradas
+        default_effort: Esforço (horas) de tarefas sem estimativa
+
+    Raises:
+        ValueError: Se algum parâmetro estiver fora do intervalo válido
+    """
+    if not 1 <= days <= MAX_DAYS:
+        raise ValueError(f"days must be between 1 and {MAX_DAYS}, got {days}")
+    if window_days < 1:
+        raise ValueError(f"window_days must be positive, got {window_days}")
+    if threshold <= 0 or default_effort <= 0:
+        raise ValueError("threshold and default_effort must be positive")
+    today = today or date.today()
+    end = today + timedelta(days=days - 1)
+
+    tasks: List[Task] = []
+    windows: List[Window] = []
+    last_deadline = end + timedelta(days=window_days - 1)
+    for task in repo.deadline_index().due_between(date.min, last_deadline):
+        if _PRIORITY_LEVELS[task.priority] < _PRIORITY_LEVELS[min_priority]:
+            continue
+        first, last = task_window(task, today, window_days)
+        effort = task.effort_hours or default_effort
+        tasks.append(task)
+        windows.append((first, min(last, end), effort / ((last - first).days + 1)))
+
+    intervals = [
+        CrunchInterval(start, stop, peak, hours, [tasks[i] for i in members])
+        for start, stop, peak, hours, members in sweep_overloads(windows, threshold)
+    ]
+    return CrunchReport(today, end, threshold, window_days, intervals)
@@ -0,0 +1,187 @@
+"""
+Tempo de ciclo (criação → conclusão) e vazão semanal das tarefas concluídas.
+
+As tarefas são agrupadas pela semana de conclusão (segunda a domingo) e, em
+cada semana, os tempos de ciclo de cada (categoria, prioridade) viram um
+``QuantileSketch``. Um relatório mescla os sketches das semanas pedidas, sem
+reler as tarefas: no SQLite eles ficam em cache por semana e uma escrita só
+invalida as semanas das tarefas que mudou (ver ``Database.cycle_time_sketches``).
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils.sketch import QuantileSketch
+
+# Segunda-feira da semana de 1970-01-01; semanas são contadas a partir dela
+WEEK_EPOCH = date(1969, 12, 29)
+PERCENTILES = (0.5, 0.9, 0.99)
+
+_DAY = timedelta(days=1)
+
+# (categoria, prioridade) -> sketch dos tempos de ciclo, em dias
+Buckets = Dict[Tuple[str, TaskPriority], QuantileSketch]
+# semana -> sketches da semana
+WeekSketches = Dict[int, Buckets]
+
+
+def week_of(day: date) -> int:
+    """Número da semana (segunda a domingo) que contém ``day``."""
+    return (day - WEEK_EPOCH).days // 7
+
+
+def week_start(week: int) -> date:
+    """Segunda-feira da semana ``week``."""
+    return WEEK_EPOCH + timedelta(weeks=week)
+
+
+def cycle_days(created_at: datetime, completed_at: datetime) -> float:
+    """Tempo de ciclo em dias (nunca negativo)."""
+    return max(0.0, (completed_at - created_at) / _DAY)
+
+
+def week_range(
+    start: Optional[date], end: Optional[date]
+) -> Tuple[Optional[int], Optional[int]]:
+    """Semanas que contêm ``start`` e ``end`` (None mantém o lado aberto)."""
+    return (
+        week_of(start) if start else None,
+        week_of(end) if end else None,
+    )
+
+
+def add_completion(
+    weeks: WeekSketches,
+    category: str,
+    priority: TaskPriority,
+    created_at: datetime,
+    completed_at: datetime,
+) -> None:
+    """Acrescenta uma conclusão ao sketch da sua semana."""
+    buckets = weeks.setdefault(week_of(completed_at.date()), {})
+    sketch = buckets.get((category, priority))
+    if sketch is None:
+        sketch = buckets[(category, priority)] = QuantileSketch()
+    sketch.add(cycle_days(created_at, completed_at))
+
+
+def sketch_tasks(
+    tasks: Iterable[Task], start: Optional[date] = None, end: Optional[date] = None
+) -> WeekSketches:
+    """
+    Resume as tarefas concluídas em uma passada, por semana de conclusão.
+
+    Args:
+        tasks: Tarefas (as não concluídas são ignoradas)
+        start: Só semanas a partir da que contém esta data
+        end: Só semanas até a que contém esta data
+    """
+    first, last = week_range(start, end)
+    weeks: WeekSketches = {}
+    for task in tasks:
+        if task.status != TaskStatus.COMPLETED or task.completed_at is None:
+            continue
+        week = week_of(task.completed_at.date())
+        if (first is not None and week < first) or (last is not None and week > last):
+            continue
+        add_completion(
+            weeks, task.category, task.priority, task.created_at, task.completed_at
+        )
+    return weeks
+
+
+@dataclass(frozen=True)
+class CycleTimeStats:
+    """Percentis do tempo de ciclo (em dias) de um grupo de tarefas."""
+
+    count: int
+    p50: float
+    p90: float
+    p99: float
+
+    @classmethod
+    def from_sketch(cls, sketch: QuantileSketch) -> "CycleTimeStats":
+        p50, p90, p99 = sketch.quantiles(PERCENTILES)
+        return cls(count=sketch.count, p50=p50, p90=p90, p99=p99)
+
+
+@dataclass(frozen=True)
+class CycleTimeReport:
+    """
+    Tempo de ciclo e vazão de um período.
+
+    Attributes:
+        start: Primeiro dia do período (segunda-feira), ou None sem conclusões
+        end: Último dia do período (domingo), ou None sem conclusões
+        overall: Percentis de todas as tarefas (None sem conclusões)
+        by_category: Percentis por categoria
+        by_priority: Percentis por prioridade
+        throughput: Por semana do período, (segunda-feira, conclusões por categoria)
+    """
+
+    start: Optional[date]
+    end: Optional[date]
+    overall: Optional[CycleTimeStats]
+    by_category: Dict[str, CycleTimeStats]
+    by_priority: Dict[TaskPriority, CycleTimeStats]
+    throughput: List[Tuple[date, Dict[str, int]]]
+
+
+def summarize_cycle_time(
+    weeks: WeekSketches, start: Optional[date] = None, end: Optional[date] = None
+) -> CycleTimeReport:
+    """
+    Mescla os sketches semanais em um relatório.
+
+    O período é arredondado para semanas inteiras; lados abertos vão até a
+    primeira/última semana com conclusões.
+
+    Raises:
+        ValueError: Se start > end
+    """
+    if start and end and start > end:
+        raise ValueError(f"start ({start}) must not be after end ({end})")
+    first, last = week_range(start, end)
+    if weeks:
+        first = min(weeks) if first is None else first
+        last = max(weeks) if last is None else last
+    if first is None or last is None or first > last:
+        return CycleTimeReport(None, None, None, {}, {}, [])
+
+    overall = QuantileSketch()
+    categories: Dict[str, QuantileSketch] = {}
+    priorities: Dict[TaskPriority, QuantileSketch] = {}
+    throughput = []
+    for week in range(first, last + 1):
+        completed: Dict[str, int] = {}
+        for (category, priority), sketch in weeks.get(week, {}).items():
+            overall.merge(sketch)
+            categories.setdefault(category, QuantileSketch()).merge(sketch)
+            priorities.setdefault(priority, QuantileSketch()).merge(sketch)
+            completed[category] = completed.get(category, 0) + sketch.count
+        throughput.append((week_start(week), dict(sorted(completed.items()))))
+
+    return CycleTimeReport(
+        start=week_start(first),
+        end=week_start(last) + timedelta(days=6),
+        overall=CycleTimeStats.from_sketch(overall) if overall.count else None,
+        by_category={
+            category: CycleTimeStats.from_sketch(sketch)
+            for category, sketch in sorted(categories.items())
+        },
+        by_priority={
+            priority: CycleTimeStats.from_sketch(priority_sketch)
+            for priority in TaskPriority
+            if (priority_sketch := priorities.get(priority)) is not None
+        },
+        throughput=throughput,
+    )
+
+
+def cycle_time_report(
+    repo, start: Optional[date] = None, end: Optional[date] = None
+) -> CycleTimeReport:
+    """Relatório de tempo de ciclo e vazão a partir de um repositório."""
+    return summarize_cycle_time(repo.cycle_time_sketches(start, end), start, end)
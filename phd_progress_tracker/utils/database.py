@@ -4,11 +4,201 @@ Gerenciamento de persistência de dados em SQLite.
 
 import json
 import sqlite3
-from datetime import datetime
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
 from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.utils.activity import DayCounts, activity_dates
+from phd_progress_tracker.utils.burndown import (
+    BurndownPoint,
+    bucket_start,
+    series_bounds,
+)
+from phd_progress_tracker.utils.cycle_time import (
+    WeekSketches,
+    add_completion,
+    week_of,
+    week_range,
+    week_start,
+)
+from phd_progress_tracker.utils.deadline_index import DeadlineIndex
+from phd_progress_tracker.utils.dependencies import blocked_status
+from phd_progress_tracker.utils.history import (
+    USER_KINDS,
+    EventKind,
+    TaskEvent,
+    decode_change,
+    decode_states,
+    encode_change,
+    encode_states,
+    replay,
+    task_change,
+)
+from phd_progress_tracker.utils.ids import is_time_ordered_id, new_id
+from phd_progress_tracker.utils.sketch import QuantileSketch
+from phd_progress_tracker.utils.task_filter import FACETS, TaskFilter
+from phd_progress_tracker.utils.task_frame import (
+    FRAME_QUERY,
+    STATUS_CODES,
+    PRIORITIES,
+    PRIORITY_CODES,
+    STATUSES,
+    TaskFrame,
+)
+
+
+@lru_cache(maxsize=8192)
+def _parse_day(value: str) -> date:
+    """
+    Converte "YYYY-MM-DD" (ou um datetime ISO) em date.
+
+    O cache faz tarefas com o mesmo prazo compartilharem o mesmo objeto date.
+    """
+    return date.fromisoformat(value[:10])
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(value: datetime) -> int:
+    """Timestamp (local, sem fuso) como microssegundos desde 1970-01-01."""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + value * _MICROSECOND
+
+
+# Início do período de cada granularidade e passo até o seguinte, nas
+# funções de data do SQLite (semanas começam na segunda-feira)
+_BUCKET_SQL = {
+    "day": ("date({})", "+1 day"),
+    "week": ("date({}, 'weekday 0', '-6 days')", "+7 days"),
+    "month": ("date({}, 'start of month')", "+1 month"),
+}
+
+# Último dia da barra de uma tarefa na linha do tempo (ver utils/timeline.py):
+# conclusão ou prazo, nunca antes da criação; indexado como expressão
+_SPAN_END_SQL = (
+    "max(substr(created_at, 1, 10), CASE WHEN status = 'COMPLETED' "
+    "AND completed_at IS NOT NULL THEN substr(completed_at, 1, 10) "
+    "ELSE deadline END)"
+)
+
+# Dependências que citam tarefas que não existem mais (após save_tasks)
+_DELETE_DANGLING_DEPENDENCIES = (
+    "DELETE FROM task_dependencies WHERE task_id NOT IN (SELECT id FROM tasks) "
+    "OR depends_on NOT IN (SELECT id FROM tasks)"
+)
+
+# Campos que entram no tempo de ciclo de uma tarefa
+_cycle_time_fields = attrgetter(
+    "status", "category", "priority", "created_at", "completed_at"
+)
+
+
+# Conversão de cada coluna para o tipo do modelo, usada nas projeções
+# (a chave também serve de lista de colunas permitidas no SELECT)
+_TASK_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "id": _identity,
+    "title": _identity,
+    "description": _identity,
+    "deadline": _parse_day,
+    "status": lambda value: TaskStatus[value],
+    "priority": lambda value: TaskPriority[value],
+    "category": sys.intern,
+    "created_at": _parse_timestamp,
+    "completed_at": _parse_timestamp,
+    "effort_hours": _identity,
+}
+_MILESTONE_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "id": _identity,
+    "title": _identity,
+    "description": _identity,
+    "target_date": _parse_day,
+    "is_achieved": bool,
+}
+
+
+def _projection(columns: Sequence[str], decoders: Dict[str, Callable]) -> str:
+    """Valida as colunas pedidas e monta a lista do SELECT."""
+    unknown = [c for c in columns if c not in decoders]
+    if unknown or not columns:
+        raise ValueError(
+            f"Unknown columns: {unknown} (expected some of {list(decoders)})"
+        )
+    return ", ".join(columns)
+
+
+def _decode_row(row: sqlite3.Row, decoders: Dict[str, Callable]) -> Dict[str, Any]:
+    return {column: decoders[column](row[column]) for column in row.keys()}
+
+
+class _PinnedConnection:
+    """
+    Conexão fixada por ``Database.read_transaction``.
+
+    Usada como context manager não faz commit (a transação continua aberta),
+    e ``commit`` é recusado; a conexão também fica com ``query_only``.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def __enter__(self) -> "_PinnedConnection":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+    def commit(self) -> None:
+        raise sqlite3.OperationalError("cannot write inside a read transaction")
+
+
+class _SharedConnection:
+    """
+    Conexão única de um banco ``:memory:``, compartilhada entre threads.
+
+    Usada como context manager, segura o lock do banco até o commit (ou
+    rollback), para que transações de threads diferentes não se misturem.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.RLock):
+        self._conn = conn
+        self._lock = lock
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def __enter__(self) -> "_SharedConnection":
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            self._conn.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._lock.release()
 
 
 class Database:
@@ -17,16 +207,33 @@ class Database:
     # Constant for in-memory database path
     IN_MEMORY_PATH = ":memory:"
 
-    def __init__(self, data_dir: str = "data", db_path: Optional[str] = None):
+    # Histórico de tarefas: um snapshot do estado a cada SNAPSHOT_INTERVAL
+    # eventos, gravado depois do commit da escrita, em transação própria; ao
+    # gravar um snapshot, eventos além de HISTORY_LIMIT são podados
+    SNAPSHOT_INTERVAL = 256
+    HISTORY_LIMIT = 10_000
+
+    # Filtros com contagens por faceta em cache (os menos usados saem antes)
+    FACETS_CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        data_dir: str = "data",
+        db_path: Optional[str] = None,
+        without_rowid: bool = False,
+    ):
         """
         Inicializa database SQLite.
 
         Args:
             data_dir: Diretório onde dados serão salvos
             db_path: Caminho alternativo para o banco SQLite (para testes)
+            without_rowid: Cria as tabelas como ``WITHOUT ROWID``, agrupadas
+                pelo ID em vez do rowid (só vale para bancos novos; ver
+                ``benchmarks/bench_ids.py``)
         """
         self.data_dir = Path(data_dir)
-        self.data_dir.mkdir(exist_ok=True)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
 
         # JSON files (legacy, for migration)
         self.tasks_file = self.data_dir / "tasks.json"
@@ -38,27 +245,95 @@ class Database:
         else:
             self.db_path = self.data_dir / "phd_tracker.db"
 
-        # For in-memory databases, keep a single connection
+        # For in-memory databases, keep a single connection, used by one
+        # transaction at a time
         self._connection: Optional[sqlite3.Connection] = None
+        self._connection_lock = threading.RLock()
         self._is_memory = str(self.db_path) == self.IN_MEMORY_PATH
+        self.without_rowid = without_rowid
+
+        # Índice de prazos em memória, construído sob demanda e depois
+        # mantido pelas escritas desta instância; a revisão em que ele está
+        # detecta escritas de outros processos (workers, CLI)
+        self._deadline_index: Optional[DeadlineIndex] = None
+        self._index_revision = -1
+        self._index_lock = threading.Lock()
+
+        # Conexão da read_transaction em andamento, por thread
+        self._pinned = threading.local()
+
+        # Contagens por faceta (revisão, contagens), válidas enquanto a revisão
+        # não mudar; LRU limitado a FACETS_CACHE_SIZE filtros
+        self._facets_cache: OrderedDict[TaskFilter, Tuple[int, Dict]] = OrderedDict()
+        self._facets_lock = threading.Lock()
 
         self._init_db()
         self._migrate_from_json()
+        self._ensure_history_baseline()
+        self._ensure_status_baseline()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Retorna conexão com o banco de dados."""
+        pinned = getattr(self._pinned, "conn", None)
+        if pinned is not None:
+            return pinned
         if self._is_memory:
             if self._connection is None:
                 self._connection = sqlite3.connect(
                     str(self.db_path), check_same_thread=False
                 )
                 self._connection.row_factory = sqlite3.Row
-            return self._connection
+            return _SharedConnection(self._connection, self._connection_lock)
         else:
             conn = sqlite3.connect(str(self.db_path))
             conn.row_factory = sqlite3.Row
             return conn
 
+    @contextmanager
+    def read_transaction(self) -> Iterator["Database"]:
+        """
+        Executa várias leituras sobre o mesmo snapshot do banco.
+
+        Dentro do bloco, todos os métodos desta thread usam uma única conexão
+        com a transação aberta, então veem os dados de um mesmo instante;
+        escritas falham com RuntimeError. Blocos aninhados reaproveitam a transação.
+        Em bancos ``:memory:`` (conexão única), as outras threads esperam o bloco
+        terminar.
+
+        Exemplo:
+            with db.read_transaction():
+                revision = db.revision()
+                tasks = db.load_tasks()
+        """
+        if getattr(self._pinned, "conn", None) is not None:
+            yield self
+            return
+        conn = self._get_connection()
+        if self._is_memory:
+            # A conexão é de todas as threads: as outras esperam o fim do
+            # bloco em vez de escrever dentro desta transação
+            self._connection_lock.acquire()
+        try:
+            try:
+                # query_only faz qualquer escrita falhar já no execute
+                conn.execute("PRAGMA query_only = ON")
+                conn.execute("BEGIN")
+            except sqlite3.Error as e:
+                conn.execute("PRAGMA query_only = OFF")
+                raise RuntimeError(f"Failed to begin read transaction: {e}") from e
+            self._pinned.conn = _PinnedConnection(conn)
+            try:
+                yield self
+            finally:
+                self._pinned.conn = None
+                conn.rollback()
+                conn.execute("PRAGMA query_only = OFF")
+        finally:
+            if self._is_memory:
+                self._connection_lock.release()
+            else:
+                conn.close()
+
     def close(self) -> None:
         """Fecha a conexão com o banco de dados."""
         if self._connection is not None:
@@ -75,9 +350,10 @@ class Database:
 
     def _init_db(self) -> None:
         """Cria as tabelas se não existirem."""
+        table_options = "WITHOUT ROWID" if self.without_rowid else ""
         try:
             with self._get_connection() as conn:
-                conn.execute("""
+                conn.execute(f"""
                     CREATE TABLE IF NOT EXISTS tasks (
                         id TEXT PRIMARY KEY,
                         title TEXT NOT NULL,
@@ -87,18 +363,155 @@ class Database:
                         priority TEXT NOT NULL,
                         category TEXT NOT NULL,
                         created_at TEXT NOT NULL,
-                        completed_at TEXT
-                    )
+                        completed_at TEXT,
+                        effort_hours REAL
+                    ) {table_options}
                 """)
-                conn.execute("""
+                conn.execute(f"""
                     CREATE TABLE IF NOT EXISTS milestones (
                         id TEXT PRIMARY KEY,
                         title TEXT NOT NULL,
                         description TEXT NOT NULL,
                         target_date TEXT NOT NULL,
                         is_achieved INTEGER NOT NULL
+                    ) {table_options}
+                """)
+                # IDs antigos continuam válidos como apelidos após migrate_ids()
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS id_aliases (
+                        kind TEXT NOT NULL,
+                        alias TEXT NOT NULL,
+                        id TEXT NOT NULL,
+                        PRIMARY KEY (kind, alias)
+                    ) WITHOUT ROWID
+                """)
+                # Bancos anteriores ao esforço estimado (utils/planner.py)
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(tasks)")}
+                if "effort_hours" not in columns:
+                    conn.execute("ALTER TABLE tasks ADD COLUMN effort_hours REAL")
+                # Índices para as consultas por intervalo de datas (calendário)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks (deadline)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_milestones_target_date "
+                    "ON milestones (target_date)"
+                )
+                # Índices para as contagens por faceta (GROUP BY)
+                for column in ("status", "priority", "category"):
+                    conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_tasks_{column} "
+                        f"ON tasks ({column})"
+                    )
+                # Revisão do armazenamento, incrementada a cada escrita
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS storage_meta (
+                        key TEXT PRIMARY KEY,
+                        value INTEGER NOT NULL
+                    )
+                """)
+                conn.execute(
+                    "INSERT OR IGNORE INTO storage_meta (key, value) "
+                    "VALUES ('revision', 0), ('history_top', 0)"
+                )
+                # Histórico de tarefas (ver utils/history.py): eventos
+                # codificados em binário e snapshots periódicos do estado
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS task_events (
+                        seq INTEGER PRIMARY KEY,
+                        task_id TEXT NOT NULL,
+                        kind INTEGER NOT NULL,
+                        at INTEGER NOT NULL,
+                        ref INTEGER NOT NULL,
+                        change BLOB NOT NULL
+                    )
+                """)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_task_events_task "
+                    "ON task_events (task_id, seq)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_task_events_ref "
+                    "ON task_events (ref)"
+                )
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS task_snapshots (
+                        seq INTEGER PRIMARY KEY,
+                        state BLOB NOT NULL
+                    )
+                """)
+                # Intervalos de status (código de task_frame, microssegundos);
+                # left_at NULL marca o status atual de cada tarefa
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS status_transitions (
+                        task_id TEXT NOT NULL,
+                        status INTEGER NOT NULL,
+                        entered_at INTEGER NOT NULL,
+                        left_at INTEGER,
+                        PRIMARY KEY (task_id, entered_at)
+                    ) WITHOUT ROWID
+                """)
+                # Índice parcial só com os status atuais, para stalled_tasks()
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_status_transitions_open "
+                    "ON status_transitions (status, entered_at) WHERE left_at IS NULL"
+                )
+                # Cache do tempo de ciclo (ver utils/cycle_time.py): semanas já
+                # resumidas e um sketch serializado por (semana, categoria,
+                # prioridade); escritas de tarefas descartam as semanas afetadas
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_tasks_completed_at "
+                    "ON tasks (completed_at)"
+                )
+                # Séries de burndown (Database.burndown) filtram por created_at
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_tasks_created_at "
+                    "ON tasks (created_at)"
+                )
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS cycle_time_weeks (
+                        week INTEGER PRIMARY KEY
+                    )
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS cycle_time_sketches (
+                        week INTEGER NOT NULL,
+                        category TEXT NOT NULL,
+                        priority INTEGER NOT NULL,
+                        sketch BLOB NOT NULL,
+                        PRIMARY KEY (week, category, priority)
+                    ) WITHOUT ROWID
+                """)
+                # Linha do tempo (Database.tasks_overlapping) filtra pelo fim da barra
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_tasks_span_end "
+                    f"ON tasks ({_SPAN_END_SQL})"
+                )
+                # Anos já agregados no mapa de atividade (Database.activity_counts)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS activity_years (
+                        year INTEGER PRIMARY KEY
                     )
                 """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS activity_days (
+                        day TEXT PRIMARY KEY,
+                        created INTEGER NOT NULL,
+                        completed INTEGER NOT NULL
+                    ) WITHOUT ROWID
+                """)
+                # Arestas "task_id depende de depends_on" (Database.add_dependency)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS task_dependencies (
+                        task_id TEXT NOT NULL,
+                        depends_on TEXT NOT NULL,
+                        PRIMARY KEY (task_id, depends_on)
+                    ) WITHOUT ROWID
+                """)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_task_dependencies_depends_on "
+                    "ON task_dependencies (depends_on)"
+                )
                 conn.commit()
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to initialize database: {e}") from e
@@ -141,8 +554,8 @@ class Database:
                             conn.execute(
                                 """
                                 INSERT OR REPLACE INTO tasks
-                                (id, title, description, deadline, status, priority, category, created_at, completed_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                                (id, title, description, deadline, status, priority, category, created_at, completed_at, effort_hours)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                             """,
                                 (
                                     task_data["id"],
@@ -154,6 +567,7 @@ class Database:
                                     task_data["category"],
                                     task_data["created_at"],
                                     task_data.get("completed_at"),
+                                    task_data.get("effort_hours"),
                                 ),
                             )
 
@@ -197,6 +611,93 @@ class Database:
         except sqlite3.Error as e:
             raise RuntimeError(f"Database error during migration: {e}") from e
 
+    @staticmethod
+    def _bump_revision(conn: sqlite3.Connection) -> int:
+        """Incrementa a revisão na mesma transação da escrita e retorna o novo valor."""
+        return conn.execute(
+            "UPDATE storage_meta SET value = value + 1 WHERE key = 'revision' "
+            "RETURNING value"
+        ).fetchall()[0][0]
+
+    @staticmethod
+    def _read_revision(conn: sqlite3.Connection) -> int:
+        return conn.execute(
+            "SELECT value FROM storage_meta WHERE key = 'revision'"
+        ).fetchone()[0]
+
+    def revision(self) -> int:
+        """
+        Retorna a revisão atual do armazenamento.
+        Muda a cada escrita, inclusive de outros processos no mesmo arquivo.
+        """
+        try:
+            with self._get_connection() as conn:
+                return self._read_revision(conn)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to read revision: {e}") from e
+
+    # Colunas na ordem usada por INSERT/SELECT
+    TASK_COLUMNS = "id, title, description, deadline, status, priority, category, created_at, completed_at, effort_hours"
+    MILESTONE_COLUMNS = "id, title, description, target_date, is_achieved"
+
+    @staticmethod
+    def _task_params(task: Task) -> tuple:
+        """Converte tarefa para os parâmetros de INSERT (na ordem de TASK_COLUMNS)."""
+        return (
+            task.id,
+            task.title,
+            task.description,
+            task.deadline.isoformat(),
+            task.status.name,
+            task.priority.name,
+            task.category,
+            task.created_at.isoformat(),
+            task.completed_at.isoformat() if task.completed_at else None,
+            task.effort_hours,
+        )
+
+    @staticmethod
+    def _row_to_task(row: sqlite3.Row) -> Task:
+        """Converte uma linha da tabela tasks em Task."""
+        return Task(
+            id=row["id"],
+            title=row["title"],
+            description=row["description"],
+            deadline=_parse_day(row["deadline"]),
+            status=TaskStatus[row["status"]],
+            priority=TaskPriority[row["priority"]],
+            category=sys.intern(row["category"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            completed_at=(
+                datetime.fromisoformat(row["completed_at"])
+                if row["completed_at"]
+                else None
+            ),
+            effort_hours=row["effort_hours"],
+        )
+
+    @staticmethod
+    def _milestone_params(milestone: Milestone) -> tuple:
+        """Converte milestone para os parâmetros de INSERT (na ordem de MILESTONE_COLUMNS)."""
+        return (
+            milestone.id,
+            milestone.title,
+            milestone.description,
+            milestone.target_date.isoformat(),
+            1 if milestone.is_achieved else 0,
+        )
+
+    @staticmethod
+    def _row_to_milestone(row: sqlite3.Row) -> Milestone:
+        """Converte uma linha da tabela milestones em Milestone."""
+        return Milestone(
+            id=row["id"],
+            title=row["title"],
+            description=row["description"],
+            target_date=_parse_day(row["target_date"]),
+            is_achieved=bool(row["is_achieved"]),
+        )
+
     def save_tasks(self, tasks: List[Task]) -> None:
         """Salva lista de tarefas no SQLite."""
         try:
@@ -205,65 +706,416 @@ class Database:
                 conn.execute("DELETE FROM tasks")
 
                 # Insert all tasks
-                for task in tasks:
-                    conn.execute(
-                        """
-                        INSERT INTO tasks
-                        (id, title, description, deadline, status, priority, category, created_at, completed_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        (
-                            task.id,
-                            task.title,
-                            task.description,
-                            task.deadline.isoformat(),
-                            task.status.name,
-                            task.priority.name,
-                            task.category,
-                            task.created_at.isoformat(),
-                            (
-                                task.completed_at.isoformat()
-                                if task.completed_at
-                                else None
-                            ),
-                        ),
-                    )
+                conn.executemany(
+                    f"INSERT INTO tasks ({self.TASK_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [self._task_params(task) for task in tasks],
+                )
+                # Substituição em massa não é desfeita: o histórico recomeça
+                self._reset_history(conn)
+                self._reconcile_status_transitions(conn)
+                conn.execute("DELETE FROM cycle_time_weeks")
+                conn.execute("DELETE FROM cycle_time_sketches")
+                conn.execute("DELETE FROM activity_years")
+                conn.execute("DELETE FROM activity_days")
+                conn.execute(_DELETE_DANGLING_DEPENDENCIES)
+                self._bump_revision(conn)
                 conn.commit()
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to save tasks: {e}") from e
+        finally:
+            # Substituição em massa: o índice é reconstruído no próximo uso
+            self._deadline_index = None
 
     def load_tasks(self) -> List[Task]:
         """Carrega lista de tarefas do SQLite."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT id, title, description, deadline, status, priority, category, created_at, completed_at
-                    FROM tasks
-                """)
+                cursor = conn.execute(f"SELECT {self.TASK_COLUMNS} FROM tasks")
                 rows = cursor.fetchall()
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to load tasks: {e}") from e
 
-        tasks = []
-        for row in rows:
-            tasks.append(
-                Task(
-                    id=row["id"],
-                    title=row["title"],
-                    description=row["description"],
-                    deadline=datetime.fromisoformat(row["deadline"]).date(),
-                    status=TaskStatus[row["status"]],
-                    priority=TaskPriority[row["priority"]],
-                    category=row["category"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    completed_at=(
-                        datetime.fromisoformat(row["completed_at"])
-                        if row["completed_at"]
-                        else None
-                    ),
-                )
+        return [self._row_to_task(row) for row in rows]
+
+    @staticmethod
+    def _resolve_id(conn: sqlite3.Connection, kind: str, item_id: str) -> str:
+        """Traduz um ID antigo (apelido) para o ID atual; outros IDs passam direto."""
+        row = conn.execute(
+            "SELECT id FROM id_aliases WHERE kind = ? AND alias = ?", (kind, item_id)
+        ).fetchone()
+        return row[0] if row else item_id
+
+    def _fetch_task(self, conn: sqlite3.Connection, task_id: str) -> Optional[Task]:
+        row = conn.execute(
+            f"SELECT {self.TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        return self._row_to_task(row) if row else None
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Busca uma tarefa pelo ID (ou por um ID antigo migrado)."""
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    f"SELECT {self.TASK_COLUMNS} FROM tasks WHERE id = ?",
+                    (self._resolve_id(conn, "task", task_id),),
+                ).fetchone()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load task: {e}") from e
+
+        return self._row_to_task(row) if row else None
+
+    def load_task_columns(
+        self, columns: Sequence[str], filters: Optional[TaskFilter] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Carrega só as colunas pedidas das tarefas, como dicionários.
+        Colunas não pedidas (ex.: ``description``) não são lidas do SQLite.
+
+        Raises:
+            ValueError: Se alguma coluna não existir
+        """
+        select = _projection(columns, _TASK_DECODERS)
+        where, params = (filters or TaskFilter()).to_sql()
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    f"SELECT {select} FROM tasks{where}", params
+                ).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load tasks: {e}") from e
+
+        return [_decode_row(row, _TASK_DECODERS) for row in rows]
+
+    def get_task_columns(
+        self, task_id: str, columns: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Busca só as colunas pedidas de uma tarefa.
+
+        Raises:
+            ValueError: Se alguma coluna não existir
+        """
+        select = _projection(columns, _TASK_DECODERS)
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    f"SELECT {select} FROM tasks WHERE id = ?",
+                    (self._resolve_id(conn, "task", task_id),),
+                ).fetchone()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load task: {e}") from e
+
+        return _decode_row(row, _TASK_DECODERS) if row else None
+
+    def find_tasks(self, filters: TaskFilter) -> List[Task]:
+        """Carrega as tarefas que atendem ao filtro."""
+        where, params = filters.to_sql()
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    f"SELECT {self.TASK_COLUMNS} FROM tasks{where}", params
+                ).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load tasks: {e}") from e
+
+        return [self._row_to_task(row) for row in rows]
+
+    def task_facets(
+        self, filters: Optional[TaskFilter] = None
+    ) -> Tuple[int, Dict[str, Dict[str, int]]]:
+        """
+        Conta as tarefas por status, prioridade, categoria e mês do prazo.
+
+        Cada faceta é um ``GROUP BY`` sobre colunas indexadas, todas lidas na
+        mesma transação. O resultado fica em cache até a revisão mudar.
+
+        Returns:
+            Revisão em que as contagens foram feitas e as contagens por faceta
+        """
+        filters = filters or TaskFilter()
+        where, params = filters.to_sql()
+        try:
+            with self._get_connection() as conn:
+                # Reaproveita a transação de read_transaction, se houver
+                owns_transaction = not conn.in_transaction
+                if owns_transaction:
+                    conn.execute("BEGIN")
+                try:
+                    revision = self._read_revision(conn)
+                    with self._facets_lock:
+                        cached = self._facets_cache.get(filters)
+                        if cached is not None and cached[0] == revision:
+                            self._facets_cache.move_to_end(filters)
+                            return cached
+                    facets = {
+                        name: {
+                            key: count
+                            for key, count in conn.execute(
+                                f"SELECT {expr}, COUNT(*) FROM tasks{where} "
+                                "GROUP BY 1 ORDER BY 1",
+                                params,
+                            )
+                        }
+                        for name, expr in FACETS.items()
+                    }
+                finally:
+                    if owns_transaction:
+                        conn.rollback()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to count tasks: {e}") from e
+
+        with self._facets_lock:
+            self._facets_cache[filters] = (revision, facets)
+            self._facets_cache.move_to_end(filters)
+            if len(self._facets_cache) > self.FACETS_CACHE_SIZE:
+                self._facets_cache.popitem(last=False)
+        return revision, facets
+
+    def tasks_by_deadline(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        limit: Optional[int] = None,
+    ) -> List[Task]:
+        """Carrega tarefas com deadline em [start, end], ordenadas por deadline."""
+        query = f"SELECT {self.TASK_COLUMNS} FROM tasks WHERE deadline >= ? AND deadline <= ?"
+        params: list = [
+            start.isoformat() if start else date.min.isoformat(),
+            end.isoformat() if end else date.max.isoformat(),
+        ]
+        query += " ORDER BY deadline, id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load tasks: {e}") from e
+
+        return [self._row_to_task(row) for row in rows]
+
+    def tasks_overlapping(self, start: date, end: date) -> List[Task]:
+        """
+        Carrega tarefas cuja barra (criação → conclusão ou prazo) cruza
+        [start, end], ordenadas pela criação.
+
+        O fim da barra é uma expressão indexada, então a consulta só lê as
+        tarefas que terminam a partir de ``start``. A ordenação fica em Python:
+        um ORDER BY created_at levaria o SQLite a varrer o índice de criação.
+        """
+        query = (
+            f"SELECT {self.TASK_COLUMNS} FROM tasks "
+            f"WHERE {_SPAN_END_SQL} >= ? AND created_at < ?"
+        )
+        # Datas ISO comparam como texto: tudo criado antes do dia seguinte a end
+        params = (start.isoformat(), (end + timedelta(days=1)).isoformat())
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load tasks: {e}") from e
+
+        tasks = [self._row_to_task(row) for row in rows]
+        return sorted(tasks, key=lambda task: (task.created_at, task.id))
+
+    def deadline_index(self) -> DeadlineIndex:
+        """
+        Retorna o índice de prazos das tarefas abertas.
+
+        O índice é construído no primeiro uso e mantido pelas escritas desta
+        instância. Cada chamada compara a revisão do banco com a do índice;
+        se outro processo (outro worker do uvicorn, o CLI) escreveu no
+        arquivo, o índice é reconstruído.
+        """
+        with self._index_lock:
+            try:
+                with self._get_connection() as conn:
+                    revision = self._read_revision(conn)
+                    if (
+                        self._deadline_index is not None
+                        and self._index_revision == revision
+                    ):
+                        return self._deadline_index
+                    # Revisão e linhas do mesmo snapshot
+                    owns_transaction = not conn.in_transaction
+                    if owns_transaction:
+                        conn.execute("BEGIN")
+                    try:
+                        revision = self._read_revision(conn)
+                        rows = conn.execute(
+                            f"SELECT {self.TASK_COLUMNS} FROM tasks WHERE status != ?",
+                            (TaskStatus.COMPLETED.name,),
+                        ).fetchall()
+                    finally:
+                        if owns_transaction:
+                            conn.rollback()
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Failed to load tasks: {e}") from e
+            self._deadline_index = DeadlineIndex.build(
+                self._row_to_task(row) for row in rows
             )
-        return tasks
+            self._index_revision = revision
+            return self._deadline_index
+
+    def _sync_deadline_index(
+        self, revision: int, change: Optional[Callable[[DeadlineIndex], None]] = None
+    ) -> None:
+        """
+        Aplica ao índice de prazos uma escrita desta instância.
+
+        A atualização só é incremental se o índice estava na revisão anterior
+        à escrita; se outro processo escreveu no meio, o índice é descartado
+        e reconstruído no próximo uso.
+        """
+        with self._index_lock:
+            if self._deadline_index is None:
+                return
+            if self._index_revision == revision - 1:
+                if change is not None:
+                    change(self._deadline_index)
+                self._index_revision = revision
+            else:
+                self._deadline_index = None
+
+    def task_frame(self) -> TaskFrame:
+        """Carrega as tarefas como TaskFrame (colunas NumPy), sem criar objetos Task."""
+        try:
+            with self._get_connection() as conn:
+                return TaskFrame.from_cursor(conn.execute(FRAME_QUERY))
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load tasks: {e}") from e
+
+    def add_task(self, task: Task) -> None:
+        """Insere uma nova tarefa."""
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    f"INSERT INTO tasks ({self.TASK_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    self._task_params(task),
+                )
+                self._log_task_change(conn, None, task)
+                self._record_status(
+                    conn,
+                    task.id,
+                    None,
+                    task.status,
+                    task.completed_at or task.created_at,
+                )
+                self._invalidate_cycle_time(conn, None, task)
+                self._update_activity(conn, None, task)
+                revision = self._bump_revision(conn)
+                conn.commit()
+                self._snapshot_if_due(conn)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to add task: {e}") from e
+
+        self._sync_deadline_index(revision, lambda index: index.upsert(task))
+
+    def update_task(
+        self, task: Task, automatic: bool = False, refresh_blocked: bool = False
+    ) -> bool:
+        """
+        Atualiza uma tarefa existente. Retorna False se ela não existir.
+
+        ``automatic`` marca mudanças derivadas (bloqueio por dependências):
+        ficam no histórico, mas fora da cadeia de desfazer.
+
+        Com ``refresh_blocked``, o bloqueio da tarefa (e, se o status mudou,
+        o dos dependentes) é recalculado na mesma transação.
+        """
+        params = self._task_params(task)
+        try:
+            with self._get_connection() as conn:
+                # "Antes" lido na mesma transação da escrita
+                conn.execute("BEGIN IMMEDIATE")
+                before = self._fetch_task(conn, task.id)
+                cursor = conn.execute(
+                    """
+                    UPDATE tasks SET title = ?, description = ?, deadline = ?, status = ?,
+                        priority = ?, category = ?, created_at = ?, completed_at = ?,
+                        effort_hours = ?
+                    WHERE id = ?
+                """,
+                    params[1:] + params[:1],
+                )
+                refreshed: List[Task] = []
+                if before is not None:
+                    self._log_task_change(conn, before, task, automatic)
+                    self._record_status(
+                        conn, task.id, before.status, task.status, task.completed_at
+                    )
+                    self._invalidate_cycle_time(conn, before, task)
+                    self._update_activity(conn, before, task)
+                    if refresh_blocked:
+                        top = self._read_meta(conn, "history_top")
+                        refreshed = self._refresh_blocked(
+                            conn, [task.id], top, keep_independent=True
+                        )
+                        if before.status != task.status:
+                            refreshed += self._refresh_blocked(
+                                conn, self._dependent_ids(conn, task.id), top
+                            )
+                revision = self._bump_revision(conn)
+                conn.commit()
+                self._snapshot_if_due(conn)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to update task: {e}") from e
+
+        if cursor.rowcount == 0:
+            self._sync_deadline_index(revision)
+            return False
+        self._sync_refreshed(revision, [task, *refreshed])
+        return True
+
+    def delete_task(self, task_id: str, refresh_blocked: bool = False) -> bool:
+        """
+        Remove uma tarefa (pelo ID ou por um ID antigo). Retorna False se ela não existir.
+
+        Com ``refresh_blocked``, o bloqueio dos dependentes é recalculado na
+        mesma transação.
+        """
+        try:
+            with self._get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                task_id = self._resolve_id(conn, "task", task_id)
+                before = self._fetch_task(conn, task_id)
+                dependents = self._dependent_ids(conn, task_id)
+                cursor = conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+                conn.execute(
+                    "DELETE FROM id_aliases WHERE kind = 'task' AND id = ?", (task_id,)
+                )
+                conn.execute(
+                    "DELETE FROM task_dependencies WHERE task_id = ? OR depends_on = ?",
+                    (task_id, task_id),
+                )
+                refreshed: List[Task] = []
+                if before is not None:
+                    self._log_task_change(conn, before, None)
+                    self._record_status(conn, task_id, before.status, None)
+                    self._invalidate_cycle_time(conn, before, None)
+                    self._update_activity(conn, before, None)
+                    if refresh_blocked:
+                        refreshed = self._refresh_blocked(
+                            conn, dependents, self._read_meta(conn, "history_top")
+                        )
+                revision = self._bump_revision(conn)
+                conn.commit()
+                self._snapshot_if_due(conn)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to delete task: {e}") from e
+
+        if cursor.rowcount == 0:
+            self._sync_deadline_index(revision)
+            return False
+
+        def sync(index: DeadlineIndex) -> None:
+            index.discard(task_id)
+            for changed in refreshed:
+                index.upsert(changed)
+
+        self._sync_deadline_index(revision, sync)
+        return True
 
     def save_milestones(self, milestones: List[Milestone]) -> None:
         """Salva lista de milestones no SQLite."""
@@ -273,46 +1125,1277 @@ class Database:
                 conn.execute("DELETE FROM milestones")
 
                 # Insert all milestones
-                for milestone in milestones:
-                    conn.execute(
-                        """
-                        INSERT INTO milestones
-                        (id, title, description, target_date, is_achieved)
-                        VALUES (?, ?, ?, ?, ?)
-                    """,
-                        (
-                            milestone.id,
-                            milestone.title,
-                            milestone.description,
-                            milestone.target_date.isoformat(),
-                            1 if milestone.is_achieved else 0,
-                        ),
-                    )
+                conn.executemany(
+                    f"INSERT INTO milestones ({self.MILESTONE_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                    [self._milestone_params(m) for m in milestones],
+                )
+                revision = self._bump_revision(conn)
                 conn.commit()
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to save milestones: {e}") from e
 
+        # Marcos não entram no índice, mas a revisão dele acompanha a escrita
+        self._sync_deadline_index(revision)
+
     def load_milestones(self) -> List[Milestone]:
         """Carrega lista de milestones do SQLite."""
         try:
             with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT id, title, description, target_date, is_achieved
-                    FROM milestones
-                """)
+                cursor = conn.execute(
+                    f"SELECT {self.MILESTONE_COLUMNS} FROM milestones"
+                )
                 rows = cursor.fetchall()
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to load milestones: {e}") from e
 
-        milestones = []
-        for row in rows:
-            milestones.append(
-                Milestone(
-                    id=row["id"],
-                    title=row["title"],
-                    description=row["description"],
-                    target_date=datetime.fromisoformat(row["target_date"]).date(),
-                    is_achieved=bool(row["is_achieved"]),
-                )
+        return [self._row_to_milestone(row) for row in rows]
+
+    def milestones_by_date(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        achieved: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> List[Milestone]:
+        """
+        Carrega milestones com data alvo em [start, end], ordenados por data.
+
+        Args:
+            start: Início do intervalo (inclusive); sem limite se None
+            end: Fim do intervalo (inclusive); sem limite se None
+            achieved: Filtra por atingidos/não atingidos; ambos se None
+            limit: Número máximo de milestones retornados
+        """
+        query, params = self._milestone_range_query(
+            self.MILESTONE_COLUMNS, start, end, achieved, limit
+        )
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load milestones: {e}") from e
+
+        return [self._row_to_milestone(row) for row in rows]
+
+    @staticmethod
+    def _milestone_range_query(
+        select: str,
+        start: Optional[date],
+        end: Optional[date],
+        achieved: Optional[bool],
+        limit: Optional[int],
+    ) -> Tuple[str, list]:
+        """Monta a consulta por intervalo de data alvo com as colunas de ``select``."""
+        query = (
+            f"SELECT {select} FROM milestones "
+            "WHERE target_date >= ? AND target_date <= ?"
+        )
+        params: list = [
+            start.isoformat() if start else date.min.isoformat(),
+            end.isoformat() if end else date.max.isoformat(),
+        ]
+        if achieved is not None:
+            query += " AND is_achieved = ?"
+            params.append(1 if achieved else 0)
+        query += " ORDER BY target_date, id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return query, params
+
+    def load_milestone_columns(
+        self,
+        columns: Sequence[str],
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        achieved: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Carrega só as colunas pedidas dos milestones, como dicionários.
+        Com filtros, usa a mesma consulta ordenada de milestones_by_date.
+
+        Raises:
+            ValueError: Se alguma coluna não existir
+        """
+        select = _projection(columns, _MILESTONE_DECODERS)
+        if start is None and end is None and achieved is None:
+            query, params = f"SELECT {select} FROM milestones", []
+        else:
+            query, params = self._milestone_range_query(
+                select, start, end, achieved, None
+            )
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load milestones: {e}") from e
+
+        return [_decode_row(row, _MILESTONE_DECODERS) for row in rows]
+
+    def get_milestone_columns(
+        self, milestone_id: str, columns: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Busca só as colunas pedidas de um milestone.
+
+        Raises:
+            ValueError: Se alguma coluna não existir
+        """
+        select = _projection(columns, _MILESTONE_DECODERS)
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    f"SELECT {select} FROM milestones WHERE id = ?",
+                    (self._resolve_id(conn, "milestone", milestone_id),),
+                ).fetchone()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load milestone: {e}") from e
+
+        return _decode_row(row, _MILESTONE_DECODERS) if row else None
+
+    def get_milestone(self, milestone_id: str) -> Optional[Milestone]:
+        """Busca um milestone pelo ID (ou por um ID antigo migrado)."""
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    f"SELECT {self.MILESTONE_COLUMNS} FROM milestones WHERE id = ?",
+                    (self._resolve_id(conn, "milestone", milestone_id),),
+                ).fetchone()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load milestone: {e}") from e
+
+        return self._row_to_milestone(row) if row else None
+
+    def add_milestone(self, milestone: Milestone) -> None:
+        """Insere um novo milestone."""
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    f"INSERT INTO milestones ({self.MILESTONE_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                    self._milestone_params(milestone),
+                )
+                revision = self._bump_revision(conn)
+                conn.commit()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to add milestone: {e}") from e
+
+        self._sync_deadline_index(revision)
+
+    def update_milestone(self, milestone: Milestone) -> bool:
+        """Atualiza um milestone existente. Retorna False se ele não existir."""
+        params = self._milestone_params(milestone)
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    """
+                    UPDATE milestones SET title = ?, description = ?, target_date = ?, is_achieved = ?
+                    WHERE id = ?
+                """,
+                    params[1:] + params[:1],
+                )
+                revision = self._bump_revision(conn)
+                conn.commit()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to update milestone: {e}") from e
+
+        self._sync_deadline_index(revision)
+
+        return cursor.rowcount > 0
+
+    def delete_milestone(self, milestone_id: str) -> bool:
+        """Remove um milestone (pelo ID ou por um ID antigo). Retorna False se ele não existir."""
+        try:
+            with self._get_connection() as conn:
+                milestone_id = self._resolve_id(conn, "milestone", milestone_id)
+                cursor = conn.execute(
+                    "DELETE FROM milestones WHERE id = ?", (milestone_id,)
+                )
+                conn.execute(
+                    "DELETE FROM id_aliases WHERE kind = 'milestone' AND id = ?",
+                    (milestone_id,),
+                )
+                revision = self._bump_revision(conn)
+                conn.commit()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to delete milestone: {e}") from e
+
+        self._sync_deadline_index(revision)
+
+        return cursor.rowcount > 0
+
+    def migrate_ids(self) -> int:
+        """
+        Troca IDs aleatórios (uuid4 ou os 8 caracteres do CLI) por IDs
+        ordenados pelo tempo, em uma única transação.
+
+        Tarefas recebem IDs com o timestamp de ``created_at``, preservando a
+        ordem de criação. Os IDs antigos ficam em ``id_aliases`` e continuam
+        funcionando em get/delete. Idempotente.
+
+        Returns:
+            Número de tarefas e milestones migrados
+        """
+        migrated = 0
+        try:
+            with self._get_connection() as conn:
+                try:
+                    tasks = conn.execute(
+                        "SELECT id, created_at FROM tasks ORDER BY created_at, id"
+                    ).fetchall()
+                    for old_id, created_at in tasks:
+                        if is_time_ordered_id(old_id):
+                            continue
+                        self._rename_id(
+                            conn,
+                            "task",
+                            old_id,
+                            new_id(datetime.fromisoformat(created_at)),
+                        )
+                        migrated += 1
+
+                    milestones = conn.execute(
+                        "SELECT id FROM milestones ORDER BY target_date, id"
+                    ).fetchall()
+                    for (old_id,) in milestones:
+                        if is_time_ordered_id(old_id):
+                            continue
+                        self._rename_id(conn, "milestone", old_id, new_id())
+                        migrated += 1
+
+                    # Eventos e snapshots citam os IDs antigos
+                    if migrated:
+                        self._reset_history(conn)
+                    self._bump_revision(conn)
+                    conn.commit()
+                except sqlite3.Error:
+                    conn.rollback()
+                    raise
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to migrate ids: {e}") from e
+        finally:
+            self._deadline_index = None
+
+        return migrated
+
+    @staticmethod
+    def _rename_id(
+        conn: sqlite3.Connection, kind: str, old_id: str, new_id: str
+    ) -> None:
+        """Renomeia o ID de uma linha e registra o antigo como apelido."""
+        table = "tasks" if kind == "task" else "milestones"
+        conn.execute(f"UPDATE {table} SET id = ? WHERE id = ?", (new_id, old_id))
+        if kind == "task":
+            conn.execute(
+                "UPDATE status_transitions SET task_id = ? WHERE task_id = ?",
+                (new_id, old_id),
+            )
+            for column in ("task_id", "depends_on"):
+                conn.execute(
+                    f"UPDATE task_dependencies SET {column} = ? WHERE {column} = ?",
+                    (new_id, old_id),
+                )
+        # Apelidos que apontavam para o ID antigo passam a apontar para o novo
+        conn.execute(
+            "UPDATE id_aliases SET id = ? WHERE kind = ? AND id = ?",
+            (new_id, kind, old_id),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO id_aliases (kind, alias, id) VALUES (?, ?, ?)",
+            (kind, old_id, new_id),
+        )
+
+    # Dependências entre tarefas
+
+    def dependency_edges(self) -> List[Tuple[str, str]]:
+        """Todas as dependências, como pares ``(task_id, depends_on)``."""
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    "SELECT task_id, depends_on FROM task_dependencies "
+                    "ORDER BY task_id, depends_on"
+                ).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load dependencies: {e}") from e
+        return [(row[0], row[1]) for row in rows]
+
+    def _dependency_ids(self, task_id: str, column: str, other: str) -> List[str]:
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    f"SELECT {other} FROM task_dependencies WHERE {column} = ? "
+                    f"ORDER BY {other}",
+                    (self._resolve_id(conn, "task", task_id),),
+                ).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load dependencies: {e}") from e
+        return [row[0] for row in rows]
+
+    def dependencies(self, task_id: str) -> List[str]:
+        """IDs das tarefas de que ``task_id`` depende (pré-requisitos diretos)."""
+        return self._dependency_ids(task_id, "task_id", "depends_on")
+
+    def dependents(self, task_id: str) -> List[str]:
+        """IDs das tarefas que dependem diretamente de ``task_id``."""
+        return self._dependency_ids(task_id, "depends_on", "task_id")
+
+    def add_dependency(
+        self, task_id: str, depends_on: str, refresh_blocked: bool = False
+    ) -> bool:
+        """
+        Registra que ``task_id`` só pode ser feita depois de ``depends_on``.
+
+        Antes de inserir, uma CTE recursiva percorre os pré-requisitos de
+        ``depends_on``: se ``task_id`` estiver entre eles, a aresta fecharia
+        um ciclo. Com ``refresh_blocked``, o bloqueio de ``task_id`` é
+        recalculado na mesma transação.
+
+        Returns:
+            False se a dependência já existia
+
+        Raises:
+            ValueError: Se alguma tarefa não existir, se forem a mesma tarefa
+                ou se a dependência criar um ciclo
+        """
+        try:
+            with self._get_connection() as conn:
+                task_id = self._resolve_id(conn, "task", task_id)
+                depends_on = self._resolve_id(conn, "task", depends_on)
+                for item_id in (task_id, depends_on):
+                    if not conn.execute(
+                        "SELECT 1 FROM tasks WHERE id = ?", (item_id,)
+                    ).fetchone():
+                        raise ValueError(f"Task not found: {item_id!r}")
+                if task_id == depends_on:
+                    raise ValueError("A task cannot depend on itself")
+                cycle = conn.execute(
+                    """
+                    WITH RECURSIVE upstream(id) AS (
+                        SELECT :depends_on
+                        UNION
+                        SELECT d.depends_on FROM task_dependencies d
+                        JOIN upstream u ON d.task_id = u.id
+                    )
+                    SELECT 1 FROM upstream WHERE id = :task_id LIMIT 1
+                """,
+                    {"task_id": task_id, "depends_on": depends_on},
+                ).fetchone()
+                if cycle:
+                    raise ValueError(
+                        f"Dependency cycle: {depends_on!r} already depends on "
+                        f"{task_id!r}"
+                    )
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO task_dependencies (task_id, depends_on) "
+                    "VALUES (?, ?)",
+                    (task_id, depends_on),
+                )
+                refreshed = (
+                    self._refresh_blocked(
+                        conn, [task_id], self._read_meta(conn, "history_top")
+                    )
+                    if refresh_blocked
+                    else []
+                )
+                revision = self._bump_revision(conn)
+                conn.commit()
+                self._snapshot_if_due(conn)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to add dependency: {e}") from e
+
+        self._sync_refreshed(revision, refreshed)
+        return cursor.rowcount > 0
+
+    def remove_dependency(
+        self, task_id: str, depends_on: str, refresh_blocked: bool = False
+    ) -> bool:
+        """
+        Remove uma dependência. Retorna False se ela não existir.
+
+        Com ``refresh_blocked``, o bloqueio de ``task_id`` é recalculado na
+        mesma transação.
+        """
+        try:
+            with self._get_connection() as conn:
+                task_id = self._resolve_id(conn, "task", task_id)
+                cursor = conn.execute(
+                    "DELETE FROM task_dependencies WHERE task_id = ? AND depends_on = ?",
+                    (task_id, self._resolve_id(conn, "task", depends_on)),
+                )
+                refreshed = (
+                    self._refresh_blocked(
+                        conn, [task_id], self._read_meta(conn, "history_top")
+                    )
+                    if refresh_blocked and cursor.rowcount
+                    else []
+                )
+                revision = self._bump_revision(conn)
+                conn.commit()
+                self._snapshot_if_due(conn)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to remove dependency: {e}") from e
+
+        self._sync_refreshed(revision, refreshed)
+        return cursor.rowcount > 0
+
+    def _sync_refreshed(self, revision: int, refreshed: List[Task]) -> None:
+        """Leva ao índice de prazos as tarefas gravadas por uma escrita."""
+
+        def sync(index: DeadlineIndex) -> None:
+            for changed in refreshed:
+                index.upsert(changed)
+
+        self._sync_deadline_index(revision, sync)
+
+    # Histórico de tarefas (undo/redo)
+
+    @staticmethod
+    def _read_meta(conn: sqlite3.Connection, key: str) -> int:
+        return conn.execute(
+            "SELECT value FROM storage_meta WHERE key = ?", (key,)
+        ).fetchone()[0]
+
+    @staticmethod
+    def _write_meta(conn: sqlite3.Connection, key: str, value: int) -> None:
+        conn.execute("UPDATE storage_meta SET value = ? WHERE key = ?", (value, key))
+
+    @staticmethod
+    def _row_to_event(row: sqlite3.Row) -> TaskEvent:
+        before, after = decode_change(row["change"])
+        return TaskEvent(
+            seq=row["seq"],
+            task_id=row["task_id"],
+            kind=EventKind(row["kind"]),
+            at=_from_micros(row["at"]),
+            ref=row["ref"],
+            before=before,
+            after=after,
+        )
+
+    def _write_snapshot(self, conn: sqlite3.Connection, seq: int) -> None:
+        """Grava o estado atual das tarefas como snapshot na posição ``seq``."""
+        rows = conn.execute(f"SELECT {self.TASK_COLUMNS} FROM tasks").fetchall()
+        conn.execute(
+            "INSERT OR REPLACE INTO task_snapshots (seq, state) VALUES (?, ?)",
+            (seq, encode_states(self._row_to_task(row) for row in rows)),
+        )
+
+    def _ensure_history_baseline(self) -> None:
+        """Grava o snapshot inicial, para o replay de bancos com tarefas anteriores ao histórico."""
+        try:
+            with self._get_connection() as conn:
+                if conn.execute("SELECT 1 FROM task_snapshots LIMIT 1").fetchone():
+                    return
+                last = conn.execute(
+                    "SELECT COALESCE(MAX(seq), 0) FROM task_events"
+                ).fetchone()[0]
+                self._write_snapshot(conn, last)
+                conn.commit()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to initialize history: {e}") from e
+
+    def _reset_history(self, conn: sqlite3.Connection) -> None:
+        """Descarta eventos e snapshots e recomeça a partir do estado atual."""
+        conn.execute("DELETE FROM task_events")
+        conn.execute("DELETE FROM task_snapshots")
+        self._write_meta(conn, "history_top", 0)
+        self._write_snapshot(conn, 0)
+
+    def _append_event(
+        self,
+        conn: sqlite3.Connection,
+        kind: EventKind,
+        task_id: str,
+        ref: int,
+        before: Optional[Dict[str, Any]],
+        after: Optional[Dict[str, Any]],
+    ) -> int:
+        """Grava um evento (depois da escrita, na mesma transação) e retorna sua posição."""
+        at = _to_micros(datetime.now())
+        seq = conn.execute(
+            "INSERT INTO task_events (task_id, kind, at, ref, change) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (task_id, int(kind), at, ref, encode_change(before, after)),
+        ).lastrowid
+        return seq
+
+    def _snapshot_if_due(self, conn: sqlite3.Connection) -> None:
+        """
+        Grava um snapshot (e poda o histórico) se o último ficou
+        ``SNAPSHOT_INTERVAL`` eventos para trás.
+
+        Chamado depois do commit de uma escrita, em transação própria, para
+        não serializar a tabela inteira dentro da escrita do usuário. Se o
+        banco estiver ocupado, o snapshot fica para a próxima escrita.
+        """
+        due = (
+            "SELECT (SELECT COALESCE(MAX(seq), 0) FROM task_events), "
+            "(SELECT COALESCE(MAX(seq), 0) FROM task_snapshots)"
+        )
+        last, snapshot = conn.execute(due).fetchone()
+        if last - snapshot < self.SNAPSHOT_INTERVAL:
+            return
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # Outra escrita pode ter gravado o snapshot ou novos eventos antes
+            last, snapshot = conn.execute(due).fetchone()
+            if last - snapshot >= self.SNAPSHOT_INTERVAL:
+                self._write_snapshot(conn, last)
+                self._prune_history(conn, self.HISTORY_LIMIT)
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+
+    def _log_task_change(
+        self,
+        conn: sqlite3.Connection,
+        before: Optional[Task],
+        after: Optional[Task],
+        automatic: bool = False,
+    ) -> None:
+        """
+        Registra uma escrita do usuário no topo da cadeia de desfazer; as
+        automáticas entram no log sem mover o topo.
+        """
+        change = task_change(before, after)
+        if change is None:
+            return
+        kind, old, new = change
+        task_id = (after or before).id
+        top = self._read_meta(conn, "history_top")
+        if automatic:
+            self._append_event(conn, EventKind.AUTOMATIC, task_id, top, old, new)
+            return
+        seq = self._append_event(conn, kind, task_id, top, old, new)
+        self._write_meta(conn, "history_top", seq)
+
+    def _apply_task_state(
+        self, conn: sqlite3.Connection, task_id: str, state: Optional[Dict[str, Any]]
+    ) -> Optional[Task]:
+        """Leva uma tarefa ao estado (parcial) dado; None a remove."""
+        current = self._fetch_task(conn, task_id)
+        if state is None:
+            conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            conn.execute(
+                "DELETE FROM task_dependencies WHERE task_id = ? OR depends_on = ?",
+                (task_id, task_id),
+            )
+            task = None
+        else:
+            task = replace(current, **state) if current else Task(id=task_id, **state)
+            conn.execute(
+                f"INSERT OR REPLACE INTO tasks ({self.TASK_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._task_params(task),
+            )
+        self._record_status(
+            conn,
+            task_id,
+            current.status if current else None,
+            task.status if task else None,
+        )
+        self._invalidate_cycle_time(conn, current, task)
+        self._update_activity(conn, current, task)
+        return task
+
+    @staticmethod
+    def _dependent_ids(conn: sqlite3.Connection, task_id: str) -> List[str]:
+        return [
+            row[0]
+            for row in conn.execute(
+                "SELECT task_id FROM task_dependencies WHERE depends_on = ?",
+                (task_id,),
+            )
+        ]
+
+    def _refresh_blocked(
+        self,
+        conn: sqlite3.Connection,
+        task_ids: Sequence[str],
+        ref: int,
+        keep_independent: bool = False,
+    ) -> List[Task]:
+        """
+        Reaplica o bloqueio por dependências (como em
+        :func:`~phd_progress_tracker.utils.dependencies.refresh_blocked`),
+        gravando as mudanças como eventos automáticos.
+        """
+        changed = []
+        for task_id in dict.fromkeys(task_ids):
+            task = self._fetch_task(conn, task_id)
+            if task is None or task.status == TaskStatus.COMPLETED:
+                continue
+            prerequisites, waiting = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(t.status != ?), 0) "
+                "FROM task_dependencies d JOIN tasks t ON t.id = d.depends_on "
+                "WHERE d.task_id = ?",
+                (TaskStatus.COMPLETED.name, task_id),
+            ).fetchone()
+            if keep_independent and not prerequisites:
+                continue
+            status = blocked_status(task, waiting > 0)
+            if status is None:
+                continue
+            old, new = {"status": task.status}, {"status": status}
+            changed.append(self._apply_task_state(conn, task_id, new))
+            self._append_event(conn, EventKind.AUTOMATIC, task_id, ref, old, new)
+        return changed
+
+    def _move_history(self, redo: bool) -> Optional[TaskEvent]:
+        """
+        Desfaz o evento no topo da cadeia ou refaz o último desfeito.
+
+        O bloqueio por dependências da tarefa e dos dependentes dela é
+        recalculado na mesma transação, a partir do estado restaurado.
+        """
+        action = "redo" if redo else "undo"
+        try:
+            with self._get_connection() as conn:
+                # Leitura e escrita na mesma transação, mesmo com outros processos
+                conn.execute("BEGIN IMMEDIATE")
+                top = self._read_meta(conn, "history_top")
+                if redo:
+                    # Ramo mais recente a partir do topo (como no undo do vim)
+                    row = conn.execute(
+                        "SELECT * FROM task_events WHERE ref = ? AND kind IN "
+                        f"({', '.join(str(int(k)) for k in USER_KINDS)}) "
+                        "ORDER BY seq DESC LIMIT 1",
+                        (top,),
+                    ).fetchone()
+                else:
+                    row = conn.execute(
+                        "SELECT * FROM task_events WHERE seq = ?", (top,)
+                    ).fetchone()
+                if row is None:
+                    conn.rollback()
+                    return None
+                event = self._row_to_event(row)
+                if redo:
+                    kind, old, new = EventKind.REDONE, event.before, event.after
+                    new_top = event.seq
+                else:
+                    kind, old, new = EventKind.UNDONE, event.after, event.before
+                    new_top = event.ref
+                dependents = self._dependent_ids(conn, event.task_id)
+                task = self._apply_task_state(conn, event.task_id, new)
+                self._append_event(conn, kind, event.task_id, event.seq, old, new)
+                self._write_meta(conn, "history_top", new_top)
+                refreshed = self._refresh_blocked(
+                    conn, [event.task_id], new_top, keep_independent=True
+                ) + self._refresh_blocked(conn, dependents, new_top)
+                revision = self._bump_revision(conn)
+                conn.commit()
+                self._snapshot_if_due(conn)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to {action}: {e}") from e
+
+        def sync(index: DeadlineIndex) -> None:
+            if task:
+                index.upsert(task)
+            else:
+                index.discard(event.task_id)
+            for changed in refreshed:
+                index.upsert(changed)
+
+        self._sync_deadline_index(revision, sync)
+        return event
+
+    def undo(self) -> Optional[TaskEvent]:
+        """
+        Desfaz a última alteração de tarefa (criação, edição, conclusão ou remoção).
+
+        Returns:
+            O evento desfeito, ou None se não houver o que desfazer
+        """
+        return self._move_history(redo=False)
+
+    def redo(self) -> Optional[TaskEvent]:
+        """
+        Refaz a última alteração desfeita.
+
+        Depois de uma nova alteração, o ramo desfeito deixa de ser refeito.
+
+        Returns:
+            O evento refeito, ou None se não houver o que refazer
+        """
+        return self._move_history(redo=True)
+
+    def task_history(self, task_id: str) -> List[TaskEvent]:
+        """Eventos de uma tarefa (pelo ID ou por um ID antigo), do mais antigo ao mais recente."""
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    "SELECT * FROM task_events WHERE task_id = ? ORDER BY seq",
+                    (self._resolve_id(conn, "task", task_id),),
+                ).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load task history: {e}") from e
+
+        return [self._row_to_event(row) for row in rows]
+
+    def tasks_at(self, seq: int) -> List[Task]:
+        """
+        Reconstrói as tarefas como estavam logo após o evento ``seq``.
+
+        Parte do snapshot mais próximo e reaplica só os eventos seguintes.
+
+        Raises:
+            ValueError: Se essa parte do histórico já foi podada
+        """
+        try:
+            with self._get_connection() as conn:
+                owns_transaction = not conn.in_transaction
+                if owns_transaction:
+                    conn.execute("BEGIN")
+                try:
+                    snapshot = conn.execute(
+                        "SELECT seq, state FROM task_snapshots WHERE seq <= ? "
+                        "ORDER BY seq DESC LIMIT 1",
+                        (seq,),
+                    ).fetchone()
+                    if snapshot is None:
+                        raise ValueError(f"History before event {seq} was pruned")
+                    rows = conn.execute(
+                        "SELECT task_id, change FROM task_events "
+                        "WHERE seq > ? AND seq <= ? ORDER BY seq",
+                        (snapshot["seq"], seq),
+                    ).fetchall()
+                finally:
+                    if owns_transaction:
+                        conn.rollback()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to replay history: {e}") from e
+
+        return replay(
+            decode_states(snapshot["state"]),
+            ((row["task_id"], decode_change(row["change"])[1]) for row in rows),
+        )
+
+    def _prune_history(self, conn: sqlite3.Connection, keep: int) -> int:
+        last = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM task_events").fetchone()[
+            0
+        ]
+        # O corte cai sempre em um snapshot, para o replay continuar possível
+        cutoff = conn.execute(
+            "SELECT MAX(seq) FROM task_snapshots WHERE seq <= ?", (last - keep,)
+        ).fetchone()[0]
+        if cutoff is None:
+            return 0
+        deleted = conn.execute(
+            "DELETE FROM task_events WHERE seq <= ?", (cutoff,)
+        ).rowcount
+        conn.execute("DELETE FROM task_snapshots WHERE seq < ?", (cutoff,))
+        return deleted
+
+    def prune_history(self, keep: int) -> int:
+        """
+        Remove eventos antigos, mantendo pelo menos os ``keep`` mais recentes.
+
+        Alterações podadas não podem mais ser desfeitas.
+
+        Returns:
+            Número de eventos removidos
+        """
+        try:
+            with self._get_connection() as conn:
+                deleted = self._prune_history(conn, keep)
+                conn.commit()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to prune history: {e}") from e
+        return deleted
+
+    # Tempo em cada status
+
+    @staticmethod
+    def _record_status(
+        conn: sqlite3.Connection,
+        task_id: str,
+        before: Optional[TaskStatus],
+        after: Optional[TaskStatus],
+        at: Optional[datetime] = None,
+    ) -> None:
+        """Fecha o intervalo do status anterior e abre o do novo, se o status mudou."""
+        if before == after:
+            return
+        micros = _to_micros(at or datetime.now())
+        conn.execute(
+            "UPDATE status_transitions SET left_at = ? "
+            "WHERE task_id = ? AND left_at IS NULL",
+            (micros, task_id),
+        )
+        if after is not None:
+            conn.execute(
+                "INSERT OR REPLACE INTO status_transitions (task_id, status, entered_at) "
+                "VALUES (?, ?, ?)",
+                (task_id, STATUS_CODES[after], micros),
+            )
+
+    @staticmethod
+    def _reconcile_status_transitions(conn: sqlite3.Connection) -> None:
+        """
+        Alinha os intervalos abertos ao status atual das tarefas.
+
+        Necessário para tarefas anteriores à tabela (o intervalo começa em
+        ``created_at``, ou em ``completed_at`` para concluídas) e depois de
+        ``save_tasks``, que substitui tudo de uma vez.
+        """
+        now = _to_micros(datetime.now())
+        status_case = " ".join(
+            f"WHEN '{status.name}' THEN {code}" for status, code in STATUS_CODES.items()
+        )
+        # julianday conta dias; 2440587.5 é 1970-01-01
+        started = (
+            "CAST(ROUND((julianday(CASE WHEN t.status = 'COMPLETED' "
+            "THEN COALESCE(t.completed_at, t.created_at) ELSE t.created_at END) "
+            "- 2440587.5) * 86400000000) AS INTEGER)"
+        )
+        conn.execute(
+            f"""
+            UPDATE status_transitions SET left_at = ?
+            WHERE left_at IS NULL AND NOT EXISTS (
+                SELECT 1 FROM tasks t WHERE t.id = task_id
+                AND (CASE t.status {status_case} END) = status
+            )
+        """,
+            (now,),
+        )
+        conn.execute(f"""
+            INSERT OR REPLACE INTO status_transitions (task_id, status, entered_at)
+            SELECT t.id, CASE t.status {status_case} END,
+                CASE WHEN EXISTS (
+                    SELECT 1 FROM status_transitions s WHERE s.task_id = t.id
+                ) THEN {now} ELSE {started} END
+            FROM tasks t
+            WHERE NOT EXISTS (
+                SELECT 1 FROM status_transitions s
+                WHERE s.task_id = t.id AND s.left_at IS NULL
+            )
+        """)
+
+    def _ensure_status_baseline(self) -> None:
+        """Abre intervalos de status para tarefas ainda sem nenhum (bancos antigos, JSON)."""
+        try:
+            with self._get_connection() as conn:
+                # Verificação barata para não abrir uma escrita a cada inicialização
+                missing = conn.execute(
+                    "SELECT (SELECT COUNT(*) FROM tasks) != (SELECT COUNT(*) "
+                    "FROM status_transitions WHERE left_at IS NULL)"
+                ).fetchone()[0]
+                if missing:
+                    self._reconcile_status_transitions(conn)
+                    conn.commit()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to update status transitions: {e}") from e
+
+    def time_in_status(
+        self, task_id: str, now: Optional[datetime] = None
+    ) -> Dict[TaskStatus, timedelta]:
+        """
+        Soma o tempo que uma tarefa passou em cada status.
+
+        Args:
+            task_id: ID da tarefa (ou um ID antigo)
+            now: Fim do intervalo atual (padrão: agora)
+        """
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    "SELECT status, SUM(COALESCE(left_at, ?) - entered_at) "
+                    "FROM status_transitions WHERE task_id = ? GROUP BY status",
+                    (
+                        _to_micros(now or datetime.now()),
+                        self._resolve_id(conn, "task", task_id),
+                    ),
+                ).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load status transitions: {e}") from e
+
+        return {STATUSES[code]: total * _MICROSECOND for code, total in rows}
+
+    def stalled_tasks(
+        self,
+        days: int,
+        statuses: Sequence[TaskStatus] = (TaskStatus.IN_PROGRESS, TaskStatus.BLOCKED),
+        now: Optional[datetime] = None,
+    ) -> List[Tuple[Task, datetime]]:
+        """
+        Tarefas paradas no status atual há mais de ``days`` dias.
+
+        Usa o índice parcial dos intervalos abertos, sem percorrer o histórico.
+
+        Returns:
+            Pares (tarefa, desde quando está no status), os mais antigos primeiro
+        """
+        cutoff = _to_micros((now or datetime.now()) - timedelta(days=days))
+        codes = [STATUS_CODES[status] for status in statuses]
+        if not codes:
+            return []
+        query = f"""
+            SELECT {", ".join(f"t.{c}" for c in self.TASK_COLUMNS.split(", "))},
+                s.entered_at
+            FROM status_transitions s JOIN tasks t ON t.id = s.task_id
+            WHERE s.left_at IS NULL AND s.status IN ({", ".join("?" * len(codes))})
+                AND s.entered_at <= ?
+            ORDER BY s.entered_at, t.id
+        """
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(query, (*codes, cutoff)).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load stalled tasks: {e}") from e
+
+        return [
+            (self._row_to_task(row), _from_micros(row["entered_at"])) for row in rows
+        ]
+
+    @staticmethod
+    def _invalidate_cycle_time(
+        conn: sqlite3.Connection, before: Optional[Task], after: Optional[Task]
+    ) -> None:
+        """Descarta do cache as semanas de conclusão afetadas por uma escrita."""
+        if (
+            before is not None
+            and after is not None
+            and _cycle_time_fields(before) == _cycle_time_fields(after)
+        ):
+            return
+        weeks = sorted(
+            {
+                week_of(task.completed_at.date())
+                for task in (before, after)
+                if task is not None
+                and task.status == TaskStatus.COMPLETED
+                and task.completed_at is not None
+            }
+        )
+        if not weeks:
+            return
+        marks = ", ".join("?" * len(weeks))
+        conn.execute(f"DELETE FROM cycle_time_weeks WHERE week IN ({marks})", weeks)
+        conn.execute(f"DELETE FROM cycle_time_sketches WHERE week IN ({marks})", weeks)
+
+    @staticmethod
+    def _missing_cycle_time_weeks(
+        conn: sqlite3.Connection, first: int, last: int
+    ) -> List[int]:
+        cached = {
+            week
+            for (week,) in conn.execute(
+                "SELECT week FROM cycle_time_weeks WHERE week BETWEEN ? AND ?",
+                (first, last),
+            )
+        }
+        return [week for week in range(first, last + 1) if week not in cached]
+
+    @staticmethod
+    def _sketch_cycle_time_weeks(
+        conn: sqlite3.Connection, weeks: List[int]
+    ) -> WeekSketches:
+        """Resume as conclusões das semanas dadas, uma consulta por trecho contíguo."""
+        sketches: WeekSketches = {}
+        runs: List[List[int]] = []
+        for week in weeks:
+            if runs and runs[-1][1] == week - 1:
+                runs[-1][1] = week
+            else:
+                runs.append([week, week])
+        for first, last in runs:
+            # Datas ISO comparam como texto; o índice em completed_at limita a leitura
+            cursor = conn.execute(
+                "SELECT category, priority, created_at, completed_at FROM tasks "
+                "WHERE completed_at >= ? AND completed_at < ? AND status = 'COMPLETED'",
+                (week_start(first).isoformat(), week_start(last + 1).isoformat()),
+            )
+            for category, priority, created_at, completed_at in cursor:
+                add_completion(
+                    sketches,
+                    category,
+                    TaskPriority[priority],
+                    datetime.fromisoformat(created_at),
+                    datetime.fromisoformat(completed_at),
+                )
+        return sketches
+
+    def cycle_time_sketches(
+        self, start: Optional[date] = None, end: Optional[date] = None
+    ) -> WeekSketches:
+        """
+        Sketches de tempo de ciclo por semana de conclusão, de ``start`` a ``end``.
+
+        Semanas já resumidas vêm do cache; as demais são calculadas em uma
+        passada sobre as tarefas concluídas nelas e gravadas no cache na mesma
+        transação. Dentro de ``read_transaction`` nada é gravado.
+
+        Args:
+            start: Primeira semana (a que contém esta data); padrão: a da
+                primeira conclusão
+            end: Última semana; padrão: a da última conclusão
+        """
+        first, last = week_range(start, end)
+        pinned = getattr(self._pinned, "conn", None) is not None
+        try:
+            with self._get_connection() as conn:
+                if not pinned:
+                    conn.execute("BEGIN")
+                if first is None or last is None:
+                    low, high = conn.execute(
+                        "SELECT MIN(completed_at), MAX(completed_at) FROM tasks"
+                    ).fetchone()
+                    if low is None:
+                        if not pinned:
+                            conn.rollback()
+                        return {}
+                    if first is None:
+                        first = week_of(datetime.fromisoformat(low).date())
+                    if last is None:
+                        last = week_of(datetime.fromisoformat(high).date())
+
+                computed: WeekSketches = {}
+                missing = self._missing_cycle_time_weeks(conn, first, last)
+                if missing and not pinned:
+                    # Recalcula com a trava de escrita, para não gravar um
+                    # resumo que outra escrita acabou de invalidar
+                    conn.rollback()
+                    conn.execute("BEGIN IMMEDIATE")
+                    missing = self._missing_cycle_time_weeks(conn, first, last)
+                    computed = self._sketch_cycle_time_weeks(conn, missing)
+                    conn.executemany(
+                        "INSERT INTO cycle_time_weeks (week) VALUES (?)",
+                        [(week,) for week in missing],
+                    )
+                    conn.executemany(
+                        "INSERT INTO cycle_time_sketches "
+                        "(week, category, priority, sketch) VALUES (?, ?, ?, ?)",
+                        [
+                            (
+                                week,
+                                category,
+                                PRIORITY_CODES[priority],
+                                sketch.to_bytes(),
+                            )
+                            for week, buckets in computed.items()
+                            for (category, priority), sketch in buckets.items()
+                        ],
+                    )
+                elif missing:
+                    computed = self._sketch_cycle_time_weeks(conn, missing)
+
+                rows = conn.execute(
+                    "SELECT week, category, priority, sketch FROM cycle_time_sketches "
+                    "WHERE week BETWEEN ? AND ?",
+                    (first, last),
+                ).fetchall()
+                if not pinned:
+                    conn.commit()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load cycle time sketches: {e}") from e
+
+        sketches: WeekSketches = {}
+        for week, category, priority, data in rows:
+            sketches.setdefault(week, {})[(category, PRIORITIES[priority])] = (
+                QuantileSketch.from_bytes(data)
+            )
+        for week, buckets in computed.items():
+            sketches.setdefault(week, {}).update(buckets)
+        return sketches
+
+    @staticmethod
+    def _update_activity(
+        conn: sqlite3.Connection, before: Optional[Task], after: Optional[Task]
+    ) -> None:
+        """Aplica uma escrita às contagens diárias dos anos já em cache."""
+        deltas: Dict[date, List[int]] = {}
+        for task, sign in ((before, -1), (after, 1)):
+            if task is None:
+                continue
+            for column, day in enumerate(activity_dates(task)):
+                if day is not None:
+                    deltas.setdefault(day, [0, 0])[column] += sign
+        changes = {day: delta for day, delta in deltas.items() if any(delta)}
+        if not changes:
+            return
+        years = sorted({day.year for day in changes})
+        marks = ", ".join("?" * len(years))
+        cached = {
+            year
+            for (year,) in conn.execute(
+                f"SELECT year FROM activity_years WHERE year IN ({marks})", years
+            )
+        }
+        conn.executemany(
+            "INSERT INTO activity_days (day, created, completed) VALUES (?, ?, ?) "
+            "ON CONFLICT (day) DO UPDATE SET created = created + excluded.created, "
+            "completed = completed + excluded.completed",
+            [
+                (day.isoformat(), created, completed)
+                for day, (created, completed) in changes.items()
+                if day.year in cached
+            ],
+        )
+
+    @staticmethod
+    def _missing_activity_years(
+        conn: sqlite3.Connection, first_year: int, last_year: int
+    ) -> List[int]:
+        cached = {
+            year
+            for (year,) in conn.execute(
+                "SELECT year FROM activity_years WHERE year BETWEEN ? AND ?",
+                (first_year, last_year),
+            )
+        }
+        return [y for y in range(first_year, last_year + 1) if y not in cached]
+
+    @staticmethod
+    def _aggregate_activity_years(
+        conn: sqlite3.Connection, years: List[int]
+    ) -> List[Tuple[str, int, int]]:
+        """Criações e conclusões por dia dos anos dados, agrupadas no SQLite."""
+        rows: List[Tuple[str, int, int]] = []
+        for year in years:
+            # Datas ISO comparam como texto; os índices limitam a leitura ao ano
+            bounds = (f"{year:04d}-01-01", f"{year + 1:04d}-01-01")
+            rows.extend(
+                conn.execute(
+                    """
+                    SELECT day, SUM(created), SUM(completed) FROM (
+                        SELECT date(created_at) AS day, 1 AS created, 0 AS completed
+                        FROM tasks WHERE created_at >= ? AND created_at < ?
+                        UNION ALL
+                        SELECT date(completed_at), 0, 1 FROM tasks
+                        WHERE status = 'COMPLETED'
+                            AND completed_at >= ? AND completed_at < ?
+                    )
+                    GROUP BY day
+                """,
+                    bounds + bounds,
+                ).fetchall()
+            )
+        return rows
+
+    def activity_counts(self, first_year: int, last_year: int) -> DayCounts:
+        """
+        Criações e conclusões por dia de ``first_year`` a ``last_year``.
+
+        Cada ano é agregado com ``GROUP BY`` na primeira consulta e gravado no
+        cache; depois disso, add/update/delete (e undo/redo) só ajustam os dias
+        que afetaram (``_update_activity``). Dentro de ``read_transaction``
+        nada é gravado.
+        """
+        pinned = getattr(self._pinned, "conn", None) is not None
+        try:
+            with self._get_connection() as conn:
+                if not pinned:
+                    conn.execute("BEGIN")
+                computed: List[Tuple[str, int, int]] = []
+                missing = self._missing_activity_years(conn, first_year, last_year)
+                if missing and not pinned:
+                    # Agrega com a trava de escrita, para nenhuma escrita
+                    # concorrente ficar de fora do cache
+                    conn.rollback()
+                    conn.execute("BEGIN IMMEDIATE")
+                    missing = self._missing_activity_years(conn, first_year, last_year)
+                    computed = self._aggregate_activity_years(conn, missing)
+                    conn.executemany(
+                        "INSERT INTO activity_years (year) VALUES (?)",
+                        [(year,) for year in missing],
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO activity_days (day, created, completed) "
+                        "VALUES (?, ?, ?)",
+                        computed,
+                    )
+                    computed = []
+                elif missing:
+                    computed = self._aggregate_activity_years(conn, missing)
+
+                rows = conn.execute(
+                    "SELECT day, created, completed FROM activity_days "
+                    "WHERE day >= ? AND day < ? AND (created > 0 OR completed > 0)",
+                    (f"{first_year:04d}-01-01", f"{last_year + 1:04d}-01-01"),
+                ).fetchall()
+                if not pinned:
+                    conn.commit()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load activity counts: {e}") from e
+
+        return {
+            _parse_day(day): (created, completed)
+            for day, created, completed in rows + computed
+        }
+
+    def burndown(
+        self, start: date, end: date, granularity: str, window: int
+    ) -> List[BurndownPoint]:
+        """
+        Série de burndown/burnup de ``start`` a ``end`` (ver utils/burndown.py).
+
+        Tudo em uma consulta: uma CTE recursiva gera os períodos, criações e
+        conclusões são agrupadas por período e os acumulados e a média móvel
+        de velocidade saem de funções de janela.
+        """
+        bucket, step = _BUCKET_SQL[granularity]
+        first, last = series_bounds(start, end, granularity, window)
+        query = f"""
+            WITH RECURSIVE buckets(start) AS (
+                SELECT :first
+                UNION ALL
+                SELECT date(start, '{step}') FROM buckets
+                WHERE date(start, '{step}') <= :last
+            ),
+            created AS (
+                SELECT {bucket.format("created_at")} AS start, COUNT(*) AS n
+                FROM tasks
+                WHERE created_at >= :first AND created_at < :after
+                GROUP BY 1
+            ),
+            completed AS (
+                SELECT {bucket.format("completed_at")} AS start, COUNT(*) AS n
+                FROM tasks
+                WHERE status = 'COMPLETED'
+                    AND completed_at >= :first AND completed_at < :after
+                GROUP BY 1
+            ),
+            series AS (
+                SELECT b.start,
+                    COALESCE(c.n, 0) AS created,
+                    COALESCE(d.n, 0) AS completed,
+                    (SELECT COUNT(*) FROM tasks WHERE created_at < :first)
+                        + SUM(COALESCE(c.n, 0)) OVER running AS total,
+                    (SELECT COUNT(*) FROM tasks
+                        WHERE status = 'COMPLETED' AND completed_at < :first)
+                        + SUM(COALESCE(d.n, 0)) OVER running AS done,
+                    AVG(COALESCE(d.n, 0)) OVER (
+                        ORDER BY b.start ROWS BETWEEN {int(window) - 1} PRECEDING
+                        AND CURRENT ROW
+                    ) AS velocity
+                FROM buckets b
+                LEFT JOIN created c ON c.start = b.start
+                LEFT JOIN completed d ON d.start = b.start
+                WINDOW running AS (ORDER BY b.start ROWS UNBOUNDED PRECEDING)
+            )
+            SELECT * FROM series WHERE start >= :visible ORDER BY start
+        """
+        params = {
+            "first": first.isoformat(),
+            "last": last.isoformat(),
+            # Datas ISO comparam como texto: tudo antes do dia seguinte a end
+            "after": (end + timedelta(days=1)).isoformat(),
+            "visible": bucket_start(start, granularity).isoformat(),
+        }
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to load burndown series: {e}") from e
+
+        return [
+            BurndownPoint(
+                start=_parse_day(row["start"]),
+                created=row["created"],
+                completed=row["completed"],
+                total=row["total"],
+                done=row["done"],
+                velocity=row["velocity"],
             )
-        return milestones
+            for row in rows
+        ]
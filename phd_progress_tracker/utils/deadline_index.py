@@ -0,0 +1,125 @@
+"""
+Índice ordenado por prazo das tarefas abertas, mantido incrementalmente.
+"""
+
+import copy
+import heapq
+import threading
+from bisect import bisect_left, insort
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from phd_progress_tracker.models.task import Task, TaskStatus
+
+# Maior ID possível na comparação de tuplas (deadline, id)
+_MAX_ID = "\U0010ffff"
+
+
+class DeadlineIndex:
+    """
+    Lista ordenada de ``(deadline, id)`` das tarefas não concluídas.
+
+    Responde "próximas k", "prazo em [a, b]" e "atrasadas em d" em
+    O(log n + k) e é atualizada a cada criação, edição, conclusão ou remoção
+    (O(n) no pior caso pelo deslocamento da lista, mas sem reordenar nada),
+    em vez de ser reconstruída. Pensada para o processo de longa duração
+    da API, por isso todas as operações são protegidas por um lock.
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[Tuple[date, str]] = []
+        self._tasks: Dict[str, Task] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def build(cls, tasks: Iterable[Task]) -> "DeadlineIndex":
+        """Constrói o índice a partir das tarefas (as concluídas são ignoradas)."""
+        index = cls()
+        index._tasks = {
+            t.id: copy.copy(t) for t in tasks if t.status != TaskStatus.COMPLETED
+        }
+        index._keys = sorted((t.deadline, t.id) for t in index._tasks.values())
+        return index
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._tasks
+
+    def upsert(self, task: Task) -> None:
+        """Insere ou atualiza a tarefa; tarefas concluídas saem do índice."""
+        with self._lock:
+            self.discard(task.id)
+            if task.status != TaskStatus.COMPLETED:
+                self._tasks[task.id] = copy.copy(task)
+                insort(self._keys, (task.deadline, task.id))
+
+    def discard(self, task_id: str) -> None:
+        """Remove a tarefa do índice, se estiver nele."""
+        with self._lock:
+            old = self._tasks.pop(task_id, None)
+            if old is None:
+                return
+            i = bisect_left(self._keys, (old.deadline, task_id))
+            if i < len(self._keys) and self._keys[i][1] == task_id:
+                del self._keys[i]
+
+    def _slice(self, lo: int, hi: int, limit: Optional[int]) -> List[Task]:
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        return [copy.copy(self._tasks[task_id]) for _, task_id in self._keys[lo:hi]]
+
+    def next_due(self, k: int, today: Optional[date] = None) -> List[Task]:
+        """As k tarefas abertas com prazo mais próximo, a partir de hoje."""
+        with self._lock:
+            lo = bisect_left(self._keys, (today or date.today(),))
+            return self._slice(lo, len(self._keys), k)
+
+    def due_between(
+        self, start: date, end: date, limit: Optional[int] = None
+    ) -> List[Task]:
+        """Tarefas abertas com prazo em [start, end], ordenadas por prazo."""
+        with self._lock:
+            lo = bisect_left(self._keys, (start,))
+            hi = bisect_left(self._keys, (end, _MAX_ID), lo)
+            return self._slice(lo, hi, limit)
+
+    def overdue_count(self, day: Optional[date] = None) -> int:
+        """Número de tarefas abertas com prazo anterior a ``day`` (padrão: hoje)."""
+        with self._lock:
+            return bisect_left(self._keys, (day or date.today(),))
+
+    def top(
+        self,
+        k: int,
+        score: Callable[[Task], float],
+        bound: Optional[Callable[[date], float]] = None,
+    ) -> List[Tuple[float, Task]]:
+        """
+        As k tarefas abertas de maior ``score``, da maior para a menor.
+
+        Percorre o índice em ordem de prazo mantendo um heap mínimo com as k
+        melhores até agora (O(n log k), sem ordenar todas). Se ``bound(d)``
+        limita o score de qualquer tarefa com prazo a partir de ``d``, a
+        varredura para assim que nenhuma tarefa restante pode entrar no heap.
+        Empates ficam com o prazo mais próximo.
+        """
+        heap: List[Tuple[float, int, str]] = []
+        with self._lock:
+            for seq, (deadline, task_id) in enumerate(self._keys):
+                if (
+                    bound is not None
+                    and len(heap) == k
+                    and bound(deadline) <= heap[0][0]
+                ):
+                    break
+                entry = (score(self._tasks[task_id]), -seq, task_id)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+            return [
+                (value, copy.copy(self._tasks[task_id]))
+                for value, _, task_id in sorted(heap, reverse=True)
+            ]
@@ -0,0 +1,442 @@
+"""
+Dependências entre tarefas: ordem topológica, caminho crítico e folgas.
+
+Uma dependência ``(task_id, depends_on)`` diz que a tarefa só pode ser
+feita depois do pré-requisito. O repositório guarda as arestas e recusa as
+que fechariam um ciclo; este módulo mantém, sobre as tarefas abertas, um
+grafo com:
+
+- ordem topológica dinâmica (Pearce–Kelly): uma aresta que contradiz a
+  ordem atual só reordena os nós entre as duas pontas;
+- método do caminho crítico (CPM) contra os prazos: cada tarefa dura
+  ``esforço / daily_hours`` dias corridos (``default_effort`` se não
+  estimada). O término mais cedo (EF) soma as durações pela cadeia de
+  pré-requisitos abertos a partir de hoje; o término mais tarde (LF) é o
+  menor entre o fim do prazo e o início mais tarde dos dependentes. A folga
+  é LF − EF, e o caminho crítico é a cadeia de menor folga.
+
+A atualização é incremental: quando uma aresta, um prazo ou um esforço
+muda, só os nós alcançados a partir dele são recalculados, em ordem
+topológica (EF para frente, LF para trás), e a propagação para onde os
+valores não mudam. Tarefas concluídas saem do grafo: não bloqueiam nem
+atrasam ninguém.
+"""
+
+import copy
+import heapq
+import math
+import threading
+import weakref
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from phd_progress_tracker.models.task import Task, TaskStatus
+from phd_progress_tracker.utils.planner import Capacity
+
+# Folga na comparação de somas de durações fracionárias
+_EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class TaskSlack:
+    """
+    Posição de uma tarefa aberta no cronograma das dependências.
+
+    Attributes:
+        task: Tarefa
+        earliest_finish: Dia em que a tarefa termina, no mínimo, feitos antes
+            os pré-requisitos abertos
+        latest_finish: Último dia para terminá-la sem estourar o próprio prazo
+            nem o de algum dependente
+        slack: Folga em dias (negativa: algum prazo já não é alcançável)
+        critical: Se não há folga (qualquer atraso faz um prazo estourar)
+    """
+
+    task: Task
+    earliest_finish: date
+    latest_finish: date
+    slack: float
+    critical: bool
+
+
+class DependencyGraph:
+    """
+    Grafo de dependências das tarefas abertas, com CPM incremental.
+
+    ``sync`` leva o grafo ao estado do repositório comparando tarefas e
+    arestas com as da última sincronização; cada diferença vira uma
+    operação incremental (``add_task``, ``update_task``, ``add_edge``...).
+    """
+
+    def __init__(self, capacity: Capacity = Capacity()) -> None:
+        self._lock = threading.RLock()
+        self._reset(capacity)
+
+    def _reset(self, capacity: Capacity) -> None:
+        self.capacity = capacity
+        self._revision: Optional[int] = None
+        self._tasks: Dict[str, Task] = {}
+        self._preds: Dict[str, Set[str]] = {}
+        self._succs: Dict[str, Set[str]] = {}
+        self._edges: Set[Tuple[str, str]] = set()
+        # Posição na ordem topológica (valores únicos, não contíguos)
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        # Duração, término mais cedo (dias a partir de hoje) e término mais
+        # tarde (ordinal do dia seguinte ao limite)
+        self._duration: Dict[str, float] = {}
+        self._ef: Dict[str, float] = {}
+        self._lf: Dict[str, float] = {}
+        # Nós recalculados desde a última sincronização
+        self.recomputed = 0
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def _duration_of(self, task: Task) -> float:
+        hours = task.effort_hours if task.effort_hours else self.capacity.default_effort
+        return hours / self.capacity.daily_hours
+
+    # Atualizações incrementais
+
+    def add_task(self, task: Task) -> None:
+        """Insere uma tarefa aberta, ainda sem dependências."""
+        with self._lock:
+            self._tasks[task.id] = copy.copy(task)
+            self._preds[task.id] = set()
+            self._succs[task.id] = set()
+            self._order[task.id] = self._next_order
+            self._next_order += 1
+            self._duration[task.id] = self._ef[task.id] = self._duration_of(task)
+            self._lf[task.id] = task.deadline.toordinal() + 1
+
+    def update_task(self, task: Task) -> None:
+        """Troca os dados de uma tarefa, propagando mudanças de esforço ou prazo."""
+        with self._lock:
+            old = self._tasks[task.id]
+            self._tasks[task.id] = copy.copy(task)
+            duration = self._duration_of(task)
+            if duration != self._duration[task.id]:
+                self._duration[task.id] = duration
+                self._forward([task.id])
+                self._backward(self._preds[task.id])
+            if task.deadline != old.deadline:
+                self._backward([task.id])
+
+    def remove_task(self, task_id: str) -> None:
+        """Tira uma tarefa (e as arestas dela) do grafo."""
+        with self._lock:
+            for depends_on in list(self._preds[task_id]):
+                self.remove_edge(task_id, depends_on)
+            for dependent in list(self._succs[task_id]):
+                self.remove_edge(dependent, task_id)
+            for table in (
+                self._tasks,
+                self._preds,
+                self._succs,
+                self._order,
+                self._duration,
+                self._ef,
+                self._lf,
+            ):
+                del table[task_id]
+
+    def add_edge(self, task_id: str, depends_on: str) -> None:
+        """
+        Registra que ``task_id`` depende de ``depends_on``.
+
+        Raises:
+            ValueError: Se a aresta fechar um ciclo
+        """
+        with self._lock:
+            if (task_id, depends_on) in self._edges:
+                return
+            if task_id == depends_on:
+                raise ValueError("A task cannot depend on itself")
+            if self._order[depends_on] > self._order[task_id]:
+                self._reorder(depends_on, task_id)
+            self._edges.add((task_id, depends_on))
+            self._preds[task_id].add(depends_on)
+            self._succs[depends_on].add(task_id)
+            self._forward([task_id])
+            self._backward([depends_on])
+
+    def remove_edge(self, task_id: str, depends_on: str) -> None:
+        """Remove uma dependência (a ordem topológica continua válida)."""
+        with self._lock:
+            if (task_id, depends_on) not in self._edges:
+                return
+            self._edges.discard((task_id, depends_on))
+            self._preds[task_id].discard(depends_on)
+            self._succs[depends_on].discard(task_id)
+            self._forward([task_id])
+            self._backward([depends_on])
+
+    def _reach(
+        self, start: str, edges: Dict[str, Set[str]], inside: Callable[[str], bool]
+    ) -> Set[str]:
+        """Nós alcançáveis a partir de ``start`` sem sair da janela ``inside``."""
+        seen = {start}
+        stack = [start]
+        while stack:
+            for node in edges[stack.pop()]:
+                if node not in seen and inside(node):
+                    seen.add(node)
+                    stack.append(node)
+        return seen
+
+    def _reorder(self, before: str, after: str) -> None:
+        """
+        Põe ``before`` antes de ``after`` (Pearce–Kelly).
+
+        Só os nós com posição entre as duas pontas podem estar fora de ordem:
+        os dependentes de ``after`` e os pré-requisitos de ``before`` nessa
+        janela trocam de lugar, reaproveitando as mesmas posições.
+        """
+        lower, upper = self._order[after], self._order[before]
+        forward = self._reach(after, self._succs, lambda n: self._order[n] <= upper)
+        if before in forward:
+            raise ValueError(
+                f"Dependency cycle: {before!r} already depends on {after!r}"
+            )
+        backward = self._reach(before, self._preds, lambda n: self._order[n] >= lower)
+        nodes = sorted(backward, key=self._order.get) + sorted(
+            forward, key=self._order.get
+        )
+        slots = sorted(self._order[node] for node in nodes)
+        for node, slot in zip(nodes, slots):
+            self._order[node] = slot
+
+    def _forward(self, seeds: Iterable[str]) -> None:
+        """Recalcula EF a partir de ``seeds``, em ordem topológica."""
+        heap = [(self._order[node], node) for node in set(seeds)]
+        heapq.heapify(heap)
+        queued = {node for _, node in heap}
+        while heap:
+            _, node = heapq.heappop(heap)
+            self.recomputed += 1
+            start = max((self._ef[p] for p in self._preds[node]), default=0.0)
+            ef = start + self._duration[node]
+            if ef == self._ef[node]:
+                continue
+            self._ef[node] = ef
+            for succ in self._succs[node]:
+                if succ not in queued:
+                    queued.add(succ)
+                    heapq.heappush(heap, (self._order[succ], succ))
+
+    def _backward(self, seeds: Iterable[str]) -> None:
+        """Recalcula LF a partir de ``seeds``, em ordem topológica reversa."""
+        heap = [(-self._order[node], node) for node in set(seeds)]
+        heapq.heapify(heap)
+        queued = {node for _, node in heap}
+        while heap:
+            _, node = heapq.heappop(heap)
+            self.recomputed += 1
+            lf = min(
+                (self._lf[s] - self._duration[s] for s in self._succs[node]),
+                default=math.inf,
+            )
+            lf = min(lf, self._tasks[node].deadline.toordinal() + 1)
+            if lf == self._lf[node]:
+                continue
+            self._lf[node] = lf
+            for pred in self._preds[node]:
+                if pred not in queued:
+                    queued.add(pred)
+                    heapq.heappush(heap, (-self._order[pred], pred))
+
+    def sync(self, repo, capacity: Optional[Capacity] = None) -> "DependencyGraph":
+        """
+        Leva o grafo ao estado do repositório.
+
+        Nada é feito se a revisão não mudou. Mudar a capacidade recomeça do
+        zero, já que todas as durações mudam.
+        """
+        with self._lock:
+            if capacity is not None and capacity != self.capacity:
+                self._reset(capacity)
+            revision = repo.revision()
+            if revision == self._revision:
+                return self
+            self.recomputed = 0
+            tasks = {
+                task.id: task
+                for task in repo.deadline_index().due_between(date.min, date.max)
+            }
+            edges = {
+                (task_id, depends_on)
+                for task_id, depends_on in repo.dependency_edges()
+                if task_id in tasks and depends_on in tasks
+            }
+            for task_id, depends_on in self._edges - edges:
+                self.remove_edge(task_id, depends_on)
+            for task_id in [t for t in self._tasks if t not in tasks]:
+                self.remove_task(task_id)
+            for task in tasks.values():
+                if task.id not in self._tasks:
+                    self.add_task(task)
+                elif task != self._tasks[task.id]:
+                    self.update_task(task)
+            for task_id, depends_on in sorted(edges - self._edges):
+                self.add_edge(task_id, depends_on)
+            self._revision = revision
+            return self
+
+    # Consultas
+
+    def topological_order(self) -> List[Task]:
+        """Tarefas abertas em uma ordem em que os pré-requisitos vêm antes."""
+        with self._lock:
+            return [self._tasks[n] for n in sorted(self._tasks, key=self._order.get)]
+
+    def _slack(self, task_id: str, today: date) -> TaskSlack:
+        ef, lf = self._ef[task_id], self._lf[task_id]
+        slack = lf - (today.toordinal() + ef)
+        return TaskSlack(
+            task=self._tasks[task_id],
+            earliest_finish=today + timedelta(days=math.ceil(ef - _EPSILON) - 1),
+            latest_finish=date.fromordinal(math.ceil(lf - _EPSILON) - 1),
+            slack=round(slack, 2),
+            critical=slack <= _EPSILON,
+        )
+
+    def slack(self, task_id: str, today: Optional[date] = None) -> Optional[TaskSlack]:
+        """Folga de uma tarefa aberta (None se ela não está no grafo)."""
+        with self._lock:
+            if task_id not in self._tasks:
+                return None
+            return self._slack(task_id, today or date.today())
+
+    def blockers(self, task_id: str, today: Optional[date] = None) -> List[TaskSlack]:
+        """Pré-requisitos diretos ainda abertos, em ordem topológica."""
+        today = today or date.today()
+        with self._lock:
+            preds = sorted(self._preds.get(task_id, ()), key=self._order.get)
+            return [self._slack(pred, today) for pred in preds]
+
+    def critical_path(self, today: Optional[date] = None) -> List[TaskSlack]:
+        """
+        Cadeia de menor folga, do primeiro pré-requisito ao fim.
+
+        Começa pela última tarefa (na ordem topológica) de menor folga e
+        volta pelos pré-requisitos que determinam o início de cada uma.
+        """
+        today = today or date.today()
+        with self._lock:
+            if not self._tasks:
+                return []
+
+            def slack(node: str) -> float:
+                return self._lf[node] - self._ef[node]
+
+            least = min(slack(node) for node in self._tasks)
+            node = max(
+                (n for n in self._tasks if slack(n) <= least + _EPSILON),
+                key=self._order.get,
+            )
+            path = [node]
+            while True:
+                start = self._ef[node] - self._duration[node]
+                drivers = [
+                    p for p in self._preds[node] if abs(self._ef[p] - start) <= _EPSILON
+                ]
+                if not drivers:
+                    break
+                node = max(drivers, key=self._order.get)
+                path.append(node)
+            return [self._slack(node, today) for node in reversed(path)]
+
+
+_graphs: "weakref.WeakKeyDictionary[object, DependencyGraph]" = (
+    weakref.WeakKeyDictionary()
+)
+_graphs_lock = threading.Lock()
+
+
+def graph_for(repo) -> DependencyGraph:
+    """Grafo associado a um repositório (criado no primeiro uso)."""
+    with _graphs_lock:
+        graph = _graphs.get(repo)
+        if graph is None:
+            graph = _graphs[repo] = DependencyGraph()
+        return graph
+
+
+def dependency_graph(
+    repo,
+    capacity: Capacity = Capacity(),
+    graph: Optional[DependencyGraph] = None,
+) -> DependencyGraph:
+    """
+    Grafo de dependências sincronizado com o repositório.
+
+    Args:
+        repo: Repositório de origem
+        capacity: Horas por dia e esforço padrão usados nas durações
+        graph: Grafo a reaproveitar (padrão: o do repositório, ver
+            :func:`graph_for`)
+    """
+    if graph is None:
+        graph = graph_for(repo)
+    return graph.sync(repo, capacity)
+
+
+def blocked_status(task: Task, waiting: bool) -> Optional[TaskStatus]:
+    """
+    Status que a tarefa deve ter, dado se algum pré-requisito está aberto.
+
+    - TODO ou IN_PROGRESS com algum pré-requisito aberto vira BLOCKED;
+    - BLOCKED sem pré-requisito aberto volta para TODO.
+
+    Returns:
+        O novo status, ou None se o atual já está certo
+    """
+    if waiting and task.status in (TaskStatus.TODO, TaskStatus.IN_PROGRESS):
+        return TaskStatus.BLOCKED
+    if not waiting and task.status == TaskStatus.BLOCKED:
+        return TaskStatus.TODO
+    return None
+
+
+def refresh_blocked(
+    repo, task_ids: Iterable[str], keep_independent: bool = False
+) -> List[Task]:
+    """
+    Ajusta o status das tarefas dadas aos pré-requisitos delas (ver
+    :func:`blocked_status`).
+
+    Chamada com as tarefas cujos pré-requisitos acabaram de mudar (aresta
+    nova ou removida, pré-requisito concluído, reaberto ou removido) ou
+    cujo status acabou de ser editado. As mudanças são automáticas: no
+    SQLite ficam no histórico, mas fora da cadeia de desfazer, e o undo/redo
+    as refaz a partir do estado restaurado.
+
+    Args:
+        repo: Repositório
+        task_ids: Tarefas a ajustar
+        keep_independent: Não mexe em tarefas sem pré-requisitos (um BLOCKED
+            definido pelo usuário continua BLOCKED)
+
+    Returns:
+        Tarefas cujo status mudou
+    """
+    changed = []
+    for task_id in dict.fromkeys(task_ids):
+        task = repo.get_task(task_id)
+        if task is None or task.status == TaskStatus.COMPLETED:
+            continue
+        prerequisites = [repo.get_task(i) for i in repo.dependencies(task.id)]
+        if keep_independent and not any(p is not None for p in prerequisites):
+            continue
+        waiting = any(
+            p is not None and p.status != TaskStatus.COMPLETED for p in prerequisites
+        )
+        status = blocked_status(task, waiting)
+        if status is None:
+            continue
+        task.status = status
+        repo.update_task(task, automatic=True)
+        changed.append(task)
+    return changed
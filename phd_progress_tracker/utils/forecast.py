@@ -0,0 +1,254 @@
+"""
+Previsão de conclusão por Monte Carlo a partir da vazão histórica.
+
+A vazão diária (tarefas concluídas por dia, incluindo dias sem conclusões)
+dos últimos ``history_days`` dias vem de ``completed_at`` (via
+``repo.burndown``). Cada tentativa sorteia dias dessa amostra, com
+reposição, até somar as tarefas abertas; o número de dias sorteados é a data
+de conclusão daquela tentativa.
+
+As tentativas são divididas em lotes de ``CHUNK_TRIALS``, cada um com a sua
+semente derivada de ``seed`` (``numpy.random.SeedSequence.spawn``), e os
+lotes rodam vetorizados com NumPy em um pool de processos. O CLI cria um
+pool para a execução; a API reaproveita um único pool limitado, criado na
+inicialização com :func:`forecast_pool`. Como a divisão em lotes não depende
+do número de processos, a mesma semente dá sempre o mesmo resultado.
+"""
+
+import math
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence
+
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.utils.task_frame import HAS_NUMPY
+
+if HAS_NUMPY:
+    import numpy as np
+
+DEFAULT_TRIALS = 100_000
+DEFAULT_HISTORY_DAYS = 90
+# Tentativas por lote (e por tarefa enviada ao pool)
+CHUNK_TRIALS = 25_000
+# Dias sorteados de uma vez para as tentativas ainda não concluídas
+BLOCK_DAYS = 64
+# Horizonte máximo: tentativas que não terminam até aqui contam como não concluídas
+MAX_DAYS = 3650
+PERCENTILES = (0.5, 0.85, 0.95)
+
+
+class ForecastUnavailable(RuntimeError):
+    """A previsão precisa do NumPy, que não está instalado."""
+
+
+def simulate_chunk(samples, remaining: int, trials: int, horizon: int, seed):
+    """
+    Simula um lote de tentativas.
+
+    Args:
+        samples: Vazões diárias observadas (array de inteiros)
+        remaining: Tarefas a concluir
+        trials: Tentativas do lote
+        horizon: Máximo de dias simulados
+        seed: Semente (int ou ``SeedSequence``) do lote
+
+    Returns:
+        Dias até a conclusão de cada tentativa (-1 se não terminou no horizonte)
+    """
+    rng = np.random.default_rng(seed)
+    days = np.full(trials, -1, dtype=np.int32)
+    done = np.zeros(trials, dtype=np.int64)
+    active = np.arange(trials)
+    elapsed = 0
+    while active.size and elapsed < horizon:
+        block = min(BLOCK_DAYS, horizon - elapsed)
+        draws = rng.choice(samples, size=(active.size, block))
+        progress = np.cumsum(draws, axis=1)
+        progress += done[active, None]
+        finished = progress[:, -1] >= remaining
+        first = np.argmax(progress >= remaining, axis=1)
+        days[active[finished]] = elapsed + first[finished] + 1
+        done[active] = progress[:, -1]
+        active = active[~finished]
+        elapsed += block
+    return days
+
+
+def _simulate_chunk_args(args):
+    return simulate_chunk(*args)
+
+
+def forecast_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Pool de processos para reaproveitar entre previsões.
+
+    Os processos são iniciados com ``spawn``: um ``fork`` a partir de um
+    servidor com threads pode herdar locks presos.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def simulate(
+    samples: Sequence[int],
+    remaining: int,
+    trials: int = DEFAULT_TRIALS,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    horizon: int = MAX_DAYS,
+    pool: Optional[Executor] = None,
+):
+    """
+    Dias até a conclusão em cada tentativa, em ordem determinística.
+
+    Args:
+        samples: Vazões diárias observadas
+        remaining: Tarefas a concluir
+        trials: Número de tentativas
+        seed: Semente da execução
+        workers: Processos do pool (padrão: núcleos disponíveis; 1 roda no
+            próprio processo)
+        horizon: Máximo de dias simulados
+        pool: Pool já existente (ver :func:`forecast_pool`); se dado,
+            ``workers`` é ignorado e nenhum processo é criado
+
+    Returns:
+        Array com os dias de cada tentativa (-1 se não terminou no horizonte)
+    """
+    if not HAS_NUMPY:
+        raise ForecastUnavailable(
+            "Forecasting requires numpy (poetry install --extras numpy)"
+        )
+    samples = np.asarray(samples, dtype=np.int64)
+    sizes = [CHUNK_TRIALS] * (trials // CHUNK_TRIALS)
+    if trials % CHUNK_TRIALS:
+        sizes.append(trials % CHUNK_TRIALS)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(samples, remaining, size, horizon, s) for size, s in zip(sizes, seeds)]
+
+    if pool is not None:
+        return np.concatenate(list(pool.map(_simulate_chunk_args, jobs)))
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        results = [_simulate_chunk_args(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_simulate_chunk_args, jobs))
+    return np.concatenate(results)
+
+
+@dataclass(frozen=True)
+class Forecast:
+    """
+    Resultado da previsão para um marco.
+
+    Attributes:
+        milestone: Marco avaliado
+        remaining: Tarefas abertas simuladas
+        trials: Número de tentativas
+        seed: Semente usada (repita-a para reproduzir o resultado)
+        history_start: Primeiro dia da vazão histórica
+        history_end: Último dia da vazão histórica
+        daily_throughput: Média de conclusões por dia no histórico
+        probability: Fração das tentativas concluídas até ``target_date``
+        percentiles: Data de conclusão por percentil (None se não termina
+            no horizonte)
+    """
+
+    milestone: Milestone
+    remaining: int
+    trials: int
+    seed: int
+    history_start: date
+    history_end: date
+    daily_throughput: float
+    probability: float
+    percentiles: Dict[float, Optional[date]]
+
+
+def _percentile_days(days, qs: Sequence[float]) -> List[Optional[int]]:
+    """Dias por percentil (posição mais próxima); None além do horizonte."""
+    ordered = np.sort(np.where(days < 0, np.iinfo(np.int32).max, days))
+    results: List[Optional[int]] = []
+    for q in qs:
+        value = int(ordered[max(0, math.ceil(q * len(ordered)) - 1)])
+        results.append(value if value != np.iinfo(np.int32).max else None)
+    return results
+
+
+def forecast_milestone(
+    repo,
+    milestone: Milestone,
+    trials: int = DEFAULT_TRIALS,
+    seed: Optional[int] = None,
+    history_days: int = DEFAULT_HISTORY_DAYS,
+    workers: Optional[int] = None,
+    today: Optional[date] = None,
+    pool: Optional[Executor] = None,
+) -> Forecast:
+    """
+    Probabilidade de concluir as tarefas abertas até a data do marco.
+
+    Args:
+        repo: Repositório de origem
+        milestone: Marco cuja ``target_date`` é o prazo
+        trials: Número de tentativas
+        seed: Semente (padrão: aleatória, devolvida no resultado)
+        history_days: Dias de histórico de vazão, terminando em ``today``
+        workers: Processos do pool (ver :func:`simulate`)
+        today: Data de referência (padrão: hoje)
+        pool: Pool compartilhado (ver :func:`simulate`)
+
+    Raises:
+        ValueError: Se ``trials`` ou ``history_days`` não forem positivos
+        ForecastUnavailable: Se o NumPy não estiver instalado
+    """
+    if trials < 1:
+        raise ValueError(f"trials must be positive, got {trials}")
+    if history_days < 1:
+        raise ValueError(f"history_days must be positive, got {history_days}")
+    if not HAS_NUMPY:
+        raise ForecastUnavailable(
+            "Forecasting requires numpy (poetry install --extras numpy)"
+        )
+    today = today or date.today()
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy % 2**63)
+
+    start = today - timedelta(days=history_days - 1)
+    points = repo.burndown(start, today, "day", 1)
+    samples = [point.completed for point in points]
+    remaining = points[-1].open
+    target_days = (milestone.target_date - today).days
+
+    if remaining == 0:
+        probability = 1.0
+        percentiles = {q: today for q in PERCENTILES}
+    elif not any(samples):
+        # Sem conclusões no histórico, nenhuma tentativa termina
+        probability = 0.0
+        percentiles = {q: None for q in PERCENTILES}
+    else:
+        days = simulate(samples, remaining, trials, seed, workers, pool=pool)
+        finished = (days >= 0) & (days <= target_days)
+        probability = float(np.count_nonzero(finished)) / trials
+        percentiles = {
+            q: today + timedelta(days=d) if d is not None else None
+            for q, d in zip(PERCENTILES, _percentile_days(days, PERCENTILES))
+        }
+
+    return Forecast(
+        milestone=milestone,
+        remaining=remaining,
+        trials=trials,
+        seed=seed,
+        history_start=start,
+        history_end=today,
+        daily_throughput=sum(samples) / len(samples),
+        probability=probability,
+        percentiles=percentiles,
+    )
@@ -0,0 +1,309 @@
+"""
+Histórico de alterações de tarefas: eventos, codificação compacta e replay.
+
+Cada escrita de tarefa gera um evento (criada, alterada, concluída,
+removida) com os valores antes e depois apenas dos campos que mudaram.
+Desfazer e refazer também são eventos, com a mudança inversa/repetida, de
+modo que reaplicar os eventos a partir de um snapshot de estado reproduz
+as tarefas em qualquer ponto do histórico. Mudanças automáticas de status
+(bloqueio por dependências) também são gravadas, mas ficam fora da cadeia
+de desfazer: o undo/redo as recalcula a partir do estado restaurado.
+
+Os eventos são gravados em binário: códigos de campo e enums como varint,
+datas como dias desde 1970-01-01 e timestamps como microssegundos (ambos em
+zigzag, para valores negativos continuarem curtos).
+"""
+
+import struct
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from enum import IntEnum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from phd_progress_tracker.models.task import Task, TaskStatus
+from phd_progress_tracker.utils.task_frame import (
+    PRIORITIES,
+    PRIORITY_CODES,
+    STATUS_CODES,
+    STATUSES,
+)
+
+# Estado de uma tarefa sem o ID: campo -> valor
+TaskState = Dict[str, Any]
+
+
+class EventKind(IntEnum):
+    """Tipos de evento (o valor é o código gravado no banco)."""
+
+    CREATED = 1
+    UPDATED = 2
+    COMPLETED = 3
+    DELETED = 4
+    UNDONE = 5
+    REDONE = 6
+    # Mudança de status derivada das dependências (bloqueio/desbloqueio)
+    AUTOMATIC = 7
+
+
+# Eventos que representam ações do usuário e entram na cadeia de desfazer
+USER_KINDS = (
+    EventKind.CREATED,
+    EventKind.UPDATED,
+    EventKind.COMPLETED,
+    EventKind.DELETED,
+)
+
+# Campos versionados, na ordem dos códigos gravados
+FIELDS = (
+    "title",
+    "description",
+    "deadline",
+    "status",
+    "priority",
+    "category",
+    "created_at",
+    "completed_at",
+    "effort_hours",
+)
+_FIELD_CODES = {name: code for code, name in enumerate(FIELDS)}
+
+_EPOCH_DAY = date(1970, 1, 1)
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+_BEFORE = 1
+_AFTER = 2
+
+
+@dataclass(frozen=True)
+class TaskEvent:
+    """
+    Um evento do histórico.
+
+    Attributes:
+        seq: Posição no log (crescente)
+        task_id: Tarefa afetada
+        kind: Tipo do evento
+        at: Momento da escrita
+        ref: Para ações do usuário e mudanças automáticas, o evento que
+            estava no topo da cadeia de desfazer; para UNDONE/REDONE, o
+            evento desfeito/refeito
+        before: Campos alterados antes do evento (None se a tarefa não existia)
+        after: Campos alterados depois do evento (None se a tarefa foi removida)
+    """
+
+    seq: int
+    task_id: str
+    kind: EventKind
+    at: datetime
+    ref: int
+    before: Optional[TaskState]
+    after: Optional[TaskState]
+
+
+def task_state(task: Task) -> TaskState:
+    """Campos versionados de uma tarefa."""
+    return {name: getattr(task, name) for name in FIELDS}
+
+
+def task_change(
+    before: Optional[Task], after: Optional[Task]
+) -> Optional[Tuple[EventKind, Optional[TaskState], Optional[TaskState]]]:
+    """
+    Classifica uma escrita e calcula os campos alterados.
+
+    Criação e remoção guardam o estado completo; alterações só os campos
+    que mudaram.
+
+    Returns:
+        (tipo, antes, depois), ou None se nada mudou
+    """
+    if before is None and after is None:
+        return None
+    if before is None:
+        return EventKind.CREATED, None, task_state(after)
+    if after is None:
+        return EventKind.DELETED, task_state(before), None
+    old, new = task_state(before), task_state(after)
+    changed = [name for name in FIELDS if old[name] != new[name]]
+    if not changed:
+        return None
+    completed = (
+        new["status"] == TaskStatus.COMPLETED and old["status"] != TaskStatus.COMPLETED
+    )
+    kind = EventKind.COMPLETED if completed else EventKind.UPDATED
+    return kind, {f: old[f] for f in changed}, {f: new[f] for f in changed}
+
+
+def apply_change(
+    states: Dict[str, TaskState], task_id: str, after: Optional[TaskState]
+) -> None:
+    """Aplica o lado "depois" de um evento a um mapa id -> estado."""
+    if after is None:
+        states.pop(task_id, None)
+    else:
+        states.setdefault(task_id, {}).update(after)
+
+
+def state_to_task(task_id: str, state: TaskState) -> Task:
+    """Monta a Task de um estado completo."""
+    return Task(id=task_id, **state)
+
+
+# Varint / zigzag
+
+
+def _write_uvarint(out: bytearray, n: int) -> None:
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _read_uvarint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _zigzag(n: int) -> int:
+    return n << 1 if n >= 0 else (-n << 1) - 1
+
+
+def _unzigzag(n: int) -> int:
+    return n >> 1 if not n & 1 else -((n + 1) >> 1)
+
+
+def _write_value(out: bytearray, name: str, value: Any) -> None:
+    if name == "deadline":
+        _write_uvarint(out, _zigzag((value - _EPOCH_DAY).days))
+    elif name == "status":
+        _write_uvarint(out, STATUS_CODES[value])
+    elif name == "priority":
+        _write_uvarint(out, PRIORITY_CODES[value])
+    elif name in ("created_at", "completed_at"):
+        # 0 = ausente; demais valores deslocados em 1
+        micros = None if value is None else (value - _EPOCH) // _MICROSECOND
+        _write_uvarint(out, 0 if micros is None else _zigzag(micros) + 1)
+    elif name == "effort_hours":
+        # 0 = ausente; 1 = seguido de um double
+        _write_uvarint(out, 0 if value is None else 1)
+        if value is not None:
+            out += struct.pack("<d", value)
+    else:
+        data = value.encode("utf-8")
+        _write_uvarint(out, len(data))
+        out += data
+
+
+def _read_value(data: bytes, pos: int, name: str) -> Tuple[Any, int]:
+    n, pos = _read_uvarint(data, pos)
+    if name == "deadline":
+        return _EPOCH_DAY + timedelta(days=_unzigzag(n)), pos
+    if name == "status":
+        return STATUSES[n], pos
+    if name == "priority":
+        return PRIORITIES[n], pos
+    if name in ("created_at", "completed_at"):
+        return (None if n == 0 else _EPOCH + _unzigzag(n - 1) * _MICROSECOND), pos
+    if name == "effort_hours":
+        if n == 0:
+            return None, pos
+        return struct.unpack_from("<d", data, pos)[0], pos + 8
+    end = pos + n
+    return data[pos:end].decode("utf-8"), end
+
+
+def encode_change(before: Optional[TaskState], after: Optional[TaskState]) -> bytes:
+    """
+    Codifica os campos de um evento.
+
+    Layout: flags (1 = há "antes", 2 = há "depois"), número de campos e,
+    por campo, o código seguido dos valores presentes.
+    """
+    out = bytearray(
+        [(_BEFORE if before is not None else 0) | (_AFTER if after is not None else 0)]
+    )
+    names = [
+        name for name in FIELDS if name in (after if after is not None else before)
+    ]
+    _write_uvarint(out, len(names))
+    for name in names:
+        _write_uvarint(out, _FIELD_CODES[name])
+        if before is not None:
+            _write_value(out, name, before[name])
+        if after is not None:
+            _write_value(out, name, after[name])
+    return bytes(out)
+
+
+def decode_change(data: bytes) -> Tuple[Optional[TaskState], Optional[TaskState]]:
+    """Decodifica o resultado de :func:`encode_change`."""
+    flags = data[0]
+    before: Optional[TaskState] = {} if flags & _BEFORE else None
+    after: Optional[TaskState] = {} if flags & _AFTER else None
+    count, pos = _read_uvarint(data, 1)
+    for _ in range(count):
+        code, pos = _read_uvarint(data, pos)
+        name = FIELDS[code]
+        if before is not None:
+            before[name], pos = _read_value(data, pos, name)
+        if after is not None:
+            after[name], pos = _read_value(data, pos, name)
+    return before, after
+
+
+def encode_states(tasks: Iterable[Task]) -> bytes:
+    """
+    Codifica o estado completo das tarefas para um snapshot (comprimido).
+
+    Layout: número de tarefas e, por tarefa, o id seguido dos valores de
+    ``FIELDS`` na ordem.
+    """
+    tasks = list(tasks)
+    out = bytearray()
+    _write_uvarint(out, len(tasks))
+    for task in tasks:
+        _write_value(out, "id", task.id)
+        for name in FIELDS:
+            _write_value(out, name, getattr(task, name))
+    return zlib.compress(bytes(out))
+
+
+def decode_states(data: bytes) -> Dict[str, TaskState]:
+    """Decodifica um snapshot em um mapa id -> estado."""
+    data = zlib.decompress(data)
+    count, pos = _read_uvarint(data, 0)
+    states: Dict[str, TaskState] = {}
+    for _ in range(count):
+        task_id, pos = _read_value(data, pos, "id")
+        state: TaskState = {}
+        for name in FIELDS:
+            state[name], pos = _read_value(data, pos, name)
+        states[task_id] = state
+    return states
+
+
+def replay(
+    states: Dict[str, TaskState], changes: Iterable[Tuple[str, Optional[TaskState]]]
+) -> List[Task]:
+    """
+    Reaplica eventos sobre o estado de um snapshot.
+
+    Args:
+        states: Estado do snapshot (modificado no lugar)
+        changes: Pares (id da tarefa, lado "depois" do evento), em ordem
+    """
+    for task_id, after in changes:
+        apply_change(states, task_id, after)
+    return [state_to_task(task_id, state) for task_id, state in states.items()]
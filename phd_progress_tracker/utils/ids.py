@@ -0,0 +1,91 @@
+"""
+IDs compactos ordenados pelo tempo de criação (formato ULID).
+
+Um ULID tem 128 bits: 48 de timestamp em milissegundos seguidos de 80
+aleatórios, codificados em 26 caracteres Base32 de Crockford. Como o
+timestamp vem primeiro, a ordem lexicográfica acompanha a ordem de criação
+e as inserções no B-tree da chave primária caem sempre no fim, em vez de
+espalhadas como com ``uuid4``.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+ID_LENGTH = 26
+
+_RANDOM_BITS = 80
+_RANDOM_MAX = (1 << _RANDOM_BITS) - 1
+_DECODE = {char: value for value, char in enumerate(ALPHABET)}
+
+_lock = threading.Lock()
+_last_ms = -1
+_last_random = 0
+
+
+def _encode(value: int) -> str:
+    chars = []
+    for _ in range(ID_LENGTH):
+        value, digit = divmod(value, 32)
+        chars.append(ALPHABET[digit])
+    return "".join(reversed(chars))
+
+
+def new_id(timestamp: Optional[datetime] = None) -> str:
+    """
+    Gera um novo ID ordenado pelo tempo.
+
+    IDs gerados no mesmo milissegundo por este processo são monotônicos (a
+    parte aleatória é incrementada). Com ``timestamp`` explícito, usado na
+    migração de IDs antigos, a parte aleatória é sempre sorteada.
+
+    Args:
+        timestamp: Momento a codificar no ID (padrão: agora)
+    """
+    global _last_ms, _last_random
+
+    if timestamp is not None:
+        ms = int(timestamp.timestamp() * 1000)
+        random_part = int.from_bytes(os.urandom(10), "big")
+        return _encode((ms << _RANDOM_BITS) | random_part)
+
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms <= _last_ms:
+            ms = _last_ms
+            if _last_random == _RANDOM_MAX:
+                ms += 1
+                random_part = 0
+            else:
+                random_part = _last_random + 1
+        else:
+            random_part = int.from_bytes(os.urandom(10), "big")
+        _last_ms, _last_random = ms, random_part
+    return _encode((ms << _RANDOM_BITS) | random_part)
+
+
+def is_time_ordered_id(value: str) -> bool:
+    """Verifica se ``value`` está no formato gerado por :func:`new_id`."""
+    return (
+        len(value) == ID_LENGTH
+        and value[0] <= "7"
+        and all(char in _DECODE for char in value)
+    )
+
+
+def id_timestamp(value: str) -> datetime:
+    """
+    Extrai o momento de criação codificado no ID.
+
+    Raises:
+        ValueError: Se o ID não estiver no formato de :func:`new_id`
+    """
+    if not is_time_ordered_id(value):
+        raise ValueError(f"Not a time-ordered id: {value!r}")
+    number = 0
+    for char in value:
+        number = number * 32 + _DECODE[char]
+    return datetime.fromtimestamp((number >> _RANDOM_BITS) / 1000)
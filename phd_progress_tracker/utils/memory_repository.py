@@ -0,0 +1,468 @@
+"""
+Repositório em memória, sem SQL nem decodificação de linhas.
+"""
+
+import copy
+import threading
+from contextlib import contextmanager
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import fields
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task
+from phd_progress_tracker.utils.activity import DayCounts, count_activity
+from phd_progress_tracker.utils.burndown import BurndownPoint, burndown_from_tasks
+from phd_progress_tracker.utils.cycle_time import WeekSketches, sketch_tasks
+from phd_progress_tracker.utils.deadline_index import DeadlineIndex
+from phd_progress_tracker.utils.dependencies import refresh_blocked as _refresh_blocked
+from phd_progress_tracker.utils.task_filter import FACETS, TaskFilter, facet_value
+from phd_progress_tracker.utils.task_frame import TaskFrame
+from phd_progress_tracker.utils.timeline import task_span
+
+_TASK_FIELDS = frozenset(f.name for f in fields(Task))
+_MILESTONE_FIELDS = frozenset(f.name for f in fields(Milestone))
+
+
+def _project(items: list, columns: Sequence[str], allowed: frozenset) -> List[dict]:
+    """Extrai só os atributos pedidos de cada objeto."""
+    unknown = [c for c in columns if c not in allowed]
+    if unknown or not columns:
+        raise ValueError(
+            f"Unknown columns: {unknown} (expected some of {sorted(allowed)})"
+        )
+    return [{column: getattr(item, column) for column in columns} for item in items]
+
+
+class MemoryRepository:
+    """
+    Guarda tarefas e milestones em dicionários indexados por ID.
+
+    Mantém também listas ordenadas de ``(deadline, id)`` e ``(target_date, id)``
+    para consultas por intervalo de datas em O(log n + k). Os dados vivem apenas no processo:
+    use para deploys efêmeros, testes rápidos e para medir o custo do próprio
+    armazenamento. Os objetos são copiados na entrada e na saída, como se
+    viessem de um banco.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, Task] = {}
+        self._by_deadline: List[Tuple[date, str]] = []
+        self._milestones: Dict[str, Milestone] = {}
+        self._by_target_date: List[Tuple[date, str]] = []
+        self._open_index = DeadlineIndex()
+        # Dependências nos dois sentidos: pré-requisitos e dependentes
+        self._depends_on: Dict[str, Set[str]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._revision = 0
+        self._lock = threading.RLock()
+
+    def close(self) -> None:
+        """Nada a fechar; existe para compatibilidade com Database."""
+
+    @contextmanager
+    def read_transaction(self) -> Iterator["MemoryRepository"]:
+        """Segura o lock durante o bloco, para leituras sobre o mesmo estado."""
+        with self._lock:
+            yield self
+
+    def __enter__(self) -> "MemoryRepository":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def _index_task(self, task: Task) -> None:
+        insort(self._by_deadline, (task.deadline, task.id))
+
+    def _unindex_task(self, task: Task) -> None:
+        key = (task.deadline, task.id)
+        i = bisect_left(self._by_deadline, key)
+        if i < len(self._by_deadline) and self._by_deadline[i] == key:
+            del self._by_deadline[i]
+
+    def _index_milestone(self, milestone: Milestone) -> None:
+        insort(self._by_target_date, (milestone.target_date, milestone.id))
+
+    def _unindex_milestone(self, milestone: Milestone) -> None:
+        key = (milestone.target_date, milestone.id)
+        i = bisect_left(self._by_target_date, key)
+        if i < len(self._by_target_date) and self._by_target_date[i] == key:
+            del self._by_target_date[i]
+
+    def revision(self) -> int:
+        """Retorna a revisão atual, incrementada a cada escrita."""
+        with self._lock:
+            return self._revision
+
+    def load_tasks(self) -> List[Task]:
+        """Retorna todas as tarefas, na ordem de inserção."""
+        with self._lock:
+            return [copy.copy(t) for t in self._tasks.values()]
+
+    def save_tasks(self, tasks: List[Task]) -> None:
+        """Substitui todas as tarefas."""
+        with self._lock:
+            self._revision += 1
+            self._tasks = {t.id: copy.copy(t) for t in tasks}
+            self._by_deadline = sorted((t.deadline, t.id) for t in self._tasks.values())
+            self._open_index = DeadlineIndex.build(self._tasks.values())
+            for task_id, prerequisites in list(self._depends_on.items()):
+                for depends_on in list(prerequisites):
+                    if task_id not in self._tasks or depends_on not in self._tasks:
+                        self._unlink(task_id, depends_on)
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Busca uma tarefa pelo ID."""
+        with self._lock:
+            task = self._tasks.get(task_id)
+            return copy.copy(task) if task else None
+
+    def load_task_columns(
+        self, columns: Sequence[str], filters: Optional[TaskFilter] = None
+    ) -> List[Dict[str, Any]]:
+        """Retorna só os atributos pedidos das tarefas (filtradas, se pedido)."""
+        filters = filters or TaskFilter()
+        with self._lock:
+            tasks = [t for t in self._tasks.values() if filters.matches(t)]
+            return _project(tasks, columns, _TASK_FIELDS)
+
+    def get_task_columns(
+        self, task_id: str, columns: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Retorna só os atributos pedidos de uma tarefa."""
+        with self._lock:
+            task = self._tasks.get(task_id)
+            projected = _project([task] if task else [], columns, _TASK_FIELDS)
+            return projected[0] if projected else None
+
+    def find_tasks(self, filters: TaskFilter) -> List[Task]:
+        """Retorna as tarefas que atendem ao filtro."""
+        with self._lock:
+            return [copy.copy(t) for t in self._tasks.values() if filters.matches(t)]
+
+    def task_facets(
+        self, filters: Optional[TaskFilter] = None
+    ) -> Tuple[int, Dict[str, Dict[str, int]]]:
+        """Conta as tarefas (filtradas) por faceta, junto com a revisão atual."""
+        filters = filters or TaskFilter()
+        with self._lock:
+            facets: Dict[str, Dict[str, int]] = {name: {} for name in FACETS}
+            for task in self._tasks.values():
+                if not filters.matches(task):
+                    continue
+                for name, counts in facets.items():
+                    key = facet_value(task, name)
+                    counts[key] = counts.get(key, 0) + 1
+            return self._revision, {
+                name: dict(sorted(counts.items())) for name, counts in facets.items()
+            }
+
+    def tasks_by_deadline(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        limit: Optional[int] = None,
+    ) -> List[Task]:
+        """Retorna tarefas com deadline em [start, end], ordenadas por deadline."""
+        with self._lock:
+            lo = bisect_left(self._by_deadline, (start,)) if start else 0
+            hi = (
+                bisect_right(self._by_deadline, (end, "\U0010ffff"))
+                if end
+                else len(self._by_deadline)
+            )
+            if limit is not None:
+                hi = min(hi, lo + limit)
+            return [copy.copy(self._tasks[i]) for _, i in self._by_deadline[lo:hi]]
+
+    def tasks_overlapping(self, start: date, end: date) -> List[Task]:
+        """Retorna tarefas cuja barra cruza [start, end], ordenadas pela criação."""
+        with self._lock:
+            tasks = [
+                copy.copy(task)
+                for task in self._tasks.values()
+                if task.created_at.date() <= end and task_span(task)[1] >= start
+            ]
+        return sorted(tasks, key=lambda task: (task.created_at, task.id))
+
+    def deadline_index(self) -> DeadlineIndex:
+        """Retorna o índice de prazos das tarefas abertas."""
+        return self._open_index
+
+    def task_frame(self) -> TaskFrame:
+        """Retorna as tarefas como TaskFrame (colunas NumPy)."""
+        with self._lock:
+            return TaskFrame.from_tasks(self._tasks.values())
+
+    def cycle_time_sketches(
+        self, start: Optional[date] = None, end: Optional[date] = None
+    ) -> WeekSketches:
+        """Resume os tempos de ciclo por semana de conclusão (sem cache)."""
+        with self._lock:
+            return sketch_tasks(self._tasks.values(), start, end)
+
+    def burndown(
+        self, start: date, end: date, granularity: str, window: int
+    ) -> List[BurndownPoint]:
+        """Série de burndown/burnup calculada em uma passada pelas tarefas."""
+        with self._lock:
+            return burndown_from_tasks(
+                self._tasks.values(), start, end, granularity, window
+            )
+
+    def activity_counts(self, first_year: int, last_year: int) -> DayCounts:
+        """Criações e conclusões por dia, contadas em uma passada (sem cache)."""
+        with self._lock:
+            return count_activity(self._tasks.values(), first_year, last_year)
+
+    def add_task(self, task: Task) -> None:
+        """Insere uma nova tarefa."""
+        with self._lock:
+            self._revision += 1
+            if task.id in self._tasks:
+                raise RuntimeError(f"Failed to add task: duplicate id {task.id!r}")
+            self._tasks[task.id] = copy.copy(task)
+            self._index_task(task)
+            self._open_index.upsert(task)
+
+    def update_task(
+        self, task: Task, automatic: bool = False, refresh_blocked: bool = False
+    ) -> bool:
+        """
+        Atualiza uma tarefa existente. Retorna False se ela não existir.
+
+        ``automatic`` não tem efeito: este repositório não guarda histórico.
+        Com ``refresh_blocked``, o bloqueio da tarefa (e, se o status mudou,
+        o dos dependentes) é recalculado sob o mesmo lock.
+        """
+        with self._lock:
+            self._revision += 1
+            old = self._tasks.get(task.id)
+            if old is None:
+                return False
+            self._unindex_task(old)
+            self._tasks[task.id] = copy.copy(task)
+            self._index_task(task)
+            self._open_index.upsert(task)
+            if refresh_blocked:
+                _refresh_blocked(self, [task.id], keep_independent=True)
+                if old.status != task.status:
+                    _refresh_blocked(self, self.dependents(task.id))
+            return True
+
+    def delete_task(self, task_id: str, refresh_blocked: bool = False) -> bool:
+        """
+        Remove uma tarefa. Retorna False se ela não existir.
+
+        Com ``refresh_blocked``, o bloqueio dos dependentes é recalculado sob
+        o mesmo lock.
+        """
+        with self._lock:
+            self._revision += 1
+            old = self._tasks.pop(task_id, None)
+            if old is None:
+                return False
+            self._unindex_task(old)
+            self._open_index.discard(task_id)
+            for depends_on in list(self._depends_on.get(task_id, ())):
+                self._unlink(task_id, depends_on)
+            dependents = list(self._dependents.get(task_id, ()))
+            for dependent in dependents:
+                self._unlink(dependent, task_id)
+            if refresh_blocked:
+                _refresh_blocked(self, sorted(dependents))
+            return True
+
+    def _unlink(self, task_id: str, depends_on: str) -> bool:
+        prerequisites = self._depends_on.get(task_id)
+        if not prerequisites or depends_on not in prerequisites:
+            return False
+        prerequisites.discard(depends_on)
+        self._dependents[depends_on].discard(task_id)
+        return True
+
+    def dependency_edges(self) -> List[Tuple[str, str]]:
+        """Todas as dependências, como pares ``(task_id, depends_on)``."""
+        with self._lock:
+            return sorted(
+                (task_id, depends_on)
+                for task_id, prerequisites in self._depends_on.items()
+                for depends_on in prerequisites
+            )
+
+    def dependencies(self, task_id: str) -> List[str]:
+        """IDs das tarefas de que ``task_id`` depende (pré-requisitos diretos)."""
+        with self._lock:
+            return sorted(self._depends_on.get(task_id, ()))
+
+    def dependents(self, task_id: str) -> List[str]:
+        """IDs das tarefas que dependem diretamente de ``task_id``."""
+        with self._lock:
+            return sorted(self._dependents.get(task_id, ()))
+
+    def add_dependency(
+        self, task_id: str, depends_on: str, refresh_blocked: bool = False
+    ) -> bool:
+        """
+        Registra que ``task_id`` só pode ser feita depois de ``depends_on``.
+
+        Uma busca em profundidade pelos pré-requisitos de ``depends_on``
+        recusa arestas que fechariam um ciclo. Com ``refresh_blocked``, o
+        bloqueio de ``task_id`` é recalculado sob o mesmo lock.
+
+        Returns:
+            False se a dependência já existia
+
+        Raises:
+            ValueError: Se alguma tarefa não existir, se forem a mesma tarefa
+                ou se a dependência criar um ciclo
+        """
+        with self._lock:
+            for item_id in (task_id, depends_on):
+                if item_id not in self._tasks:
+                    raise ValueError(f"Task not found: {item_id!r}")
+            if task_id == depends_on:
+                raise ValueError("A task cannot depend on itself")
+            seen = {depends_on}
+            stack = [depends_on]
+            while stack:
+                for upstream in self._depends_on.get(stack.pop(), ()):
+                    if upstream == task_id:
+                        raise ValueError(
+                            f"Dependency cycle: {depends_on!r} already depends on "
+                            f"{task_id!r}"
+                        )
+                    if upstream not in seen:
+                        seen.add(upstream)
+                        stack.append(upstream)
+            self._revision += 1
+            prerequisites = self._depends_on.setdefault(task_id, set())
+            added = depends_on not in prerequisites
+            prerequisites.add(depends_on)
+            self._dependents.setdefault(depends_on, set()).add(task_id)
+            if refresh_blocked:
+                _refresh_blocked(self, [task_id])
+            return added
+
+    def remove_dependency(
+        self, task_id: str, depends_on: str, refresh_blocked: bool = False
+    ) -> bool:
+        """
+        Remove uma dependência. Retorna False se ela não existir.
+
+        Com ``refresh_blocked``, o bloqueio de ``task_id`` é recalculado sob
+        o mesmo lock.
+        """
+        with self._lock:
+            self._revision += 1
+            removed = self._unlink(task_id, depends_on)
+            if removed and refresh_blocked:
+                _refresh_blocked(self, [task_id])
+            return removed
+
+    def load_milestones(self) -> List[Milestone]:
+        """Retorna todos os milestones, na ordem de inserção."""
+        with self._lock:
+            return [copy.copy(m) for m in self._milestones.values()]
+
+    def save_milestones(self, milestones: List[Milestone]) -> None:
+        """Substitui todos os milestones."""
+        with self._lock:
+            self._revision += 1
+            self._milestones = {m.id: copy.copy(m) for m in milestones}
+            self._by_target_date = sorted(
+                (m.target_date, m.id) for m in self._milestones.values()
+            )
+
+    def milestones_by_date(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        achieved: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> List[Milestone]:
+        """Retorna milestones com data alvo em [start, end], ordenados por data."""
+        with self._lock:
+            lo = bisect_left(self._by_target_date, (start,)) if start else 0
+            hi = (
+                bisect_right(self._by_target_date, (end, "\U0010ffff"))
+                if end
+                else len(self._by_target_date)
+            )
+            result = []
+            for _, milestone_id in self._by_target_date[lo:hi]:
+                if limit is not None and len(result) >= limit:
+                    break
+                milestone = self._milestones[milestone_id]
+                if achieved is None or milestone.is_achieved == achieved:
+                    result.append(copy.copy(milestone))
+            return result
+
+    def load_milestone_columns(
+        self,
+        columns: Sequence[str],
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        achieved: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """Retorna só os atributos pedidos dos milestones (filtrados por data, se pedido)."""
+        with self._lock:
+            if start is None and end is None and achieved is None:
+                milestones = list(self._milestones.values())
+            else:
+                milestones = self.milestones_by_date(start, end, achieved)
+            return _project(milestones, columns, _MILESTONE_FIELDS)
+
+    def get_milestone_columns(
+        self, milestone_id: str, columns: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Retorna só os atributos pedidos de um milestone."""
+        with self._lock:
+            milestone = self._milestones.get(milestone_id)
+            projected = _project(
+                [milestone] if milestone else [], columns, _MILESTONE_FIELDS
+            )
+            return projected[0] if projected else None
+
+    def get_milestone(self, milestone_id: str) -> Optional[Milestone]:
+        """Busca um milestone pelo ID."""
+        with self._lock:
+            milestone = self._milestones.get(milestone_id)
+            return copy.copy(milestone) if milestone else None
+
+    def add_milestone(self, milestone: Milestone) -> None:
+        """Insere um novo milestone."""
+        with self._lock:
+            self._revision += 1
+            if milestone.id in self._milestones:
+                raise RuntimeError(
+                    f"Failed to add milestone: duplicate id {milestone.id!r}"
+                )
+            self._milestones[milestone.id] = copy.copy(milestone)
+            self._index_milestone(milestone)
+
+    def update_milestone(self, milestone: Milestone) -> bool:
+        """Atualiza um milestone existente. Retorna False se ele não existir."""
+        with self._lock:
+            self._revision += 1
+            old = self._milestones.get(milestone.id)
+            if old is None:
+                return False
+            self._unindex_milestone(old)
+            self._milestones[milestone.id] = copy.copy(milestone)
+            self._index_milestone(milestone)
+            return True
+
+    def delete_milestone(self, milestone_id: str) -> bool:
+        """Remove um milestone. Retorna False se ele não existir."""
+        with self._lock:
+            self._revision += 1
+            old = self._milestones.pop(milestone_id, None)
+            if old is None:
+                return False
+            self._unindex_milestone(old)
+            return True
@@ -0,0 +1,384 @@
+"""
+Planejamento por capacidade: distribui o esforço das tarefas abertas em dias.
+
+As tarefas são processadas em ordem de prazo (EDF: prazo, prioridade mais
+alta, ID) e cada uma é encaixada nos dias como em um bin packing, em que
+cada dia é um recipiente com ``daily_hours`` de capacidade:
+
+- se cabe em um dia, vai inteira para o primeiro dia com espaço
+  (first-fit), desde que esse dia não passe do prazo;
+- senão (ou se o primeiro encaixe inteiro ficaria atrasado), é dividida
+  pelos primeiros dias com espaço livre, terminando o mais cedo possível.
+
+O espaço livre por dia fica em uma árvore de segmentos de máximos, então
+achar o primeiro dia com espaço suficiente custa O(log D). Tarefas sem
+estimativa usam ``default_effort``. Os minutos são inteiros, para que tirar e
+devolver esforço à árvore seja exato. A árvore cresce conforme o plano avança,
+até ``MAX_HORIZON_DAYS``; um plano que não cabe nesse horizonte gera
+``ValueError``.
+
+O planejamento é incremental: o ``Planner`` guarda a ordem e as alocações
+da última execução, e a alocação de uma tarefa só depende das anteriores na
+ordem EDF. Quando uma tarefa muda, o prefixo anterior a ela é reaproveitado:
+só as alocações do sufixo são devolvidas à árvore e refeitas.
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from phd_progress_tracker.models.task import Task, TaskPriority
+
+DEFAULT_DAYS = 14
+# Dias por consulta
+MAX_DAYS = 366
+# Limite do plano inteiro (cerca de 100 anos) e do esforço de uma tarefa
+MAX_HORIZON_DAYS = 36_600
+MAX_EFFORT_HOURS = 10_000.0
+
+# Ordem EDF: prazo, prioridade mais alta, ID
+_PRIORITY_RANK = {priority: -level for level, priority in enumerate(TaskPriority)}
+
+# Alocações de uma tarefa: (índice do dia a partir do início, minutos)
+Allocation = List[Tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class Capacity:
+    """
+    Capacidade de trabalho.
+
+    Attributes:
+        daily_hours: Horas disponíveis por dia de trabalho
+        default_effort: Esforço (horas) assumido para tarefas sem estimativa
+        weekends: Se sábados e domingos também são dias de trabalho
+    """
+
+    daily_hours: float = 6.0
+    default_effort: float = 2.0
+    weekends: bool = False
+
+    def __post_init__(self) -> None:
+        if round(self.daily_hours * 60) < 1:
+            raise ValueError(
+                f"daily_hours must be at least 1 minute, got {self.daily_hours}"
+            )
+        if not 0 < self.default_effort <= MAX_EFFORT_HOURS:
+            raise ValueError(
+                f"default_effort must be between 0 and {MAX_EFFORT_HOURS:g}, "
+                f"got {self.default_effort}"
+            )
+
+    def minutes_on(self, day: date) -> int:
+        """Minutos disponíveis em um dia."""
+        if not self.weekends and day.weekday() >= 5:
+            return 0
+        return round(self.daily_hours * 60)
+
+    def effort_minutes(self, task: Task) -> int:
+        """Esforço da tarefa em minutos (``default_effort`` se não estimado)."""
+        hours = task.effort_hours if task.effort_hours else self.default_effort
+        return max(1, round(hours * 60))
+
+
+def plan_order(tasks: Sequence[Task]) -> List[Task]:
+    """Tarefas na ordem em que são planejadas (EDF)."""
+    return sorted(tasks, key=lambda t: (t.deadline, _PRIORITY_RANK[t.priority], t.id))
+
+
+class _FreeDays:
+    """Árvore de segmentos com o máximo de minutos livres por dia."""
+
+    def __init__(self, start: date, capacity: Capacity, days: int) -> None:
+        self.start = start
+        self.capacity = capacity
+        self.size = 1
+        self.tree: List[int] = []
+        self._resize(max(min(days, MAX_HORIZON_DAYS), 64))
+
+    def _resize(self, days: int) -> None:
+        old = self.size
+        size = 1 << (days - 1).bit_length()
+        leaves = self.tree[old:]
+        leaves += [
+            self.capacity.minutes_on(self.start + timedelta(days=i))
+            for i in range(len(leaves), size)
+        ]
+        tree = [0] * size + leaves
+        for i in range(size - 1, 0, -1):
+            tree[i] = max(tree[2 * i], tree[2 * i + 1])
+        self.size, self.tree = size, tree
+
+    def free(self, day: int) -> int:
+        return self.tree[self.size + day]
+
+    def add(self, day: int, minutes: int) -> None:
+        """Soma (ou, com valor negativo, tira) minutos livres de um dia."""
+        i = self.size + day
+        self.tree[i] += minutes
+        i >>= 1
+        while i:
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+            i >>= 1
+
+    def _find(self, need: int, lo: int) -> int:
+        if lo >= self.size:
+            return -1
+        i = self.size + lo
+        if self.tree[i] < need:
+            # Sobe até o próximo nó à direita que tenha espaço suficiente
+            while True:
+                while i & 1:
+                    if i == 1:
+                        return -1
+                    i >>= 1
+                i += 1
+                if self.tree[i] >= need:
+                    break
+            while i < self.size:
+                i = 2 * i if self.tree[2 * i] >= need else 2 * i + 1
+        return i - self.size
+
+    def first_fit(self, need: int, lo: int = 0) -> int:
+        """
+        Primeiro dia a partir de ``lo`` com ``need`` minutos livres.
+
+        Raises:
+            ValueError: Se não houver dia assim em ``MAX_HORIZON_DAYS``
+        """
+        while True:
+            day = self._find(need, lo)
+            if 0 <= day < MAX_HORIZON_DAYS:
+                return day
+            if day >= 0 or self.size >= MAX_HORIZON_DAYS:
+                raise ValueError(
+                    f"plan does not fit in {MAX_HORIZON_DAYS} days; "
+                    "check the effort estimates and the daily hours"
+                )
+            self._resize(2 * self.size)
+
+
+class Planner:
+    """
+    Planejador incremental.
+
+    Guarda a ordem EDF e as alocações da última execução; ``schedule``
+    reaproveita o prefixo que não mudou e refaz só o restante. Mudar a data
+    de início ou a capacidade recomeça do zero.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._start: Optional[date] = None
+        self._capacity: Optional[Capacity] = None
+        self._days: Optional[_FreeDays] = None
+        self._keys: List[Tuple[date, int, str, int]] = []
+        self._allocations: List[Allocation] = []
+        # Tarefas (re)alocadas na última execução
+        self.replanned = 0
+
+    def _place(self, minutes: int, due: int) -> Allocation:
+        days = self._days
+        if minutes <= round(days.capacity.daily_hours * 60):
+            day = days.first_fit(minutes)
+            if day <= due:
+                days.add(day, -minutes)
+                return [(day, minutes)]
+        allocation: Allocation = []
+        day = 0
+        while minutes > 0:
+            day = days.first_fit(1, day)
+            chunk = min(minutes, days.free(day))
+            days.add(day, -chunk)
+            allocation.append((day, chunk))
+            minutes -= chunk
+            day += 1
+        return allocation
+
+    def schedule(
+        self, tasks: Sequence[Task], start: date, capacity: Capacity
+    ) -> List[Allocation]:
+        """
+        Aloca as tarefas, já na ordem de :func:`plan_order`.
+
+        Returns:
+            Alocações de cada tarefa, na mesma ordem
+
+        Raises:
+            ValueError: Se o plano não couber em ``MAX_HORIZON_DAYS``
+        """
+        keys = [
+            (t.deadline, _PRIORITY_RANK[t.priority], t.id, capacity.effort_minutes(t))
+            for t in tasks
+        ]
+        with self._lock:
+            if start != self._start or capacity != self._capacity:
+                last = max((t.deadline for t in tasks), default=start)
+                self._start, self._capacity = start, capacity
+                self._days = _FreeDays(start, capacity, (last - start).days + 1)
+                self._keys, self._allocations = [], []
+
+            same = 0
+            for old, new in zip(self._keys, keys):
+                if old != new:
+                    break
+                same += 1
+            for allocation in self._allocations[same:]:
+                for day, minutes in allocation:
+                    self._days.add(day, minutes)
+            del self._allocations[same:]
+            try:
+                for deadline, _, _, minutes in keys[same:]:
+                    self._allocations.append(
+                        self._place(minutes, (deadline - start).days)
+                    )
+            except ValueError:
+                # Árvore com alocações parciais: a próxima execução recomeça
+                self._start = self._capacity = self._days = None
+                self._keys, self._allocations = [], []
+                raise
+            self._keys = keys
+            self.replanned = len(keys) - same
+            return list(self._allocations)
+
+
+_planners: "weakref.WeakKeyDictionary[object, Planner]" = weakref.WeakKeyDictionary()
+_planners_lock = threading.Lock()
+
+
+def planner_for(repo) -> Planner:
+    """Planejador associado a um repositório (criado no primeiro uso)."""
+    with _planners_lock:
+        planner = _planners.get(repo)
+        if planner is None:
+            planner = _planners[repo] = Planner()
+        return planner
+
+
+@dataclass(frozen=True)
+class PlanSlot:
+    """Horas de uma tarefa em um dia."""
+
+    task: Task
+    hours: float
+
+
+@dataclass(frozen=True)
+class PlanDay:
+    """Um dia do plano."""
+
+    day: date
+    capacity: float
+    slots: List[PlanSlot]
+
+    @property
+    def used(self) -> float:
+        """Horas alocadas no dia."""
+        return sum(slot.hours for slot in self.slots)
+
+
+@dataclass(frozen=True)
+class PlannedTask:
+    """
+    Resultado do planejamento de uma tarefa.
+
+    Attributes:
+        task: Tarefa
+        effort: Esforço planejado (horas)
+        estimated: Se o esforço veio da tarefa (False: ``default_effort``)
+        start: Primeiro dia com trabalho na tarefa
+        finish: Último dia com trabalho na tarefa
+    """
+
+    task: Task
+    effort: float
+    estimated: bool
+    start: date
+    finish: date
+
+    @property
+    def late(self) -> bool:
+        """Se o plano só termina a tarefa depois do prazo."""
+        return self.finish > self.task.deadline
+
+
+@dataclass(frozen=True)
+class Plan:
+    """
+    Plano a partir de ``start``; ``days`` cobre só a janela pedida.
+
+    Attributes:
+        start: Primeiro dia do plano (e da janela)
+        capacity: Capacidade usada
+        days: Dias da janela, com as horas de cada tarefa
+        tasks: Todas as tarefas abertas planejadas, em ordem EDF
+    """
+
+    start: date
+    capacity: Capacity
+    days: List[PlanDay]
+    tasks: List[PlannedTask]
+
+    @property
+    def late(self) -> List[PlannedTask]:
+        """Tarefas que o plano só termina depois do prazo."""
+        return [planned for planned in self.tasks if planned.late]
+
+    @property
+    def finish(self) -> Optional[date]:
+        """Último dia com trabalho planejado (None se não há tarefas)."""
+        return max((planned.finish for planned in self.tasks), default=None)
+
+
+def build_plan(
+    repo,
+    start: Optional[date] = None,
+    days: int = DEFAULT_DAYS,
+    capacity: Capacity = Capacity(),
+    planner: Optional[Planner] = None,
+) -> Plan:
+    """
+    Planeja as tarefas abertas a partir de ``start`` (padrão: hoje).
+
+    Args:
+        repo: Repositório de origem
+        start: Primeiro dia do plano
+        days: Dias da janela devolvida em ``Plan.days``
+        capacity: Capacidade de trabalho
+        planner: Planejador a reaproveitar (padrão: o do repositório, ver
+            :func:`planner_for`)
+
+    Raises:
+        ValueError: Se ``days`` estiver fora de 1..MAX_DAYS ou se o plano não
+            couber em ``MAX_HORIZON_DAYS``
+    """
+    if not 1 <= days <= MAX_DAYS:
+        raise ValueError(f"days must be between 1 and {MAX_DAYS}, got {days}")
+    start = start or date.today()
+    planner = planner or planner_for(repo)
+    tasks = plan_order(repo.deadline_index().due_between(date.min, date.max))
+    allocations = planner.schedule(tasks, start, capacity)
+
+    slots: Dict[int, List[PlanSlot]] = {}
+    planned = []
+    for task, allocation in zip(tasks, allocations):
+        for day, minutes in allocation:
+            if day < days:
+                slots.setdefault(day, []).append(PlanSlot(task, minutes / 60))
+        planned.append(
+            PlannedTask(
+                task=task,
+                effort=sum(minutes for _, minutes in allocation) / 60,
+                estimated=bool(task.effort_hours),
+                start=start + timedelta(days=allocation[0][0]),
+                finish=start + timedelta(days=allocation[-1][0]),
+            )
+        )
+
+    window = []
+    for i in range(days):
+        day = start + timedelta(days=i)
+        window.append(PlanDay(day, capacity.minutes_on(day) / 60, slots.get(i, [])))
+    return Plan(start=start, capacity=capacity, days=window, tasks=planned)
@@ -0,0 +1,137 @@
+"""
+Ranking "no que trabalhar agora": pontuação das tarefas abertas e top-k.
+
+A pontuação soma, com pesos configuráveis (``ScoreWeights``):
+
+- prioridade: de 0 (LOW) a 1 (CRITICAL);
+- proximidade do prazo: 0 a ``horizon_days`` ou mais dias do prazo, 1 no
+  dia, e até ``OVERDUE_CAP`` para tarefas atrasadas;
+- idade: dias desde a criação, até 1 em ``max_age_days``;
+- status: bônus para tarefas em progresso e penalidade para bloqueadas.
+
+O top-k vem de ``DeadlineIndex.top``: o índice das tarefas abertas já é
+mantido a cada escrita, e a varredura em ordem de prazo para cedo, pois a
+proximidade só diminui com prazos mais distantes e as outras parcelas são
+limitadas (``score_bound``).
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+
+DEFAULT_K = 5
+# Proximidade máxima, atingida com metade do horizonte de atraso
+OVERDUE_CAP = 1.5
+
+PRIORITY_LEVELS = {
+    priority: level / (len(TaskPriority) - 1)
+    for level, priority in enumerate(TaskPriority)
+}
+
+
+@dataclass(frozen=True)
+class ScoreWeights:
+    """
+    Pesos da pontuação.
+
+    Attributes:
+        priority: Peso da prioridade
+        deadline: Peso da proximidade do prazo
+        age: Peso da idade da tarefa
+        in_progress: Bônus de tarefas em progresso
+        blocked: Bônus (negativo: penalidade) de tarefas bloqueadas
+        horizon_days: Dias antes do prazo em que a proximidade começa a contar
+        max_age_days: Idade a partir da qual a parcela de idade não cresce
+    """
+
+    priority: float = 3.0
+    deadline: float = 4.0
+    age: float = 1.0
+    in_progress: float = 1.0
+    blocked: float = -5.0
+    horizon_days: int = 30
+    max_age_days: int = 60
+
+    def __post_init__(self) -> None:
+        if self.horizon_days < 1 or self.max_age_days < 1:
+            raise ValueError("horizon_days and max_age_days must be positive")
+
+
+@dataclass(frozen=True)
+class RankedTask:
+    """Tarefa com a pontuação total e as parcelas ponderadas."""
+
+    task: Task
+    score: float
+    parts: Dict[str, float]
+
+
+def deadline_proximity(days_remaining: int, horizon_days: int) -> float:
+    """Proximidade do prazo, de 0 (longe) a ``OVERDUE_CAP`` (bem atrasada)."""
+    return min(OVERDUE_CAP, max(0.0, 1 - days_remaining / horizon_days))
+
+
+def score_parts(task: Task, today: date, weights: ScoreWeights) -> Dict[str, float]:
+    """Parcelas ponderadas da pontuação de uma tarefa."""
+    age = (today - task.created_at.date()).days
+    status = 0.0
+    if task.status == TaskStatus.IN_PROGRESS:
+        status = weights.in_progress
+    elif task.status == TaskStatus.BLOCKED:
+        status = weights.blocked
+    return {
+        "priority": weights.priority * PRIORITY_LEVELS[task.priority],
+        "deadline": weights.deadline
+        * deadline_proximity((task.deadline - today).days, weights.horizon_days),
+        "age": weights.age * min(1.0, max(0, age) / weights.max_age_days),
+        "status": status,
+    }
+
+
+def score_task(task: Task, today: date, weights: ScoreWeights) -> float:
+    """Pontuação total de uma tarefa."""
+    return sum(score_parts(task, today, weights).values())
+
+
+def score_bound(deadline: date, today: date, weights: ScoreWeights) -> float:
+    """Maior pontuação possível de uma tarefa com prazo em ``deadline`` ou depois."""
+    proximity = deadline_proximity((deadline - today).days, weights.horizon_days)
+    return (
+        max(weights.priority, 0.0)
+        + weights.deadline * proximity
+        + max(weights.age, 0.0)
+        + max(weights.in_progress, weights.blocked, 0.0)
+    )
+
+
+def next_tasks(
+    repo,
+    k: int = DEFAULT_K,
+    weights: Optional[ScoreWeights] = None,
+    today: Optional[date] = None,
+) -> List[RankedTask]:
+    """
+    As k tarefas abertas de maior pontuação, da maior para a menor.
+
+    Raises:
+        ValueError: Se k não for positivo
+    """
+    if k < 1:
+        raise ValueError(f"k must be positive, got {k}")
+    weights = weights or ScoreWeights()
+    today = today or date.today()
+    # Com peso negativo no prazo, a proximidade deixa de limitar a varredura
+    bound = (
+        (lambda deadline: score_bound(deadline, today, weights))
+        if weights.deadline >= 0
+        else None
+    )
+    top = repo.deadline_index().top(
+        k, lambda task: score_task(task, today, weights), bound
+    )
+    return [
+        RankedTask(task, score, score_parts(task, today, weights))
+        for score, task in top
+    ]
@@ -0,0 +1,250 @@
+"""
+Interface de repositório para tarefas e milestones.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    runtime_checkable,
+)
+
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task, TaskStatus
+from phd_progress_tracker.utils.activity import DayCounts
+from phd_progress_tracker.utils.burndown import BurndownPoint
+from phd_progress_tracker.utils.cycle_time import WeekSketches
+from phd_progress_tracker.utils.deadline_index import DeadlineIndex
+from phd_progress_tracker.utils.history import TaskEvent
+from phd_progress_tracker.utils.task_filter import TaskFilter
+from phd_progress_tracker.utils.task_frame import TaskFrame
+
+
+class Repository(Protocol):
+    """
+    Operações de persistência usadas pelas rotas da API e pelo CLI.
+
+    Implementada por ``Database`` (SQLite) e ``MemoryRepository`` (dicionários
+    em memória, para deploys efêmeros, testes rápidos e benchmarks).
+    """
+
+    def read_transaction(self) -> ContextManager["Repository"]:
+        """Context manager em que todas as leituras veem o mesmo snapshot."""
+
+    def revision(self) -> int:
+        """Retorna a revisão do armazenamento, que muda a cada escrita."""
+
+    def load_tasks(self) -> List[Task]:
+        """Carrega todas as tarefas."""
+
+    def save_tasks(self, tasks: List[Task]) -> None:
+        """Substitui todas as tarefas."""
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Busca uma tarefa pelo ID."""
+
+    def load_task_columns(
+        self, columns: Sequence[str], filters: Optional[TaskFilter] = None
+    ) -> List[Dict[str, Any]]:
+        """Carrega só as colunas pedidas das tarefas (ValueError se desconhecidas)."""
+
+    def get_task_columns(
+        self, task_id: str, columns: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Busca só as colunas pedidas de uma tarefa."""
+
+    def find_tasks(self, filters: TaskFilter) -> List[Task]:
+        """Carrega as tarefas que atendem ao filtro."""
+
+    def task_facets(
+        self, filters: Optional[TaskFilter] = None
+    ) -> Tuple[int, Dict[str, Dict[str, int]]]:
+        """Conta as tarefas por faceta; retorna também a revisão das contagens."""
+
+    def tasks_by_deadline(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        limit: Optional[int] = None,
+    ) -> List[Task]:
+        """Carrega tarefas com deadline em [start, end], ordenadas por deadline."""
+
+    def tasks_overlapping(self, start: date, end: date) -> List[Task]:
+        """Carrega tarefas cuja barra (criação → conclusão ou prazo) cruza [start, end]."""
+
+    def deadline_index(self) -> DeadlineIndex:
+        """Retorna o índice de prazos das tarefas abertas, mantido pelas escritas."""
+
+    def task_frame(self) -> TaskFrame:
+        """Carrega as tarefas como TaskFrame (requer NumPy)."""
+
+    def cycle_time_sketches(
+        self, start: Optional[date] = None, end: Optional[date] = None
+    ) -> WeekSketches:
+        """Resume os tempos de ciclo das tarefas concluídas por semana de conclusão."""
+
+    def burndown(
+        self, start: date, end: date, granularity: str, window: int
+    ) -> List[BurndownPoint]:
+        """Série de criadas/concluídas/abertas por período, com velocidade móvel."""
+
+    def activity_counts(self, first_year: int, last_year: int) -> DayCounts:
+        """Criações e conclusões por dia (só dias com atividade) nos anos dados."""
+
+    def add_task(self, task: Task) -> None:
+        """Insere uma nova tarefa."""
+
+    def update_task(
+        self, task: Task, automatic: bool = False, refresh_blocked: bool = False
+    ) -> bool:
+        """
+        Atualiza uma tarefa existente. Retorna False se ela não existir.
+
+        ``automatic`` marca mudanças derivadas (bloqueio por dependências),
+        que não entram na cadeia de desfazer. Com ``refresh_blocked``, o
+        bloqueio da tarefa (e, se o status mudou, o dos dependentes) é
+        recalculado na mesma escrita.
+        """
+
+    def delete_task(self, task_id: str, refresh_blocked: bool = False) -> bool:
+        """
+        Remove uma tarefa (e as dependências dela). Retorna False se ela não existir.
+
+        Com ``refresh_blocked``, o bloqueio dos dependentes é recalculado na
+        mesma escrita.
+        """
+
+    def dependency_edges(self) -> List[Tuple[str, str]]:
+        """Carrega todas as dependências, como pares ``(task_id, depends_on)``."""
+
+    def dependencies(self, task_id: str) -> List[str]:
+        """IDs dos pré-requisitos diretos de uma tarefa."""
+
+    def dependents(self, task_id: str) -> List[str]:
+        """IDs das tarefas que dependem diretamente de uma tarefa."""
+
+    def add_dependency(
+        self, task_id: str, depends_on: str, refresh_blocked: bool = False
+    ) -> bool:
+        """
+        Registra uma dependência (ValueError se fechar um ciclo). False se já existia.
+
+        Com ``refresh_blocked``, o bloqueio de ``task_id`` é recalculado na
+        mesma escrita.
+        """
+
+    def remove_dependency(
+        self, task_id: str, depends_on: str, refresh_blocked: bool = False
+    ) -> bool:
+        """
+        Remove uma dependência. Retorna False se ela não existir.
+
+        Com ``refresh_blocked``, o bloqueio de ``task_id`` é recalculado na
+        mesma escrita.
+        """
+
+    def load_milestones(self) -> List[Milestone]:
+        """Carrega todos os milestones."""
+
+    def save_milestones(self, milestones: List[Milestone]) -> None:
+        """Substitui todos os milestones."""
+
+    def milestones_by_date(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        achieved: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> List[Milestone]:
+        """Carrega milestones com data alvo em [start, end], ordenados por data."""
+
+    def load_milestone_columns(
+        self,
+        columns: Sequence[str],
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        achieved: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """Carrega só as colunas pedidas dos milestones, opcionalmente por intervalo."""
+
+    def get_milestone_columns(
+        self, milestone_id: str, columns: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Busca só as colunas pedidas de um milestone."""
+
+    def get_milestone(self, milestone_id: str) -> Optional[Milestone]:
+        """Busca um milestone pelo ID."""
+
+    def add_milestone(self, milestone: Milestone) -> None:
+        """Insere um novo milestone."""
+
+    def update_milestone(self, milestone: Milestone) -> bool:
+        """Atualiza um milestone existente. Retorna False se ele não existir."""
+
+    def delete_milestone(self, milestone_id: str) -> bool:
+        """Remove um milestone. Retorna False se ele não existir."""
+
+    def close(self) -> None:
+        """Libera conexões abertas."""
+
+
+@runtime_checkable
+class HistoryRepository(Protocol):
+    """
+    Operações opcionais que dependem de histórico gravado: eventos de tarefa
+    (undo/redo), transições de status e aliases de ID.
+
+    Implementada por ``Database``; ``MemoryRepository`` não guarda histórico.
+    Rotas e comandos verificam o suporte com
+    ``isinstance(repo, HistoryRepository)``.
+    """
+
+    def undo(self) -> Optional[TaskEvent]:
+        """Desfaz a última alteração de tarefa; None se não houver."""
+
+    def redo(self) -> Optional[TaskEvent]:
+        """Refaz a última alteração desfeita; None se não houver."""
+
+    def task_history(self, task_id: str) -> List[TaskEvent]:
+        """Eventos de uma tarefa, do mais antigo ao mais recente."""
+
+    def time_in_status(
+        self, task_id: str, now: Optional[datetime] = None
+    ) -> Dict[TaskStatus, timedelta]:
+        """Tempo que uma tarefa passou em cada status."""
+
+    def stalled_tasks(
+        self,
+        days: int,
+        statuses: Sequence[TaskStatus] = (TaskStatus.IN_PROGRESS, TaskStatus.BLOCKED),
+        now: Optional[datetime] = None,
+    ) -> List[Tuple[Task, datetime]]:
+        """Tarefas paradas no status atual há mais de ``days`` dias."""
+
+    def migrate_ids(self) -> int:
+        """Troca IDs antigos por IDs ordenados pelo tempo; retorna quantos mudaram."""
+
+
+def open_repository(data_dir: str = "data", backend: str = "sqlite") -> Repository:
+    """
+    Abre o repositório configurado.
+
+    Args:
+        data_dir: Diretório onde dados serão salvos (ignorado pelo backend "memory")
+        backend: "sqlite" ou "memory"
+    """
+    if backend == "memory":
+        from phd_progress_tracker.utils.memory_repository import MemoryRepository
+
+        return MemoryRepository()
+    if backend == "sqlite":
+        from phd_progress_tracker.utils.database import Database
+
+        return Database(data_dir=data_dir)
+    raise ValueError(f"Unknown storage backend: {backend!r}")
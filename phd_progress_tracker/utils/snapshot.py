@@ -0,0 +1,349 @@
+"""
+Snapshot colunar somente leitura, para ser mapeado em memória (``mmap``).
+
+Scripts de análise e dashboards que só leem podem abrir o snapshot em vez de
+consultar o SQLite e recriar objetos a cada execução. As colunas ficam no
+arquivo já no formato de uso, então vários processos compartilham as mesmas
+páginas do cache do sistema operacional sem desserializar nada.
+
+Layout (little-endian, colunas alinhadas em 8 bytes):
+
+    cabeçalho   magic "PHDSNAP1", versão, revisão do banco, nº de colunas
+    diretório   por coluna: nome (32 bytes), formato, deslocamento, tamanho
+    colunas     dados crus de cada coluna
+
+Colunas de tamanho fixo usam os formatos de ``struct``/``memoryview``:
+datas são dias desde 1970-01-01 (``q``), timestamps microssegundos
+(``q``, com ``NULL_TIMESTAMP`` para ausente), status/prioridade os códigos
+de ``task_frame`` (``b``), categorias índices em ``task.categories`` (``i``)
+e o esforço em horas ``d`` (NaN quando não estimado).
+Textos são duas colunas: ``<nome>.offsets`` (``q``, n + 1 posições) e
+``<nome>.heap`` (bytes UTF-8).
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from phd_progress_tracker.utils.task_frame import (
+    HAS_NUMPY,
+    PRIORITY_CODES,
+    STATUS_CODES,
+    TaskFrame,
+)
+
+if HAS_NUMPY:
+    import numpy as np
+
+MAGIC = b"PHDSNAP1"
+# 2: coluna task.effort_hours
+FORMAT_VERSION = 2
+SNAPSHOT_FILENAME = "snapshot.phds"
+
+# Valor de timestamp ausente; coincide com NaT de datetime64 no NumPy
+NULL_TIMESTAMP = -(2**63)
+# Esforço não estimado
+NULL_EFFORT = float("nan")
+
+_HEADER = struct.Struct("<8sIqI")
+_ENTRY = struct.Struct("<32s1sxxxQQ")
+_ALIGN = 8
+_BYTE_ORDER_SWAP = sys.byteorder != "little"
+
+_EPOCH_DAY = date(1970, 1, 1)
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Tipos NumPy de cada formato e das colunas de data/timestamp
+_NUMPY_DTYPES = {"q": "<i8", "i": "<i4", "b": "i1", "B": "u1", "d": "<f8"}
+_DATE_COLUMNS = {"task.deadline", "milestone.target_date"}
+_TIMESTAMP_COLUMNS = {"task.created_at", "task.completed_at"}
+_BOOL_COLUMNS = {"milestone.is_achieved"}
+
+
+def _days(value: date) -> int:
+    return (value - _EPOCH_DAY).days
+
+
+def _micros(value: Optional[datetime]) -> int:
+    return NULL_TIMESTAMP if value is None else (value - _EPOCH) // _MICROSECOND
+
+
+def _fixed(fmt: str, values: Iterable[int]) -> bytes:
+    data = array(fmt, values)
+    if _BYTE_ORDER_SWAP and data.itemsize > 1:  # pragma: no cover - big-endian
+        data.byteswap()
+    return data.tobytes()
+
+
+def _strings(name: str, values: Iterable[str]) -> List[Tuple[str, str, bytes]]:
+    """Codifica textos como offsets + heap UTF-8."""
+    heap = bytearray()
+    offsets = [0]
+    for value in values:
+        heap += value.encode("utf-8")
+        offsets.append(len(heap))
+    return [
+        (f"{name}.offsets", "q", _fixed("q", offsets)),
+        (f"{name}.heap", "B", bytes(heap)),
+    ]
+
+
+def _task_columns(tasks) -> List[Tuple[str, str, bytes]]:
+    category_codes: Dict[str, int] = {}
+    for task in tasks:
+        category_codes.setdefault(task.category, len(category_codes))
+    return [
+        *_strings("task.id", (t.id for t in tasks)),
+        *_strings("task.title", (t.title for t in tasks)),
+        *_strings("task.description", (t.description for t in tasks)),
+        ("task.deadline", "q", _fixed("q", (_days(t.deadline) for t in tasks))),
+        ("task.status", "b", _fixed("b", (STATUS_CODES[t.status] for t in tasks))),
+        (
+            "task.priority",
+            "b",
+            _fixed("b", (PRIORITY_CODES[t.priority] for t in tasks)),
+        ),
+        (
+            "task.category",
+            "i",
+            _fixed("i", (category_codes[t.category] for t in tasks)),
+        ),
+        *_strings("task.categories", category_codes),
+        ("task.created_at", "q", _fixed("q", (_micros(t.created_at) for t in tasks))),
+        (
+            "task.completed_at",
+            "q",
+            _fixed("q", (_micros(t.completed_at) for t in tasks)),
+        ),
+        (
+            "task.effort_hours",
+            "d",
+            _fixed(
+                "d",
+                (
+                    NULL_EFFORT if t.effort_hours is None else t.effort_hours
+                    for t in tasks
+                ),
+            ),
+        ),
+    ]
+
+
+def _milestone_columns(milestones) -> List[Tuple[str, str, bytes]]:
+    return [
+        *_strings("milestone.id", (m.id for m in milestones)),
+        *_strings("milestone.title", (m.title for m in milestones)),
+        *_strings("milestone.description", (m.description for m in milestones)),
+        (
+            "milestone.target_date",
+            "q",
+            _fixed("q", (_days(m.target_date) for m in milestones)),
+        ),
+        (
+            "milestone.is_achieved",
+            "B",
+            _fixed("B", (m.is_achieved for m in milestones)),
+        ),
+    ]
+
+
+def _padding(offset: int) -> int:
+    return -offset % _ALIGN
+
+
+def build_snapshot(db, path: str) -> int:
+    """
+    Grava um snapshot de tarefas e marcos em ``path``.
+
+    A leitura acontece em uma única transação de leitura e o arquivo é
+    substituído atomicamente, então processos com o snapshot anterior
+    mapeado continuam vendo a versão antiga até reabrirem.
+
+    Args:
+        db: Repositório de origem
+        path: Caminho do arquivo de snapshot
+
+    Returns:
+        Revisão do banco registrada no snapshot
+    """
+    with db.read_transaction():
+        revision = db.revision()
+        tasks = db.load_tasks()
+        milestones = db.load_milestones()
+    columns = _task_columns(tasks) + _milestone_columns(milestones)
+
+    offset = _HEADER.size + _ENTRY.size * len(columns)
+    offset += _padding(offset)
+    entries = []
+    for name, fmt, data in columns:
+        entries.append(
+            _ENTRY.pack(name.encode("ascii"), fmt.encode("ascii"), offset, len(data))
+        )
+        offset += len(data) + _padding(len(data))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, revision, len(columns)))
+            f.write(b"".join(entries))
+            f.write(b"\0" * _padding(f.tell()))
+            for _, _, data in columns:
+                f.write(data)
+                f.write(b"\0" * _padding(len(data)))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return revision
+
+
+class StringColumn:
+    """Coluna de textos; cada item é decodificado só quando acessado."""
+
+    def __init__(self, offsets: memoryview, heap: memoryview):
+        self._offsets = offsets
+        self._heap = heap
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("string column index out of range")
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return str(self._heap[start:end], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        return (self[i] for i in range(len(self)))
+
+    def release(self) -> None:
+        """Libera as views sobre o arquivo mapeado."""
+        self._offsets.release()
+        self._heap.release()
+
+
+class Snapshot:
+    """
+    Leitor de um snapshot mapeado em memória.
+
+    ``column()`` devolve ``memoryview`` sobre o próprio mapeamento e
+    ``array()`` um array NumPy sem cópia. As views devem ser liberadas
+    (ou descartadas) antes de ``close()``.
+
+    Attributes:
+        revision: Revisão do banco no momento do snapshot
+        task_count: Número de tarefas
+        milestone_count: Número de marcos
+
+    Example:
+        >>> with Snapshot("data/snapshot.phds") as snap:
+        ...     deadlines = snap.array("task.deadline")
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.revision, count = _HEADER.unpack_from(self._mmap)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(
+                    f"Not a snapshot file (version {FORMAT_VERSION}): {path}"
+                )
+            self._columns: Dict[str, Tuple[str, int, int]] = {}
+            for i in range(count):
+                name, fmt, offset, size = _ENTRY.unpack_from(
+                    self._mmap, _HEADER.size + i * _ENTRY.size
+                )
+                self._columns[name.rstrip(b"\0").decode("ascii")] = (
+                    fmt.decode("ascii"),
+                    offset,
+                    size,
+                )
+        except Exception:
+            self._mmap.close()
+            raise
+        self.task_count = self._length("task.id.offsets") - 1
+        self.milestone_count = self._length("milestone.id.offsets") - 1
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Desfaz o mapeamento (falha se ainda houver views abertas)."""
+        self._mmap.close()
+
+    def _length(self, name: str) -> int:
+        fmt, _, size = self._columns[name]
+        return size // struct.calcsize(fmt)
+
+    @property
+    def columns(self) -> List[str]:
+        """Nomes das colunas no arquivo."""
+        return list(self._columns)
+
+    def column(self, name: str) -> memoryview:
+        """
+        View sem cópia de uma coluna de tamanho fixo.
+
+        Raises:
+            KeyError: Se a coluna não existir
+        """
+        fmt, offset, size = self._columns[name]
+        end = offset + size
+        view = memoryview(self._mmap)[offset:end]
+        return view if fmt == "B" else view.cast(fmt)
+
+    def strings(self, name: str) -> StringColumn:
+        """Coluna de textos (ex.: ``"task.title"``)."""
+        return StringColumn(self.column(f"{name}.offsets"), self.column(f"{name}.heap"))
+
+    def array(self, name: str):
+        """
+        Array NumPy sem cópia de uma coluna de tamanho fixo.
+
+        Datas viram ``datetime64[D]`` e timestamps ``datetime64[us]`` (NaT
+        quando ausentes), apenas reinterpretando os mesmos bytes.
+        """
+        if not HAS_NUMPY:
+            raise RuntimeError(
+                "Snapshot.array requires numpy (poetry install --extras numpy)"
+            )
+        fmt, offset, _ = self._columns[name]
+        values = np.frombuffer(
+            self._mmap,
+            dtype=_NUMPY_DTYPES[fmt],
+            count=self._length(name),
+            offset=offset,
+        )
+        if name in _DATE_COLUMNS:
+            return values.view("<M8[D]")
+        if name in _TIMESTAMP_COLUMNS:
+            return values.view("<M8[us]")
+        if name in _BOOL_COLUMNS:
+            return values.view(np.bool_)
+        return values
+
+    def task_frame(self) -> TaskFrame:
+        """Monta um TaskFrame sobre as colunas do snapshot."""
+        return TaskFrame(
+            self.array("task.deadline"),
+            self.array("task.status"),
+            self.array("task.priority"),
+            self.array("task.category"),
+            list(self.strings("task.categories")),
+            self.array("task.created_at").astype("datetime64[D]"),
+            self.array("task.completed_at").astype("datetime64[D]"),
+        )
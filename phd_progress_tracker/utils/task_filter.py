@@ -0,0 +1,90 @@
+"""
+Filtros de tarefas compartilhados pela listagem e pelas contagens por faceta.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Tuple
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+
+# Facetas disponíveis e a expressão SQL que agrupa cada uma
+FACETS = {
+    "status": "status",
+    "priority": "priority",
+    "category": "category",
+    "month": "substr(deadline, 1, 7)",
+}
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    """
+    Critérios opcionais de filtro; campos None não filtram.
+
+    É imutável (e portanto hashable) para servir de chave de cache.
+
+    Attributes:
+        status: Status exato
+        priority: Prioridade exata
+        category: Categoria (comparação sem diferenciar maiúsculas)
+        deadline_from: Prazo mínimo (inclusive)
+        deadline_to: Prazo máximo (inclusive)
+    """
+
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    category: Optional[str] = None
+    deadline_from: Optional[date] = None
+    deadline_to: Optional[date] = None
+
+    def is_empty(self) -> bool:
+        """Verifica se nenhum critério foi definido."""
+        return self == TaskFilter()
+
+    def to_sql(self) -> Tuple[str, List]:
+        """Retorna a cláusula WHERE (ou string vazia) e seus parâmetros."""
+        clauses: List[str] = []
+        params: List = []
+        if self.status is not None:
+            clauses.append("status = ?")
+            params.append(self.status.name)
+        if self.priority is not None:
+            clauses.append("priority = ?")
+            params.append(self.priority.name)
+        if self.category is not None:
+            clauses.append("category = ? COLLATE NOCASE")
+            params.append(self.category)
+        if self.deadline_from is not None:
+            clauses.append("deadline >= ?")
+            params.append(self.deadline_from.isoformat())
+        if self.deadline_to is not None:
+            clauses.append("deadline <= ?")
+            params.append(self.deadline_to.isoformat())
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def matches(self, task: Task) -> bool:
+        """Aplica o filtro a uma tarefa em Python (backend em memória)."""
+        return (
+            (self.status is None or task.status == self.status)
+            and (self.priority is None or task.priority == self.priority)
+            and (
+                self.category is None or task.category.lower() == self.category.lower()
+            )
+            and (self.deadline_from is None or task.deadline >= self.deadline_from)
+            and (self.deadline_to is None or task.deadline <= self.deadline_to)
+        )
+
+
+def facet_value(task: Task, facet: str) -> str:
+    """Valor de uma tarefa na faceta, no mesmo formato do GROUP BY do SQLite."""
+    if facet == "status":
+        return task.status.name
+    if facet == "priority":
+        return task.priority.name
+    if facet == "category":
+        return task.category
+    if facet == "month":
+        return task.deadline.isoformat()[:7]
+    raise ValueError(f"Unknown facet: {facet!r} (expected one of {list(FACETS)})")
@@ -0,0 +1,286 @@
+"""
+Estatísticas de tarefas em formato colunar (NumPy), com fallback em Python puro.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Códigos int8 na ordem de declaração dos enums
+STATUS_CODES = {status: code for code, status in enumerate(TaskStatus)}
+PRIORITY_CODES = {priority: code for code, priority in enumerate(TaskPriority)}
+STATUSES = list(TaskStatus)
+PRIORITIES = list(TaskPriority)
+
+# Expressões SQL que devolvem os mesmos códigos direto do SQLite
+_STATUS_CASE = "CASE status {} END".format(
+    " ".join(f"WHEN '{s.name}' THEN {c}" for s, c in STATUS_CODES.items())
+)
+_PRIORITY_CASE = "CASE priority {} END".format(
+    " ".join(f"WHEN '{p.name}' THEN {c}" for p, c in PRIORITY_CODES.items())
+)
+FRAME_QUERY = (
+    f"SELECT deadline, {_STATUS_CASE}, {_PRIORITY_CASE}, category, created_at, completed_at "
+    "FROM tasks"
+)
+
+_COMPLETED = STATUS_CODES[TaskStatus.COMPLETED]
+_IN_PROGRESS = STATUS_CODES[TaskStatus.IN_PROGRESS]
+
+
+@dataclass
+class TaskSummary:
+    """Contagens exibidas nos dashboards da API e do CLI."""
+
+    total: int = 0
+    completed: int = 0
+    in_progress: int = 0
+    overdue: int = 0
+    by_category: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def pending(self) -> int:
+        """Tarefas ainda não concluídas."""
+        return self.total - self.completed
+
+    @property
+    def progress_pct(self) -> float:
+        """Percentual de tarefas concluídas."""
+        return (self.completed / self.total) * 100 if self.total else 0.0
+
+
+class TaskFrame:
+    """
+    Colunas de tarefas em arrays NumPy para estatísticas vetorizadas.
+
+    Attributes:
+        deadlines: Prazos como datetime64[D]
+        status: Códigos de status (int8, ver STATUS_CODES)
+        priority: Códigos de prioridade (int8, ver PRIORITY_CODES)
+        category: Códigos de categoria (int32, índices em ``categories``)
+        categories: Nomes das categorias
+        created: Dia de criação (datetime64[D])
+        completed: Dia de conclusão (datetime64[D], NaT se não concluída)
+
+    Os métodos recebem a data de referência ``today`` para que um
+    dashboard "as of" uma data passada considere só as tarefas já criadas
+    e só as conclusões ocorridas até ela.
+    """
+
+    __slots__ = (
+        "deadlines",
+        "status",
+        "priority",
+        "category",
+        "categories",
+        "created",
+        "completed",
+    )
+
+    def __init__(
+        self,
+        deadlines,
+        status,
+        priority,
+        category,
+        categories: List[str],
+        created,
+        completed,
+    ):
+        if not HAS_NUMPY:
+            raise RuntimeError(
+                "TaskFrame requires numpy (poetry install --extras numpy)"
+            )
+        self.deadlines = deadlines
+        self.status = status
+        self.priority = priority
+        self.category = category
+        self.categories = categories
+        self.created = created
+        self.completed = completed
+
+    @classmethod
+    def _build(cls, rows: Iterable[Sequence]) -> "TaskFrame":
+        """
+        Monta o frame a partir de tuplas na ordem de FRAME_QUERY:
+        (deadline, status, prioridade, categoria, criação, conclusão), datas em ISO.
+        """
+        deadlines: List[str] = []
+        status: List[int] = []
+        priority: List[int] = []
+        category: List[int] = []
+        created: List[str] = []
+        completed: List[str] = []
+        category_codes: Dict[str, int] = {}
+        for row in rows:
+            deadline, status_code, priority_code, category_name, created_at, done = row
+            deadlines.append(deadline[:10])
+            status.append(status_code)
+            priority.append(priority_code)
+            code = category_codes.get(category_name)
+            if code is None:
+                code = category_codes[category_name] = len(category_codes)
+            category.append(code)
+            created.append(created_at[:10])
+            completed.append(done[:10] if done else "NaT")
+        return cls(
+            np.array(deadlines, dtype="datetime64[D]"),
+            np.array(status, dtype=np.int8),
+            np.array(priority, dtype=np.int8),
+            np.array(category, dtype=np.int32),
+            list(category_codes),
+            np.array(created, dtype="datetime64[D]"),
+            np.array(completed, dtype="datetime64[D]"),
+        )
+
+    @classmethod
+    def from_cursor(cls, cursor) -> "TaskFrame":
+        """Monta o frame direto de um cursor sobre FRAME_QUERY, sem criar Tasks."""
+        return cls._build(cursor)
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task]) -> "TaskFrame":
+        """Monta o frame a partir de objetos Task."""
+        return cls._build(
+            (
+                t.deadline.isoformat(),
+                STATUS_CODES[t.status],
+                PRIORITY_CODES[t.priority],
+                t.category,
+                t.created_at.isoformat(),
+                t.completed_at.isoformat() if t.completed_at else None,
+            )
+            for t in tasks
+        )
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    @staticmethod
+    def _day(today: Optional[date]):
+        return np.datetime64(today or date.today(), "D")
+
+    def exists_mask(self, today: Optional[date] = None):
+        """Máscara das tarefas já criadas na data de referência."""
+        return self.created <= self._day(today)
+
+    def completed_mask(self, today: Optional[date] = None):
+        """Máscara das tarefas já concluídas na data de referência."""
+        day = self._day(today)
+        done_by_day = np.isnat(self.completed) | (self.completed <= day)
+        return (self.status == _COMPLETED) & done_by_day & (self.created <= day)
+
+    def open_mask(self, today: Optional[date] = None):
+        """Máscara das tarefas criadas e ainda não concluídas na data de referência."""
+        return self.exists_mask(today) & ~self.completed_mask(today)
+
+    def days_remaining(self, today: Optional[date] = None):
+        """Dias restantes até o prazo de cada tarefa (int64)."""
+        return (self.deadlines - self._day(today)).astype(np.int64)
+
+    def overdue_mask(self, today: Optional[date] = None):
+        """Máscara das tarefas atrasadas (prazo vencido e não concluídas)."""
+        return (self.deadlines < self._day(today)) & self.open_mask(today)
+
+    def due_within(self, days: int, today: Optional[date] = None):
+        """Máscara das tarefas abertas com prazo entre hoje e hoje + days."""
+        remaining = self.days_remaining(today)
+        return (remaining >= 0) & (remaining <= days) & self.open_mask(today)
+
+    def count_by(self, column: str, mask=None) -> Dict[str, int]:
+        """
+        Conta tarefas por "status", "priority" ou "category".
+
+        Args:
+            column: Coluna de agrupamento
+            mask: Máscara booleana opcional para filtrar as tarefas
+        """
+        if column == "status":
+            codes, labels = self.status, [s.name for s in STATUSES]
+        elif column == "priority":
+            codes, labels = self.priority, [p.name for p in PRIORITIES]
+        elif column == "category":
+            codes, labels = self.category, self.categories
+        else:
+            raise ValueError(f"Unknown column: {column!r}")
+        if mask is not None:
+            codes = codes[mask]
+        counts = np.bincount(codes.astype(np.int64), minlength=len(labels))
+        return {label: int(n) for label, n in zip(labels, counts) if n}
+
+    def percentiles(
+        self,
+        q: Sequence[float] = (50, 90, 99),
+        mask=None,
+        today: Optional[date] = None,
+    ) -> Dict[float, float]:
+        """Percentis dos dias restantes até o prazo (opcionalmente filtrados)."""
+        values = self.days_remaining(today)
+        if mask is not None:
+            values = values[mask]
+        if not len(values):
+            return {}
+        return {p: float(v) for p, v in zip(q, np.percentile(values, q))}
+
+    def summary(self, today: Optional[date] = None) -> TaskSummary:
+        """Calcula as contagens do dashboard na data de referência."""
+        today = today or date.today()
+        exists = self.exists_mask(today)
+        is_open = self.open_mask(today)
+        return TaskSummary(
+            total=int(np.count_nonzero(exists)),
+            completed=int(np.count_nonzero(self.completed_mask(today))),
+            in_progress=int(np.count_nonzero(is_open & (self.status == _IN_PROGRESS))),
+            overdue=int(np.count_nonzero(self.overdue_mask(today))),
+            by_category=self.count_by("category", exists),
+        )
+
+
+def summarize_tasks(tasks: Iterable[Task], today: Optional[date] = None) -> TaskSummary:
+    """Calcula as contagens do dashboard em uma única passada em Python puro."""
+    today = today or date.today()
+    summary = TaskSummary()
+    for task in tasks:
+        if task.created_at.date() > today:
+            continue
+        summary.total += 1
+        summary.by_category[task.category] = (
+            summary.by_category.get(task.category, 0) + 1
+        )
+        if task.is_completed_as_of(today):
+            summary.completed += 1
+            continue
+        if task.status == TaskStatus.IN_PROGRESS:
+            summary.in_progress += 1
+        if task.deadline < today:
+            summary.overdue += 1
+    return summary
+
+
+def summarize_repository(db, today: Optional[date] = None) -> TaskSummary:
+    """Resume as tarefas do repositório, usando TaskFrame se NumPy estiver instalado."""
+    if HAS_NUMPY:
+        return db.task_frame().summary(today)
+    return summarize_tasks(db.load_tasks(), today)
+
+
+def upcoming_tasks(
+    db, days: int = 7, today: Optional[date] = None, limit: Optional[int] = None
+) -> List[Task]:
+    """Tarefas abertas com prazo nos próximos ``days`` dias, ordenadas por prazo."""
+    today = today or date.today()
+    tasks = [
+        t
+        for t in db.tasks_by_deadline(today, today + timedelta(days=days))
+        if t.created_at.date() <= today and not t.is_completed_as_of(today)
+    ]
+    return tasks[:limit] if limit is not None else tasks
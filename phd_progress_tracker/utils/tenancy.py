@@ -0,0 +1,184 @@
+"""
+Roteamento multi-tenant: um arquivo SQLite por usuário.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from phd_progress_tracker.utils.repository import Repository, open_repository
+
+# Letras, dígitos, "_" e "-"; o ID vira nome de diretório, então nada de "/" ou ".."
+TENANT_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]{0,63}$")
+
+
+def validate_tenant_id(tenant_id: str) -> str:
+    """
+    Valida um identificador de tenant.
+
+    Returns:
+        O próprio identificador, se válido
+
+    Raises:
+        ValueError: Se o identificador não puder ser usado como nome de diretório
+    """
+    if not TENANT_ID_PATTERN.match(tenant_id):
+        raise ValueError(f"Invalid tenant id: {tenant_id!r}")
+    return tenant_id
+
+
+class UnknownTenantError(LookupError):
+    """Tenant que não foi provisionado (ver ``TenantDatabasePool.create``)."""
+
+
+class TenantLimitError(RuntimeError):
+    """Não há como abrir mais um tenant sem fechar um que está em uso."""
+
+
+class _Entry:
+    """Banco aberto e quantas requisições o estão usando."""
+
+    __slots__ = ("repo", "leases")
+
+    def __init__(self, repo: Repository) -> None:
+        self.repo = repo
+        self.leases = 0
+
+
+class TenantDatabasePool:
+    """
+    Mantém um LRU limitado de bancos abertos, um por tenant.
+
+    Cada tenant tem seu próprio arquivo em ``<data_dir>/tenants/<tenant_id>/``,
+    então escritas de usuários diferentes nunca disputam o mesmo lock do
+    SQLite. O tenant ``None`` corresponde ao banco legado em ``<data_dir>``.
+
+    Tenants só são criados por :meth:`create` (``phd tenant create``); abrir
+    um tenant inexistente gera ``UnknownTenantError``, para que leituras com
+    IDs arbitrários não criem arquivos. Os bancos são emprestados com
+    :meth:`lease`, e o LRU só fecha bancos sem empréstimos ativos. Com o
+    backend "memory" os tenants nascem no primeiro uso, mas nunca são
+    despejados (fechar perderia os dados): passar de ``max_open`` gera
+    ``TenantLimitError``.
+    """
+
+    DEFAULT_MAX_OPEN = 32
+
+    def __init__(
+        self,
+        data_dir: str = "data",
+        max_open: int = DEFAULT_MAX_OPEN,
+        backend: str = "sqlite",
+    ):
+        """
+        Inicializa o pool.
+
+        Args:
+            data_dir: Diretório raiz dos dados
+            max_open: Número máximo de bancos mantidos abertos
+            backend: Backend de armazenamento ("sqlite" ou "memory")
+        """
+        if max_open < 1:
+            raise ValueError("max_open must be at least 1")
+        self.data_dir = Path(data_dir)
+        self.max_open = max_open
+        self.backend = backend
+        self._open: "OrderedDict[Optional[str], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def tenant_dir(self, tenant_id: Optional[str]) -> Path:
+        """Retorna o diretório de dados de um tenant."""
+        if tenant_id is None:
+            return self.data_dir
+        return self.data_dir / "tenants" / validate_tenant_id(tenant_id)
+
+    def exists(self, tenant_id: Optional[str]) -> bool:
+        """Se o tenant já foi provisionado (o tenant None sempre existe)."""
+        if tenant_id is None:
+            return True
+        if self.backend == "memory":
+            with self._lock:
+                return tenant_id in self._open
+        return self.tenant_dir(tenant_id).is_dir()
+
+    def create(self, tenant_id: str) -> bool:
+        """
+        Provisiona um tenant (diretório e banco vazio).
+
+        Returns:
+            False se o tenant já existia
+        """
+        if self.exists(tenant_id):
+            return False
+        if self.backend == "memory":
+            self.release(self.acquire(tenant_id, create=True))
+        else:
+            open_repository(str(self.tenant_dir(tenant_id)), self.backend).close()
+        return True
+
+    def _evict_idle(self) -> None:
+        """Fecha os bancos ociosos menos usados até caber em ``max_open``."""
+        excess = len(self._open) - self.max_open
+        for tenant_id in [t for t, e in self._open.items() if not e.leases]:
+            if excess <= 0:
+                break
+            self._open.pop(tenant_id).repo.close()
+            excess -= 1
+
+    def acquire(self, tenant_id: Optional[str] = None, create: bool = False) -> _Entry:
+        """
+        Empresta o banco do tenant, abrindo-o se preciso. Devolva com
+        :meth:`release`.
+
+        Raises:
+            UnknownTenantError: Se o tenant não existe (e ``create`` é False;
+                no backend "memory", criar é implícito)
+            TenantLimitError: Se o backend "memory" já tem ``max_open`` tenants
+        """
+        with self._lock:
+            entry = self._open.get(tenant_id)
+            if entry is None:
+                if self.backend == "memory":
+                    if len(self._open) >= self.max_open:
+                        raise TenantLimitError(
+                            f"Too many tenants for the memory backend "
+                            f"(max {self.max_open})"
+                        )
+                elif not (create or self.exists(tenant_id)):
+                    raise UnknownTenantError(f"Unknown tenant: {tenant_id!r}")
+                repo = open_repository(str(self.tenant_dir(tenant_id)), self.backend)
+                entry = self._open[tenant_id] = _Entry(repo)
+            self._open.move_to_end(tenant_id)
+            entry.leases += 1
+            self._evict_idle()
+            return entry
+
+    def release(self, entry: _Entry) -> None:
+        """Devolve um empréstimo; bancos em excesso são fechados quando ficam ociosos."""
+        with self._lock:
+            entry.leases -= 1
+            self._evict_idle()
+
+    @contextmanager
+    def lease(self, tenant_id: Optional[str] = None) -> Iterator[Repository]:
+        """Banco do tenant durante o bloco ``with``; não é fechado enquanto em uso."""
+        entry = self.acquire(tenant_id)
+        try:
+            yield entry.repo
+        finally:
+            self.release(entry)
+
+    def open_tenants(self) -> List[Optional[str]]:
+        """Lista os tenants abertos, do menos para o mais recentemente usado."""
+        with self._lock:
+            return list(self._open)
+
+    def close_all(self) -> None:
+        """Fecha todos os bancos abertos."""
+        with self._lock:
+            for entry in self._open.values():
+                entry.repo.close()
+            self._open.clear()
@@ -0,0 +1,184 @@
+"""
+Dados de linha do tempo (Gantt): barras de tarefas recortadas na janela,
+distribuídas em faixas, e marcos.
+
+Cada tarefa ocupa do dia de criação até o dia de conclusão (concluídas) ou o
+prazo (abertas). Só as que cruzam a janela são carregadas
+(``repo.tasks_overlapping``) e as barras são recortadas nas bordas. As faixas
+saem de uma partição gulosa de intervalos: em ordem de início, cada barra vai
+para a menor faixa livre, o que usa o mínimo de faixas possível (o maior
+número de barras simultâneas).
+
+Em resoluções de semana ou mês, tarefas mais curtas que um período não
+apareceriam como barra; elas são somadas em barras-resumo por período.
+"""
+
+import heapq
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Sequence, Tuple
+
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task, TaskStatus
+from phd_progress_tracker.utils.burndown import (
+    MAX_POINTS,
+    bucket_start,
+    choose_granularity,
+    shift_bucket,
+)
+
+RESOLUTIONS = ("auto", "day", "week", "month")
+# Duração mínima (em dias) de uma barra individual em cada resolução
+MIN_BAR_DAYS = {"day": 1, "week": 7, "month": 28}
+
+
+def task_span(task: Task) -> Tuple[date, date]:
+    """Primeiro e último dia da barra de uma tarefa."""
+    start = task.created_at.date()
+    if task.status == TaskStatus.COMPLETED and task.completed_at is not None:
+        end = task.completed_at.date()
+    else:
+        end = task.deadline
+    return start, max(start, end)
+
+
+def assign_lanes(spans: Sequence[Tuple[date, date]]) -> Tuple[List[int], int]:
+    """
+    Faixa de cada intervalo (ordenados por início) e o total de faixas.
+
+    Intervalos de uma mesma faixa não se sobrepõem (os dias são inclusivos).
+    """
+    busy: List[Tuple[date, int]] = []
+    free: List[int] = []
+    lanes: List[int] = []
+    count = 0
+    for start, end in spans:
+        while busy and busy[0][0] < start:
+            heapq.heappush(free, heapq.heappop(busy)[1])
+        if free:
+            lane = heapq.heappop(free)
+        else:
+            lane, count = count, count + 1
+        heapq.heappush(busy, (end, lane))
+        lanes.append(lane)
+    return lanes, count
+
+
+@dataclass(frozen=True)
+class TimelineBar:
+    """
+    Barra de uma tarefa, recortada na janela.
+
+    Attributes:
+        task: Tarefa
+        start: Primeiro dia visível
+        end: Último dia visível
+        lane: Faixa (0 é a de cima)
+        clipped_start: A tarefa começa antes da janela
+        clipped_end: A tarefa termina depois da janela
+    """
+
+    task: Task
+    start: date
+    end: date
+    lane: int
+    clipped_start: bool
+    clipped_end: bool
+
+
+@dataclass(frozen=True)
+class TimelineSummary:
+    """Tarefas curtas demais para a resolução, somadas em um período."""
+
+    start: date
+    end: date
+    count: int
+    completed: int
+    by_category: Dict[str, int]
+
+
+@dataclass(frozen=True)
+class Timeline:
+    """Linha do tempo de uma janela, na resolução usada."""
+
+    start: date
+    end: date
+    resolution: str
+    lanes: int
+    bars: List[TimelineBar]
+    milestones: List[Milestone]
+    summaries: List[TimelineSummary]
+
+
+def build_timeline(
+    repo,
+    start: date,
+    end: date,
+    resolution: str = "auto",
+    max_columns: int = MAX_POINTS,
+) -> Timeline:
+    """
+    Monta a linha do tempo da janela [start, end].
+
+    Args:
+        repo: Repositório de origem
+        start: Primeiro dia da janela
+        end: Último dia da janela
+        resolution: "day", "week", "month" ou "auto" (a mais fina com até
+            ``max_columns`` colunas)
+        max_columns: Máximo de colunas da resolução automática
+
+    Raises:
+        ValueError: Se start > end ou a resolução for desconhecida
+    """
+    if start > end:
+        raise ValueError(f"start ({start}) must not be after end ({end})")
+    if resolution not in RESOLUTIONS:
+        raise ValueError(
+            f"Unknown resolution: {resolution!r} (expected one of {RESOLUTIONS})"
+        )
+    if resolution == "auto":
+        resolution = choose_granularity(start, end, "day", max_columns)
+
+    clipped: List[Tuple[date, date, Task, bool, bool]] = []
+    short: Dict[date, List[Task]] = {}
+    for task in repo.tasks_overlapping(start, end):
+        first, last = task_span(task)
+        visible = (max(first, start), min(last, end))
+        if (visible[1] - visible[0]).days + 1 < MIN_BAR_DAYS[resolution]:
+            short.setdefault(bucket_start(visible[0], resolution), []).append(task)
+            continue
+        clipped.append((*visible, task, first < start, last > end))
+
+    clipped.sort(key=lambda item: (item[0], item[1], item[2].id))
+    lanes, count = assign_lanes([(first, last) for first, last, *_ in clipped])
+    bars = [
+        TimelineBar(task, first, last, lane, clipped_start, clipped_end)
+        for (first, last, task, clipped_start, clipped_end), lane in zip(clipped, lanes)
+    ]
+
+    summaries = []
+    for period in sorted(short):
+        tasks = short[period]
+        by_category: Dict[str, int] = {}
+        for task in tasks:
+            by_category[task.category] = by_category.get(task.category, 0) + 1
+        summaries.append(
+            TimelineSummary(
+                start=max(period, start),
+                end=min(shift_bucket(period, resolution, 1) - timedelta(days=1), end),
+                count=len(tasks),
+                completed=sum(t.status == TaskStatus.COMPLETED for t in tasks),
+                by_category=dict(sorted(by_category.items())),
+            )
+        )
+
+    return Timeline(
+        start=start,
+        end=end,
+        resolution=resolution,
+        lanes=count,
+        bars=bars,
+        milestones=repo.milestones_by_date(start, end),
+        summaries=summaries,
+    )
@@ -0,0 +1,304 @@
+"""
+Formato binário compacto (MessagePack) com listas em colunas.
+
+Em vez de uma lista de objetos com as mesmas chaves repetidas, uma lista é
+enviada como um mapa de colunas. Datas viram inteiros (dias desde
+1970-01-01), timestamps viram microssegundos desde 1970-01-01 e enums e
+categorias viram códigos em um dicionário enviado junto:
+
+    {
+        "v": 1,
+        "n": 2,
+        "columns": {"id": [...], "deadline": [20515, 20516], "status": [0, 2]},
+        "dicts": {"status": ["TODO", "IN_PROGRESS", "COMPLETED", "BLOCKED"]},
+    }
+
+Usa o pacote ``msgpack`` (extensão em C) se estiver instalado; sem ele, o
+codec em Python puro deste módulo produz os mesmos bytes.
+"""
+
+import struct
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Sequence
+
+from phd_progress_tracker.models.task import TaskPriority, TaskStatus
+from phd_progress_tracker.utils.task_frame import PRIORITIES, STATUSES
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depende do ambiente
+    msgpack = None
+
+HAS_MSGPACK = msgpack is not None
+
+MEDIA_TYPE = "application/msgpack"
+WIRE_VERSION = 1
+
+_EPOCH_DAY = date(1970, 1, 1)
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Colunas de data, de timestamp e de enum (codificadas pelo índice no dicionário)
+DATE_FIELDS = frozenset({"deadline", "target_date"})
+TIMESTAMP_FIELDS = frozenset({"created_at", "completed_at"})
+ENUM_FIELDS = {"status": STATUSES, "priority": PRIORITIES}
+# Texto repetido (poucos valores distintos) vira dicionário + códigos
+DICTIONARY_FIELDS = frozenset({"category"})
+
+
+# MessagePack em Python puro
+
+
+def _pack(obj: Any, out: bytearray) -> None:
+    if obj is None:
+        out.append(0xC0)
+    elif obj is True:
+        out.append(0xC3)
+    elif obj is False:
+        out.append(0xC2)
+    elif isinstance(obj, int):
+        _pack_int(obj, out)
+    elif isinstance(obj, float):
+        out.append(0xCB)
+        out += struct.pack(">d", obj)
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        n = len(data)
+        if n < 32:
+            out.append(0xA0 | n)
+        elif n < 0x100:
+            out += struct.pack(">BB", 0xD9, n)
+        elif n < 0x10000:
+            out += struct.pack(">BH", 0xDA, n)
+        else:
+            out += struct.pack(">BI", 0xDB, n)
+        out += data
+    elif isinstance(obj, (bytes, bytearray)):
+        n = len(obj)
+        if n < 0x100:
+            out += struct.pack(">BB", 0xC4, n)
+        elif n < 0x10000:
+            out += struct.pack(">BH", 0xC5, n)
+        else:
+            out += struct.pack(">BI", 0xC6, n)
+        out += obj
+    elif isinstance(obj, (list, tuple)):
+        n = len(obj)
+        if n < 16:
+            out.append(0x90 | n)
+        elif n < 0x10000:
+            out += struct.pack(">BH", 0xDC, n)
+        else:
+            out += struct.pack(">BI", 0xDD, n)
+        for item in obj:
+            _pack(item, out)
+    elif isinstance(obj, dict):
+        n = len(obj)
+        if n < 16:
+            out.append(0x80 | n)
+        elif n < 0x10000:
+            out += struct.pack(">BH", 0xDE, n)
+        else:
+            out += struct.pack(">BI", 0xDF, n)
+        for key, value in obj.items():
+            _pack(key, out)
+            _pack(value, out)
+    else:
+        raise TypeError(f"Cannot serialize {type(obj).__name__} to msgpack")
+
+
+def _pack_int(n: int, out: bytearray) -> None:
+    if 0 <= n < 0x80:
+        out.append(n)
+    elif -32 <= n < 0:
+        out.append(n & 0xFF)
+    elif n >= 0:
+        if n < 0x100:
+            out += struct.pack(">BB", 0xCC, n)
+        elif n < 0x10000:
+            out += struct.pack(">BH", 0xCD, n)
+        elif n < 0x100000000:
+            out += struct.pack(">BI", 0xCE, n)
+        else:
+            out += struct.pack(">BQ", 0xCF, n)
+    elif n >= -0x80:
+        out += struct.pack(">Bb", 0xD0, n)
+    elif n >= -0x8000:
+        out += struct.pack(">Bh", 0xD1, n)
+    elif n >= -0x80000000:
+        out += struct.pack(">Bi", 0xD2, n)
+    else:
+        out += struct.pack(">Bq", 0xD3, n)
+
+
+# Formatos de tamanho fixo: byte -> (struct, tamanho)
+_FIXED = {
+    0xCA: (">f", 4),
+    0xCB: (">d", 8),
+    0xCC: (">B", 1),
+    0xCD: (">H", 2),
+    0xCE: (">I", 4),
+    0xCF: (">Q", 8),
+    0xD0: (">b", 1),
+    0xD1: (">h", 2),
+    0xD2: (">i", 4),
+    0xD3: (">q", 8),
+}
+# Prefixos de tamanho de str/bin/array/map: byte -> (tipo, struct, tamanho)
+_SIZED = {
+    0xC4: ("bin", ">B", 1),
+    0xC5: ("bin", ">H", 2),
+    0xC6: ("bin", ">I", 4),
+    0xD9: ("str", ">B", 1),
+    0xDA: ("str", ">H", 2),
+    0xDB: ("str", ">I", 4),
+    0xDC: ("array", ">H", 2),
+    0xDD: ("array", ">I", 4),
+    0xDE: ("map", ">H", 2),
+    0xDF: ("map", ">I", 4),
+}
+
+
+def _unpack(data: bytes, pos: int):
+    byte = data[pos]
+    pos += 1
+    if byte < 0x80:
+        return byte, pos
+    if byte >= 0xE0:
+        return byte - 0x100, pos
+    if 0xA0 <= byte <= 0xBF:
+        kind, n = "str", byte & 0x1F
+    elif 0x90 <= byte <= 0x9F:
+        kind, n = "array", byte & 0x0F
+    elif 0x80 <= byte <= 0x8F:
+        kind, n = "map", byte & 0x0F
+    elif byte == 0xC0:
+        return None, pos
+    elif byte == 0xC2:
+        return False, pos
+    elif byte == 0xC3:
+        return True, pos
+    elif byte in _FIXED:
+        fmt, size = _FIXED[byte]
+        return struct.unpack_from(fmt, data, pos)[0], pos + size
+    elif byte in _SIZED:
+        kind, fmt, size = _SIZED[byte]
+        n = struct.unpack_from(fmt, data, pos)[0]
+        pos += size
+    else:
+        raise ValueError(f"Unsupported msgpack type byte 0x{byte:02x}")
+
+    end = pos + n
+    if kind == "str":
+        return data[pos:end].decode("utf-8"), end
+    if kind == "bin":
+        return bytes(data[pos:end]), end
+    if kind == "array":
+        items = []
+        for _ in range(n):
+            item, pos = _unpack(data, pos)
+            items.append(item)
+        return items, pos
+    result = {}
+    for _ in range(n):
+        key, pos = _unpack(data, pos)
+        result[key], pos = _unpack(data, pos)
+    return result, pos
+
+
+def packb(obj: Any) -> bytes:
+    """Serializa ``obj`` em MessagePack."""
+    if HAS_MSGPACK:
+        return msgpack.packb(obj, use_bin_type=True)
+    out = bytearray()
+    _pack(obj, out)
+    return bytes(out)
+
+
+def unpackb(data: bytes) -> Any:
+    """Desserializa MessagePack (arrays viram listas)."""
+    if HAS_MSGPACK:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    obj, pos = _unpack(data, 0)
+    if pos != len(data):
+        raise ValueError("Trailing bytes after msgpack object")
+    return obj
+
+
+# Codificação colunar
+
+
+def _encode_column(name: str, values: List[Any], dicts: Dict[str, List]) -> List:
+    if name in DATE_FIELDS:
+        return [(v - _EPOCH_DAY).days for v in values]
+    if name in TIMESTAMP_FIELDS:
+        return [(v - _EPOCH) // _MICROSECOND if v is not None else None for v in values]
+    if name in ENUM_FIELDS:
+        members = ENUM_FIELDS[name]
+        dicts[name] = [m.name for m in members]
+        codes = {m: i for i, m in enumerate(members)}
+        return [codes[v] for v in values]
+    if name in DICTIONARY_FIELDS:
+        codes: Dict[str, int] = {}
+        column = [codes.setdefault(v, len(codes)) for v in values]
+        dicts[name] = list(codes)
+        return column
+    return values
+
+
+def encode_columns(items: Iterable[Any], fields: Sequence[str]) -> bytes:
+    """
+    Codifica objetos (Task, Milestone) ou dicionários em colunas.
+
+    Args:
+        items: Objetos ou dicionários (ex.: projeções de ``?fields=``)
+        fields: Campos a incluir, na ordem das colunas
+    """
+    items = list(items)
+    if items and isinstance(items[0], dict):
+        rows = [[item[f] for f in fields] for item in items]
+    else:
+        rows = [[getattr(item, f) for f in fields] for item in items]
+    dicts: Dict[str, List] = {}
+    columns = {
+        name: _encode_column(name, [row[i] for row in rows], dicts)
+        for i, name in enumerate(fields)
+    }
+    return packb(
+        {"v": WIRE_VERSION, "n": len(rows), "columns": columns, "dicts": dicts}
+    )
+
+
+def decode_columns(payload: bytes) -> List[Dict[str, Any]]:
+    """
+    Decodificador de referência: volta às linhas com tipos Python.
+
+    Datas viram ``date``, timestamps ``datetime``, status e prioridade os
+    enums ``TaskStatus``/``TaskPriority`` e categorias o texto original.
+
+    Raises:
+        ValueError: Se a versão do formato não for suportada
+    """
+    message = unpackb(payload)
+    if message.get("v") != WIRE_VERSION:
+        raise ValueError(f"Unsupported wire format version: {message.get('v')!r}")
+    dicts = message["dicts"]
+    enums = {"status": TaskStatus, "priority": TaskPriority}
+    decoded: Dict[str, List[Any]] = {}
+    for name, column in message["columns"].items():
+        if name in DATE_FIELDS:
+            decoded[name] = [_EPOCH_DAY + timedelta(days=v) for v in column]
+        elif name in TIMESTAMP_FIELDS:
+            decoded[name] = [
+                _EPOCH + v * _MICROSECOND if v is not None else None for v in column
+            ]
+        elif name in enums:
+            decoded[name] = [enums[name][dicts[name][code]] for code in column]
+        elif name in dicts:
+            decoded[name] = [dicts[name][code] for code in column]
+        else:
+            decoded[name] = column
+    return [
+        {name: values[i] for name, values in decoded.items()}
+        for i in range(message["n"])
+    ]
@@ -0,0 +1,40 @@
+"""
+Fixtures compartilhadas pelos testes.
+"""
+
+from datetime import date
+
+import pytest
+
+from phd_progress_tracker.models.task import Task, TaskStatus
+from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def backend(request, tmp_path):
+    """Repositório vazio de cada backend (SQLite e memória), fechado ao final."""
+    if request.param == "sqlite":
+        repo = Database(data_dir=str(tmp_path))
+    else:
+        repo = MemoryRepository()
+    yield repo
+    repo.close()
+
+
+@pytest.fixture
+def task_factory():
+    """Cria tarefas a partir das datas de criação e, se houver, de conclusão."""
+
+    def make(task_id, created, completed=None):
+        return Task(
+            id=task_id,
+            title=task_id,
+            description="",
+            deadline=date(2026, 12, 1),
+            status=TaskStatus.COMPLETED if completed else TaskStatus.TODO,
+            created_at=created,
+            completed_at=completed,
+        )
+
+    return make
@@ -0,0 +1,119 @@
+import sqlite3
+from datetime import date, datetime
+
+import pytest
+
+from phd_progress_tracker.utils.activity import (
+    activity_report,
+    count_activity,
+    heatmap_grid,
+    intensity,
+)
+from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
+
+
+@pytest.fixture
+def tasks(task_factory):
+    """Tarefas entre 2025 e 2026."""
+    return [
+        task_factory("a", datetime(2025, 3, 1, 9), datetime(2025, 3, 4, 18)),
+        task_factory("b", datetime(2025, 3, 4, 8), datetime(2026, 1, 2, 10)),
+        task_factory("c", datetime(2026, 1, 2, 11)),
+    ]
+
+
+@pytest.fixture
+def repo(backend, tasks):
+    """Os dois backends com as mesmas tarefas."""
+    backend.save_tasks(tasks)
+    return backend
+
+
+def test_counts_per_day(repo):
+    """Verifica criações e conclusões por dia, separadas por ano."""
+    report = activity_report(repo, 2025, 2026)
+
+    assert [year.year for year in report] == [2025, 2026]
+    assert report[0].days == {date(2025, 3, 1): (1, 0), date(2025, 3, 4): (1, 1)}
+    assert report[1].days == {date(2026, 1, 2): (1, 1)}
+    assert (report[0].created, report[0].completed) == (2, 1)
+    assert report[0].counts("all") == {date(2025, 3, 1): 1, date(2025, 3, 4): 2}
+    assert report[1].counts("created") == {date(2026, 1, 2): 1}
+
+
+def test_defaults_to_current_year(repo):
+    """Verifica o ano corrente como padrão."""
+    report = activity_report(repo, today=date(2026, 5, 1))
+
+    assert [year.year for year in report] == [2026]
+
+
+def test_writes_update_cached_years(repo, task_factory):
+    """Verifica que escritas depois do cache aparecem nas contagens."""
+    activity_report(repo, 2025, 2026)
+    task = repo.get_task("c")
+    task.complete()
+    task.completed_at = datetime(2026, 1, 5, 12)
+    repo.update_task(task)
+    repo.delete_task("a")
+    repo.add_task(task_factory("d", datetime(2025, 3, 1, 10)))
+
+    report = activity_report(repo, 2025, 2026)
+
+    assert report[0].days == {date(2025, 3, 1): (1, 0), date(2025, 3, 4): (1, 0)}
+    assert report[1].days == {
+        date(2026, 1, 2): (1, 1),
+        date(2026, 1, 5): (0, 1),
+    }
+
+
+def test_cached_years_are_not_recomputed(tmp_path, tasks):
+    """Verifica que um ano em cache não é reagregado a partir das tarefas."""
+    db = Database(data_dir=str(tmp_path))
+    db.save_tasks(tasks)
+    activity_report(db, 2025, 2025)
+    # Alteração por fora do Database: o cache não a enxerga
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute("DELETE FROM tasks WHERE id = 'a'")
+
+    assert activity_report(db, 2025, 2025)[0].created == 2
+    assert activity_report(db, 2026, 2026)[0].created == 1
+
+
+def test_sqlite_matches_python_reference(tmp_path, tasks):
+    """Verifica o cache do SQLite contra a contagem em Python após undo/redo."""
+    db = Database(data_dir=str(tmp_path))
+    db.save_tasks(tasks)
+    db.activity_counts(2025, 2026)
+    db.delete_task("b")
+    db.undo()
+    db.undo()
+
+    assert db.activity_counts(2025, 2026) == count_activity(db.load_tasks(), 2025, 2026)
+
+
+def test_invalid_years():
+    """Verifica a validação do intervalo de anos."""
+    with pytest.raises(ValueError):
+        activity_report(MemoryRepository(), 2026, 2025)
+    with pytest.raises(ValueError):
+        activity_report(MemoryRepository(), 2000, 2026)
+
+
+def test_heatmap_grid():
+    """Verifica a grade de 7 linhas com células vazias fora do ano."""
+    grid = heatmap_grid(2026, {date(2026, 1, 1): 3})
+
+    assert len(grid) == 7
+    assert len(grid[0]) == 53
+    # 2026-01-01 é uma quinta-feira
+    assert grid[3][0] == 3
+    assert grid[0][0] is None
+    assert grid[4][-1] is None
+
+
+def test_intensity():
+    """Verifica os níveis relativos ao dia mais ativo."""
+    assert [intensity(n, 8) for n in (0, 1, 2, 3, 8)] == [0, 1, 1, 2, 4]
+    assert intensity(3, 0) == 0
@@ -0,0 +1,274 @@
+"""
+Tests for Analytics API endpoints.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from phd_progress_tracker.api.main import app
+from phd_progress_tracker.api.routes import analytics
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+
+
+@pytest.fixture
+def client(backend):
+    """Create test client backed by each storage backend."""
+    repo = backend
+    created = datetime(2026, 3, 2, 9, 0)
+    for i, (category, priority) in enumerate(
+        [
+            ("Writing", TaskPriority.HIGH),
+            ("Writing", TaskPriority.LOW),
+            ("Review", TaskPriority.HIGH),
+        ]
+    ):
+        repo.add_task(
+            Task(
+                id=f"t{i}",
+                title=f"Task {i}",
+                description="",
+                deadline=date(2026, 4, 1),
+                status=TaskStatus.COMPLETED,
+                priority=priority,
+                category=category,
+                created_at=created,
+                completed_at=created + timedelta(days=3 * (i + 1)),
+            )
+        )
+    repo.add_task(
+        Task(id="open", title="Open", description="", deadline=date(2026, 4, 1))
+    )
+
+    app.dependency_overrides[analytics.get_db] = lambda: repo
+
+    with TestClient(app) as test_client:
+        yield test_client, repo
+
+    app.dependency_overrides.clear()
+
+
+class TestCycleTime:
+    """Tests for GET /analytics/cycle-time."""
+
+    def test_percentiles_and_throughput(self, client):
+        """Test percentiles per group and completions per week."""
+        test_client, _ = client
+
+        response = test_client.get("/analytics/cycle-time")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["start"] == "2026-03-02"
+        assert body["end"] == "2026-03-15"
+        assert body["overall"] == {"count": 3, "p50": 6.0, "p90": 9.0, "p99": 9.0}
+        assert body["by_category"]["Writing"]["count"] == 2
+        assert body["by_priority"]["Alta"]["p50"] == 3.0
+        assert body["throughput"] == [
+            {
+                "week_start": "2026-03-02",
+                "completed": 2,
+                "by_category": {"Writing": 2},
+            },
+            {
+                "week_start": "2026-03-09",
+                "completed": 1,
+                "by_category": {"Review": 1},
+            },
+        ]
+
+    def test_period_filter(self, client):
+        """Test from/to, rounded to whole weeks."""
+        test_client, _ = client
+
+        body = test_client.get(
+            "/analytics/cycle-time", params={"from": "2026-03-10", "to": "2026-03-10"}
+        ).json()
+
+        assert body["start"] == "2026-03-09"
+        assert body["overall"]["count"] == 1
+        assert list(body["by_category"]) == ["Review"]
+
+    def test_reflects_new_completions(self, client):
+        """Test that a completion after the first request is counted."""
+        test_client, repo = client
+        test_client.get("/analytics/cycle-time")
+        task = repo.get_task("open")
+        task.complete()
+        repo.update_task(task)
+
+        body = test_client.get("/analytics/cycle-time").json()
+
+        assert body["overall"]["count"] == 4
+
+    def test_empty_period(self, client):
+        """Test a period without completions."""
+        test_client, _ = client
+
+        body = test_client.get(
+            "/analytics/cycle-time", params={"from": "2025-01-01", "to": "2025-01-31"}
+        ).json()
+
+        assert body["overall"] is None
+        assert all(week["completed"] == 0 for week in body["throughput"])
+
+    def test_inverted_period(self, client):
+        """Test 400 when from is after to."""
+        test_client, _ = client
+
+        response = test_client.get(
+            "/analytics/cycle-time", params={"from": "2026-03-10", "to": "2026-03-01"}
+        )
+
+        assert response.status_code == 400
+
+
+class TestBurndown:
+    """Tests for GET /analytics/burndown."""
+
+    def test_daily_series(self, client):
+        """Test counts, running totals and velocity per day."""
+        test_client, _ = client
+
+        response = test_client.get(
+            "/analytics/burndown",
+            params={"from": "2026-03-04", "to": "2026-03-06", "window": 2},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["granularity"] == "day"
+        assert body["window"] == 2
+        assert body["points"][0] == {
+            "start": "2026-03-04",
+            "created": 0,
+            "completed": 0,
+            "total": 3,
+            "done": 0,
+            "open": 3,
+            "velocity": 0.0,
+        }
+        assert [p["done"] for p in body["points"]] == [0, 1, 1]
+        assert body["points"][-1]["velocity"] == 0.5
+
+    def test_long_range_is_downsampled(self, client):
+        """Test that long ranges switch to coarser periods."""
+        test_client, _ = client
+
+        body = test_client.get(
+            "/analytics/burndown", params={"from": "2024-01-01", "to": "2026-12-31"}
+        ).json()
+
+        assert body["granularity"] == "month"
+        assert len(body["points"]) == 36
+        assert body["points"][-1]["done"] == 3
+
+    def test_invalid_range(self, client):
+        """Test 400 when from is after to."""
+        test_client, _ = client
+
+        response = test_client.get(
+            "/analytics/burndown", params={"from": "2026-03-10", "to": "2026-03-01"}
+        )
+
+        assert response.status_code == 400
+
+
+class TestActivity:
+    """Tests for GET /analytics/activity."""
+
+    def test_daily_counts(self, client):
+        """Test created/completed counts per day of a year."""
+        test_client, _ = client
+
+        response = test_client.get(
+            "/analytics/activity", params={"first_year": 2026, "last_year": 2026}
+        )
+
+        assert response.status_code == 200
+        (year,) = response.json()
+        assert year["year"] == 2026
+        assert year["completed"] == 3
+        assert {"day": "2026-03-02", "created": 3, "completed": 0} in year["days"]
+        assert {"day": "2026-03-05", "created": 0, "completed": 1} in year["days"]
+
+    def test_years_without_activity(self, client):
+        """Test that every requested year is listed, even without activity."""
+        test_client, _ = client
+
+        body = test_client.get(
+            "/analytics/activity", params={"first_year": 2024, "last_year": 2025}
+        ).json()
+
+        assert [year["year"] for year in body] == [2024, 2025]
+        assert all(year["days"] == [] for year in body)
+
+    def test_inverted_years(self, client):
+        """Test 400 when first_year is after last_year."""
+        test_client, _ = client
+
+        response = test_client.get(
+            "/analytics/activity", params={"first_year": 2026, "last_year": 2025}
+        )
+
+        assert response.status_code == 400
+
+
+class TestCrunch:
+    """Tests for GET /analytics/crunch."""
+
+    def test_overloaded_week(self, client):
+        """Test that high-priority deadlines piling up form an interval."""
+        test_client, repo = client
+        for task_id, deadline, effort in [
+            ("a", date(2026, 4, 8), 28),
+            ("b", date(2026, 4, 9), 21),
+        ]:
+            repo.add_task(
+                Task(
+                    id=task_id,
+                    title=task_id.upper(),
+                    description="",
+                    deadline=deadline,
+                    priority=TaskPriority.CRITICAL,
+                    effort_hours=effort,
+                )
+            )
+
+        response = test_client.get(
+            "/analytics/crunch", params={"from": "2026-04-01", "days": 30}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["start"], body["end"]) == ("2026-04-01", "2026-04-30")
+        assert (body["threshold"], body["window_days"]) == (6.0, 7)
+        (interval,) = body["intervals"]
+        # a: 4h/day on 2..8, b: 3h/day on 3..9
+        assert (interval["start"], interval["end"]) == ("2026-04-03", "2026-04-08")
+        assert (interval["days"], interval["peak_load"]) == (6, 7.0)
+        assert interval["hours"] == 42.0
+        assert [task["id"] for task in interval["tasks"]] == ["a", "b"]
+
+    def test_thresholds_and_priority(self, client):
+        """Test threshold and min_priority query parameters."""
+        test_client, _ = client
+        params = {"from": "2026-03-30", "days": 7, "default_effort": 14}
+
+        high = test_client.get("/analytics/crunch", params=params).json()
+        medium = test_client.get(
+            "/analytics/crunch",
+            params={**params, "min_priority": "Média", "threshold": 1},
+        ).json()
+
+        # The open MEDIUM task is only counted from MEDIUM priority up
+        assert high["intervals"] == []
+        assert [task["id"] for task in medium["intervals"][0]["tasks"]] == ["open"]
+
+    def test_invalid_parameters(self, client):
+        """Test 422 for out-of-range parameters."""
+        test_client, _ = client
+
+        assert test_client.get("/analytics/crunch?days=0").status_code == 422
+        assert test_client.get("/analytics/crunch?threshold=0").status_code == 422
@@ -0,0 +1,112 @@
+"""
+Tests for Bootstrap API endpoint.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from phd_progress_tracker.api.main import app
+from phd_progress_tracker.api.routes import bootstrap
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task, TaskStatus
+
+
+@pytest.fixture
+def client(backend):
+    """Create test client backed by each storage backend."""
+    repo = backend
+    today = date.today()
+    for i in range(3):
+        repo.add_task(
+            Task(
+                id=f"t{i}",
+                title=f"Task {i}",
+                description="",
+                deadline=today + timedelta(days=i + 1),
+                status=TaskStatus.COMPLETED if i == 2 else TaskStatus.TODO,
+            )
+        )
+    repo.add_milestone(
+        Milestone(
+            id="m1",
+            title="Defense",
+            description="",
+            target_date=today + timedelta(days=90),
+        )
+    )
+    repo.add_milestone(
+        Milestone(
+            id="m0",
+            title="Proposal",
+            description="",
+            target_date=today - timedelta(days=90),
+            is_achieved=True,
+        )
+    )
+
+    app.dependency_overrides[bootstrap.get_db] = lambda: repo
+
+    with TestClient(app) as test_client:
+        yield test_client, repo
+
+    app.dependency_overrides.clear()
+
+
+class TestBootstrap:
+    """Tests for GET /bootstrap endpoint."""
+
+    def test_bootstrap(self, client):
+        """Test that all page data comes back in one response."""
+        test_client, repo = client
+
+        response = test_client.get("/bootstrap")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dashboard"]["total_tasks"] == 3
+        assert data["dashboard"]["completed_tasks"] == 1
+        assert [t["id"] for t in data["dashboard"]["upcoming_deadlines"]] == [
+            "t0",
+            "t1",
+        ]
+        assert [t["id"] for t in data["tasks"]] == ["t0", "t1", "t2"]
+        assert data["has_more_tasks"] is False
+        assert [m["id"] for m in data["milestones"]] == ["m1"]
+        assert data["cursor"] == repo.revision()
+
+    def test_bootstrap_task_page(self, client):
+        """Test that the task page is limited and flags more results."""
+        test_client, _ = client
+
+        data = test_client.get("/bootstrap", params={"task_limit": 2}).json()
+
+        assert [t["id"] for t in data["tasks"]] == ["t0", "t1"]
+        assert data["has_more_tasks"] is True
+
+    def test_cursor_changes_after_write(self, client):
+        """Test that the sync cursor moves when data changes."""
+        test_client, repo = client
+        before = test_client.get("/bootstrap").json()["cursor"]
+
+        repo.delete_task("t0")
+
+        after = test_client.get("/bootstrap").json()["cursor"]
+        assert after != before
+
+    def test_overdue_milestones_are_not_upcoming(self, client):
+        """Test that missed milestones don't take the upcoming slots."""
+        test_client, repo = client
+        repo.add_milestone(
+            Milestone(
+                id="m2",
+                title="Qualifying exam",
+                description="",
+                target_date=date.today() - timedelta(days=10),
+            )
+        )
+
+        data = test_client.get("/bootstrap", params={"milestone_limit": 1}).json()
+
+        assert [m["id"] for m in data["milestones"]] == ["m1"]
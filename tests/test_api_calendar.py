@@ -0,0 +1,88 @@
+"""
+Tests for Calendar API endpoint.
+"""
+
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from phd_progress_tracker.api.main import app
+from phd_progress_tracker.api.routes import calendar
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
+
+
+@pytest.fixture
+def client():
+    """Create test client backed by an in-memory repository."""
+    repo = MemoryRepository()
+    repo.add_task(
+        Task(id="t1", title="Draft", description="", deadline=date(2026, 3, 2))
+    )
+    repo.add_task(
+        Task(id="t2", title="Review", description="", deadline=date(2026, 4, 20))
+    )
+    repo.add_milestone(
+        Milestone(
+            id="m1", title="Defense", description="", target_date=date(2026, 3, 20)
+        )
+    )
+
+    def override_get_db():
+        yield repo
+
+    app.dependency_overrides[calendar.get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+class TestCalendar:
+    """Tests for GET /calendar endpoint."""
+
+    def test_calendar_by_month(self, client):
+        """Test tasks and milestones bucketed by month."""
+        response = client.get(
+            "/calendar",
+            params={"from": "2026-01-01", "to": "2026-12-31", "granularity": "month"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [b["start"] for b in data] == ["2026-03-01", "2026-04-01"]
+        assert data[0]["end"] == "2026-03-31"
+        assert [t["id"] for t in data[0]["tasks"]] == ["t1"]
+        assert [m["id"] for m in data[0]["milestones"]] == ["m1"]
+
+    def test_calendar_window(self, client):
+        """Test that items outside the window are excluded."""
+        response = client.get(
+            "/calendar", params={"from": "2026-03-01", "to": "2026-03-10"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["start"] == data[0]["end"] == "2026-03-02"
+        assert data[0]["milestones"] == []
+
+    def test_calendar_invalid_granularity(self, client):
+        """Test that unknown granularities are rejected."""
+        response = client.get(
+            "/calendar",
+            params={"from": "2026-01-01", "to": "2026-12-31", "granularity": "year"},
+        )
+
+        assert response.status_code == 422
+
+    def test_calendar_inverted_window(self, client):
+        """Test that 'from' after 'to' is rejected."""
+        response = client.get(
+            "/calendar", params={"from": "2026-12-31", "to": "2026-01-01"}
+        )
+
+        assert response.status_code == 400
@@ -3,30 +3,34 @@ Tests for Dashboard API endpoints.
 """
 
 from datetime import date, datetime, timedelta
-from unittest.mock import patch, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
 from phd_progress_tracker.api.main import app
+from phd_progress_tracker.api.routes import dashboard
 from phd_progress_tracker.models.task import Task, TaskStatus, TaskPriority
+from phd_progress_tracker.utils import task_frame
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
 
 
-@pytest.fixture
-def mock_db():
-    """Create a mock database."""
-    mock = MagicMock()
-    mock.load_tasks.return_value = []
-    return mock
+@pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+def client(request, monkeypatch):
+    """Create test client backed by an in-memory repository."""
+    if request.param:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(task_frame, "HAS_NUMPY", request.param)
+    repo = MemoryRepository()
 
+    def override_get_db():
+        yield repo
 
-@pytest.fixture
-def client(mock_db):
-    """Create test client with mocked database."""
-    with patch("phd_progress_tracker.api.routes.dashboard.Database") as MockDB:
-        MockDB.return_value = mock_db
-        with TestClient(app) as test_client:
-            yield test_client, mock_db
+    app.dependency_overrides[dashboard.get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client, repo
+
+    app.dependency_overrides.clear()
 
 
 class TestDashboard:
@@ -34,8 +38,7 @@ class TestDashboard:
 
     def test_dashboard_empty(self, client):
         """Test dashboard with no tasks."""
-        test_client, mock_db = client
-        mock_db.load_tasks.return_value = []
+        test_client, _ = client
 
         response = test_client.get("/dashboard")
 
@@ -49,7 +52,7 @@ class TestDashboard:
 
     def test_dashboard_with_completed_tasks(self, client):
         """Test dashboard with completed tasks."""
-        test_client, mock_db = client
+        test_client, repo = client
         task = Task(
             id="1",
             title="Completed Task",
@@ -61,7 +64,7 @@ class TestDashboard:
             created_at=datetime.now() - timedelta(days=10),
             completed_at=datetime.now() - timedelta(days=2),
         )
-        mock_db.load_tasks.return_value = [task]
+        repo.save_tasks([task])
 
         response = test_client.get("/dashboard")
 
@@ -73,7 +76,7 @@ class TestDashboard:
 
     def test_dashboard_with_pending_tasks(self, client):
         """Test dashboard with pending tasks."""
-        test_client, mock_db = client
+        test_client, repo = client
         task = Task(
             id="1",
             title="Pending Task",
@@ -84,7 +87,7 @@ class TestDashboard:
             category="Geral",
             created_at=datetime.now(),
         )
-        mock_db.load_tasks.return_value = [task]
+        repo.save_tasks([task])
 
         response = test_client.get("/dashboard")
 
@@ -96,7 +99,7 @@ class TestDashboard:
 
     def test_dashboard_with_overdue_tasks(self, client):
         """Test dashboard with overdue tasks."""
-        test_client, mock_db = client
+        test_client, repo = client
         task = Task(
             id="1",
             title="Overdue Task",
@@ -107,7 +110,7 @@ class TestDashboard:
             category="Geral",
             created_at=datetime.now() - timedelta(days=10),
         )
-        mock_db.load_tasks.return_value = [task]
+        repo.save_tasks([task])
 
         response = test_client.get("/dashboard")
 
@@ -118,7 +121,7 @@ class TestDashboard:
 
     def test_dashboard_with_upcoming_deadlines(self, client):
         """Test dashboard with upcoming deadlines."""
-        test_client, mock_db = client
+        test_client, repo = client
         # Task with deadline in next 3 days
         task = Task(
             id="1",
@@ -130,7 +133,7 @@ class TestDashboard:
             category="Geral",
             created_at=datetime.now(),
         )
-        mock_db.load_tasks.return_value = [task]
+        repo.save_tasks([task])
 
         response = test_client.get("/dashboard")
 
@@ -141,7 +144,7 @@ class TestDashboard:
 
     def test_dashboard_excludes_completed_from_upcoming(self, client):
         """Test that completed tasks are excluded from upcoming deadlines."""
-        test_client, mock_db = client
+        test_client, repo = client
         # Completed task with upcoming deadline
         task = Task(
             id="1",
@@ -154,7 +157,7 @@ class TestDashboard:
             created_at=datetime.now(),
             completed_at=datetime.now(),
         )
-        mock_db.load_tasks.return_value = [task]
+        repo.save_tasks([task])
 
         response = test_client.get("/dashboard")
 
@@ -163,6 +166,40 @@ class TestDashboard:
         # Completed tasks should not appear in upcoming deadlines
         assert len(data["upcoming_deadlines"]) == 0
 
+    def test_dashboard_as_of_date(self, client):
+        """Test that ?as_of= evaluates the dashboard at a reference date."""
+        test_client, repo = client
+        task = Task(
+            id="1",
+            title="Completed Later",
+            description="Description",
+            deadline=date(2026, 1, 10),
+            status=TaskStatus.COMPLETED,
+            priority=TaskPriority.MEDIUM,
+            category="Geral",
+            created_at=datetime(2026, 1, 1, 9, 0),
+            completed_at=datetime(2026, 1, 20, 9, 0),
+        )
+        repo.save_tasks([task])
+
+        before = test_client.get("/dashboard", params={"as_of": "2026-01-05"}).json()
+        overdue = test_client.get("/dashboard", params={"as_of": "2026-01-15"}).json()
+        after = test_client.get("/dashboard", params={"as_of": "2026-01-25"}).json()
+
+        assert before["pending_tasks"] == 1
+        assert before["upcoming_deadlines"][0]["title"] == "Completed Later"
+        assert overdue["overdue_tasks"] == 1
+        assert after["completed_tasks"] == 1
+        assert after["overdue_tasks"] == 0
+
+    def test_dashboard_invalid_as_of(self, client):
+        """Test that an invalid ?as_of= is rejected."""
+        test_client, _ = client
+
+        response = test_client.get("/dashboard", params={"as_of": "yesterday"})
+
+        assert response.status_code == 422
+
 
 class TestRootEndpoint:
     """Tests for root endpoint."""
@@ -2,14 +2,20 @@
 Tests for Milestone API endpoints.
 """
 
-from datetime import date
-from unittest.mock import patch, MagicMock
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
 from phd_progress_tracker.api.main import app
+from phd_progress_tracker.api.routes import milestones
+from phd_progress_tracker.config import settings
 from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task, TaskStatus
+from phd_progress_tracker.utils import forecast
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
+from phd_progress_tracker.utils.wire import decode_columns
 
 
 @pytest.fixture
@@ -23,10 +29,16 @@ def mock_db():
 @pytest.fixture
 def client(mock_db):
     """Create test client with mocked database."""
-    with patch("phd_progress_tracker.api.routes.milestones.Database") as MockDB:
-        MockDB.return_value = mock_db
-        with TestClient(app) as test_client:
-            yield test_client, mock_db
+
+    def mock_get_db():
+        yield mock_db
+
+    app.dependency_overrides[milestones.get_db] = mock_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client, mock_db
+
+    app.dependency_overrides.clear()
 
 
 class TestListMilestones:
@@ -61,6 +73,76 @@ class TestListMilestones:
         assert len(data) == 1
         assert data[0]["title"] == "Qualification Exam"
 
+    def test_list_milestones_date_range(self, client):
+        """Test that filters are forwarded to the range query."""
+        test_client, mock_db = client
+        mock_db.milestones_by_date.return_value = []
+
+        response = test_client.get(
+            "/milestones",
+            params={"from": "2025-01-01", "to": "2025-12-31", "achieved": "false"},
+        )
+
+        assert response.status_code == 200
+        mock_db.milestones_by_date.assert_called_once_with(
+            date(2025, 1, 1), date(2025, 12, 31), False
+        )
+        mock_db.load_milestones.assert_not_called()
+
+    def test_list_milestones_msgpack(self, client):
+        """Test the columnar MessagePack format with Accept negotiation."""
+        test_client, mock_db = client
+        mock_db.load_milestones.return_value = [
+            Milestone(
+                id="1",
+                title="Qualification Exam",
+                description="",
+                target_date=date(2025, 6, 15),
+            )
+        ]
+
+        response = test_client.get(
+            "/milestones", headers={"Accept": "application/msgpack"}
+        )
+
+        assert response.headers["content-type"] == "application/msgpack"
+        assert decode_columns(response.content) == [
+            {
+                "id": "1",
+                "title": "Qualification Exam",
+                "description": "",
+                "target_date": date(2025, 6, 15),
+                "is_achieved": False,
+            }
+        ]
+
+    def test_list_milestones_inverted_range(self, client):
+        """Test that 'from' after 'to' is rejected."""
+        test_client, mock_db = client
+
+        response = test_client.get(
+            "/milestones", params={"from": "2025-12-31", "to": "2025-01-01"}
+        )
+
+        assert response.status_code == 400
+        mock_db.milestones_by_date.assert_not_called()
+
+    def test_list_milestones_with_fields(self, client):
+        """Test that ?fields= uses the column projection."""
+        test_client, mock_db = client
+        mock_db.load_milestone_columns.return_value = [
+            {"id": "1", "target_date": date(2025, 6, 15)}
+        ]
+
+        response = test_client.get("/milestones", params={"fields": "id,target_date"})
+
+        assert response.status_code == 200
+        assert response.json() == [{"id": "1", "target_date": "2025-06-15"}]
+        mock_db.load_milestone_columns.assert_called_once_with(
+            ["id", "target_date"], None, None, None
+        )
+        mock_db.load_milestones.assert_not_called()
+
 
 class TestCreateMilestone:
     """Tests for POST /milestones endpoint."""
@@ -68,8 +150,7 @@ class TestCreateMilestone:
     def test_create_milestone_success(self, client):
         """Test creating a new milestone."""
         test_client, mock_db = client
-        mock_db.load_milestones.return_value = []
-        mock_db.save_milestones.return_value = None
+        mock_db.add_milestone.return_value = None
 
         payload = {
             "title": "Defense",
@@ -83,7 +164,7 @@ class TestCreateMilestone:
         data = response.json()
         assert data["title"] == "Defense"
         assert data["is_achieved"] is False
-        mock_db.save_milestones.assert_called_once()
+        mock_db.add_milestone.assert_called_once()
 
 
 class TestGetMilestone:
@@ -99,7 +180,7 @@ class TestGetMilestone:
             target_date=date(2025, 6, 15),
             is_achieved=False,
         )
-        mock_db.load_milestones.return_value = [milestone]
+        mock_db.get_milestone.return_value = milestone
 
         response = test_client.get("/milestones/milestone-123")
 
@@ -108,10 +189,21 @@ class TestGetMilestone:
         assert data["id"] == "milestone-123"
         assert data["title"] == "Qualification Exam"
 
+    def test_get_milestone_with_fields(self, client):
+        """Test field selection on the detail endpoint."""
+        test_client, mock_db = client
+        mock_db.get_milestone_columns.return_value = {"is_achieved": True}
+
+        response = test_client.get("/milestones/1", params={"fields": "is_achieved"})
+
+        assert response.status_code == 200
+        assert response.json() == {"is_achieved": True}
+        mock_db.get_milestone_columns.assert_called_once_with("1", ["is_achieved"])
+
     def test_get_milestone_not_found(self, client):
         """Test getting non-existent milestone."""
         test_client, mock_db = client
-        mock_db.load_milestones.return_value = []
+        mock_db.get_milestone.return_value = None
 
         response = test_client.get("/milestones/nonexistent")
 
@@ -132,8 +224,8 @@ class TestUpdateMilestone:
             target_date=date(2025, 6, 15),
             is_achieved=False,
         )
-        mock_db.load_milestones.return_value = [milestone]
-        mock_db.save_milestones.return_value = None
+        mock_db.get_milestone.return_value = milestone
+        mock_db.update_milestone.return_value = True
 
         payload = {"title": "Updated Title", "is_achieved": True}
 
@@ -147,7 +239,7 @@ class TestUpdateMilestone:
     def test_update_milestone_not_found(self, client):
         """Test updating non-existent milestone."""
         test_client, mock_db = client
-        mock_db.load_milestones.return_value = []
+        mock_db.get_milestone.return_value = None
 
         payload = {"title": "New Title"}
 
@@ -162,26 +254,140 @@ class TestDeleteMilestone:
     def test_delete_milestone_success(self, client):
         """Test deleting a milestone."""
         test_client, mock_db = client
-        milestone = Milestone(
-            id="milestone-123",
-            title="Test Milestone",
-            description="Test Description",
-            target_date=date(2025, 6, 15),
-            is_achieved=False,
-        )
-        mock_db.load_milestones.return_value = [milestone]
-        mock_db.save_milestones.return_value = None
+        mock_db.delete_milestone.return_value = True
 
         response = test_client.delete("/milestones/milestone-123")
 
         assert response.status_code == 204
-        mock_db.save_milestones.assert_called_once()
+        mock_db.delete_milestone.assert_called_once_with("milestone-123")
 
     def test_delete_milestone_not_found(self, client):
         """Test deleting non-existent milestone."""
         test_client, mock_db = client
-        mock_db.load_milestones.return_value = []
+        mock_db.delete_milestone.return_value = False
 
         response = test_client.delete("/milestones/nonexistent")
 
         assert response.status_code == 404
+
+
+class TestForecast:
+    """Tests for GET /milestones/{id}/forecast endpoint."""
+
+    @pytest.fixture
+    def forecast_client(self):
+        """Create test client with one completion per day and open tasks."""
+        pytest.importorskip("numpy")
+        repo = MemoryRepository()
+        today = date.today()
+        for i in range(30):
+            done = datetime.combine(today - timedelta(days=i), datetime.min.time())
+            repo.add_task(
+                Task(
+                    id=f"done{i}",
+                    title=f"Done {i}",
+                    description="",
+                    deadline=today,
+                    status=TaskStatus.COMPLETED,
+                    created_at=done - timedelta(days=60),
+                    completed_at=done,
+                )
+            )
+        for i in range(10):
+            repo.add_task(
+                Task(id=f"open{i}", title=f"Open {i}", description="", deadline=today)
+            )
+        repo.add_milestone(
+            Milestone(
+                id="m1",
+                title="Defense",
+                description="",
+                target_date=today + timedelta(days=30),
+            )
+        )
+        app.dependency_overrides[milestones.get_db] = lambda: repo
+
+        with TestClient(app) as test_client:
+            yield test_client
+
+        app.dependency_overrides.clear()
+
+    def test_forecast(self, forecast_client):
+        """Test probability and completion dates with steady throughput."""
+        response = forecast_client.get(
+            "/milestones/m1/forecast",
+            params={"trials": 1000, "seed": 3, "history_days": 30},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["remaining"] == 10
+        assert body["seed"] == 3
+        assert body["daily_throughput"] == 1.0
+        assert body["probability"] == 1.0
+        expected = (date.today() + timedelta(days=10)).isoformat()
+        assert body["p50"] == body["p95"] == expected
+
+    def test_random_seed_is_returned(self, forecast_client):
+        """Test that a run without seed can be repeated with the returned one."""
+        first = forecast_client.get(
+            "/milestones/m1/forecast", params={"trials": 1000}
+        ).json()
+
+        again = forecast_client.get(
+            "/milestones/m1/forecast", params={"trials": 1000, "seed": first["seed"]}
+        ).json()
+
+        assert again == first
+
+    def test_requests_share_the_startup_pool(self, forecast_client):
+        """Test that every request runs on the one bounded pool made at startup."""
+        pool = forecast_client.app.state.forecast_pool
+
+        for seed in (1, 2):
+            response = forecast_client.get(
+                "/milestones/m1/forecast", params={"trials": 60_000, "seed": seed}
+            )
+            assert response.status_code == 200
+
+        assert forecast_client.app.state.forecast_pool is pool
+        assert pool._max_workers == settings.forecast_workers
+        assert len(pool._processes) <= settings.forecast_workers
+
+    def test_forecast_not_found(self, forecast_client):
+        """Test 404 for an unknown milestone."""
+        response = forecast_client.get("/milestones/missing/forecast")
+
+        assert response.status_code == 404
+
+    def test_forecast_invalid_trials(self, forecast_client):
+        """Test validation of the number of trials."""
+        response = forecast_client.get("/milestones/m1/forecast", params={"trials": 10})
+
+        assert response.status_code == 422
+
+
+class TestForecastErrors:
+    """Tests for GET /milestones/{id}/forecast error mapping."""
+
+    def test_forecast_without_numpy(self, client, monkeypatch):
+        """Test 501 when the numpy extra is not installed."""
+        test_client, _ = client
+        monkeypatch.setattr(forecast, "HAS_NUMPY", False)
+
+        response = test_client.get("/milestones/m1/forecast")
+
+        assert response.status_code == 501
+        assert "numpy" in response.json()["detail"]
+
+    def test_storage_errors_are_not_501(self, client, monkeypatch):
+        """Test that other runtime errors are not reported as missing numpy."""
+        test_client, _ = client
+
+        def failing(*args, **kwargs):
+            raise RuntimeError("Failed to load tasks: disk I/O error")
+
+        monkeypatch.setattr(milestones, "forecast_milestone", failing)
+
+        with pytest.raises(RuntimeError, match="disk I/O"):
+            test_client.get("/milestones/m1/forecast")
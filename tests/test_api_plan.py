@@ -0,0 +1,151 @@
+"""
+Tests for Plan API endpoint.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from phd_progress_tracker.api.main import app
+from phd_progress_tracker.api.routes import plan
+from phd_progress_tracker.models.task import Task, TaskStatus
+
+# A Monday
+MONDAY = date(2026, 3, 2)
+
+
+@pytest.fixture
+def client(backend):
+    """Create test client backed by each storage backend."""
+    repo = backend
+    for task_id, days, effort, status in [
+        ("draft", 1, 4, TaskStatus.TODO),
+        ("review", 2, None, TaskStatus.IN_PROGRESS),
+        ("thesis", 3, 30, TaskStatus.TODO),
+        ("done", 1, 8, TaskStatus.COMPLETED),
+    ]:
+        repo.add_task(
+            Task(
+                id=task_id,
+                title=task_id.title(),
+                description="",
+                deadline=MONDAY + timedelta(days=days),
+                status=status,
+                created_at=datetime(2026, 2, 1),
+                effort_hours=effort,
+            )
+        )
+    app.dependency_overrides[plan.get_db] = lambda: repo
+
+    with TestClient(app) as test_client:
+        yield test_client, repo
+
+    app.dependency_overrides.clear()
+
+
+class TestPlan:
+    """Tests for GET /plan endpoint."""
+
+    def test_day_by_day_schedule(self, client):
+        """Test that open tasks are packed earliest-deadline-first into days."""
+        test_client, _ = client
+
+        response = test_client.get(
+            "/plan", params={"from": MONDAY.isoformat(), "days": 3}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["start"], data["end"]) == ("2026-03-02", "2026-03-04")
+        assert (data["daily_hours"], data["weekends"]) == (6.0, False)
+        assert (data["total_tasks"], data["total_hours"]) == (3, 36.0)
+        assert [
+            [(slot["task_id"], slot["hours"]) for slot in day["slots"]]
+            for day in data["days"]
+        ] == [
+            [("draft", 4.0), ("review", 2.0)],
+            [("thesis", 6.0)],
+            [("thesis", 6.0)],
+        ]
+        assert data["days"][0]["used"] == 6.0
+        # 30h over 6h days (skipping the weekend) ends the next Monday
+        assert data["finish"] == "2026-03-09"
+        assert [(t["task_id"], t["finish"]) for t in data["late"]] == [
+            ("thesis", "2026-03-09")
+        ]
+        assert data["late"][0]["estimated"] is True
+
+    def test_capacity_parameters(self, client):
+        """Test daily hours, default effort and weekends query parameters."""
+        test_client, _ = client
+
+        response = test_client.get(
+            "/plan",
+            params={
+                "from": MONDAY.isoformat(),
+                "days": 1,
+                "hours": 10,
+                "default_effort": 1,
+                "weekends": True,
+            },
+        )
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["total_hours"] == 35.0
+        assert [
+            (slot["task_id"], slot["hours"]) for slot in data["days"][0]["slots"]
+        ] == [("draft", 4.0), ("review", 1.0), ("thesis", 5.0)]
+        # Weekends enabled: 30h at 10h/day, starting with 5h on Monday
+        assert data["finish"] == "2026-03-05"
+
+    def test_replans_after_a_change(self, client):
+        """Test that the plan follows task updates."""
+        test_client, repo = client
+        params = {"from": MONDAY.isoformat(), "days": 1}
+        test_client.get("/plan", params=params)
+        task = repo.get_task("thesis")
+        task.effort_hours = 5
+        repo.update_task(task)
+
+        data = test_client.get("/plan", params=params).json()
+
+        assert data["late"] == []
+        assert data["finish"] == "2026-03-03"
+
+    def test_invalid_parameters(self, client):
+        """Test that out-of-range parameters are rejected."""
+        test_client, _ = client
+
+        assert test_client.get("/plan", params={"days": 0}).status_code == 422
+        assert test_client.get("/plan", params={"hours": 0}).status_code == 422
+        assert test_client.get("/plan", params={"days": 400}).status_code == 422
+        assert (
+            test_client.get("/plan", params={"default_effort": 1e7}).status_code == 422
+        )
+
+    def test_capacity_below_one_minute(self, client):
+        """Test that a daily capacity that rounds to zero minutes is a 400."""
+        test_client, _ = client
+
+        response = test_client.get("/plan", params={"hours": 0.008})
+
+        assert response.status_code == 400
+        assert "1 minute" in response.json()["detail"]
+
+    def test_plan_past_the_horizon(self, client):
+        """Test that a plan that never finishes is a 400, not a hang or a 500."""
+        test_client, repo = client
+        thesis = repo.get_task("thesis")
+        thesis.effort_hours = 1e7
+        repo.update_task(thesis)
+
+        response = test_client.get("/plan", params={"from": MONDAY.isoformat()})
+        tiny = test_client.get(
+            "/plan", params={"from": MONDAY.isoformat(), "hours": 1 / 60}
+        )
+
+        assert response.status_code == 400
+        assert "does not fit" in response.json()["detail"]
+        assert tiny.status_code == 400
@@ -2,7 +2,7 @@
 Tests for Task API endpoints.
 """
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock
 
 import pytest
@@ -12,6 +12,8 @@ from phd_progress_tracker.api.main import app
 from phd_progress_tracker.api.routes import tasks
 from phd_progress_tracker.models.task import Task, TaskStatus, TaskPriority
 from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
+from phd_progress_tracker.utils.wire import decode_columns
 
 
 @pytest.fixture
@@ -84,8 +86,7 @@ class TestCreateTask:
     def test_create_task_success(self, client):
         """Test creating a new task."""
         test_client, mock_db = client
-        mock_db.load_tasks.return_value = []
-        mock_db.save_tasks.return_value = None
+        mock_db.add_task.return_value = None
 
         payload = {
             "title": "New Task",
@@ -102,13 +103,12 @@ class TestCreateTask:
         assert data["title"] == "New Task"
         assert data["status"] == "A Fazer"
         assert data["priority"] == "Alta"
-        mock_db.save_tasks.assert_called_once()
+        mock_db.add_task.assert_called_once()
 
     def test_create_task_with_defaults(self, client):
         """Test creating task with default values."""
         test_client, mock_db = client
-        mock_db.load_tasks.return_value = []
-        mock_db.save_tasks.return_value = None
+        mock_db.add_task.return_value = None
 
         payload = {
             "title": "Minimal Task",
@@ -122,6 +122,27 @@ class TestCreateTask:
         data = response.json()
         assert data["category"] == "Geral"
         assert data["priority"] == "Média"
+        assert data["effort_hours"] is None
+
+    def test_create_task_with_effort(self, client):
+        """Test that the effort estimate is stored and must be positive."""
+        test_client, mock_db = client
+        payload = {
+            "title": "Estimated Task",
+            "description": "Description",
+            "deadline": "2025-12-31",
+            "effort_hours": 4.5,
+        }
+
+        response = test_client.post("/tasks", json=payload)
+        invalid = test_client.post("/tasks", json={**payload, "effort_hours": 0})
+        huge = test_client.post("/tasks", json={**payload, "effort_hours": 1e7})
+
+        assert response.status_code == 201
+        assert response.json()["effort_hours"] == 4.5
+        assert mock_db.add_task.call_args.args[0].effort_hours == 4.5
+        assert invalid.status_code == 422
+        assert huge.status_code == 422
 
 
 class TestGetTask:
@@ -140,7 +161,7 @@ class TestGetTask:
             category="Geral",
             created_at=datetime.now(),
         )
-        mock_db.load_tasks.return_value = [task]
+        mock_db.get_task.return_value = task
 
         response = test_client.get("/tasks/task-123")
 
@@ -152,7 +173,7 @@ class TestGetTask:
     def test_get_task_not_found(self, client):
         """Test getting non-existent task."""
         test_client, mock_db = client
-        mock_db.load_tasks.return_value = []
+        mock_db.get_task.return_value = None
 
         response = test_client.get("/tasks/nonexistent")
 
@@ -176,8 +197,8 @@ class TestUpdateTask:
             category="Geral",
             created_at=datetime.now(),
         )
-        mock_db.load_tasks.return_value = [task]
-        mock_db.save_tasks.return_value = None
+        mock_db.get_task.return_value = task
+        mock_db.update_task.return_value = True
 
         payload = {"title": "Updated Title", "status": "Em Progresso"}
 
@@ -188,10 +209,28 @@ class TestUpdateTask:
         assert data["title"] == "Updated Title"
         assert data["status"] == "Em Progresso"
 
+    def test_update_task_effort(self, client):
+        """Test updating only the effort estimate."""
+        test_client, mock_db = client
+        mock_db.get_task.return_value = Task(
+            id="task-123",
+            title="Original Title",
+            description="",
+            deadline=date(2025, 12, 31),
+        )
+
+        response = test_client.patch("/tasks/task-123", json={"effort_hours": 3})
+        huge = test_client.patch("/tasks/task-123", json={"effort_hours": 1e7})
+
+        assert response.status_code == 200
+        assert response.json()["effort_hours"] == 3
+        assert huge.status_code == 422
+        assert response.json()["title"] == "Original Title"
+
     def test_update_task_not_found(self, client):
         """Test updating non-existent task."""
         test_client, mock_db = client
-        mock_db.load_tasks.return_value = []
+        mock_db.get_task.return_value = None
 
         payload = {"title": "New Title"}
 
@@ -206,29 +245,566 @@ class TestDeleteTask:
     def test_delete_task_success(self, client):
         """Test deleting a task."""
         test_client, mock_db = client
-        task = Task(
-            id="task-123",
-            title="Test Task",
-            description="Test Description",
-            deadline=date(2025, 12, 31),
-            status=TaskStatus.TODO,
-            priority=TaskPriority.MEDIUM,
-            category="Geral",
-            created_at=datetime.now(),
-        )
-        mock_db.load_tasks.return_value = [task]
-        mock_db.save_tasks.return_value = None
+        mock_db.delete_task.return_value = True
 
         response = test_client.delete("/tasks/task-123")
 
         assert response.status_code == 204
-        mock_db.save_tasks.assert_called_once()
+        mock_db.delete_task.assert_called_once_with("task-123", refresh_blocked=True)
 
     def test_delete_task_not_found(self, client):
         """Test deleting non-existent task."""
         test_client, mock_db = client
-        mock_db.load_tasks.return_value = []
+        mock_db.delete_task.return_value = False
 
         response = test_client.delete("/tasks/nonexistent")
 
         assert response.status_code == 404
+
+
+class TestSparseFieldsets:
+    """Tests for ?fields= on GET /tasks and GET /tasks/{id}."""
+
+    @pytest.fixture
+    def sqlite_client(self, tmp_path):
+        """Create test client backed by a real SQLite database."""
+        db = Database(data_dir=str(tmp_path), db_path=":memory:")
+        db.add_task(
+            Task(
+                id="task-123",
+                title="Test Task",
+                description="A very long description",
+                deadline=date(2025, 12, 31),
+                status=TaskStatus.IN_PROGRESS,
+            )
+        )
+        app.dependency_overrides[tasks.get_db] = lambda: db
+
+        with TestClient(app) as test_client:
+            yield test_client
+
+        app.dependency_overrides.clear()
+        db.close()
+
+    def test_list_tasks_with_fields(self, sqlite_client):
+        """Test that only the requested fields are returned."""
+        response = sqlite_client.get(
+            "/tasks", params={"fields": "id,title,deadline,status"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "id": "task-123",
+                "title": "Test Task",
+                "deadline": "2025-12-31",
+                "status": "Em Progresso",
+            }
+        ]
+
+    def test_get_task_with_fields(self, sqlite_client):
+        """Test field selection on the detail endpoint."""
+        response = sqlite_client.get("/tasks/task-123", params={"fields": "title"})
+
+        assert response.status_code == 200
+        assert response.json() == {"title": "Test Task"}
+
+    def test_get_task_with_fields_not_found(self, sqlite_client):
+        """Test that a missing task is still a 404 with fields."""
+        response = sqlite_client.get("/tasks/nope", params={"fields": "title"})
+
+        assert response.status_code == 404
+
+    def test_unknown_field(self, client):
+        """Test that unknown fields are rejected before touching the database."""
+        test_client, mock_db = client
+
+        response = test_client.get("/tasks", params={"fields": "id,secret"})
+
+        assert response.status_code == 400
+        assert "secret" in response.json()["detail"]
+        mock_db.load_task_columns.assert_not_called()
+
+
+class TestTaskFacets:
+    """Tests for GET /tasks/facets and filters on GET /tasks."""
+
+    @pytest.fixture
+    def memory_client(self):
+        """Create test client backed by an in-memory repository."""
+        repo = MemoryRepository()
+        repo.add_task(
+            Task(
+                id="t1",
+                title="Draft",
+                description="",
+                deadline=date(2026, 3, 2),
+                category="Escrita",
+            )
+        )
+        repo.add_task(
+            Task(
+                id="t2",
+                title="Review",
+                description="",
+                deadline=date(2026, 4, 2),
+                status=TaskStatus.COMPLETED,
+                priority=TaskPriority.HIGH,
+                category="Escrita",
+            )
+        )
+        app.dependency_overrides[tasks.get_db] = lambda: repo
+
+        with TestClient(app) as test_client:
+            yield test_client, repo
+
+        app.dependency_overrides.clear()
+
+    def test_facets(self, memory_client):
+        """Test grouped counts with display labels for enums."""
+        test_client, _ = memory_client
+
+        response = test_client.get("/tasks/facets")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == {"A Fazer": 1, "Concluída": 1}
+        assert data["priority"] == {"Alta": 1, "Média": 1}
+        assert data["category"] == {"Escrita": 2}
+        assert data["month"] == {"2026-03": 1, "2026-04": 1}
+
+    def test_facets_with_filter(self, memory_client):
+        """Test that facets accept the list filters."""
+        test_client, _ = memory_client
+
+        response = test_client.get("/tasks/facets", params={"status": "A Fazer"})
+
+        assert response.json()["month"] == {"2026-03": 1}
+
+    def test_facets_etag_follows_revision(self, memory_client):
+        """Test conditional requests keyed by the storage revision."""
+        test_client, repo = memory_client
+        etag = test_client.get("/tasks/facets").headers["ETag"]
+
+        cached = test_client.get("/tasks/facets", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+        repo.delete_task("t1")
+        fresh = test_client.get("/tasks/facets", headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.headers["ETag"] != etag
+
+    def test_list_tasks_with_filters(self, memory_client):
+        """Test that GET /tasks applies the same filters."""
+        test_client, _ = memory_client
+
+        response = test_client.get(
+            "/tasks", params={"priority": "Alta", "fields": "id"}
+        )
+
+        assert response.json() == [{"id": "t2"}]
+        response = test_client.get("/tasks", params={"from": "2026-04-01"})
+        assert [t["id"] for t in response.json()] == ["t2"]
+
+
+class TestMsgpackTasks:
+    """Tests for Accept: application/msgpack on GET /tasks."""
+
+    @pytest.fixture
+    def memory_client(self):
+        """Create test client backed by the in-memory repository."""
+        repo = MemoryRepository()
+        repo.add_task(
+            Task(
+                id="t1",
+                title="Write chapter",
+                description="",
+                deadline=date(2026, 3, 10),
+                priority=TaskPriority.HIGH,
+                category="Escrita",
+                created_at=datetime(2026, 1, 1, 9, 30),
+            )
+        )
+        app.dependency_overrides[tasks.get_db] = lambda: repo
+
+        with TestClient(app) as test_client:
+            yield test_client
+
+        app.dependency_overrides.clear()
+
+    def test_list_tasks_msgpack(self, memory_client):
+        """Test that the binary format decodes to the same tasks."""
+        response = memory_client.get(
+            "/tasks", headers={"Accept": "application/msgpack"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/msgpack"
+        rows = decode_columns(response.content)
+        assert rows[0]["id"] == "t1"
+        assert rows[0]["deadline"] == date(2026, 3, 10)
+        assert rows[0]["priority"] == TaskPriority.HIGH
+        assert rows[0]["created_at"] == datetime(2026, 1, 1, 9, 30)
+        assert rows[0]["completed_at"] is None
+
+    def test_list_tasks_msgpack_with_fields(self, memory_client):
+        """Test that sparse fieldsets select the encoded columns."""
+        response = memory_client.get(
+            "/tasks",
+            params={"fields": "id,status", "category": "escrita"},
+            headers={"Accept": "application/msgpack, application/json;q=0.5"},
+        )
+
+        assert decode_columns(response.content) == [
+            {"id": "t1", "status": TaskStatus.TODO}
+        ]
+
+    def test_json_remains_default(self, memory_client):
+        """Test that other Accept headers still get JSON."""
+        response = memory_client.get("/tasks", headers={"Accept": "*/*"})
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()[0]["status"] == "A Fazer"
+
+
+class TestTaskHistory:
+    """Tests for GET /tasks/{id}/history."""
+
+    @pytest.fixture
+    def sqlite_client(self, tmp_path):
+        """Create test client backed by a real SQLite database."""
+        db = Database(data_dir=str(tmp_path))
+        app.dependency_overrides[tasks.get_db] = lambda: db
+
+        with TestClient(app) as test_client:
+            yield test_client, db
+
+        app.dependency_overrides.clear()
+
+    def test_history_of_completed_and_deleted_task(self, sqlite_client):
+        """Test that creation, completion and deletion are listed in order."""
+        test_client, db = sqlite_client
+        task_id = test_client.post(
+            "/tasks",
+            json={"title": "Draft", "description": "", "deadline": "2026-03-10"},
+        ).json()["id"]
+        test_client.patch(f"/tasks/{task_id}", json={"status": "Concluída"})
+        test_client.delete(f"/tasks/{task_id}")
+
+        response = test_client.get(f"/tasks/{task_id}/history")
+
+        assert response.status_code == 200
+        events = response.json()
+        assert [e["kind"] for e in events] == ["created", "completed", "deleted"]
+        assert events[0]["before"] is None
+        assert events[0]["after"]["title"] == "Draft"
+        assert events[1]["after"]["status"] == "Concluída"
+        assert events[2]["after"] is None
+
+    def test_history_shows_undo(self, sqlite_client):
+        """Test that undo is recorded and points at the reverted event."""
+        test_client, db = sqlite_client
+        task_id = test_client.post(
+            "/tasks",
+            json={"title": "Draft", "description": "", "deadline": "2026-03-10"},
+        ).json()["id"]
+        test_client.delete(f"/tasks/{task_id}")
+        db.undo()
+
+        events = test_client.get(f"/tasks/{task_id}/history").json()
+
+        assert events[-1]["kind"] == "undone"
+        assert events[-1]["ref"] == events[-2]["seq"]
+        assert test_client.get(f"/tasks/{task_id}").status_code == 200
+
+    def test_history_not_found(self, sqlite_client):
+        """Test 404 for an unknown task."""
+        test_client, _ = sqlite_client
+
+        assert test_client.get("/tasks/nope/history").status_code == 404
+
+    def test_history_requires_sqlite(self):
+        """Test 501 with the in-memory backend."""
+        app.dependency_overrides[tasks.get_db] = MemoryRepository
+
+        with TestClient(app) as test_client:
+            response = test_client.get("/tasks/any/history")
+
+        app.dependency_overrides.clear()
+        assert response.status_code == 501
+
+
+class TestStatusDurations:
+    """Tests for GET /tasks/stalled and GET /tasks/{id}/time-in-status."""
+
+    @pytest.fixture
+    def sqlite_client(self, tmp_path):
+        """Create test client backed by a real SQLite database."""
+        db = Database(data_dir=str(tmp_path))
+        app.dependency_overrides[tasks.get_db] = lambda: db
+
+        with TestClient(app) as test_client:
+            yield test_client, db
+
+        app.dependency_overrides.clear()
+
+    def _add(self, db, task_id, status, days_ago):
+        db.add_task(
+            Task(
+                id=task_id,
+                title=task_id,
+                description="",
+                deadline=date(2026, 3, 10),
+                status=status,
+                created_at=datetime.now() - timedelta(days=days_ago),
+            )
+        )
+
+    def test_stalled_defaults_to_in_progress_and_blocked(self, sqlite_client):
+        """Test that only long-running in-progress/blocked tasks are listed."""
+        test_client, db = sqlite_client
+        self._add(db, "old", TaskStatus.BLOCKED, 30)
+        self._add(db, "recent", TaskStatus.IN_PROGRESS, 3)
+        self._add(db, "todo", TaskStatus.TODO, 60)
+
+        response = test_client.get("/tasks/stalled", params={"days": 7})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["task"]["id"] for item in body] == ["old"]
+        assert body[0]["days"] == 30
+
+    def test_stalled_with_status_filter(self, sqlite_client):
+        """Test repeated status parameters."""
+        test_client, db = sqlite_client
+        self._add(db, "todo", TaskStatus.TODO, 60)
+
+        response = test_client.get(
+            "/tasks/stalled", params={"days": 7, "status": ["A Fazer"]}
+        )
+
+        assert [item["task"]["id"] for item in response.json()] == ["todo"]
+
+    def test_time_in_status(self, sqlite_client):
+        """Test days per status, including the current one."""
+        test_client, db = sqlite_client
+        self._add(db, "t1", TaskStatus.TODO, 4)
+        test_client.patch("/tasks/t1", json={"status": "Em Progresso"})
+
+        response = test_client.get("/tasks/t1/time-in-status")
+
+        assert response.status_code == 200
+        days = response.json()["days"]
+        assert days["A Fazer"] == pytest.approx(4, abs=0.01)
+        assert days["Em Progresso"] == pytest.approx(0, abs=0.01)
+
+    def test_time_in_status_not_found(self, sqlite_client):
+        """Test 404 for an unknown task."""
+        test_client, _ = sqlite_client
+
+        assert test_client.get("/tasks/nope/time-in-status").status_code == 404
+
+    def test_requires_sqlite(self):
+        """Test 501 with the in-memory backend."""
+        app.dependency_overrides[tasks.get_db] = MemoryRepository
+
+        with TestClient(app) as test_client:
+            stalled = test_client.get("/tasks/stalled")
+            durations = test_client.get("/tasks/any/time-in-status")
+
+        app.dependency_overrides.clear()
+        assert stalled.status_code == 501
+        assert durations.status_code == 501
+
+
+class TestNextTasks:
+    """Tests for GET /tasks/next."""
+
+    @pytest.fixture
+    def memory_client(self):
+        """Create test client backed by an in-memory repository."""
+        repo = MemoryRepository()
+        today = date.today()
+        for task_id, days, priority, status in [
+            ("urgent", 1, TaskPriority.MEDIUM, TaskStatus.TODO),
+            ("important", 90, TaskPriority.CRITICAL, TaskStatus.TODO),
+            ("blocked", 1, TaskPriority.HIGH, TaskStatus.BLOCKED),
+            ("done", 0, TaskPriority.CRITICAL, TaskStatus.COMPLETED),
+        ]:
+            repo.add_task(
+                Task(
+                    id=task_id,
+                    title=task_id,
+                    description="",
+                    deadline=today + timedelta(days=days),
+                    status=status,
+                    priority=priority,
+                )
+            )
+        app.dependency_overrides[tasks.get_db] = lambda: repo
+
+        with TestClient(app) as test_client:
+            yield test_client
+
+        app.dependency_overrides.clear()
+
+    def test_next_tasks(self, memory_client):
+        """Test the default ranking and the score breakdown."""
+        response = memory_client.get("/tasks/next", params={"k": 2})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["task"]["id"] for item in body] == ["urgent", "important"]
+        assert set(body[0]["parts"]) == {"priority", "deadline", "age", "status"}
+        assert body[0]["score"] == pytest.approx(sum(body[0]["parts"].values()))
+
+    def test_custom_weights(self, memory_client):
+        """Test that weights change the ranking."""
+        body = memory_client.get(
+            "/tasks/next",
+            params={"k": 1, "blocked_weight": 0, "priority_weight": 20},
+        ).json()
+
+        assert body[0]["task"]["id"] == "important"
+
+    def test_invalid_k(self, memory_client):
+        """Test validation of k."""
+        response = memory_client.get("/tasks/next", params={"k": 0})
+
+        assert response.status_code == 422
+
+
+class TestDependencies:
+    """Tests for task dependencies, blockers and the critical path."""
+
+    @pytest.fixture
+    def repo_client(self, backend):
+        """Create a test client over a chain draft → review, plus a loose task."""
+        repo = backend
+        today = date.today()
+        for task_id, days, effort in [
+            ("draft", 2, 6),
+            ("review", 3, 6),
+            ("loose", 30, None),
+        ]:
+            repo.add_task(
+                Task(
+                    id=task_id,
+                    title=task_id,
+                    description="",
+                    deadline=today + timedelta(days=days),
+                    status=TaskStatus.TODO,
+                    priority=TaskPriority.HIGH,
+                    effort_hours=effort,
+                )
+            )
+        app.dependency_overrides[tasks.get_db] = lambda: repo
+
+        with TestClient(app) as test_client:
+            yield test_client, repo
+
+        app.dependency_overrides.clear()
+
+    def test_add_dependency_blocks_task(self, repo_client):
+        """Test that a task with an open prerequisite becomes BLOCKED."""
+        client, repo = repo_client
+
+        response = client.post(
+            "/tasks/review/dependencies", json={"depends_on": "draft"}
+        )
+
+        assert response.status_code == 201
+        body = response.json()
+        assert body["dependencies"] == ["draft"]
+        assert [b["task"]["id"] for b in body["blockers"]] == ["draft"]
+        # One 6h day each: draft ends today, review tomorrow; deadlines allow +1
+        assert (
+            body["schedule"]["earliest_finish"]
+            == (date.today() + timedelta(days=1)).isoformat()
+        )
+        assert body["schedule"]["slack"] == 2
+        assert repo.get_task("review").status == TaskStatus.BLOCKED
+
+    def test_completing_prerequisite_unblocks(self, repo_client):
+        """Test that completing the last prerequisite moves the task back to TODO."""
+        client, repo = repo_client
+        client.post("/tasks/review/dependencies", json={"depends_on": "draft"})
+
+        client.patch("/tasks/draft", json={"status": "Concluída"})
+
+        assert repo.get_task("review").status == TaskStatus.TODO
+        body = client.get("/tasks/review/blockers").json()
+        assert body["dependencies"] == ["draft"]
+        assert body["blockers"] == []
+
+    def test_patch_cannot_unblock_with_open_prerequisite(self, repo_client):
+        """Test that moving a task out of BLOCKED is undone while it still waits."""
+        client, repo = repo_client
+        client.post("/tasks/review/dependencies", json={"depends_on": "draft"})
+
+        response = client.patch("/tasks/review", json={"status": "Em Progresso"})
+        manual = client.patch("/tasks/loose", json={"status": "Bloqueada"})
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "Bloqueada"
+        assert repo.get_task("review").status == TaskStatus.BLOCKED
+        # Without prerequisites, a manual BLOCKED is left alone
+        assert manual.json()["status"] == "Bloqueada"
+
+    def test_remove_dependency_unblocks(self, repo_client):
+        """Test removing a dependency."""
+        client, repo = repo_client
+        client.post("/tasks/review/dependencies", json={"depends_on": "draft"})
+
+        response = client.delete("/tasks/review/dependencies/draft")
+
+        assert response.status_code == 204
+        assert repo.get_task("review").status == TaskStatus.TODO
+        missing = client.delete("/tasks/review/dependencies/draft")
+        assert missing.status_code == 404
+
+    def test_cycle_is_rejected(self, repo_client):
+        """Test that a dependency closing a cycle returns 409."""
+        client, _ = repo_client
+        client.post("/tasks/review/dependencies", json={"depends_on": "draft"})
+
+        response = client.post(
+            "/tasks/draft/dependencies", json={"depends_on": "review"}
+        )
+
+        assert response.status_code == 409
+        assert "cycle" in response.json()["detail"]
+
+    def test_unknown_tasks(self, repo_client):
+        """Test 404 for unknown tasks and prerequisites."""
+        client, _ = repo_client
+
+        assert client.get("/tasks/nope/blockers").status_code == 404
+        response = client.post("/tasks/review/dependencies", json={"depends_on": "x"})
+        assert response.status_code == 404
+        response = client.post("/tasks/nope/dependencies", json={"depends_on": "x"})
+        assert response.status_code == 404
+
+    def test_critical_path(self, repo_client):
+        """Test that the critical path follows the tightest chain."""
+        client, _ = repo_client
+        client.post("/tasks/review/dependencies", json={"depends_on": "draft"})
+
+        response = client.get("/tasks/critical-path", params={"hours": 3})
+
+        assert response.status_code == 200
+        body = response.json()
+        # Two 3h days each: draft ends tomorrow, review in 3 days (its deadline)
+        assert [item["task"]["id"] for item in body] == ["draft", "review"]
+        assert [item["slack"] for item in body] == [0, 0]
+        assert all(item["critical"] for item in body)
+
+    def test_deleting_prerequisite_unblocks(self, repo_client):
+        """Test that deleting a prerequisite frees its dependents."""
+        client, repo = repo_client
+        client.post("/tasks/review/dependencies", json={"depends_on": "draft"})
+
+        client.delete("/tasks/draft")
+
+        assert repo.get_task("review").status == TaskStatus.TODO
+        assert repo.dependency_edges() == []
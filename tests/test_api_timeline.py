@@ -0,0 +1,105 @@
+"""
+Tests for Timeline API endpoint.
+"""
+
+from datetime import date, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from phd_progress_tracker.api.main import app
+from phd_progress_tracker.api.routes import timeline
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task
+
+
+@pytest.fixture
+def client(backend):
+    """Create test client backed by each storage backend."""
+    repo = backend
+    for task_id, created, deadline in [
+        ("t1", datetime(2025, 11, 1), date(2026, 4, 1)),
+        ("t2", datetime(2026, 1, 5), date(2026, 1, 8)),
+        ("t3", datetime(2026, 1, 6), date(2026, 1, 20)),
+        ("t4", datetime(2024, 1, 1), date(2024, 2, 1)),
+    ]:
+        repo.add_task(
+            Task(
+                id=task_id,
+                title=task_id.upper(),
+                description="",
+                deadline=deadline,
+                created_at=created,
+            )
+        )
+    repo.add_milestone(
+        Milestone(
+            id="m1", title="Defense", description="", target_date=date(2026, 1, 15)
+        )
+    )
+    app.dependency_overrides[timeline.get_db] = lambda: repo
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+class TestTimeline:
+    """Tests for GET /timeline endpoint."""
+
+    def test_clipped_bars_with_lanes(self, client):
+        """Test that only intersecting tasks are returned, clipped, with lanes."""
+        response = client.get(
+            "/timeline", params={"from": "2026-01-01", "to": "2026-01-31"}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["resolution"] == "day"
+        assert body["lanes"] == 3
+        assert [bar["id"] for bar in body["bars"]] == ["t1", "t2", "t3"]
+        assert body["bars"][0] == {
+            "id": "t1",
+            "title": "T1",
+            "status": "A Fazer",
+            "category": "Geral",
+            "start": "2026-01-01",
+            "end": "2026-01-31",
+            "lane": 0,
+            "clipped_start": True,
+            "clipped_end": True,
+        }
+        assert [m["id"] for m in body["milestones"]] == ["m1"]
+
+    def test_summary_bars_when_zoomed_out(self, client):
+        """Test that short tasks become summary bars at month resolution."""
+        body = client.get(
+            "/timeline",
+            params={"from": "2026-01-01", "to": "2026-12-31", "resolution": "month"},
+        ).json()
+
+        assert [bar["id"] for bar in body["bars"]] == ["t1"]
+        assert body["summaries"] == [
+            {
+                "start": "2026-01-01",
+                "end": "2026-01-31",
+                "count": 2,
+                "completed": 0,
+                "by_category": {"Geral": 2},
+            }
+        ]
+
+    def test_invalid_window(self, client):
+        """Test 400 when from is after to."""
+        response = client.get(
+            "/timeline", params={"from": "2026-02-01", "to": "2026-01-01"}
+        )
+
+        assert response.status_code == 400
+
+    def test_missing_window(self, client):
+        """Test that from and to are required."""
+        response = client.get("/timeline")
+
+        assert response.status_code == 422
@@ -0,0 +1,125 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from phd_progress_tracker.utils.burndown import (
+    bucket_start,
+    burndown_from_tasks,
+    burndown_report,
+    choose_granularity,
+    count_buckets,
+    shift_bucket,
+)
+from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
+
+
+@pytest.fixture
+def tasks(task_factory):
+    """Tarefas criadas e concluídas em março de 2026 (e uma antes)."""
+    return [
+        task_factory("old", datetime(2026, 2, 1), datetime(2026, 2, 10)),
+        task_factory("a", datetime(2026, 3, 2, 9), datetime(2026, 3, 3, 18)),
+        task_factory("b", datetime(2026, 3, 2, 10), datetime(2026, 3, 5, 8)),
+        task_factory("c", datetime(2026, 3, 3, 11)),
+        task_factory("d", datetime(2026, 3, 4, 12), datetime(2026, 3, 20)),
+    ]
+
+
+@pytest.fixture
+def repo(backend, tasks):
+    """Os dois backends com as mesmas tarefas."""
+    backend.save_tasks(tasks)
+    return backend
+
+
+def test_bucket_helpers():
+    """Verifica início, deslocamento e contagem de períodos."""
+    assert bucket_start(date(2026, 3, 5), "week") == date(2026, 3, 2)
+    assert bucket_start(date(2026, 3, 5), "month") == date(2026, 3, 1)
+    assert shift_bucket(date(2026, 1, 1), "month", -2) == date(2025, 11, 1)
+    assert count_buckets(date(2026, 3, 1), date(2026, 3, 31), "week") == 6
+    assert count_buckets(date(2025, 12, 15), date(2026, 2, 1), "month") == 3
+
+
+def test_long_ranges_are_downsampled():
+    """Verifica a troca automática de granularidade."""
+    assert choose_granularity(date(2026, 1, 1), date(2026, 3, 1)) == "day"
+    assert choose_granularity(date(2026, 1, 1), date(2027, 1, 1)) == "week"
+    assert choose_granularity(date(2020, 1, 1), date(2026, 1, 1)) == "month"
+    assert choose_granularity(date(2026, 1, 1), date(2026, 3, 1), "week") == "week"
+
+
+def test_daily_series(repo):
+    """Verifica contagens, acumulados (com o que veio antes) e velocidade."""
+    series = burndown_report(repo, date(2026, 3, 2), date(2026, 3, 5), "day", window=2)
+
+    assert series.granularity == "day"
+    assert [(p.created, p.completed) for p in series.points] == [
+        (2, 0),
+        (1, 1),
+        (1, 0),
+        (0, 1),
+    ]
+    assert [(p.total, p.done, p.open) for p in series.points] == [
+        (3, 1, 2),
+        (4, 2, 2),
+        (5, 2, 3),
+        (5, 3, 2),
+    ]
+    assert [p.velocity for p in series.points] == [0.0, 0.5, 0.5, 0.5]
+
+
+def test_velocity_window_reaches_before_start(repo):
+    """Verifica que a média do primeiro ponto já usa a janela inteira."""
+    series = burndown_report(repo, date(2026, 3, 6), date(2026, 3, 6), window=4)
+
+    assert series.points[0].velocity == 0.5
+
+
+def test_weekly_series(repo):
+    """Verifica a série por semana até o fim do mês."""
+    series = burndown_report(
+        repo, date(2026, 3, 1), date(2026, 3, 31), "week", window=1
+    )
+
+    assert series.points[0].start == date(2026, 2, 23)
+    assert [p.completed for p in series.points] == [0, 2, 0, 1, 0, 0]
+    assert series.points[-1].open == 1
+
+
+def test_sqlite_matches_python_reference(tmp_path, task_factory):
+    """Verifica que a consulta com funções de janela bate com a referência."""
+    rng = random.Random(3)
+    tasks = []
+    for i in range(400):
+        created = datetime(2025, 6, 1) + timedelta(minutes=rng.randrange(400 * 1440))
+        completed = (
+            created + timedelta(hours=rng.randrange(1, 2000))
+            if rng.random() < 0.7
+            else None
+        )
+        tasks.append(task_factory(f"t{i}", created, completed))
+    db = Database(data_dir=str(tmp_path))
+    db.save_tasks(tasks)
+
+    for start, end, granularity, window in [
+        (date(2025, 9, 1), date(2025, 10, 15), "day", 7),
+        (date(2025, 6, 3), date(2026, 5, 20), "week", 4),
+        (date(2025, 1, 1), date(2026, 12, 31), "month", 3),
+    ]:
+        assert db.burndown(start, end, granularity, window) == burndown_from_tasks(
+            tasks, start, end, granularity, window
+        )
+
+
+def test_invalid_arguments():
+    """Verifica a validação do período, da granularidade e da janela."""
+    repo = MemoryRepository()
+    with pytest.raises(ValueError):
+        burndown_report(repo, date(2026, 3, 2), date(2026, 3, 1))
+    with pytest.raises(ValueError):
+        burndown_report(repo, granularity="hour")
+    with pytest.raises(ValueError):
+        burndown_report(repo, window=0)
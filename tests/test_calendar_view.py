@@ -0,0 +1,91 @@
+from datetime import date
+
+import pytest
+
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task
+from phd_progress_tracker.utils.calendar_view import bucket_bounds, build_calendar
+from phd_progress_tracker.utils.database import Database
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Banco com tarefas e milestones espalhados em dois meses."""
+    db = Database(data_dir=str(tmp_path), db_path=":memory:")
+    for task_id, deadline in [
+        ("t1", date(2026, 3, 2)),
+        ("t2", date(2026, 3, 4)),
+        ("t3", date(2026, 3, 31)),
+        ("t4", date(2026, 5, 1)),
+    ]:
+        db.add_task(Task(id=task_id, title=task_id, description="", deadline=deadline))
+    db.add_milestone(
+        Milestone(
+            id="m1", title="Qualificação", description="", target_date=date(2026, 3, 4)
+        )
+    )
+    yield db
+    db.close()
+
+
+class TestBucketBounds:
+    """Testes dos limites de cada período."""
+
+    def test_day(self):
+        """Verifica que o período diário é o próprio dia."""
+        day = date(2026, 3, 4)
+        assert bucket_bounds(day, "day") == (day, day)
+
+    def test_week_starts_on_monday(self):
+        """Verifica semanas ISO, de segunda a domingo."""
+        assert bucket_bounds(date(2026, 3, 4), "week") == (
+            date(2026, 3, 2),
+            date(2026, 3, 8),
+        )
+
+    def test_month_handles_february(self):
+        """Verifica o último dia do mês, inclusive em ano bissexto."""
+        assert bucket_bounds(date(2028, 2, 10), "month") == (
+            date(2028, 2, 1),
+            date(2028, 2, 29),
+        )
+
+    def test_unknown_granularity(self):
+        """Verifica erro para granularidade desconhecida."""
+        with pytest.raises(ValueError):
+            bucket_bounds(date(2026, 3, 4), "year")
+
+
+class TestBuildCalendar:
+    """Testes do agrupamento de tarefas e milestones."""
+
+    def test_by_day_only_returns_non_empty(self, database):
+        """Verifica que só dias com itens aparecem, em ordem."""
+        buckets = build_calendar(database, date(2026, 3, 1), date(2026, 3, 31))
+
+        assert [b.start for b in buckets] == [
+            date(2026, 3, 2),
+            date(2026, 3, 4),
+            date(2026, 3, 31),
+        ]
+        assert [t.id for t in buckets[1].tasks] == ["t2"]
+        assert [m.id for m in buckets[1].milestones] == ["m1"]
+
+    def test_by_week(self, database):
+        """Verifica que tarefas da mesma semana caem no mesmo período."""
+        buckets = build_calendar(database, date(2026, 3, 1), date(2026, 3, 31), "week")
+
+        assert [t.id for t in buckets[0].tasks] == ["t1", "t2"]
+        assert buckets[0].end == date(2026, 3, 8)
+
+    def test_by_month_respects_window(self, database):
+        """Verifica que itens fora da janela são ignorados."""
+        buckets = build_calendar(database, date(2026, 3, 1), date(2026, 4, 30), "month")
+
+        assert len(buckets) == 1
+        assert [t.id for t in buckets[0].tasks] == ["t1", "t2", "t3"]
+
+    def test_invalid_window(self, database):
+        """Verifica erro quando o início é posterior ao fim."""
+        with pytest.raises(ValueError):
+            build_calendar(database, date(2026, 4, 1), date(2026, 3, 1))
@@ -1,4 +1,4 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 
 import pytest
 from typer.testing import CliRunner
@@ -6,7 +6,10 @@ from typer.testing import CliRunner
 from phd_progress_tracker.cli import commands
 from phd_progress_tracker.models.task import Task, TaskStatus, TaskPriority
 from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.config import Settings
+from phd_progress_tracker.utils import forecast
 from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.snapshot import Snapshot
 
 
 @pytest.fixture
@@ -122,6 +125,27 @@ class TestAddCommand:
         tasks = db_module.load_tasks()
         assert tasks[0].priority == TaskPriority.HIGH
 
+    def test_add_task_with_effort(self, runner, db_module):
+        """Verifica adição com esforço estimado (que precisa ser positivo)."""
+        result = runner.invoke(
+            commands.app,
+            ["add", "Tarefa Estimada", "--deadline", "+7d", "--effort", "6.5"],
+        )
+        invalid = runner.invoke(
+            commands.app,
+            ["add", "Tarefa Inválida", "--deadline", "+7d", "-e", "0"],
+        )
+        huge = runner.invoke(
+            commands.app,
+            ["add", "Tarefa Enorme", "--deadline", "+7d", "-e", "10000000"],
+        )
+
+        assert result.exit_code == 0
+        assert invalid.exit_code == 1
+        assert huge.exit_code == 1
+        tasks = db_module.load_tasks()
+        assert [t.effort_hours for t in tasks] == [6.5]
+
     def test_add_task_invalid_priority(self, runner, db_module):
         """Verifica erro com prioridade inválida."""
         result = runner.invoke(
@@ -203,6 +227,14 @@ class TestEditCommand:
         assert result.exit_code == 0
         assert "atualizada com sucesso" in result.stdout
 
+    def test_edit_task_effort(self, runner, db_module, saved_task):
+        """Verifica edição do esforço estimado."""
+        result = runner.invoke(commands.app, ["edit", saved_task.id, "-e", "3"])
+
+        assert result.exit_code == 0
+        assert "esforço" in result.stdout
+        assert db_module.get_task(saved_task.id).effort_hours == 3
+
     def test_edit_task_not_found(self, runner, db_module):
         """Verifica erro ao editar tarefa inexistente."""
         result = runner.invoke(
@@ -274,6 +306,34 @@ class TestDashboardCommand:
         assert result.exit_code == 0
         assert "Tarefa Teste" in result.stdout
 
+    def test_dashboard_crunch_warning(self, runner, db_module):
+        """Verifica o aviso de sobrecarga quando prazos críticos se acumulam."""
+        for task_id in ("artigo", "relatorio"):
+            db_module.add_task(
+                Task(
+                    id=task_id,
+                    title=f"Entregar {task_id}",
+                    description="",
+                    deadline=date.today() + timedelta(days=3),
+                    priority=TaskPriority.CRITICAL,
+                    effort_hours=16,
+                )
+            )
+
+        result = runner.invoke(commands.app, ["dashboard"])
+
+        assert result.exit_code == 0
+        assert "Sobrecarga à vista" in result.stdout
+        assert "2 tarefa(s)" in result.stdout
+        assert "8.0h/dia" in result.stdout
+
+    def test_dashboard_without_crunch(self, runner, saved_task):
+        """Verifica que o aviso só aparece quando há sobrecarga."""
+        result = runner.invoke(commands.app, ["dashboard"])
+
+        assert result.exit_code == 0
+        assert "Sobrecarga" not in result.stdout
+
     def test_dashboard_with_milestones(self, runner, saved_task, saved_milestone):
         """Verifica dashboard com milestones."""
         result = runner.invoke(commands.app, ["dashboard"])
@@ -281,6 +341,24 @@ class TestDashboardCommand:
         assert result.exit_code == 0
         assert "Marcos Importantes" in result.stdout
 
+    def test_dashboard_as_of(self, runner, saved_task):
+        """Verifica dashboard com data de referência."""
+        as_of = saved_task.deadline - timedelta(days=1)
+
+        result = runner.invoke(
+            commands.app, ["dashboard", "--as-of", as_of.isoformat()]
+        )
+
+        assert result.exit_code == 0
+        assert as_of.strftime("%d/%m/%Y") in result.stdout
+        assert "Amanhã" in result.stdout
+
+    def test_dashboard_invalid_as_of(self, runner, db_module):
+        """Verifica erro com data de referência inválida."""
+        result = runner.invoke(commands.app, ["dashboard", "--as-of", "data-invalida"])
+
+        assert result.exit_code == 1
+
 
 class TestMilestoneAddCommand:
     """Testes para o comando 'milestone-add'."""
@@ -313,3 +391,561 @@ class TestMilestoneAddCommand:
         )
 
         assert result.exit_code == 1
+
+
+class TestMigrateIdsCommand:
+    """Testes para o comando 'migrate-ids'."""
+
+    def test_migrate_ids(self, runner, db_module, saved_task):
+        """Verifica migração e que o ID antigo continua funcionando."""
+        result = runner.invoke(commands.app, ["migrate-ids"])
+
+        assert result.exit_code == 0
+        assert "1 IDs migrados" in result.stdout
+
+        result = runner.invoke(commands.app, ["complete", saved_task.id])
+        assert result.exit_code == 0
+        assert db_module.get_task(saved_task.id).status == TaskStatus.COMPLETED
+
+    def test_migrate_ids_nothing_to_do(self, runner, db_module):
+        """Verifica mensagem quando não há IDs antigos."""
+        runner.invoke(commands.app, ["add", "Nova", "--deadline", "+3d"])
+
+        result = runner.invoke(commands.app, ["migrate-ids"])
+
+        assert result.exit_code == 0
+        assert "já estão no formato novo" in result.stdout
+
+
+class TestStatsCommand:
+    """Testes para o comando 'stats'."""
+
+    def test_stats_by_category(self, runner, db_module, saved_task):
+        """Verifica contagem por categoria (padrão)."""
+        result = runner.invoke(commands.app, ["stats"])
+
+        assert result.exit_code == 0
+        assert "Tarefas por Categoria" in result.stdout
+        assert "Teste" in result.stdout
+        assert "100.0%" in result.stdout
+
+    def test_stats_by_status_uses_labels(self, runner, db_module, saved_task):
+        """Verifica que status aparecem com o nome exibido ao usuário."""
+        result = runner.invoke(commands.app, ["stats", "--by", "status"])
+
+        assert result.exit_code == 0
+        assert "A Fazer" in result.stdout
+
+    def test_stats_empty(self, runner, db_module):
+        """Verifica mensagem sem tarefas."""
+        result = runner.invoke(commands.app, ["stats", "--by", "month"])
+
+        assert result.exit_code == 0
+        assert "Nenhuma tarefa encontrada" in result.stdout
+
+    def test_stats_invalid_facet(self, runner, db_module):
+        """Verifica erro com agrupamento inválido."""
+        result = runner.invoke(commands.app, ["stats", "--by", "cor"])
+
+        assert result.exit_code == 1
+
+
+class TestSnapshotCommand:
+    """Testes para o comando 'snapshot build'."""
+
+    def test_snapshot_build(self, runner, db_module, saved_task, tmp_path):
+        """Verifica que o snapshot é gravado e pode ser lido."""
+        path = str(tmp_path / "out.phds")
+
+        result = runner.invoke(commands.app, ["snapshot", "build", "--output", path])
+
+        assert result.exit_code == 0
+        assert "Snapshot gravado" in result.stdout
+        with Snapshot(path) as snap:
+            assert snap.task_count == 1
+            assert snap.strings("task.id")[0] == saved_task.id
+
+    def test_snapshot_build_default_path(
+        self, runner, db_module, monkeypatch, tmp_path
+    ):
+        """Verifica o caminho padrão no diretório de dados."""
+        monkeypatch.setattr(commands, "settings", Settings(data_dir=str(tmp_path)))
+
+        result = runner.invoke(commands.app, ["snapshot", "build"])
+
+        assert result.exit_code == 0
+        assert (tmp_path / "snapshot.phds").exists()
+
+
+class TestTenantCommand:
+    """Testes para o comando 'tenant create'."""
+
+    def test_create_tenant(self, runner, monkeypatch, tmp_path):
+        """Verifica o provisionamento e a repetição do mesmo tenant."""
+        monkeypatch.setattr(commands, "settings", Settings(data_dir=str(tmp_path)))
+
+        created = runner.invoke(commands.app, ["tenant", "create", "alice"])
+        again = runner.invoke(commands.app, ["tenant", "create", "alice"])
+        invalid = runner.invoke(commands.app, ["tenant", "create", "../x"])
+
+        assert created.exit_code == 0
+        assert (tmp_path / "tenants" / "alice" / "phd_tracker.db").exists()
+        assert "já existe" in again.stdout
+        assert invalid.exit_code == 1
+
+
+class TestUndoRedoCommands:
+    """Testes para os comandos 'undo' e 'redo'."""
+
+    def test_undo_complete(self, runner, db_module):
+        """Verifica que 'undo' reabre uma tarefa concluída e 'redo' a conclui de novo."""
+        db_module.add_task(
+            Task(
+                id="t1",
+                title="Escrever",
+                description="",
+                deadline=date.today(),
+            )
+        )
+        runner.invoke(commands.app, ["complete", "t1"])
+
+        result = runner.invoke(commands.app, ["undo"])
+
+        assert result.exit_code == 0
+        assert "Desfeita: conclusão da tarefa 'Escrever'" in result.stdout
+        assert db_module.get_task("t1").status == TaskStatus.TODO
+
+        result = runner.invoke(commands.app, ["redo"])
+
+        assert "Refeita: conclusão" in result.stdout
+        assert db_module.get_task("t1").status == TaskStatus.COMPLETED
+
+    def test_nothing_to_undo(self, runner, db_module):
+        """Verifica mensagem sem histórico."""
+        result = runner.invoke(commands.app, ["undo"])
+
+        assert result.exit_code == 0
+        assert "Nada para desfazer" in result.stdout
+
+
+class TestStalledCommand:
+    """Testes para o comando 'stalled'."""
+
+    def test_lists_stalled_tasks(self, runner, db_module, sample_task_data):
+        """Verifica a tabela de tarefas paradas."""
+        sample_task_data["status"] = TaskStatus.BLOCKED
+        sample_task_data["created_at"] = datetime.now() - timedelta(days=20)
+        db_module.add_task(Task(**sample_task_data))
+
+        result = runner.invoke(commands.app, ["stalled", "--days", "14"])
+
+        assert result.exit_code == 0
+        assert "Tarefa Teste" in result.stdout
+        assert "20" in result.stdout
+
+    def test_no_stalled_tasks(self, runner, saved_task):
+        """Verifica mensagem quando nada está parado."""
+        result = runner.invoke(commands.app, ["stalled", "--status", "todo"])
+
+        assert result.exit_code == 0
+        assert "Nenhuma tarefa parada" in result.stdout
+
+    def test_invalid_status(self, runner, db_module):
+        """Verifica erro com status inválido."""
+        result = runner.invoke(commands.app, ["stalled", "--status", "PAUSED"])
+
+        assert result.exit_code == 1
+        assert "status inválido" in result.stdout
+
+
+class TestCycleTimeCommand:
+    """Testes para o comando 'stats cycle-time'."""
+
+    def test_shows_percentiles_and_throughput(self, runner, db_module):
+        """Verifica as tabelas de tempo de ciclo e de vazão."""
+        created = datetime(2026, 3, 2, 9, 0)
+        for i in range(3):
+            db_module.add_task(
+                Task(
+                    id=f"t{i}",
+                    title=f"Tarefa {i}",
+                    description="",
+                    deadline=date(2026, 4, 1),
+                    status=TaskStatus.COMPLETED,
+                    category="Escrita",
+                    created_at=created,
+                    completed_at=created + timedelta(days=i + 1),
+                )
+            )
+
+        result = runner.invoke(commands.app, ["stats", "cycle-time"])
+
+        assert result.exit_code == 0
+        assert "Tempo de ciclo" in result.stdout
+        assert "Escrita" in result.stdout
+        assert "02/03/2026" in result.stdout
+
+    def test_no_completed_tasks(self, runner, saved_task):
+        """Verifica mensagem sem tarefas concluídas."""
+        result = runner.invoke(commands.app, ["stats", "cycle-time"])
+
+        assert result.exit_code == 0
+        assert "Nenhuma tarefa concluída" in result.stdout
+
+    def test_invalid_period(self, runner, db_module):
+        """Verifica erro com período invertido."""
+        result = runner.invoke(
+            commands.app,
+            ["stats", "cycle-time", "--from", "2026-03-10", "--to", "2026-03-01"],
+        )
+
+        assert result.exit_code == 1
+
+
+class TestBurndownCommand:
+    """Testes para o comando 'stats burndown'."""
+
+    def test_weekly_chart(self, runner, db_module):
+        """Verifica o gráfico por semana."""
+        created = datetime(2026, 3, 2, 9, 0)
+        for i in range(3):
+            db_module.add_task(
+                Task(
+                    id=f"t{i}",
+                    title=f"Tarefa {i}",
+                    description="",
+                    deadline=date(2026, 4, 1),
+                    status=TaskStatus.COMPLETED if i else TaskStatus.TODO,
+                    created_at=created,
+                    completed_at=created + timedelta(days=7 * i) if i else None,
+                )
+            )
+
+        result = runner.invoke(
+            commands.app,
+            [
+                "stats",
+                "burndown",
+                "--from",
+                "2026-03-01",
+                "--to",
+                "2026-03-31",
+                "-g",
+                "week",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Burndown por semana" in result.stdout
+        assert "09/03/2026" in result.stdout
+        assert "█" in result.stdout
+
+    def test_invalid_granularity(self, runner, db_module):
+        """Verifica erro com granularidade desconhecida."""
+        result = runner.invoke(commands.app, ["stats", "burndown", "-g", "hour"])
+
+        assert result.exit_code == 1
+        assert "Erro" in result.stdout
+
+
+class TestForecastCommand:
+    """Testes para o comando 'forecast'."""
+
+    def test_forecast(self, runner, db_module, saved_milestone):
+        """Verifica a chance e as datas com uma conclusão por dia."""
+        pytest.importorskip("numpy")
+        today = date.today()
+        for i in range(10):
+            done = datetime.combine(today - timedelta(days=i), datetime.min.time())
+            db_module.add_task(
+                Task(
+                    id=f"done{i}",
+                    title=f"Feita {i}",
+                    description="",
+                    deadline=today,
+                    status=TaskStatus.COMPLETED,
+                    created_at=done - timedelta(days=30),
+                    completed_at=done,
+                )
+            )
+        db_module.add_task(
+            Task(id="open", title="Aberta", description="", deadline=today)
+        )
+
+        result = runner.invoke(
+            commands.app,
+            [
+                "forecast",
+                "mile-001",
+                "-n",
+                "1000",
+                "--seed",
+                "4",
+                "-H",
+                "10",
+                "-j",
+                "1",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Qualificação" in result.stdout
+        assert "100.0%" in result.stdout
+        assert "semente 4" in result.stdout
+
+    def test_forecast_without_numpy(
+        self, runner, db_module, saved_milestone, monkeypatch
+    ):
+        """Verifica o aviso de instalação quando o NumPy não está disponível."""
+        monkeypatch.setattr(forecast, "HAS_NUMPY", False)
+
+        result = runner.invoke(commands.app, ["forecast", "mile-001"])
+
+        assert result.exit_code == 1
+        assert "--extras numpy" in result.stdout
+
+    def test_forecast_unknown_milestone(self, runner, db_module):
+        """Verifica erro com marco inexistente."""
+        result = runner.invoke(commands.app, ["forecast", "nao-existe"])
+
+        assert result.exit_code == 1
+        assert "não encontrado" in result.stdout
+
+
+class TestActivityCommand:
+    """Testes para o comando 'stats activity'."""
+
+    def test_heatmap(self, runner, db_module, saved_task):
+        """Verifica o painel do ano com o total da métrica."""
+        year = saved_task.created_at.year
+
+        result = runner.invoke(
+            commands.app, ["stats", "activity", "-y", str(year), "-m", "created"]
+        )
+
+        assert result.exit_code == 0
+        assert f"{year}: 1 criadas" in result.stdout
+        assert "■" in result.stdout
+
+    def test_invalid_metric(self, runner, db_module):
+        """Verifica erro com métrica desconhecida."""
+        result = runner.invoke(commands.app, ["stats", "activity", "-m", "x"])
+
+        assert result.exit_code == 1
+        assert "métrica inválida" in result.stdout
+
+
+class TestNextCommand:
+    """Testes para o comando 'next'."""
+
+    def test_next(self, runner, db_module):
+        """Verifica a tabela com as tarefas de maior pontuação."""
+        today = date.today()
+        for task_id, days in [("perto", 1), ("longe", 200)]:
+            db_module.add_task(
+                Task(
+                    id=task_id,
+                    title=f"Tarefa {task_id}",
+                    description="",
+                    deadline=today + timedelta(days=days),
+                )
+            )
+
+        result = runner.invoke(commands.app, ["next", "-k", "1"])
+
+        assert result.exit_code == 0
+        assert "Tarefa perto" in result.stdout
+        assert "Tarefa longe" not in result.stdout
+
+    def test_next_in_progress_weight(self, runner, db_module):
+        """Verifica que --in-progress-weight chega ao ranking."""
+        deadline = date.today() + timedelta(days=30)
+        db_module.add_task(
+            Task(
+                id="urgente",
+                title="Urgente",
+                description="",
+                deadline=deadline,
+                priority=TaskPriority.HIGH,
+            )
+        )
+        db_module.add_task(
+            Task(
+                id="andamento",
+                title="Andamento",
+                description="",
+                deadline=deadline,
+                status=TaskStatus.IN_PROGRESS,
+            )
+        )
+
+        default = runner.invoke(
+            commands.app, ["next", "-k", "1", "--in-progress-weight", "0"]
+        )
+        boosted = runner.invoke(
+            commands.app, ["next", "-k", "1", "--in-progress-weight", "10"]
+        )
+
+        assert default.exit_code == 0 and boosted.exit_code == 0
+        assert "Urgente" in default.stdout
+        assert "Andamento" in boosted.stdout
+        assert "Urgente" not in boosted.stdout
+
+    def test_next_without_open_tasks(self, runner, db_module):
+        """Verifica a mensagem sem tarefas abertas."""
+        result = runner.invoke(commands.app, ["next"])
+
+        assert result.exit_code == 0
+        assert "Nenhuma tarefa aberta" in result.stdout
+
+
+class TestPlanCommand:
+    """Testes para o comando 'plan'."""
+
+    def test_plan(self, runner, db_module):
+        """Verifica o plano por dia e o aviso de tarefas que passam do prazo."""
+        monday = date(2026, 3, 2)
+        for task_id, days, effort in [("rascunho", 1, 4), ("tese", 2, 20)]:
+            db_module.add_task(
+                Task(
+                    id=task_id,
+                    title=f"Tarefa {task_id}",
+                    description="",
+                    deadline=monday + timedelta(days=days),
+                    effort_hours=effort,
+                )
+            )
+
+        result = runner.invoke(
+            commands.app, ["plan", "--from", "2026-03-02", "-n", "3", "-H", "6"]
+        )
+
+        assert result.exit_code == 0
+        assert "Tarefa rascunho" in result.stdout
+        assert "4h" in result.stdout
+        assert "2h" in result.stdout
+        assert "terminam em 05/03/2026" in result.stdout
+        assert "1 tarefa(s) terminam depois do prazo" in result.stdout
+
+    def test_plan_without_open_tasks(self, runner, db_module):
+        """Verifica a mensagem sem tarefas abertas."""
+        result = runner.invoke(commands.app, ["plan"])
+
+        assert result.exit_code == 0
+        assert "Nenhuma tarefa aberta" in result.stdout
+
+    def test_plan_invalid_hours(self, runner, saved_task):
+        """Verifica erro com capacidade inválida."""
+        result = runner.invoke(commands.app, ["plan", "--hours", "0"])
+        tiny = runner.invoke(commands.app, ["plan", "--hours", "0.008"])
+
+        assert result.exit_code == 1
+        assert tiny.exit_code == 1
+
+    def test_plan_past_the_horizon(self, runner, db_module, saved_task):
+        """Verifica erro (e não travamento) quando o plano não tem fim."""
+        saved_task.effort_hours = 1e7
+        db_module.update_task(saved_task)
+
+        result = runner.invoke(commands.app, ["plan"])
+
+        assert result.exit_code == 1
+        assert "does not fit" in result.stdout
+
+
+class TestDependsCommand:
+    """Testes para o comando 'depends' e o desbloqueio automático."""
+
+    @pytest.fixture
+    def prerequisite(self, db_module, saved_task):
+        """Pré-requisito da tarefa salva, com prazo antes dela."""
+        task = Task(
+            id="pre-001",
+            title="Coletar dados",
+            description="",
+            deadline=date.today() + timedelta(days=3),
+        )
+        db_module.add_task(task)
+        return task
+
+    def test_depends_blocks_and_complete_unblocks(
+        self, runner, db_module, saved_task, prerequisite
+    ):
+        """Verifica o bloqueio ao adicionar o pré-requisito e o desbloqueio ao concluí-lo."""
+        result = runner.invoke(
+            commands.app, ["depends", saved_task.id, "--on", prerequisite.id]
+        )
+
+        assert result.exit_code == 0
+        assert "depende de pre-001" in result.stdout
+        assert "Bloqueada" in result.stdout
+        assert "Coletar dados" in result.stdout
+        assert "folga" in result.stdout
+        assert db_module.get_task(saved_task.id).status == TaskStatus.BLOCKED
+
+        result = runner.invoke(commands.app, ["complete", prerequisite.id])
+
+        assert "desbloqueada" in result.stdout
+        assert db_module.get_task(saved_task.id).status == TaskStatus.TODO
+
+    def test_undo_complete_blocks_again(
+        self, runner, db_module, saved_task, prerequisite
+    ):
+        """Verifica que desfazer a conclusão do pré-requisito rebloqueia a tarefa."""
+        runner.invoke(commands.app, ["depends", saved_task.id, "--on", prerequisite.id])
+        runner.invoke(commands.app, ["complete", prerequisite.id])
+
+        result = runner.invoke(commands.app, ["undo"])
+
+        assert result.exit_code == 0
+        assert "Coletar dados" in result.stdout
+        assert db_module.get_task(prerequisite.id).status == TaskStatus.TODO
+        assert db_module.get_task(saved_task.id).status == TaskStatus.BLOCKED
+
+        runner.invoke(commands.app, ["redo"])
+
+        assert db_module.get_task(prerequisite.id).status == TaskStatus.COMPLETED
+        assert db_module.get_task(saved_task.id).status == TaskStatus.TODO
+
+    def test_depends_remove(self, runner, db_module, saved_task, prerequisite):
+        """Verifica a remoção de uma dependência."""
+        db_module.add_dependency(saved_task.id, prerequisite.id)
+
+        result = runner.invoke(
+            commands.app, ["depends", saved_task.id, "-r", prerequisite.id]
+        )
+
+        assert result.exit_code == 0
+        assert "removida" in result.stdout
+        assert "não tem pré-requisitos" in result.stdout
+        assert db_module.dependency_edges() == []
+
+    def test_depends_rejects_cycle(self, runner, db_module, saved_task, prerequisite):
+        """Verifica erro ao fechar um ciclo."""
+        db_module.add_dependency(saved_task.id, prerequisite.id)
+
+        result = runner.invoke(
+            commands.app, ["depends", prerequisite.id, "--on", saved_task.id]
+        )
+
+        assert result.exit_code == 1
+        assert "cycle" in result.stdout
+
+    def test_critical_path(self, runner, db_module, saved_task, prerequisite):
+        """Verifica o caminho crítico sem tarefa informada."""
+        db_module.add_dependency(saved_task.id, prerequisite.id)
+
+        result = runner.invoke(commands.app, ["depends"])
+
+        assert result.exit_code == 0
+        assert "Caminho crítico" in result.stdout
+        # 2h de 6h por dia: prazo em 3 dias menos 1/3 de dia de trabalho
+        assert "pre-001" in result.stdout
+        assert "3.7d" in result.stdout
+
+    def test_depends_unknown_task(self, runner, db_module):
+        """Verifica erro com tarefa inexistente."""
+        result = runner.invoke(commands.app, ["depends", "nope", "--on", "x"])
+
+        assert result.exit_code == 1
+        assert "não encontrada" in result.stdout
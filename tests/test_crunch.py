@@ -0,0 +1,151 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils.crunch import (
+    crunch_report,
+    sweep_overloads,
+    task_window,
+)
+
+TODAY = date(2026, 3, 2)
+
+
+def _day(n):
+    return TODAY + timedelta(days=n)
+
+
+def _task(
+    task_id,
+    days,
+    effort=None,
+    priority=TaskPriority.HIGH,
+    status=TaskStatus.TODO,
+):
+    return Task(
+        id=task_id,
+        title=task_id,
+        description="",
+        deadline=_day(days),
+        status=status,
+        priority=priority,
+        created_at=datetime(2026, 2, 1, 9),
+        effort_hours=effort,
+    )
+
+
+@pytest.fixture
+def repo(backend):
+    """Os dois backends, vazios."""
+    return backend
+
+
+def test_task_window():
+    """A janela termina no prazo, não começa antes de hoje e atrasadas vencem hoje."""
+    assert task_window(_task("a", 10), TODAY, 7) == (_day(4), _day(10))
+    assert task_window(_task("b", 2), TODAY, 7) == (TODAY, _day(2))
+    assert task_window(_task("c", -5), TODAY, 7) == (TODAY, TODAY)
+
+
+def test_sweep_overloads():
+    """Soma as cargas das janelas e devolve só os trechos acima do limite."""
+    windows = [
+        (_day(0), _day(4), 3.0),
+        (_day(2), _day(6), 4.0),
+        (_day(5), _day(5), 1.0),
+        (_day(10), _day(12), 7.0),
+    ]
+
+    overloads = sweep_overloads(windows, 6.0)
+
+    assert overloads == [
+        (_day(2), _day(4), 7.0, 21.0, [0, 1]),
+        (_day(10), _day(12), 7.0, 21.0, [3]),
+    ]
+
+
+def test_sweep_matches_day_by_day_sum():
+    """Confere a varredura contra a soma ingênua, dia a dia."""
+    rng = random.Random(5)
+    windows = []
+    for _ in range(200):
+        start = _day(rng.randint(0, 60))
+        windows.append(
+            (start, start + timedelta(days=rng.randint(0, 10)), rng.random() * 3)
+        )
+    threshold = 8.0
+
+    overloads = sweep_overloads(windows, threshold)
+
+    loads = {}
+    for start, end, rate in windows:
+        for n in range((end - start).days + 1):
+            day = start + timedelta(days=n)
+            loads[day] = loads.get(day, 0.0) + rate
+    expected = sorted(day for day, load in loads.items() if load > threshold)
+    covered = [
+        start + timedelta(days=n)
+        for start, end, *_ in overloads
+        for n in range((end - start).days + 1)
+    ]
+    assert covered == expected
+    for start, end, peak, hours, members in overloads:
+        days = [start + timedelta(days=n) for n in range((end - start).days + 1)]
+        assert peak == pytest.approx(max(loads[day] for day in days))
+        assert hours == pytest.approx(sum(loads[day] for day in days))
+        assert members == sorted(
+            i for i, (s, e, _) in enumerate(windows) if s <= end and e >= start
+        )
+
+
+def test_crunch_report(repo):
+    """Prazos de alta prioridade na mesma semana viram um período sobrecarregado."""
+    repo.save_tasks(
+        [
+            _task("chapter", 20, 21),
+            _task("paper", 21, 28),
+            _task("slides", 19, None, TaskPriority.CRITICAL),
+            _task("email", 20, 40, TaskPriority.LOW),
+            _task("done", 20, 40, status=TaskStatus.COMPLETED),
+            _task("later", 50, 7),
+        ]
+    )
+
+    report = crunch_report(repo, TODAY, days=30, threshold=6, default_effort=14)
+
+    assert (report.start, report.end) == (TODAY, _day(29))
+    (interval,) = report.intervals
+    # chapter: 3h/dia em 14..20; paper: 4h/dia em 15..21; slides: 2h/dia em 13..19
+    assert (interval.start, interval.end) == (_day(15), _day(20))
+    assert interval.days == 6
+    assert interval.peak_load == pytest.approx(9)
+    assert [t.id for t in interval.tasks] == ["slides", "chapter", "paper"]
+
+
+def test_crunch_report_priority_and_overdue(repo):
+    """Tarefas atrasadas pesam hoje; min_priority inclui as de menor prioridade."""
+    repo.save_tasks(
+        [
+            _task("late", -3, 5, TaskPriority.MEDIUM),
+            _task("today", 0, 3, TaskPriority.MEDIUM),
+        ]
+    )
+
+    high_only = crunch_report(repo, TODAY, threshold=6)
+    everything = crunch_report(repo, TODAY, threshold=6, min_priority=TaskPriority.LOW)
+
+    assert high_only.intervals == []
+    (interval,) = everything.intervals
+    assert (interval.start, interval.end, interval.peak_load) == (TODAY, TODAY, 8)
+
+
+def test_invalid_arguments(repo):
+    """Parâmetros fora do intervalo geram ValueError."""
+    with pytest.raises(ValueError):
+        crunch_report(repo, TODAY, days=0)
+    with pytest.raises(ValueError):
+        crunch_report(repo, TODAY, window_days=0)
+    with pytest.raises(ValueError):
+        crunch_report(repo, TODAY, threshold=0)
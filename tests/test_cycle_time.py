@@ -0,0 +1,161 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils.cycle_time import (
+    cycle_time_report,
+    sketch_tasks,
+    summarize_cycle_time,
+    week_of,
+    week_start,
+)
+from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
+
+
+def _completed(task_id, category, priority, created, days):
+    """Tarefa concluída ``days`` dias depois de criada."""
+    return Task(
+        id=task_id,
+        title=task_id,
+        description="",
+        deadline=date(2026, 6, 1),
+        status=TaskStatus.COMPLETED,
+        priority=priority,
+        category=category,
+        created_at=created,
+        completed_at=created + timedelta(days=days),
+    )
+
+
+@pytest.fixture
+def tasks():
+    """Conclusões em duas semanas de março de 2026, mais uma tarefa aberta."""
+    start = datetime(2026, 3, 1, 9, 0)
+    return [
+        _completed("a", "Escrita", TaskPriority.HIGH, start, 1),
+        _completed("b", "Escrita", TaskPriority.LOW, start, 3),
+        _completed("c", "RSL", TaskPriority.HIGH, start, 5),
+        _completed("d", "RSL", TaskPriority.HIGH, start, 10),
+        Task(
+            id="e",
+            title="Aberta",
+            description="",
+            deadline=date(2026, 6, 1),
+            created_at=start,
+        ),
+    ]
+
+
+@pytest.fixture
+def repo(backend, tasks):
+    """Os dois backends com as mesmas tarefas."""
+    backend.save_tasks(tasks)
+    return backend
+
+
+def test_weeks_start_on_monday():
+    """Verifica a numeração das semanas (segunda a domingo)."""
+    assert week_start(week_of(date(2026, 3, 4))) == date(2026, 3, 2)
+    assert week_of(date(2026, 3, 8)) == week_of(date(2026, 3, 2))
+    assert week_of(date(2026, 3, 9)) == week_of(date(2026, 3, 8)) + 1
+
+
+def test_report_percentiles_and_throughput(repo):
+    """Verifica percentis por grupo e vazão semanal nos dois backends."""
+    report = cycle_time_report(repo)
+
+    assert report.start == date(2026, 3, 2)
+    assert report.end == date(2026, 3, 15)
+    assert report.overall.count == 4
+    assert (report.overall.p50, report.overall.p99) == (3, 10)
+    assert report.by_category["RSL"].p50 == 5
+    assert report.by_priority[TaskPriority.HIGH].count == 3
+    assert TaskPriority.CRITICAL not in report.by_priority
+    assert report.throughput == [
+        (date(2026, 3, 2), {"Escrita": 2, "RSL": 1}),
+        (date(2026, 3, 9), {"RSL": 1}),
+    ]
+
+
+def test_report_period_rounds_to_weeks(repo):
+    """Verifica o filtro por período, em semanas inteiras."""
+    report = cycle_time_report(repo, date(2026, 3, 10), date(2026, 3, 31))
+
+    assert report.start == date(2026, 3, 9)
+    assert report.overall.count == 1
+    assert [week for week, _ in report.throughput][-1] == date(2026, 3, 30)
+
+
+def test_empty_report():
+    """Verifica o relatório sem conclusões e o período invertido."""
+    assert cycle_time_report(MemoryRepository()).overall is None
+    with pytest.raises(ValueError):
+        summarize_cycle_time({}, date(2026, 3, 2), date(2026, 3, 1))
+
+
+def test_sqlite_caches_weeks_and_invalidates_on_write(tmp_path, tasks):
+    """Verifica que só as semanas tocadas por uma escrita são recalculadas."""
+    db = Database(data_dir=str(tmp_path))
+    db.save_tasks(tasks)
+    cycle_time_report(db)
+
+    with db._get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM cycle_time_weeks").fetchone()[0] == 2
+
+    task = db.get_task("d")
+    task.priority = TaskPriority.CRITICAL
+    db.update_task(task)
+    with db._get_connection() as conn:
+        weeks = conn.execute("SELECT week FROM cycle_time_weeks").fetchall()
+    assert [w for (w,) in weeks] == [week_of(date(2026, 3, 2))]
+
+    # Concluída uma semana antes: as semanas antiga e nova são descartadas
+    cycle_time_report(db)
+    task.completed_at = task.created_at + timedelta(days=2)
+    db.update_task(task)
+    with db._get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM cycle_time_weeks").fetchone()[0] == 0
+
+    report = cycle_time_report(db)
+    assert report.throughput[-1] == (date(2026, 3, 2), {"Escrita": 2, "RSL": 2})
+    assert report.overall.p99 == 5
+
+    db.undo()
+    db.undo()
+    assert cycle_time_report(db).by_category["RSL"].p99 == 10
+
+
+def test_title_edit_keeps_cache(tmp_path, tasks):
+    """Verifica que editar campos que não afetam o tempo de ciclo mantém o cache."""
+    db = Database(data_dir=str(tmp_path))
+    db.save_tasks(tasks)
+    cycle_time_report(db)
+
+    task = db.get_task("a")
+    task.title = "Outro título"
+    db.update_task(task)
+
+    with db._get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM cycle_time_weeks").fetchone()[0] == 2
+
+
+def test_read_transaction_does_not_write_cache(tmp_path, tasks):
+    """Verifica que dentro de read_transaction o cache não é gravado."""
+    db = Database(data_dir=str(tmp_path))
+    db.save_tasks(tasks)
+
+    with db.read_transaction():
+        report = cycle_time_report(db)
+
+    assert report.overall.count == 4
+    with db._get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM cycle_time_weeks").fetchone()[0] == 0
+
+
+def test_sketch_tasks_ignores_open_tasks(tasks):
+    """Verifica que só tarefas concluídas entram nos sketches."""
+    weeks = sketch_tasks(tasks)
+
+    assert sum(s.count for buckets in weeks.values() for s in buckets.values()) == 4
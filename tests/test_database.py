@@ -1,10 +1,16 @@
-from datetime import date, timedelta
+import multiprocessing
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
 
 import pytest
 
 from phd_progress_tracker.models.milestone import Milestone
 from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
 from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.history import EventKind
+from phd_progress_tracker.utils.ids import is_time_ordered_id
 
 
 @pytest.fixture
@@ -318,3 +324,487 @@ def sample_tasks_helper():
             priority=TaskPriority.MEDIUM,
         ),
     ]
+
+
+def test_load_tasks_shares_categories_and_dates(database):
+    """Verifica que categorias e prazos repetidos são o mesmo objeto na memória."""
+    deadline = date.today() + timedelta(days=3)
+    database.save_tasks(
+        [
+            Task(
+                id=f"task-{i}",
+                title="Tarefa",
+                description="",
+                deadline=deadline,
+                category="".join(["Escr", "ita"]),
+            )
+            for i in range(2)
+        ]
+    )
+
+    first, second = database.load_tasks()
+
+    assert first.category is second.category
+    assert first.deadline is second.deadline
+
+
+def test_migrate_ids_keeps_old_ids_as_aliases(
+    database, sample_tasks, sample_milestones
+):
+    """Verifica que a migração troca os IDs e mantém os antigos como apelidos."""
+    database.save_tasks(sample_tasks)
+    database.save_milestones(sample_milestones)
+
+    migrated = database.migrate_ids()
+
+    assert migrated == len(sample_tasks) + len(sample_milestones)
+    task = database.get_task("task-001")
+    assert task is not None
+    assert is_time_ordered_id(task.id)
+    assert database.get_milestone(sample_milestones[0].id).title == (
+        sample_milestones[0].title
+    )
+    assert database.migrate_ids() == 0
+
+
+def test_migrate_ids_preserves_creation_order(database, sample_task):
+    """Verifica que os novos IDs seguem a ordem de created_at."""
+    newer = Task.from_dict({**sample_task.to_dict(), "id": "aaa"})
+    sample_task.created_at = newer.created_at - timedelta(days=1)
+    database.save_tasks([newer, sample_task])
+
+    database.migrate_ids()
+
+    assert database.get_task(sample_task.id).id < database.get_task("aaa").id
+
+
+def test_migrate_ids_renames_dependencies(database, sample_task):
+    """Verifica que as dependências passam para os novos IDs (e aceitam os antigos)."""
+    other = Task.from_dict({**sample_task.to_dict(), "id": "aaa"})
+    database.save_tasks([sample_task, other])
+    database.add_dependency("task-001", "aaa")
+
+    database.migrate_ids()
+
+    new_id = database.get_task("task-001").id
+    assert database.dependency_edges() == [(new_id, database.get_task("aaa").id)]
+    assert database.dependencies("task-001") == database.dependencies(new_id)
+    assert database.remove_dependency("task-001", "aaa") is True
+
+
+def test_delete_by_alias_removes_alias(database, sample_task):
+    """Verifica que remover pelo ID antigo apaga a tarefa e o apelido."""
+    database.add_task(sample_task)
+    database.migrate_ids()
+
+    assert database.delete_task("task-001") is True
+    assert database.get_task("task-001") is None
+    assert database.delete_task("task-001") is False
+
+
+def test_without_rowid_tables(tmp_path, sample_task):
+    """Verifica que a opção WITHOUT ROWID cria tabelas agrupadas pelo ID."""
+    with Database(data_dir=str(tmp_path), without_rowid=True) as db:
+        db.add_task(sample_task)
+        with db._get_connection() as conn:
+            sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'tasks'"
+            ).fetchone()[0]
+
+        assert "WITHOUT ROWID" in sql
+        assert db.get_task("task-001").title == sample_task.title
+
+
+def test_read_transaction_is_read_only(tmp_path, sample_task):
+    """Verifica leituras na mesma transação e recusa de escritas dentro dela."""
+    db = Database(data_dir=str(tmp_path))
+    db.add_task(sample_task)
+
+    with db.read_transaction():
+        revision = db.revision()
+        assert len(db.load_tasks()) == 1
+        with pytest.raises(RuntimeError):
+            db.delete_task(sample_task.id)
+        assert db.revision() == revision
+
+    assert db.get_task(sample_task.id) is not None
+    assert db.revision() == revision
+
+
+def test_memory_read_transaction_holds_off_other_threads(database, sample_task):
+    """Verifica que, em :memory:, escritas de outra thread esperam a leitura terminar."""
+    writer = threading.Thread(target=database.add_task, args=(sample_task,))
+
+    with database.read_transaction():
+        writer.start()
+        writer.join(timeout=0.2)
+        assert writer.is_alive()
+        assert database.load_tasks() == []
+
+    writer.join()
+    assert database.get_task(sample_task.id) is not None
+
+
+def test_read_transaction_reuses_connection_for_facets(database, sample_tasks):
+    """Verifica que task_facets funciona dentro de uma read_transaction."""
+    database.save_tasks(sample_tasks)
+
+    with database.read_transaction():
+        revision, facets = database.task_facets()
+        assert revision == database.revision()
+
+    assert sum(facets["status"].values()) == len(sample_tasks)
+
+
+def _write_in_other_process(data_dir, prefix, count, complete=None):
+    """Escreve no banco a partir de outro processo (como outro worker ou o CLI)."""
+    db = Database(data_dir=data_dir)
+    for i in range(count):
+        db.add_task(
+            Task(
+                id=f"{prefix}-{i}",
+                title=f"Tarefa {prefix} {i}",
+                description="",
+                deadline=date.today() + timedelta(days=i),
+            )
+        )
+    if complete is not None:
+        task = db.get_task(complete)
+        task.complete()
+        db.update_task(task)
+    return db.revision()
+
+
+def _run_in_processes(*calls):
+    """Executa cada chamada em um processo separado e espera todas."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(calls), mp_context=context) as pool:
+        return [f.result() for f in [pool.submit(*call) for call in calls]]
+
+
+def test_deadline_index_sees_writes_from_other_processes(tmp_path, sample_task):
+    """Verifica que o índice é reconstruído após escritas de outros processos."""
+    db = Database(data_dir=str(tmp_path))
+    db.add_task(sample_task)
+    assert len(db.deadline_index()) == 1
+
+    _run_in_processes(
+        *[(_write_in_other_process, str(tmp_path), f"w{n}", 5) for n in range(3)]
+    )
+
+    index = db.deadline_index()
+    assert len(index) == 16
+    assert "w2-4" in index
+
+
+def test_local_write_after_external_write_rebuilds_index(tmp_path, sample_task):
+    """Verifica que a escrita local não aplica incremento sobre um índice defasado."""
+    db = Database(data_dir=str(tmp_path))
+    db.add_task(sample_task)
+    db.deadline_index()
+
+    _run_in_processes(
+        (_write_in_other_process, str(tmp_path), "cli", 1, sample_task.id)
+    )
+    db.add_milestone(
+        Milestone(id="m1", title="Marco", description="", target_date=date.today())
+    )
+
+    index = db.deadline_index()
+    assert sample_task.id not in index
+    assert "cli-0" in index
+    assert db.deadline_index() is index
+
+
+def test_undo_and_redo_completion(database, sample_task):
+    """Verifica desfazer e refazer a conclusão de uma tarefa."""
+    database.add_task(sample_task)
+    task = database.get_task(sample_task.id)
+    task.complete()
+    database.update_task(task)
+
+    undone = database.undo()
+    assert undone.kind == EventKind.COMPLETED
+    assert database.get_task(sample_task.id).status == TaskStatus.TODO
+    assert sample_task.id in database.deadline_index()
+
+    redone = database.redo()
+    assert redone.seq == undone.seq
+    assert database.get_task(sample_task.id).status == TaskStatus.COMPLETED
+    assert database.redo() is None
+
+
+def test_undo_delete_restores_task(database, sample_task):
+    """Verifica que uma remoção acidental pode ser desfeita."""
+    database.add_task(sample_task)
+    database.delete_task(sample_task.id)
+
+    database.undo()
+
+    assert database.get_task(sample_task.id) == sample_task
+    database.undo()
+    assert database.get_task(sample_task.id) is None
+    assert database.undo() is None
+
+
+def test_new_write_discards_redo_branch(database, sample_tasks):
+    """Verifica que uma nova alteração depois de desfazer descarta o ramo desfeito."""
+    first, second = sample_tasks
+    database.add_task(first)
+    database.undo()
+    database.add_task(second)
+
+    assert database.redo() is None
+    assert database.undo().task_id == second.id
+    assert database.redo().task_id == second.id
+    assert database.get_task(first.id) is None
+
+
+def test_task_history_records_undo(database, sample_task):
+    """Verifica os eventos de uma tarefa, inclusive os de desfazer."""
+    database.add_task(sample_task)
+    task = database.get_task(sample_task.id)
+    task.title = "Outro título"
+    database.update_task(task)
+    database.undo()
+
+    events = database.task_history(sample_task.id)
+
+    assert [e.kind for e in events] == [
+        EventKind.CREATED,
+        EventKind.UPDATED,
+        EventKind.UNDONE,
+    ]
+    assert events[1].after == {"title": "Outro título"}
+    assert events[2].ref == events[1].seq
+
+
+def test_tasks_at_replays_from_snapshots(database, sample_task, monkeypatch):
+    """Verifica o replay a partir do snapshot mais próximo."""
+    monkeypatch.setattr(Database, "SNAPSHOT_INTERVAL", 4)
+    database.add_task(sample_task)
+    task = database.get_task(sample_task.id)
+    for day in range(1, 10):
+        task.deadline = date(2026, 1, day)
+        database.update_task(task)
+
+    assert database.tasks_at(0) == []
+    assert database.tasks_at(5)[0].deadline == date(2026, 1, 4)
+    assert database.tasks_at(10) == database.load_tasks()
+
+
+def test_prune_history_keeps_replay_possible(database, sample_task, monkeypatch):
+    """Verifica que a poda corta em um snapshot e limita o desfazer."""
+    monkeypatch.setattr(Database, "SNAPSHOT_INTERVAL", 4)
+    database.add_task(sample_task)
+    task = database.get_task(sample_task.id)
+    for day in range(1, 10):
+        task.deadline = date(2026, 1, day)
+        database.update_task(task)
+
+    assert database.prune_history(keep=3) == 4
+    assert database.tasks_at(10) == database.load_tasks()
+    with pytest.raises(ValueError):
+        database.tasks_at(3)
+    for _ in range(6):
+        assert database.undo() is not None
+    assert database.undo() is None
+
+
+def test_snapshot_is_written_after_the_write_commits(
+    database, sample_task, monkeypatch
+):
+    """Verifica que o snapshot fica fora da transação da escrita do usuário."""
+    monkeypatch.setattr(Database, "SNAPSHOT_INTERVAL", 2)
+    write_snapshot = Database._write_snapshot
+
+    def busy(self, conn, seq):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(Database, "_write_snapshot", busy)
+    database.add_task(sample_task)
+    task = database.get_task(sample_task.id)
+    task.title = "Outro título"
+    database.update_task(task)
+
+    assert database.get_task(sample_task.id).title == "Outro título"
+    monkeypatch.setattr(Database, "_write_snapshot", write_snapshot)
+    task.title = "Mais um título"
+    database.update_task(task)
+    # O snapshot atrasado sai na escrita seguinte, na posição dela
+    assert database.prune_history(keep=0) == 3
+    assert database.tasks_at(3) == database.load_tasks()
+
+
+def test_failed_refresh_rolls_back_the_edit(database, sample_task, monkeypatch):
+    """Verifica que a edição e o bloqueio derivado são gravados juntos."""
+    database.add_task(sample_task)
+
+    def failing(self, conn, task_ids, ref, keep_independent=False):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(Database, "_refresh_blocked", failing)
+    task = database.get_task(sample_task.id)
+    task.title = "Outro título"
+
+    with pytest.raises(RuntimeError):
+        database.update_task(task, refresh_blocked=True)
+    assert database.get_task(sample_task.id).title == sample_task.title
+
+
+def test_history_is_pruned_automatically(database, sample_task, monkeypatch):
+    """Verifica a poda automática ao gravar snapshots."""
+    monkeypatch.setattr(Database, "SNAPSHOT_INTERVAL", 2)
+    monkeypatch.setattr(Database, "HISTORY_LIMIT", 4)
+    database.add_task(sample_task)
+    task = database.get_task(sample_task.id)
+    for day in range(1, 20):
+        task.deadline = date(2026, 1, day)
+        database.update_task(task)
+
+    assert len(database.task_history(sample_task.id)) <= 6
+
+
+def test_save_tasks_restarts_history(database, sample_tasks):
+    """Verifica que a substituição em massa recomeça o histórico."""
+    database.add_task(sample_tasks[0])
+    database.save_tasks(sample_tasks)
+
+    assert database.undo() is None
+    assert database.task_history(sample_tasks[0].id) == []
+    assert database.tasks_at(0) == database.load_tasks()
+
+
+def test_time_in_status_sums_intervals(database, sample_task):
+    """Verifica o tempo acumulado em cada status, com o atual contando até agora."""
+    start = datetime(2026, 1, 1, 9, 0)
+    sample_task.created_at = start
+    database.add_task(sample_task)
+    task = database.get_task(sample_task.id)
+    task.status = TaskStatus.IN_PROGRESS
+    task.completed_at = start + timedelta(days=2)
+    database.update_task(task)
+
+    durations = database.time_in_status(sample_task.id, now=start + timedelta(days=5))
+
+    assert durations == {
+        TaskStatus.TODO: timedelta(days=2),
+        TaskStatus.IN_PROGRESS: timedelta(days=3),
+    }
+
+
+def test_stalled_tasks_uses_open_interval(database, sample_tasks):
+    """Verifica as tarefas paradas há mais de N dias, as mais antigas primeiro."""
+    now = datetime(2026, 3, 1)
+    todo, in_progress = sample_tasks
+    in_progress.created_at = now - timedelta(days=20)
+    todo.created_at = now - timedelta(days=40)
+    database.add_task(todo)
+    database.add_task(in_progress)
+
+    stalled = database.stalled_tasks(14, now=now)
+    assert [(t.id, since) for t, since in stalled] == [
+        (in_progress.id, now - timedelta(days=20))
+    ]
+    assert database.stalled_tasks(30, now=now) == []
+    assert [t.id for t, _ in database.stalled_tasks(14, [TaskStatus.TODO], now)] == [
+        todo.id
+    ]
+
+
+def test_stalled_tasks_query_uses_partial_index(database):
+    """Verifica que a consulta de tarefas paradas usa o índice dos intervalos abertos."""
+    with database._get_connection() as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT task_id FROM status_transitions "
+            "WHERE left_at IS NULL AND status IN (1, 3) AND entered_at <= 0"
+        ).fetchall()
+
+    assert any("idx_status_transitions_open" in row[-1] for row in plan)
+
+
+def test_status_transitions_follow_undo_and_delete(database, sample_task):
+    """Verifica que desfazer e remover fecham/reabrem os intervalos."""
+    database.add_task(sample_task)
+    task = database.get_task(sample_task.id)
+    task.status = TaskStatus.BLOCKED
+    database.update_task(task)
+    database.undo()
+
+    assert set(database.time_in_status(sample_task.id)) == {
+        TaskStatus.TODO,
+        TaskStatus.BLOCKED,
+    }
+    far = datetime.now() + timedelta(days=30)
+    assert [t.status for t, _ in database.stalled_tasks(7, [TaskStatus.TODO], far)] == [
+        TaskStatus.TODO
+    ]
+    assert database.stalled_tasks(7, [TaskStatus.BLOCKED], far) == []
+
+    database.delete_task(sample_task.id)
+    assert database.stalled_tasks(0, list(TaskStatus), far) == []
+
+
+def test_save_tasks_reconciles_status_transitions(database, sample_tasks):
+    """Verifica que a substituição em massa abre intervalos para as novas tarefas."""
+    now = datetime(2026, 3, 1)
+    for task in sample_tasks:
+        task.created_at = now - timedelta(days=10)
+    database.save_tasks(sample_tasks)
+
+    stalled = database.stalled_tasks(7, now=now)
+    assert [t.id for t, _ in stalled] == [sample_tasks[1].id]
+
+    sample_tasks[1].status = TaskStatus.TODO
+    database.save_tasks(sample_tasks)
+    assert database.stalled_tasks(0, now=now + timedelta(days=1)) == []
+
+
+def test_existing_tasks_get_status_baseline(tmp_path, sample_tasks):
+    """Verifica que bancos anteriores à tabela recebem intervalos desde created_at."""
+    db_path = str(tmp_path / "test.db")
+    created = datetime(2026, 1, 1)
+    for task in sample_tasks:
+        task.created_at = created
+    Database(data_dir=str(tmp_path), db_path=db_path).save_tasks(sample_tasks)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM status_transitions")
+
+    db = Database(data_dir=str(tmp_path), db_path=db_path)
+
+    stalled = db.stalled_tasks(7, now=datetime(2026, 2, 1))
+    assert [(t.id, since) for t, since in stalled] == [(sample_tasks[1].id, created)]
+
+
+def test_effort_hours_roundtrip_and_undo(database, sample_task):
+    """Verifica que o esforço estimado é salvo, projetado e desfeito."""
+    database.add_task(sample_task)
+    task = database.get_task(sample_task.id)
+    task.effort_hours = 3.5
+    database.update_task(task)
+
+    assert database.get_task(sample_task.id).effort_hours == 3.5
+    assert database.get_task_columns(sample_task.id, ["effort_hours"]) == {
+        "effort_hours": 3.5
+    }
+
+    database.undo()
+    assert database.get_task(sample_task.id).effort_hours is None
+
+
+def test_effort_hours_column_added_to_existing_database(tmp_path, sample_task):
+    """Verifica a migração de bancos criados antes da coluna effort_hours."""
+    with Database(data_dir=str(tmp_path)) as db:
+        db.add_task(sample_task)
+    conn = sqlite3.connect(tmp_path / "phd_tracker.db")
+    conn.execute("DROP INDEX IF EXISTS idx_tasks_span_end")
+    conn.execute("ALTER TABLE tasks DROP COLUMN effort_hours")
+    conn.commit()
+    conn.close()
+
+    with Database(data_dir=str(tmp_path)) as db:
+        task = db.get_task(sample_task.id)
+        assert task.effort_hours is None
+        task.effort_hours = 8
+        db.update_task(task)
+        assert db.get_task(sample_task.id).effort_hours == 8
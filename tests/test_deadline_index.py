@@ -0,0 +1,131 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from phd_progress_tracker.models.task import Task, TaskStatus
+from phd_progress_tracker.utils.deadline_index import DeadlineIndex
+
+TODAY = date(2026, 3, 10)
+
+
+def make_task(task_id, days, status=TaskStatus.TODO):
+    """Cria uma tarefa com prazo relativo a TODAY."""
+    return Task(
+        id=task_id,
+        title=f"Tarefa {task_id}",
+        description="",
+        deadline=TODAY + timedelta(days=days),
+        status=status,
+        created_at=datetime(2026, 1, 1),
+    )
+
+
+@pytest.fixture
+def index():
+    """Índice com tarefas atrasadas, no prazo e uma concluída."""
+    return DeadlineIndex.build(
+        [
+            make_task("a", -5),
+            make_task("b", -1),
+            make_task("c", 0),
+            make_task("d", 3),
+            make_task("e", 3),
+            make_task("f", 10),
+            make_task("g", 2, TaskStatus.COMPLETED),
+        ]
+    )
+
+
+class TestDeadlineIndex:
+    """Testes da estrutura do índice."""
+
+    def test_build_skips_completed(self, index):
+        """Verifica que tarefas concluídas não entram no índice."""
+        assert len(index) == 6
+        assert "g" not in index
+
+    def test_next_due(self, index):
+        """Verifica as próximas k tarefas a partir de hoje."""
+        assert [t.id for t in index.next_due(3, TODAY)] == ["c", "d", "e"]
+        assert [t.id for t in index.next_due(10, TODAY)] == ["c", "d", "e", "f"]
+
+    def test_due_between_is_inclusive(self, index):
+        """Verifica que o intervalo inclui as duas extremidades."""
+        result = index.due_between(TODAY, TODAY + timedelta(days=3))
+        assert [t.id for t in result] == ["c", "d", "e"]
+        result = index.due_between(TODAY, TODAY + timedelta(days=3), limit=2)
+        assert [t.id for t in result] == ["c", "d"]
+
+    def test_overdue_count(self, index):
+        """Verifica a contagem de atrasadas em datas diferentes."""
+        assert index.overdue_count(TODAY) == 2
+        assert index.overdue_count(TODAY + timedelta(days=4)) == 5
+        assert index.overdue_count(TODAY - timedelta(days=10)) == 0
+
+    def test_upsert_moves_and_completes(self, index):
+        """Verifica que editar o prazo reposiciona e concluir remove."""
+        index.upsert(make_task("f", 1))
+        assert [t.id for t in index.next_due(2, TODAY)] == ["c", "f"]
+
+        index.upsert(make_task("c", 0, TaskStatus.COMPLETED))
+        assert "c" not in index
+        assert [t.id for t in index.next_due(2, TODAY)] == ["f", "d"]
+
+    def test_discard(self, index):
+        """Verifica remoção, inclusive de ID inexistente."""
+        index.discard("a")
+        index.discard("nao-existe")
+        assert index.overdue_count(TODAY) == 1
+
+    def test_returns_copies(self, index):
+        """Verifica que alterar o resultado não corrompe o índice."""
+        index.next_due(1, TODAY)[0].deadline = TODAY + timedelta(days=100)
+        assert index.next_due(1, TODAY)[0].deadline == TODAY
+
+
+@pytest.fixture
+def repository(backend):
+    """Repositório de cada backend com algumas tarefas."""
+    backend.save_tasks([make_task("a", -1), make_task("b", 2)])
+    return backend
+
+
+class TestRepositoryDeadlineIndex:
+    """Testes da manutenção do índice pelas escritas dos repositórios."""
+
+    def test_index_follows_writes(self, repository):
+        """Verifica que add/update/complete/delete atualizam o índice já construído."""
+        index = repository.deadline_index()
+        assert index.overdue_count(TODAY) == 1
+
+        repository.add_task(make_task("c", 1))
+        assert [t.id for t in index.next_due(5, TODAY)] == ["c", "b"]
+
+        moved = make_task("b", -2)
+        assert repository.update_task(moved)
+        assert index.overdue_count(TODAY) == 2
+
+        done = repository.get_task("a")
+        done.complete()
+        repository.update_task(done)
+        assert "a" not in index
+
+        assert repository.delete_task("c")
+        assert [t.id for t in index.next_due(5, TODAY)] == []
+        assert index is repository.deadline_index()
+
+    def test_failed_writes_leave_index_untouched(self, repository):
+        """Verifica que update/delete de IDs inexistentes não mexem no índice."""
+        index = repository.deadline_index()
+
+        assert not repository.update_task(make_task("x", 0))
+        assert not repository.delete_task("x")
+        assert "x" not in index
+        assert len(index) == 2
+
+    def test_save_tasks_replaces_index(self, repository):
+        """Verifica que a substituição em massa reflete no índice."""
+        repository.deadline_index()
+        repository.save_tasks([make_task("z", 4)])
+
+        assert [t.id for t in repository.deadline_index().next_due(5, TODAY)] == ["z"]
@@ -0,0 +1,310 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.dependencies import (
+    DependencyGraph,
+    dependency_graph,
+    refresh_blocked,
+)
+from phd_progress_tracker.utils.history import EventKind
+from phd_progress_tracker.utils.planner import Capacity
+
+TODAY = date(2026, 3, 2)
+# 1 hora = 1 dia de trabalho, para contas redondas
+ONE_HOUR_DAYS = Capacity(daily_hours=1, default_effort=1)
+
+
+def _task(task_id, deadline, effort=None, status=TaskStatus.TODO):
+    return Task(
+        id=task_id,
+        title=task_id,
+        description="",
+        deadline=deadline,
+        status=status,
+        priority=TaskPriority.MEDIUM,
+        created_at=datetime(2026, 2, 1, 9),
+        effort_hours=effort,
+    )
+
+
+@pytest.fixture
+def repo(backend):
+    """Os dois backends, vazios."""
+    return backend
+
+
+def _graph(repo, graph=None):
+    return dependency_graph(
+        repo, ONE_HOUR_DAYS, DependencyGraph() if graph is None else graph
+    )
+
+
+def test_edges_roundtrip(repo):
+    """Dependências são gravadas, listadas nos dois sentidos e removidas."""
+    repo.save_tasks([_task(i, TODAY) for i in "abc"])
+
+    assert repo.add_dependency("c", "a")
+    assert repo.add_dependency("c", "b")
+    assert not repo.add_dependency("c", "a")
+
+    assert repo.dependency_edges() == [("c", "a"), ("c", "b")]
+    assert repo.dependencies("c") == ["a", "b"]
+    assert repo.dependents("a") == ["c"]
+    assert repo.remove_dependency("c", "a")
+    assert not repo.remove_dependency("c", "a")
+    assert repo.dependency_edges() == [("c", "b")]
+
+
+def test_cycles_and_unknown_tasks_are_rejected(repo):
+    """Arestas que fecham ciclo, laços e tarefas inexistentes geram ValueError."""
+    repo.save_tasks([_task(i, TODAY) for i in "abc"])
+    repo.add_dependency("b", "a")
+    repo.add_dependency("c", "b")
+
+    with pytest.raises(ValueError, match="cycle"):
+        repo.add_dependency("a", "c")
+    with pytest.raises(ValueError):
+        repo.add_dependency("a", "a")
+    with pytest.raises(ValueError, match="not found"):
+        repo.add_dependency("a", "zzz")
+    assert repo.dependency_edges() == [("b", "a"), ("c", "b")]
+
+
+def test_deleting_a_task_drops_its_edges(repo):
+    """Remover uma tarefa (ou substituir todas) apaga as dependências dela."""
+    repo.save_tasks([_task(i, TODAY) for i in "abc"])
+    repo.add_dependency("b", "a")
+    repo.add_dependency("c", "b")
+
+    repo.delete_task("b")
+    assert repo.dependency_edges() == []
+
+    repo.add_dependency("c", "a")
+    repo.save_tasks([_task("a", TODAY)])
+    assert repo.dependency_edges() == []
+
+
+def test_critical_path_and_slack(repo):
+    """
+    Cadeia a → b → d com prazo folgado em d e c (paralela a b) com prazo
+    apertado: a folga vem do menor prazo entre a tarefa e os dependentes.
+    """
+    repo.save_tasks(
+        [
+            _task("a", TODAY + timedelta(days=10), 2),
+            _task("b", TODAY + timedelta(days=10), 3),
+            _task("c", TODAY + timedelta(days=2), 1),
+            _task("d", TODAY + timedelta(days=7), 1),
+        ]
+    )
+    repo.add_dependency("b", "a")
+    repo.add_dependency("c", "a")
+    repo.add_dependency("d", "b")
+
+    graph = _graph(repo)
+    slack = {t: graph.slack(t, TODAY) for t in "abcd"}
+
+    # a termina no dia 2 (EF=2); c precisa de 1 dia e vence no dia 3
+    assert slack["a"].earliest_finish == TODAY + timedelta(days=1)
+    assert slack["a"].latest_finish == TODAY + timedelta(days=1)
+    assert (slack["a"].slack, slack["c"].slack) == (0, 0)
+    assert slack["a"].critical and slack["c"].critical
+    # b termina no dia 5, d no dia 6, com prazo de d no dia 8
+    assert (slack["b"].slack, slack["d"].slack) == (2, 2)
+    assert not slack["d"].critical
+    assert [s.task.id for s in graph.critical_path(TODAY)] == ["a", "c"]
+    assert [s.task.id for s in graph.blockers("d", TODAY)] == ["b"]
+    assert [t.id for t in graph.topological_order()].index("a") == 0
+
+
+def test_completed_prerequisites_leave_the_graph(repo):
+    """Pré-requisitos concluídos não bloqueiam nem atrasam."""
+    repo.save_tasks(
+        [
+            _task("a", TODAY, 5, TaskStatus.COMPLETED),
+            _task("b", TODAY + timedelta(days=1), 1),
+        ]
+    )
+    repo.add_dependency("b", "a")
+
+    graph = _graph(repo)
+
+    assert len(graph) == 1
+    assert graph.blockers("b", TODAY) == []
+    assert graph.slack("b", TODAY).slack == 1
+
+
+def test_incremental_updates_match_a_fresh_graph(repo):
+    """Arestas, prazos e esforços que mudam só recalculam o necessário."""
+    rng = random.Random(11)
+    ids = [f"t{i:03d}" for i in range(120)]
+    repo.save_tasks(
+        [
+            _task(i, TODAY + timedelta(days=rng.randint(0, 60)), rng.choice([None, 2]))
+            for i in ids
+        ]
+    )
+    graph = _graph(repo)
+    assert graph.recomputed == 0
+
+    for step in range(300):
+        try:
+            repo.add_dependency(*rng.sample(ids, 2))
+        except ValueError:
+            pass
+        if step % 10 == 0:
+            task = repo.get_task(rng.choice(ids))
+            task.deadline = TODAY + timedelta(days=rng.randint(0, 60))
+            task.effort_hours = rng.choice([None, 1, 4])
+            repo.update_task(task)
+        if step % 25 == 0:
+            repo.remove_dependency(*rng.choice(repo.dependency_edges()))
+        if step % 60 == 0:
+            _graph(repo, graph)
+
+    _graph(repo, graph)
+    fresh = _graph(repo)
+    assert [graph.slack(i, TODAY) for i in ids] == [fresh.slack(i, TODAY) for i in ids]
+    assert [s.task.id for s in graph.critical_path(TODAY)] == [
+        s.task.id for s in fresh.critical_path(TODAY)
+    ]
+    position = {t.id: i for i, t in enumerate(graph.topological_order())}
+    assert all(position[d] < position[t] for t, d in repo.dependency_edges())
+
+    # Tarefa nova e isolada: mudar o prazo dela só recalcula ela mesma
+    repo.add_task(_task("new", TODAY))
+    _graph(repo, graph)
+    assert graph.recomputed == 0
+    task = repo.get_task("new")
+    task.deadline = TODAY + timedelta(days=3)
+    repo.update_task(task)
+    _graph(repo, graph)
+    assert graph.recomputed == 1
+
+
+def test_graph_rejects_cycles():
+    """O grafo também recusa ciclos, sem mexer na ordem."""
+    graph = DependencyGraph(ONE_HOUR_DAYS)
+    for i in "abc":
+        graph.add_task(_task(i, TODAY))
+    graph.add_edge("b", "a")
+    graph.add_edge("c", "b")
+
+    with pytest.raises(ValueError, match="cycle"):
+        graph.add_edge("a", "c")
+    assert [t.id for t in graph.topological_order()] == ["a", "b", "c"]
+
+    # Aresta contra a ordem atual: c passa a vir antes de a
+    graph.remove_edge("b", "a")
+    graph.add_edge("a", "c")
+    order = [t.id for t in graph.topological_order()]
+    assert order.index("b") < order.index("c") < order.index("a")
+
+
+def test_undo_recomputes_blocked_status(tmp_path):
+    """Desfazer a conclusão do pré-requisito volta a bloquear o dependente."""
+    db = Database(data_dir=str(tmp_path))
+    db.save_tasks([_task("a", TODAY), _task("b", TODAY)])
+    db.add_dependency("b", "a")
+    refresh_blocked(db, ["b"])
+    a = db.get_task("a")
+    a.complete()
+    db.update_task(a)
+    assert [t.id for t in refresh_blocked(db, db.dependents("a"))] == ["b"]
+
+    # A mudança automática não é um passo de desfazer: o undo volta a conclusão
+    assert db.undo().task_id == "a"
+    assert db.get_task("a").status == TaskStatus.TODO
+    assert db.get_task("b").status == TaskStatus.BLOCKED
+    assert db.undo() is None
+
+    assert db.redo().task_id == "a"
+    assert db.get_task("b").status == TaskStatus.TODO
+    kinds = [event.kind for event in db.task_history("b")]
+    # Bloqueio inicial, desbloqueio, rebloqueio no undo e desbloqueio no redo
+    assert kinds == [EventKind.AUTOMATIC] * 4
+    # O replay inclui as mudanças automáticas
+    last = db.task_history("b")[-1].seq
+    assert {t.id: t.status for t in db.tasks_at(last)} == {
+        "a": TaskStatus.COMPLETED,
+        "b": TaskStatus.TODO,
+    }
+    due = {t.id: t.status for t in db.deadline_index().due_between(TODAY, TODAY)}
+    assert due["b"] == TaskStatus.TODO
+    db.close()
+
+
+def test_undo_keeps_manual_blocks(tmp_path):
+    """Tarefas sem pré-requisitos bloqueadas pelo usuário continuam bloqueadas."""
+    db = Database(data_dir=str(tmp_path))
+    db.save_tasks([_task("a", TODAY)])
+    a = db.get_task("a")
+    a.status = TaskStatus.BLOCKED
+    db.update_task(a)
+    a.title = "renomeada"
+    db.update_task(a)
+
+    db.undo()
+
+    assert db.get_task("a").status == TaskStatus.BLOCKED
+    db.close()
+
+
+def test_refresh_blocked(repo):
+    """Tarefas com pré-requisito aberto bloqueiam e voltam quando ele termina."""
+    repo.save_tasks(
+        [
+            _task("a", TODAY),
+            _task("b", TODAY),
+            _task("c", TODAY, status=TaskStatus.IN_PROGRESS),
+        ]
+    )
+    repo.add_dependency("b", "a")
+    repo.add_dependency("c", "a")
+
+    assert [t.id for t in refresh_blocked(repo, ["b", "c", "b"])] == ["b", "c"]
+    assert repo.get_task("c").status == TaskStatus.BLOCKED
+
+    a = repo.get_task("a")
+    a.complete()
+    repo.update_task(a)
+    assert [t.status for t in refresh_blocked(repo, repo.dependents("a"))] == [
+        TaskStatus.TODO,
+        TaskStatus.TODO,
+    ]
+    assert refresh_blocked(repo, ["a", "b", "missing"]) == []
+
+
+def test_writes_refresh_blocked_in_the_same_write(repo):
+    """Com refresh_blocked, cada escrita já deixa o bloqueio ajustado."""
+    repo.save_tasks([_task("a", TODAY), _task("b", TODAY), _task("c", TODAY)])
+    # Índice já construído: as mudanças derivadas também chegam a ele
+    repo.deadline_index()
+
+    repo.add_dependency("b", "a", refresh_blocked=True)
+    repo.add_dependency("c", "a", refresh_blocked=True)
+    assert repo.get_task("b").status == TaskStatus.BLOCKED
+
+    b = repo.get_task("b")
+    b.status = TaskStatus.TODO
+    repo.update_task(b, refresh_blocked=True)
+    assert repo.get_task("b").status == TaskStatus.BLOCKED
+
+    repo.remove_dependency("c", "a", refresh_blocked=True)
+    assert repo.get_task("c").status == TaskStatus.TODO
+
+    a = repo.get_task("a")
+    a.complete()
+    repo.update_task(a, refresh_blocked=True)
+    assert repo.get_task("b").status == TaskStatus.TODO
+
+    repo.add_dependency("c", "b", refresh_blocked=True)
+    assert repo.get_task("c").status == TaskStatus.BLOCKED
+    repo.delete_task("b", refresh_blocked=True)
+    assert repo.get_task("c").status == TaskStatus.TODO
+    due = repo.deadline_index().due_between(TODAY, TODAY)
+    assert {t.id: t.status for t in due} == {"c": TaskStatus.TODO}
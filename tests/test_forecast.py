@@ -0,0 +1,135 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.utils import forecast
+from phd_progress_tracker.utils.forecast import forecast_milestone, simulate
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
+
+np = pytest.importorskip("numpy")
+
+TODAY = date(2026, 6, 1)
+
+
+@pytest.fixture
+def repo(backend, task_factory):
+    """Uma conclusão por dia nos últimos 30 dias e 10 tarefas abertas."""
+    start = datetime(2026, 4, 1, 9)
+    tasks = [
+        task_factory(f"done{i}", start, datetime(2026, 5, 3, 10) + timedelta(days=i))
+        for i in range(30)
+    ]
+    tasks += [task_factory(f"open{i}", start) for i in range(10)]
+    backend.save_tasks(tasks)
+    return backend
+
+
+def test_simulate_constant_throughput():
+    """Verifica que vazão constante dá sempre o mesmo número de dias."""
+    days = simulate([2], remaining=7, trials=500, seed=1, workers=1)
+
+    assert days.shape == (500,)
+    assert set(days.tolist()) == {4}
+
+
+def test_simulate_is_deterministic_across_workers(monkeypatch):
+    """Verifica que a mesma semente dá o mesmo resultado com 1 ou 2 processos."""
+    monkeypatch.setattr(forecast, "CHUNK_TRIALS", 1000)
+    samples = [0, 0, 1, 3, 0, 2]
+
+    serial = simulate(samples, 40, trials=3500, seed=7, workers=1)
+    parallel = simulate(samples, 40, trials=3500, seed=7, workers=2)
+    other = simulate(samples, 40, trials=3500, seed=8, workers=1)
+
+    assert np.array_equal(serial, parallel)
+    assert not np.array_equal(serial, other)
+
+
+def test_simulate_on_a_shared_pool(monkeypatch):
+    """Verifica que um pool compartilhado dá o mesmo resultado e continua aberto."""
+    monkeypatch.setattr(forecast, "CHUNK_TRIALS", 1000)
+    samples = [0, 1, 2]
+    serial = simulate(samples, 30, trials=2500, seed=9, workers=1)
+
+    with forecast.forecast_pool(2) as pool:
+        first = simulate(samples, 30, trials=2500, seed=9, pool=pool)
+        second = simulate(samples, 30, trials=2500, seed=9, pool=pool)
+
+    assert np.array_equal(serial, first)
+    assert np.array_equal(first, second)
+
+
+def test_simulate_marks_unfinished_runs():
+    """Verifica -1 para tentativas que não terminam no horizonte."""
+    days = simulate([0, 0, 0, 1], 50, trials=200, seed=3, workers=1, horizon=30)
+
+    assert (days == -1).all()
+
+
+def test_forecast_with_steady_throughput(repo):
+    """Verifica probabilidade e datas com uma conclusão por dia."""
+    milestone = Milestone("m", "Qualificação", "", date(2026, 6, 30))
+
+    result = forecast_milestone(
+        repo, milestone, trials=2000, seed=5, history_days=30, today=TODAY
+    )
+
+    assert result.remaining == 10
+    assert result.daily_throughput == 1.0
+    assert result.probability == 1.0
+    assert set(result.percentiles.values()) == {date(2026, 6, 11)}
+
+
+def test_forecast_deadline_too_close(repo):
+    """Verifica probabilidade zero quando o prazo é curto demais."""
+    milestone = Milestone("m", "Qualificação", "", date(2026, 6, 5))
+
+    result = forecast_milestone(
+        repo, milestone, trials=2000, seed=5, history_days=30, today=TODAY
+    )
+
+    assert result.probability == 0.0
+
+
+def test_forecast_same_seed_same_result(repo):
+    """Verifica que uma execução pode ser repetida com a semente devolvida."""
+    milestone = Milestone("m", "Qualificação", "", date(2026, 6, 20))
+    first = forecast_milestone(repo, milestone, trials=2000, today=TODAY)
+
+    again = forecast_milestone(
+        repo, milestone, trials=2000, seed=first.seed, today=TODAY
+    )
+
+    assert again == first
+
+
+def test_forecast_without_history(task_factory):
+    """Verifica que sem conclusões no histórico não há previsão."""
+    repo = MemoryRepository()
+    repo.add_task(task_factory("open", datetime(2026, 5, 1)))
+    milestone = Milestone("m", "Defesa", "", date(2027, 1, 1))
+
+    result = forecast_milestone(repo, milestone, trials=1000, seed=1, today=TODAY)
+
+    assert result.probability == 0.0
+    assert set(result.percentiles.values()) == {None}
+
+
+def test_forecast_nothing_left():
+    """Verifica certeza quando não há tarefas abertas."""
+    milestone = Milestone("m", "Defesa", "", date(2027, 1, 1))
+
+    result = forecast_milestone(MemoryRepository(), milestone, today=TODAY)
+
+    assert result.remaining == 0
+    assert result.probability == 1.0
+
+
+def test_forecast_invalid_arguments():
+    """Verifica a validação de tentativas e histórico."""
+    milestone = Milestone("m", "Defesa", "", date(2027, 1, 1))
+    with pytest.raises(ValueError):
+        forecast_milestone(MemoryRepository(), milestone, trials=0)
+    with pytest.raises(ValueError):
+        forecast_milestone(MemoryRepository(), milestone, history_days=0)
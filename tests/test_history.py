@@ -0,0 +1,110 @@
+from dataclasses import replace
+from datetime import date, datetime
+
+import pytest
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils.history import (
+    EventKind,
+    decode_change,
+    decode_states,
+    encode_change,
+    encode_states,
+    replay,
+    task_change,
+    task_state,
+)
+
+
+@pytest.fixture
+def task():
+    """Tarefa com datas antes e depois de 1970 e texto acentuado."""
+    return Task(
+        id="t1",
+        title="Revisão de literatura",
+        description="Capítulo 2",
+        deadline=date(1969, 7, 20),
+        priority=TaskPriority.HIGH,
+        category="Escrita",
+        created_at=datetime(2026, 1, 2, 3, 4, 5, 6),
+    )
+
+
+def test_created_event_roundtrip(task):
+    """Verifica que a criação guarda e recupera o estado completo."""
+    kind, before, after = task_change(None, task)
+
+    assert kind == EventKind.CREATED
+    assert before is None
+    assert decode_change(encode_change(before, after)) == (None, task_state(task))
+
+
+def test_completed_event_keeps_only_changed_fields(task):
+    """Verifica classificação da conclusão e tamanho compacto do evento."""
+    done = replace(
+        task, status=TaskStatus.COMPLETED, completed_at=datetime(2026, 2, 1, 12)
+    )
+
+    kind, before, after = task_change(task, done)
+    payload = encode_change(before, after)
+
+    assert kind == EventKind.COMPLETED
+    assert set(after) == {"status", "completed_at"}
+    assert decode_change(payload) == (before, after)
+    assert len(payload) < 20
+
+
+def test_unchanged_task_has_no_event(task):
+    """Verifica que salvar sem mudanças não gera evento."""
+    assert task_change(task, replace(task)) is None
+
+
+def test_deleted_event(task):
+    """Verifica que a remoção guarda o estado anterior completo."""
+    kind, before, after = task_change(task, None)
+
+    assert kind == EventKind.DELETED
+    assert after is None
+    assert decode_change(encode_change(before, after)) == (task_state(task), None)
+
+
+def test_states_roundtrip_and_replay(task):
+    """Verifica snapshot de estados e reaplicação de eventos."""
+    other = Task(id="t2", title="Coleta", description="", deadline=date(2026, 5, 1))
+    states = decode_states(encode_states([task, other]))
+
+    tasks = replay(
+        states,
+        [("t2", None), ("t1", {"title": "Novo título"})],
+    )
+
+    assert [(t.id, t.title, t.deadline) for t in tasks] == [
+        ("t1", "Novo título", date(1969, 7, 20))
+    ]
+
+
+def test_effort_change_roundtrip(task):
+    """Verifica que o esforço estimado é versionado (e pode voltar a None)."""
+    estimated = replace(task, effort_hours=2.5)
+
+    kind, before, after = task_change(task, estimated)
+
+    assert kind == EventKind.UPDATED
+    assert (before, after) == ({"effort_hours": None}, {"effort_hours": 2.5})
+    assert decode_change(encode_change(before, after)) == (before, after)
+
+
+def test_states_keep_effort(task):
+    """Verifica que o esforço estimado (ou sua ausência) entra nos snapshots."""
+    other = Task(
+        id="t2",
+        title="Coleta",
+        description="",
+        deadline=date(2026, 5, 1),
+        effort_hours=4.0,
+    )
+
+    states = decode_states(encode_states([task, other]))
+
+    assert states["t1"]["effort_hours"] is None
+    assert states["t2"]["effort_hours"] == 4.0
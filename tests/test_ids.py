@@ -0,0 +1,42 @@
+from datetime import datetime
+
+import pytest
+
+from phd_progress_tracker.utils.ids import (
+    ID_LENGTH,
+    id_timestamp,
+    is_time_ordered_id,
+    new_id,
+)
+
+
+def test_new_id_format():
+    """Verifica tamanho e alfabeto do ID."""
+    value = new_id()
+
+    assert len(value) == ID_LENGTH
+    assert is_time_ordered_id(value)
+
+
+def test_new_ids_are_monotonic():
+    """Verifica que IDs gerados em sequência já saem ordenados."""
+    ids = [new_id() for _ in range(1000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_explicit_timestamp_roundtrip():
+    """Verifica que o timestamp codificado pode ser recuperado."""
+    moment = datetime(2025, 3, 1, 12, 30, 15, 250000)
+
+    assert id_timestamp(new_id(moment)) == moment
+    assert new_id(moment) < new_id(datetime(2025, 3, 1, 12, 30, 16))
+
+
+@pytest.mark.parametrize("value", ["task-001", "a1b2c3d4", "9" * ID_LENGTH, "U" * 26])
+def test_legacy_ids_are_not_time_ordered(value):
+    """Verifica que IDs antigos e inválidos não são reconhecidos."""
+    assert not is_time_ordered_id(value)
+    with pytest.raises(ValueError):
+        id_timestamp(value)
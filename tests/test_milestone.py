@@ -113,3 +113,10 @@ def test_milestone_from_dict(sample_milestone):
     assert new_milestone.description == sample_milestone.description
     assert new_milestone.target_date == sample_milestone.target_date
     assert new_milestone.is_achieved == sample_milestone.is_achieved
+
+
+def test_days_until_with_reference_date(sample_milestone):
+    """Verifica days_until com data de referência explícita."""
+    reference = sample_milestone.target_date - timedelta(days=10)
+
+    assert sample_milestone.days_until(reference) == 10
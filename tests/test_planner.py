@@ -0,0 +1,254 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils.planner import (
+    MAX_EFFORT_HOURS,
+    MAX_HORIZON_DAYS,
+    Capacity,
+    Planner,
+    build_plan,
+    plan_order,
+)
+
+# Segunda-feira
+MONDAY = date(2026, 3, 2)
+
+
+def _task(
+    task_id,
+    deadline,
+    effort=None,
+    priority=TaskPriority.MEDIUM,
+    status=TaskStatus.TODO,
+):
+    return Task(
+        id=task_id,
+        title=task_id,
+        description="",
+        deadline=deadline,
+        status=status,
+        priority=priority,
+        created_at=datetime(2026, 2, 1, 9),
+        effort_hours=effort,
+    )
+
+
+@pytest.fixture
+def repo(backend):
+    """Os dois backends, vazios."""
+    return backend
+
+
+def _ids(day):
+    return [slot.task.id for slot in day.slots]
+
+
+def test_edf_first_fit(repo):
+    """Prazo mais próximo primeiro; tarefas que cabem vão inteiras ao primeiro dia com espaço."""
+    repo.save_tasks(
+        [
+            _task("b", MONDAY + timedelta(days=2), 4),
+            _task("a", MONDAY + timedelta(days=1), 4),
+            _task("c", MONDAY + timedelta(days=2), 2, TaskPriority.HIGH),
+        ]
+    )
+
+    plan = build_plan(repo, MONDAY, 3, Capacity(daily_hours=6), Planner())
+
+    assert [_ids(day) for day in plan.days] == [["a", "c"], ["b"], []]
+    assert [day.used for day in plan.days] == [6, 4, 0]
+    assert [p.task.id for p in plan.tasks] == ["a", "c", "b"]
+    assert plan.late == []
+    assert plan.finish == MONDAY + timedelta(days=1)
+
+
+def test_large_task_is_split(repo):
+    """Tarefas maiores que um dia são divididas pelos primeiros dias livres."""
+    repo.save_tasks(
+        [
+            _task("small", MONDAY + timedelta(days=5), 2),
+            _task("big", MONDAY + timedelta(days=9), 10),
+        ]
+    )
+
+    plan = build_plan(repo, MONDAY, 3, Capacity(daily_hours=6), Planner())
+
+    assert [[(s.task.id, s.hours) for s in day.slots] for day in plan.days] == [
+        [("small", 2), ("big", 4)],
+        [("big", 6)],
+        [],
+    ]
+    big = plan.tasks[1]
+    assert (big.start, big.finish, big.effort) == (MONDAY, MONDAY + timedelta(1), 10)
+
+
+def test_late_first_fit_falls_back_to_split(repo):
+    """Se o encaixe inteiro passaria do prazo, a tarefa é dividida para terminar antes."""
+    repo.save_tasks(
+        [
+            _task("a", MONDAY, 4),
+            _task("b", MONDAY + timedelta(days=1), 4),
+            _task("c", MONDAY + timedelta(days=1), 4),
+        ]
+    )
+
+    plan = build_plan(repo, MONDAY, 2, Capacity(daily_hours=6), Planner())
+
+    assert [[(s.task.id, s.hours) for s in day.slots] for day in plan.days] == [
+        [("a", 4), ("c", 2)],
+        [("b", 4), ("c", 2)],
+    ]
+    assert plan.late == []
+
+
+def test_weekends(repo):
+    """Fins de semana ficam sem capacidade, a não ser que sejam liberados."""
+    friday = MONDAY + timedelta(days=4)
+    repo.save_tasks([_task("t", friday + timedelta(days=10), 8)])
+
+    weekdays = build_plan(repo, friday, 4, Capacity(daily_hours=6), Planner())
+    everyday = build_plan(
+        repo, friday, 4, Capacity(daily_hours=6, weekends=True), Planner()
+    )
+
+    assert [day.capacity for day in weekdays.days] == [6, 0, 0, 6]
+    assert [day.used for day in weekdays.days] == [6, 0, 0, 2]
+    assert [day.used for day in everyday.days] == [6, 2, 0, 0]
+
+
+def test_default_effort_and_late(repo):
+    """Tarefas sem estimativa usam default_effort; as que não cabem no prazo são atrasadas."""
+    repo.save_tasks(
+        [
+            _task("guess", MONDAY + timedelta(days=10)),
+            _task("huge", MONDAY + timedelta(days=1), 20),
+            _task("done", MONDAY, 5, status=TaskStatus.COMPLETED),
+        ]
+    )
+
+    plan = build_plan(
+        repo, MONDAY, 5, Capacity(daily_hours=6, default_effort=3), Planner()
+    )
+
+    assert [p.task.id for p in plan.tasks] == ["huge", "guess"]
+    huge, guess = plan.tasks
+    assert (guess.effort, guess.estimated) == (3, False)
+    assert huge.estimated
+    assert huge.finish == MONDAY + timedelta(days=3)
+    assert [p.task.id for p in plan.late] == ["huge"]
+
+
+def test_plan_grows_past_the_last_deadline(repo):
+    """O plano continua além do último prazo quando o esforço não cabe antes."""
+    repo.save_tasks([_task("thesis", MONDAY + timedelta(days=7), 600)])
+
+    plan = build_plan(repo, MONDAY, 1, Capacity(daily_hours=6), Planner())
+
+    # 100 dias úteis = 20 semanas
+    assert plan.tasks[0].finish == MONDAY + timedelta(weeks=19, days=4)
+    assert plan.tasks[0].late
+
+
+def test_incremental_matches_full_replan(repo):
+    """Depois de uma mudança, só o sufixo é refeito e o resultado é o de um plano novo."""
+    rng = random.Random(7)
+    tasks = [
+        _task(
+            f"t{i:03d}",
+            MONDAY + timedelta(days=rng.randint(-3, 120)),
+            rng.choice([None, 0.5, 1.5, 4, 9]),
+            rng.choice(list(TaskPriority)),
+        )
+        for i in range(300)
+    ]
+    repo.save_tasks(tasks)
+    planner = Planner()
+    build_plan(repo, MONDAY, 30, planner=planner)
+    assert planner.replanned == 300
+
+    build_plan(repo, MONDAY, 30, planner=planner)
+    assert planner.replanned == 0
+
+    changed = plan_order(tasks)[250]
+    changed.effort_hours = 12
+    repo.update_task(changed)
+    plan = build_plan(repo, MONDAY, 30, planner=planner)
+    fresh = build_plan(repo, MONDAY, 30, planner=Planner())
+
+    assert planner.replanned == 50
+    assert [(p.task.id, p.start, p.finish) for p in plan.tasks] == [
+        (p.task.id, p.start, p.finish) for p in fresh.tasks
+    ]
+    assert [[(s.task.id, s.hours) for s in d.slots] for d in plan.days] == [
+        [(s.task.id, s.hours) for s in d.slots] for d in fresh.days
+    ]
+
+
+def test_capacity_never_exceeded(repo):
+    """Nenhum dia recebe mais horas do que a capacidade."""
+    rng = random.Random(3)
+    repo.save_tasks(
+        [
+            _task(
+                f"t{i}", MONDAY + timedelta(days=rng.randint(0, 30)), rng.random() * 8
+            )
+            for i in range(100)
+        ]
+    )
+
+    plan = build_plan(repo, MONDAY, 200, Capacity(daily_hours=5), Planner())
+
+    assert all(day.used <= day.capacity + 1e-9 for day in plan.days)
+    assert sum(day.used for day in plan.days) == pytest.approx(
+        sum(p.effort for p in plan.tasks)
+    )
+
+
+def test_invalid_arguments(repo):
+    """Capacidade e janela inválidas geram ValueError."""
+    with pytest.raises(ValueError):
+        Capacity(daily_hours=0)
+    with pytest.raises(ValueError):
+        Capacity(default_effort=-1)
+    with pytest.raises(ValueError):
+        Capacity(default_effort=MAX_EFFORT_HOURS + 1)
+    with pytest.raises(ValueError, match="1 minute"):
+        Capacity(daily_hours=0.008)
+    with pytest.raises(ValueError):
+        build_plan(repo, MONDAY, 0)
+
+
+def test_plan_past_the_horizon_is_rejected(repo):
+    """Esforço que não cabe em MAX_HORIZON_DAYS gera ValueError, sem travar."""
+    repo.save_tasks(
+        [_task("a", MONDAY, 1), _task("huge", MONDAY + timedelta(days=1), 1e7)]
+    )
+    planner = Planner()
+
+    with pytest.raises(ValueError, match="does not fit"):
+        build_plan(repo, MONDAY, 1, Capacity(daily_hours=6, weekends=True), planner)
+    # Capacidade mínima: 1 minuto por dia
+    with pytest.raises(ValueError, match="does not fit"):
+        build_plan(repo, MONDAY, 1, Capacity(daily_hours=1 / 60), planner)
+
+    # O planejador descarta o estado parcial e volta a funcionar
+    huge = repo.get_task("huge")
+    huge.effort_hours = 2
+    repo.update_task(huge)
+    plan = build_plan(repo, MONDAY, 1, Capacity(daily_hours=6), planner)
+    assert [p.finish for p in plan.tasks] == [MONDAY, MONDAY]
+    assert plan.tasks[0].finish < MONDAY + timedelta(days=MAX_HORIZON_DAYS)
+
+
+def test_far_deadlines_do_not_grow_the_plan(repo):
+    """Prazos muito distantes não alocam um dia por dia até o prazo."""
+    repo.save_tasks([_task("far", date(9999, 12, 31), 3)])
+    planner = Planner()
+
+    plan = build_plan(repo, MONDAY, 1, Capacity(), planner)
+
+    assert plan.tasks[0].finish == MONDAY
+    assert planner._days.size <= 2 * MAX_HORIZON_DAYS
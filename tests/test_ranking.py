@@ -0,0 +1,148 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils.deadline_index import DeadlineIndex
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
+from phd_progress_tracker.utils.ranking import (
+    ScoreWeights,
+    deadline_proximity,
+    next_tasks,
+    score_bound,
+    score_parts,
+    score_task,
+)
+
+TODAY = date(2026, 3, 1)
+
+
+def _task(task_id, deadline, priority=TaskPriority.MEDIUM, status=TaskStatus.TODO):
+    """Tarefa criada 10 dias antes de TODAY."""
+    return Task(
+        id=task_id,
+        title=task_id,
+        description="",
+        deadline=deadline,
+        status=status,
+        priority=priority,
+        created_at=datetime(2026, 2, 19, 9),
+    )
+
+
+@pytest.fixture
+def repo(backend):
+    """Os dois backends com tarefas de prioridade, prazo e status variados."""
+    backend.save_tasks(
+        [
+            _task("far", date(2026, 9, 1), TaskPriority.CRITICAL),
+            _task("soon", date(2026, 3, 3)),
+            _task("late", date(2026, 2, 20), TaskPriority.LOW),
+            _task("blocked", date(2026, 3, 2), TaskPriority.HIGH, TaskStatus.BLOCKED),
+            _task("doing", date(2026, 3, 20), status=TaskStatus.IN_PROGRESS),
+            _task("done", date(2026, 3, 1), status=TaskStatus.COMPLETED),
+        ]
+    )
+    return backend
+
+
+def test_deadline_proximity():
+    """Verifica a proximidade: zero longe, um no dia, limitada no atraso."""
+    assert deadline_proximity(60, 30) == 0.0
+    assert deadline_proximity(15, 30) == 0.5
+    assert deadline_proximity(0, 30) == 1.0
+    assert deadline_proximity(-100, 30) == 1.5
+
+
+def test_score_parts():
+    """Verifica as parcelas ponderadas de uma tarefa."""
+    task = _task("t", date(2026, 3, 16), TaskPriority.CRITICAL, TaskStatus.IN_PROGRESS)
+
+    parts = score_parts(task, TODAY, ScoreWeights())
+
+    assert parts == {
+        "priority": 3.0,
+        "deadline": 2.0,
+        "age": pytest.approx(10 / 60),
+        "status": 1.0,
+    }
+
+
+def test_ranking_order(repo):
+    """Verifica a ordem combinada e que concluídas ficam de fora."""
+    ranked = next_tasks(repo, k=10, today=TODAY)
+
+    assert [item.task.id for item in ranked] == [
+        "late",
+        "soon",
+        "doing",
+        "far",
+        "blocked",
+    ]
+    assert ranked[0].score == pytest.approx(sum(ranked[0].parts.values()))
+
+
+def test_weights_change_the_ranking(repo):
+    """Verifica que os pesos mudam a ordem."""
+    weights = ScoreWeights(priority=20.0, blocked=0.0)
+
+    ranked = next_tasks(repo, k=2, weights=weights, today=TODAY)
+
+    assert [item.task.id for item in ranked] == ["far", "blocked"]
+
+
+def test_top_k_matches_full_sort():
+    """Verifica o top-k (com parada antecipada) contra a ordenação completa."""
+    rng = random.Random(2)
+    tasks = [
+        _task(
+            f"t{i}",
+            TODAY + timedelta(days=rng.randrange(-40, 400)),
+            rng.choice(list(TaskPriority)),
+            rng.choice([TaskStatus.TODO, TaskStatus.IN_PROGRESS, TaskStatus.BLOCKED]),
+        )
+        for i in range(500)
+    ]
+    repo = MemoryRepository()
+    repo.save_tasks(tasks)
+
+    for weights in (ScoreWeights(), ScoreWeights(deadline=-1.0, age=-2.0)):
+        ranked = next_tasks(repo, k=20, weights=weights, today=TODAY)
+        expected = sorted(
+            tasks,
+            key=lambda t: (-score_task(t, TODAY, weights), t.deadline, t.id),
+        )[:20]
+        assert [item.task.id for item in ranked] == [t.id for t in expected]
+
+
+def test_scan_stops_early():
+    """Verifica que tarefas de prazo distante nem chegam a ser pontuadas."""
+    index = DeadlineIndex.build(
+        _task(
+            f"t{i}",
+            TODAY + timedelta(days=i),
+            TaskPriority.CRITICAL,
+            TaskStatus.IN_PROGRESS,
+        )
+        for i in range(1000)
+    )
+    weights = ScoreWeights()
+    scored = []
+
+    def score(task):
+        scored.append(task.id)
+        return score_task(task, TODAY, weights)
+
+    top = index.top(3, score, lambda d: score_bound(d, TODAY, weights))
+
+    assert [task.id for _, task in top] == ["t0", "t1", "t2"]
+    assert len(scored) < 100
+
+
+def test_invalid_arguments(repo):
+    """Verifica a validação de k e dos parâmetros dos pesos."""
+    with pytest.raises(ValueError):
+        next_tasks(repo, k=0)
+    with pytest.raises(ValueError):
+        ScoreWeights(horizon_days=0)
@@ -0,0 +1,234 @@
+from datetime import date, timedelta
+
+import pytest
+
+from phd_progress_tracker.config import Settings
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task, TaskStatus
+from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
+from phd_progress_tracker.utils.repository import HistoryRepository, open_repository
+
+
+@pytest.fixture
+def repo(backend):
+    """Repositório de cada backend, para testar a mesma interface."""
+    return backend
+
+
+def make_task(task_id, days=7, **kwargs):
+    """Cria uma tarefa com deadline relativo a hoje."""
+    return Task(
+        id=task_id,
+        title=f"Tarefa {task_id}",
+        description="",
+        deadline=date.today() + timedelta(days=days),
+        **kwargs,
+    )
+
+
+def test_add_and_get_task(repo):
+    """Verifica que add_task persiste e get_task recupera a tarefa."""
+    repo.add_task(make_task("t1"))
+
+    task = repo.get_task("t1")
+    assert task is not None
+    assert task.title == "Tarefa t1"
+    assert repo.get_task("inexistente") is None
+
+
+def test_add_task_duplicate_id_raises(repo):
+    """Verifica que IDs duplicados são rejeitados."""
+    repo.add_task(make_task("t1"))
+
+    with pytest.raises(RuntimeError):
+        repo.add_task(make_task("t1"))
+
+
+def test_update_task(repo):
+    """Verifica que update_task altera a tarefa existente."""
+    repo.add_task(make_task("t1"))
+    task = repo.get_task("t1")
+    task.complete()
+
+    assert repo.update_task(task) is True
+    assert repo.get_task("t1").status == TaskStatus.COMPLETED
+    assert repo.update_task(make_task("inexistente")) is False
+
+
+def test_returned_tasks_are_copies(repo):
+    """Verifica que alterar o objeto retornado não altera o repositório."""
+    repo.add_task(make_task("t1"))
+
+    repo.get_task("t1").title = "Alterado"
+
+    assert repo.get_task("t1").title == "Tarefa t1"
+
+
+def test_delete_task(repo):
+    """Verifica que delete_task remove a tarefa e informa se ela existia."""
+    repo.add_task(make_task("t1"))
+
+    assert repo.delete_task("t1") is True
+    assert repo.delete_task("t1") is False
+    assert repo.load_tasks() == []
+
+
+def test_tasks_by_deadline_range(repo):
+    """Verifica consulta por intervalo de deadline, ordenada por prazo."""
+    repo.save_tasks([make_task("c", 10), make_task("a", 1), make_task("b", 5)])
+    today = date.today()
+
+    assert [t.id for t in repo.tasks_by_deadline()] == ["a", "b", "c"]
+    assert [
+        t.id
+        for t in repo.tasks_by_deadline(
+            today + timedelta(days=5), today + timedelta(days=10)
+        )
+    ] == ["b", "c"]
+    assert [t.id for t in repo.tasks_by_deadline(end=today + timedelta(days=4))] == [
+        "a"
+    ]
+
+
+def test_tasks_by_deadline_follows_updates(repo):
+    """Verifica que o índice por deadline acompanha atualizações e remoções."""
+    repo.add_task(make_task("a", 1))
+    repo.add_task(make_task("b", 5))
+    task = repo.get_task("a")
+    task.deadline = date.today() + timedelta(days=9)
+    repo.update_task(task)
+    repo.delete_task("b")
+    repo.add_task(make_task("c", 3))
+
+    assert [t.id for t in repo.tasks_by_deadline()] == ["c", "a"]
+
+
+def test_milestone_crud(repo):
+    """Verifica o ciclo completo de um milestone."""
+    milestone = Milestone(
+        id="m1",
+        title="Qualificação",
+        description="",
+        target_date=date.today() + timedelta(days=30),
+    )
+    repo.add_milestone(milestone)
+    milestone.is_achieved = True
+
+    assert repo.update_milestone(milestone) is True
+    assert repo.get_milestone("m1").is_achieved is True
+    assert repo.delete_milestone("m1") is True
+    assert repo.get_milestone("m1") is None
+    assert repo.load_milestones() == []
+
+
+def make_milestone(milestone_id, days, achieved=False):
+    """Cria um milestone com data alvo relativa a hoje."""
+    return Milestone(
+        id=milestone_id,
+        title=f"Marco {milestone_id}",
+        description="",
+        target_date=date.today() + timedelta(days=days),
+        is_achieved=achieved,
+    )
+
+
+def test_milestones_by_date(repo):
+    """Verifica intervalo inclusivo, filtro de atingidos, ordem e limite."""
+    repo.save_milestones(
+        [
+            make_milestone("m3", 90),
+            make_milestone("m1", 10, achieved=True),
+            make_milestone("m2", 30),
+        ]
+    )
+    today = date.today()
+
+    assert [m.id for m in repo.milestones_by_date()] == ["m1", "m2", "m3"]
+    assert [
+        m.id
+        for m in repo.milestones_by_date(
+            today + timedelta(days=10), today + timedelta(days=30)
+        )
+    ] == ["m1", "m2"]
+    assert [m.id for m in repo.milestones_by_date(achieved=False)] == ["m2", "m3"]
+    assert [m.id for m in repo.milestones_by_date(achieved=False, limit=1)] == ["m2"]
+
+
+def test_milestones_by_date_follows_updates(repo):
+    """Verifica que mudar a data alvo ou remover reflete na consulta por data."""
+    repo.add_milestone(make_milestone("m1", 10))
+    repo.add_milestone(make_milestone("m2", 20))
+    moved = make_milestone("m1", 40)
+
+    repo.update_milestone(moved)
+    assert [m.id for m in repo.milestones_by_date()] == ["m2", "m1"]
+
+    repo.delete_milestone("m2")
+    assert [m.id for m in repo.milestones_by_date()] == ["m1"]
+
+
+def test_column_projection(repo):
+    """Verifica que as projeções trazem só as colunas pedidas, já convertidas."""
+    repo.add_task(make_task("t1", status=TaskStatus.IN_PROGRESS))
+    repo.add_milestone(make_milestone("m1", 10, achieved=True))
+
+    assert repo.load_task_columns(["id", "status"]) == [
+        {"id": "t1", "status": TaskStatus.IN_PROGRESS}
+    ]
+    assert repo.get_task_columns("t1", ["deadline"]) == {
+        "deadline": date.today() + timedelta(days=7)
+    }
+    assert repo.get_task_columns("inexistente", ["id"]) is None
+    assert repo.load_milestone_columns(["id", "is_achieved"], achieved=True) == [
+        {"id": "m1", "is_achieved": True}
+    ]
+    assert repo.load_milestone_columns(["id"], achieved=False) == []
+    assert repo.get_milestone_columns("m1", ["title"]) == {"title": "Marco m1"}
+
+
+@pytest.mark.parametrize("columns", [[], ["id", "senha"], ["id; DROP TABLE tasks"]])
+def test_column_projection_rejects_unknown_columns(repo, columns):
+    """Verifica que colunas desconhecidas (ou injeção de SQL) são rejeitadas."""
+    with pytest.raises(ValueError):
+        repo.load_task_columns(columns)
+    with pytest.raises(ValueError):
+        repo.get_milestone_columns("m1", columns)
+
+
+def test_open_repository_selects_backend(tmp_path):
+    """Verifica que open_repository respeita o backend configurado."""
+    assert isinstance(open_repository(str(tmp_path), "memory"), MemoryRepository)
+    assert isinstance(open_repository(str(tmp_path), "sqlite"), Database)
+    with pytest.raises(ValueError):
+        open_repository(str(tmp_path), "postgres")
+
+
+def test_history_is_an_optional_capability(tmp_path):
+    """Verifica que só o SQLite anuncia o histórico (undo, status, aliases)."""
+    db = Database(data_dir=str(tmp_path))
+
+    assert isinstance(db, HistoryRepository)
+    assert not isinstance(MemoryRepository(), HistoryRepository)
+    db.close()
+
+
+def test_settings_from_env(monkeypatch):
+    """Verifica leitura das configurações a partir do ambiente."""
+    monkeypatch.setenv("PHD_DATA_DIR", "/tmp/phd")
+    monkeypatch.setenv("PHD_STORAGE_BACKEND", "MEMORY")
+    monkeypatch.setenv("PHD_FORECAST_WORKERS", "0")
+
+    settings = Settings.from_env()
+
+    assert settings.data_dir == "/tmp/phd"
+    assert settings.storage_backend == "memory"
+    assert settings.forecast_workers == 0
+
+
+def test_settings_rejects_unknown_backend():
+    """Verifica que backends desconhecidos são rejeitados."""
+    with pytest.raises(ValueError):
+        Settings(storage_backend="postgres")
+    with pytest.raises(ValueError):
+        Settings(forecast_workers=-1)
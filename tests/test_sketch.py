@@ -0,0 +1,78 @@
+import random
+from bisect import bisect_left
+
+import pytest
+
+from phd_progress_tracker.utils.sketch import QuantileSketch
+
+
+def _rank(sorted_values, value):
+    """Posição relativa de ``value`` entre os valores ordenados."""
+    return bisect_left(sorted_values, value) / len(sorted_values)
+
+
+def test_small_sketch_is_exact():
+    """Verifica percentis exatos (posição mais próxima) com poucos valores."""
+    sketch = QuantileSketch()
+    sketch.update(range(1, 101))
+
+    assert sketch.quantiles([0, 0.5, 0.9, 0.99, 1]) == [1, 50, 90, 99, 100]
+    assert len(sketch) == 100
+
+
+def test_empty_sketch():
+    """Verifica que um sketch vazio não tem percentis."""
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_rank_error_is_bounded():
+    """Verifica o erro de posição com muito mais valores que a capacidade."""
+    rng = random.Random(42)
+    values = [rng.lognormvariate(1, 1) for _ in range(50_000)]
+    sketch = QuantileSketch()
+    sketch.update(values)
+    values.sort()
+
+    for q in (0.5, 0.9, 0.99):
+        assert abs(_rank(values, sketch.quantile(q)) - q) < 0.02
+    assert sketch.min == values[0]
+    assert sketch.max == values[-1]
+
+
+def test_merge_matches_single_pass():
+    """Verifica que mesclar sketches parciais mantém a precisão."""
+    rng = random.Random(7)
+    values = [rng.random() * 100 for _ in range(30_000)]
+    parts = [QuantileSketch() for _ in range(12)]
+    for i, value in enumerate(values):
+        parts[i % len(parts)].add(value)
+
+    merged = QuantileSketch()
+    for part in parts:
+        merged.merge(part)
+    values.sort()
+
+    assert merged.count == len(values)
+    for q in (0.5, 0.9, 0.99):
+        assert abs(_rank(values, merged.quantile(q)) - q) < 0.02
+
+
+def test_round_trip_bytes():
+    """Verifica que a serialização preserva o estado do sketch."""
+    sketch = QuantileSketch(k=32)
+    sketch.update(range(1000))
+
+    restored = QuantileSketch.from_bytes(sketch.to_bytes())
+
+    assert restored.count == sketch.count
+    assert restored.quantiles([0.1, 0.5, 0.9]) == sketch.quantiles([0.1, 0.5, 0.9])
+    restored.add(5000)
+    assert restored.max == 5000
+
+
+def test_invalid_arguments():
+    """Verifica a validação de k e das posições."""
+    with pytest.raises(ValueError):
+        QuantileSketch(k=2)
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(1.5)
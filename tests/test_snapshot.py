@@ -0,0 +1,216 @@
+import math
+import subprocess
+import sys
+from datetime import date, datetime
+
+import pytest
+
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.snapshot import (
+    FORMAT_VERSION,
+    NULL_TIMESTAMP,
+    Snapshot,
+    build_snapshot,
+)
+from phd_progress_tracker.utils.task_frame import HAS_NUMPY, summarize_tasks
+
+TODAY = date(2026, 3, 10)
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Banco com duas tarefas e um marco."""
+    database = Database(data_dir=str(tmp_path))
+    database.add_task(
+        Task(
+            id="t1",
+            title="Escrever capítulo",
+            description="Introdução e revisão",
+            deadline=date(2026, 3, 5),
+            priority=TaskPriority.HIGH,
+            category="Escrita",
+            created_at=datetime(2026, 1, 1, 9, 30),
+            effort_hours=4.5,
+        )
+    )
+    database.add_task(
+        Task(
+            id="t2",
+            title="Coleta",
+            description="",
+            deadline=date(2026, 3, 20),
+            status=TaskStatus.COMPLETED,
+            category="Pesquisa",
+            created_at=datetime(2026, 1, 2),
+            completed_at=datetime(2026, 2, 1, 12),
+        )
+    )
+    database.add_milestone(
+        Milestone(
+            id="m1",
+            title="Qualificação",
+            description="Banca",
+            target_date=date(2026, 6, 1),
+            is_achieved=True,
+        )
+    )
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def snapshot_path(db, tmp_path):
+    """Caminho de um snapshot recém-gravado."""
+    path = str(tmp_path / "snap" / "snapshot.phds")
+    build_snapshot(db, path)
+    return path
+
+
+def test_build_records_revision(db, snapshot_path):
+    """Verifica a revisão e as contagens no cabeçalho."""
+    with Snapshot(snapshot_path) as snap:
+        assert snap.revision == db.revision()
+        assert snap.task_count == 2
+        assert snap.milestone_count == 1
+
+
+def test_string_columns(snapshot_path):
+    """Verifica textos UTF-8 lidos do heap."""
+    with Snapshot(snapshot_path) as snap:
+        titles = snap.strings("task.title")
+        assert list(titles) == ["Escrever capítulo", "Coleta"]
+        assert titles[-1] == "Coleta"
+        assert list(snap.strings("milestone.description")) == ["Banca"]
+        with pytest.raises(IndexError):
+            titles[2]
+        titles.release()
+
+
+def test_fixed_width_columns_as_memoryview(snapshot_path):
+    """Verifica datas, códigos e timestamps nas views de memória."""
+    with Snapshot(snapshot_path) as snap:
+        deadline = snap.column("task.deadline")
+        completed = snap.column("task.completed_at")
+        categories = snap.strings("task.categories")
+
+        assert deadline.tolist() == [
+            (date(2026, 3, 5) - date(1970, 1, 1)).days,
+            (date(2026, 3, 20) - date(1970, 1, 1)).days,
+        ]
+        assert completed[0] == NULL_TIMESTAMP
+        assert snap.column("task.priority").tolist() == [2, 1]
+        assert [categories[c] for c in snap.column("task.category")] == [
+            "Escrita",
+            "Pesquisa",
+        ]
+        assert snap.column("milestone.is_achieved").tolist() == [1]
+        effort = snap.column("task.effort_hours")
+        assert effort[0] == 4.5
+        assert math.isnan(effort[1])
+        effort.release()
+
+        for view in (deadline, completed):
+            view.release()
+        categories.release()
+
+
+def test_unknown_column(snapshot_path):
+    """Verifica KeyError para coluna inexistente."""
+    with Snapshot(snapshot_path) as snap:
+        with pytest.raises(KeyError):
+            snap.column("task.owner")
+
+
+def test_rejects_other_files(tmp_path):
+    """Verifica que arquivos que não são snapshots são recusados."""
+    path = tmp_path / "x.phds"
+    path.write_bytes(b"\0" * 64)
+
+    with pytest.raises(ValueError):
+        Snapshot(str(path))
+
+
+def test_rejects_older_versions(tmp_path, snapshot_path):
+    """Verifica que snapshots de versão anterior (sem esforço) são recusados."""
+    path = tmp_path / "old.phds"
+    data = bytearray(open(snapshot_path, "rb").read())
+    data[8:12] = (FORMAT_VERSION - 1).to_bytes(4, "little")
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        Snapshot(str(path))
+
+
+def test_empty_database(tmp_path):
+    """Verifica snapshot de banco vazio."""
+    database = Database(data_dir=str(tmp_path))
+    path = str(tmp_path / "empty.phds")
+    build_snapshot(database, path)
+    database.close()
+
+    with Snapshot(path) as snap:
+        assert snap.task_count == 0
+        assert list(snap.strings("task.id")) == []
+
+
+def test_rebuild_replaces_file(db, snapshot_path):
+    """Verifica que reconstruir não afeta um leitor com o arquivo antigo mapeado."""
+    old = Snapshot(snapshot_path)
+    db.delete_task("t1")
+    build_snapshot(db, snapshot_path)
+
+    with Snapshot(snapshot_path) as new:
+        assert new.task_count == 1
+    assert old.task_count == 2
+    assert old.strings("task.id")[0] == "t1"
+
+
+def test_shared_between_processes(snapshot_path):
+    """Verifica que outro processo lê o mesmo arquivo sem o banco."""
+    code = (
+        "import sys\n"
+        "from phd_progress_tracker.utils.snapshot import Snapshot\n"
+        "snap = Snapshot(sys.argv[1])\n"
+        "print(','.join(snap.strings('task.id')))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, snapshot_path],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "t1,t2"
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy não instalado")
+class TestNumpyViews:
+    """Testes das views NumPy sem cópia."""
+
+    def test_arrays_share_the_mapping(self, snapshot_path):
+        """Verifica tipos de data e que o array não possui os próprios dados."""
+        import numpy as np
+
+        snap = Snapshot(snapshot_path)
+        deadlines = snap.array("task.deadline")
+        completed = snap.array("task.completed_at")
+
+        assert not deadlines.flags.owndata
+        assert not deadlines.flags.writeable
+        assert deadlines.tolist() == [date(2026, 3, 5), date(2026, 3, 20)]
+        assert np.isnat(completed[0])
+        assert completed[1] == np.datetime64("2026-02-01T12:00", "us")
+        assert snap.array("milestone.is_achieved").tolist() == [True]
+        effort = snap.array("task.effort_hours")
+        assert effort.dtype == np.float64
+        assert effort[0] == 4.5 and np.isnan(effort[1])
+
+    def test_task_frame_matches_summary(self, db, snapshot_path):
+        """Verifica que o TaskFrame do snapshot resume igual às tarefas."""
+        snap = Snapshot(snapshot_path)
+
+        assert snap.task_frame().summary(TODAY) == summarize_tasks(
+            db.load_tasks(), TODAY
+        )
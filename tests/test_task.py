@@ -191,3 +191,39 @@ def test_task_from_dict_with_completed_at(sample_task):
     assert new_task.completed_at.isoformat(
         timespec="milliseconds"
     ) == sample_task.completed_at.isoformat(timespec="milliseconds")
+
+
+def test_task_uses_slots(sample_task):
+    """Verifica que Task não tem __dict__ por instância (modelo compacto)."""
+    assert not hasattr(sample_task, "__dict__")
+    with pytest.raises(AttributeError):
+        sample_task.extra = "não permitido"
+
+
+def test_days_remaining_with_reference_date(sample_task):
+    """Verifica days_remaining com data de referência explícita."""
+    reference = sample_task.deadline - timedelta(days=3)
+
+    assert sample_task.days_remaining(reference) == 3
+
+
+def test_is_overdue_as_of_before_completion(task_data):
+    """Verifica que tarefa concluída depois da data de referência estava atrasada nela."""
+    task = Task(**task_data)
+    task.complete()
+    reference = task.deadline + timedelta(days=1)
+
+    assert task.is_overdue() is False
+    assert task.is_completed_as_of(reference) is True
+    assert task.is_completed_as_of(date.today() - timedelta(days=1)) is False
+    assert task.is_overdue(task.deadline + timedelta(days=1)) is False
+
+    # Prazo vencido antes da conclusão: entre um e outro, estava atrasada
+    late = Task(**task_data)
+    late.status = TaskStatus.COMPLETED
+    late.completed_at = datetime.combine(
+        late.deadline + timedelta(days=5), datetime.min.time()
+    )
+
+    assert late.is_overdue(late.deadline + timedelta(days=2)) is True
+    assert late.is_overdue(late.deadline + timedelta(days=5)) is False
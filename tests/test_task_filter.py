@@ -0,0 +1,100 @@
+from datetime import date
+
+import pytest
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.task_filter import TaskFilter
+
+
+def make_task(task_id, deadline, **kwargs):
+    """Cria uma tarefa com o prazo dado."""
+    return Task(id=task_id, title=task_id, description="", deadline=deadline, **kwargs)
+
+
+@pytest.fixture
+def repo(backend):
+    """Repositório de cada backend com tarefas variadas."""
+    backend.save_tasks(
+        [
+            make_task("a", date(2026, 3, 5), category="Escrita"),
+            make_task(
+                "b",
+                date(2026, 3, 20),
+                category="escrita",
+                status=TaskStatus.COMPLETED,
+                priority=TaskPriority.HIGH,
+            ),
+            make_task("c", date(2026, 4, 1), category="Análise"),
+        ]
+    )
+    return backend
+
+
+def test_find_tasks(repo):
+    """Verifica os critérios do filtro nos dois backends."""
+
+    def ids(**criteria):
+        return sorted(t.id for t in repo.find_tasks(TaskFilter(**criteria)))
+
+    assert ids() == ["a", "b", "c"]
+    assert ids(category="ESCRITA") == ["a", "b"]
+    assert ids(status=TaskStatus.TODO) == ["a", "c"]
+    assert ids(priority=TaskPriority.HIGH) == ["b"]
+    assert ids(deadline_from=date(2026, 3, 20), deadline_to=date(2026, 3, 31)) == ["b"]
+
+
+def test_task_facets(repo):
+    """Verifica as contagens de cada faceta."""
+    _, facets = repo.task_facets()
+
+    assert facets["status"] == {"COMPLETED": 1, "TODO": 2}
+    assert facets["priority"] == {"HIGH": 1, "MEDIUM": 2}
+    assert facets["category"] == {"Análise": 1, "Escrita": 1, "escrita": 1}
+    assert facets["month"] == {"2026-03": 2, "2026-04": 1}
+
+
+def test_task_facets_with_filter(repo):
+    """Verifica que as facetas respeitam o filtro."""
+    _, facets = repo.task_facets(TaskFilter(status=TaskStatus.TODO))
+
+    assert facets["month"] == {"2026-03": 1, "2026-04": 1}
+
+
+def test_revision_changes_on_write(repo):
+    """Verifica que a revisão acompanha as escritas e invalida o cache."""
+    revision, first = repo.task_facets()
+    assert repo.task_facets() == (revision, first)
+
+    repo.add_task(make_task("d", date(2026, 5, 1)))
+
+    assert repo.revision() > revision
+    new_revision, facets = repo.task_facets()
+    assert new_revision == repo.revision()
+    assert facets["month"]["2026-05"] == 1
+
+
+def test_facets_cache_sees_other_connections(tmp_path):
+    """Verifica que escritas de outra instância (processo) invalidam o cache."""
+    reader = Database(data_dir=str(tmp_path))
+    writer = Database(data_dir=str(tmp_path))
+    reader.task_facets()
+
+    writer.add_task(make_task("x", date(2026, 6, 1)))
+
+    assert reader.task_facets()[1]["month"] == {"2026-06": 1}
+
+
+def test_facets_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    """Verifica que o cache de facetas descarta o filtro usado há mais tempo."""
+    monkeypatch.setattr(Database, "FACETS_CACHE_SIZE", 2)
+    db = Database(data_dir=str(tmp_path))
+    todo = TaskFilter(status=TaskStatus.TODO)
+    done = TaskFilter(status=TaskStatus.COMPLETED)
+
+    db.task_facets()
+    db.task_facets(todo)
+    db.task_facets()
+    db.task_facets(done)
+
+    assert list(db._facets_cache) == [TaskFilter(), done]
@@ -0,0 +1,159 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils import task_frame
+from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.task_frame import (
+    TaskFrame,
+    summarize_repository,
+    summarize_tasks,
+    upcoming_tasks,
+)
+
+np = pytest.importorskip("numpy")
+
+TODAY = date(2026, 3, 10)
+
+
+@pytest.fixture
+def tasks():
+    """Tarefas com prazos, status, prioridades e categorias variados."""
+    specs = [
+        ("a", -3, TaskStatus.TODO, TaskPriority.HIGH, "Escrita"),
+        ("b", -1, TaskStatus.COMPLETED, TaskPriority.LOW, "Escrita"),
+        ("c", 0, TaskStatus.IN_PROGRESS, TaskPriority.MEDIUM, "Análise"),
+        ("d", 5, TaskStatus.BLOCKED, TaskPriority.CRITICAL, "Análise"),
+        ("e", 7, TaskStatus.TODO, TaskPriority.MEDIUM, "Revisão"),
+        ("f", 30, TaskStatus.TODO, TaskPriority.LOW, "Escrita"),
+    ]
+    return [
+        Task(
+            id=task_id,
+            title=f"Tarefa {task_id}",
+            description="",
+            deadline=TODAY + timedelta(days=days),
+            status=status,
+            priority=priority,
+            category=category,
+            created_at=datetime(2026, 1, 1),
+        )
+        for task_id, days, status, priority, category in specs
+    ]
+
+
+@pytest.fixture
+def database(tmp_path, tasks):
+    """Banco em memória com as tarefas de teste."""
+    db = Database(data_dir=str(tmp_path), db_path=":memory:")
+    db.save_tasks(tasks)
+    return db
+
+
+def test_frame_columns(tasks):
+    """Verifica tipos e valores das colunas."""
+    frame = TaskFrame.from_tasks(tasks)
+
+    assert len(frame) == 6
+    assert frame.deadlines.dtype == np.dtype("datetime64[D]")
+    assert frame.status.dtype == np.int8
+    assert frame.priority.dtype == np.int8
+    assert frame.categories == ["Escrita", "Análise", "Revisão"]
+
+
+def test_from_cursor_matches_from_tasks(database, tasks):
+    """Verifica que o frame lido do SQLite é igual ao montado a partir de Tasks."""
+    from_db = database.task_frame()
+    from_tasks = TaskFrame.from_tasks(tasks)
+
+    assert np.array_equal(from_db.deadlines, from_tasks.deadlines)
+    assert np.array_equal(from_db.status, from_tasks.status)
+    assert np.array_equal(from_db.priority, from_tasks.priority)
+    assert from_db.categories == from_tasks.categories
+
+
+def test_overdue_mask(tasks):
+    """Verifica que só tarefas abertas com prazo vencido são atrasadas."""
+    frame = TaskFrame.from_tasks(tasks)
+
+    assert np.flatnonzero(frame.overdue_mask(TODAY)).tolist() == [0]
+
+
+def test_due_within(tasks):
+    """Verifica a janela [hoje, hoje + dias] para tarefas abertas."""
+    frame = TaskFrame.from_tasks(tasks)
+
+    assert np.flatnonzero(frame.due_within(7, TODAY)).tolist() == [2, 3, 4]
+    assert np.flatnonzero(frame.due_within(0, TODAY)).tolist() == [2]
+
+
+def test_count_by(tasks):
+    """Verifica contagens agrupadas, com e sem máscara."""
+    frame = TaskFrame.from_tasks(tasks)
+
+    assert frame.count_by("category") == {"Escrita": 3, "Análise": 2, "Revisão": 1}
+    assert frame.count_by("status") == {
+        "TODO": 3,
+        "IN_PROGRESS": 1,
+        "COMPLETED": 1,
+        "BLOCKED": 1,
+    }
+    assert frame.count_by("priority", frame.open_mask()) == {
+        "LOW": 1,
+        "MEDIUM": 2,
+        "HIGH": 1,
+        "CRITICAL": 1,
+    }
+    with pytest.raises(ValueError):
+        frame.count_by("title")
+
+
+def test_percentiles(tasks):
+    """Verifica percentis dos dias restantes."""
+    frame = TaskFrame.from_tasks(tasks)
+
+    result = frame.percentiles((0, 50, 100), frame.open_mask(), TODAY)
+
+    assert result == {0: -3.0, 50: 5.0, 100: 30.0}
+    assert frame.percentiles(mask=np.zeros(len(frame), dtype=bool)) == {}
+
+
+def test_summary_matches_pure_python(tasks):
+    """Verifica que o caminho vetorizado e o fallback dão o mesmo resultado."""
+    assert TaskFrame.from_tasks(tasks).summary(TODAY) == summarize_tasks(tasks, TODAY)
+
+
+def test_summarize_repository_without_numpy(monkeypatch, database, tasks):
+    """Verifica o fallback em Python puro quando NumPy não está disponível."""
+    monkeypatch.setattr(task_frame, "HAS_NUMPY", False)
+
+    summary = summarize_repository(database, TODAY)
+
+    assert summary.total == 6
+    assert summary.completed == 1
+    assert summary.pending == 5
+    assert summary.in_progress == 1
+    assert summary.overdue == 1
+    assert summary.progress_pct == pytest.approx(100 / 6)
+
+
+def test_upcoming_tasks(database):
+    """Verifica prazos próximos ordenados, sem concluídas e com limite."""
+    assert [t.id for t in upcoming_tasks(database, 7, TODAY)] == ["c", "d", "e"]
+    assert [t.id for t in upcoming_tasks(database, 7, TODAY, limit=2)] == ["c", "d"]
+
+
+def test_summary_as_of_past_date(tasks):
+    """Verifica dashboard histórico: ignora tarefas futuras e conclusões posteriores."""
+    tasks[1].completed_at = datetime(2026, 3, 1)
+    tasks[5].created_at = datetime(2026, 3, 5)
+    as_of = date(2026, 2, 20)
+
+    summary = TaskFrame.from_tasks(tasks).summary(as_of)
+
+    assert summary == summarize_tasks(tasks, as_of)
+    assert summary.total == 5
+    assert summary.completed == 0
+    assert summary.overdue == 0
+    assert summary.by_category == {"Escrita": 2, "Análise": 2, "Revisão": 1}
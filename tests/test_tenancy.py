@@ -0,0 +1,172 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from phd_progress_tracker.api import dependencies
+from phd_progress_tracker.api.main import app
+from phd_progress_tracker.utils.tenancy import (
+    TenantDatabasePool,
+    TenantLimitError,
+    UnknownTenantError,
+    validate_tenant_id,
+)
+
+
+@pytest.fixture
+def pool(tmp_path):
+    """Pool de bancos por tenant em diretório temporário."""
+    pool = TenantDatabasePool(data_dir=str(tmp_path), max_open=2)
+    yield pool
+    pool.close_all()
+
+
+@pytest.fixture
+def client(monkeypatch, pool):
+    """Cliente da API usando o pool temporário."""
+    monkeypatch.setattr(dependencies, "database_pool", pool)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_validate_tenant_id_accepts_simple_ids():
+    """Verifica que IDs alfanuméricos com '-' e '_' são aceitos."""
+    assert validate_tenant_id("maria-silva_01") == "maria-silva_01"
+
+
+@pytest.mark.parametrize("tenant_id", ["", "../etc", "a/b", "-abc", "x" * 65])
+def test_validate_tenant_id_rejects_unsafe_ids(tenant_id):
+    """Verifica que IDs que não servem como nome de diretório são rejeitados."""
+    with pytest.raises(ValueError):
+        validate_tenant_id(tenant_id)
+
+
+def _open(pool, tenant_id=None):
+    """Empresta e devolve na hora: o banco fica aberto no pool, ocioso."""
+    entry = pool.acquire(tenant_id)
+    pool.release(entry)
+    return entry.repo
+
+
+def test_pool_uses_one_file_per_tenant(pool, tmp_path):
+    """Verifica que cada tenant recebe seu próprio arquivo SQLite."""
+    pool.create("alice")
+    pool.create("bob")
+    alice = _open(pool, "alice")
+    bob = _open(pool, "bob")
+
+    assert alice.db_path == tmp_path / "tenants" / "alice" / "phd_tracker.db"
+    assert bob.db_path == tmp_path / "tenants" / "bob" / "phd_tracker.db"
+    assert alice.db_path.exists()
+    assert bob.db_path.exists()
+
+
+def test_pool_default_tenant_uses_legacy_database(pool, tmp_path):
+    """Verifica que o tenant None usa o banco em data_dir."""
+    assert _open(pool).db_path == tmp_path / "phd_tracker.db"
+
+
+def test_unknown_tenants_are_not_created(pool, tmp_path):
+    """Verifica que abrir um tenant não provisionado não cria arquivos."""
+    with pytest.raises(UnknownTenantError):
+        pool.acquire("mallory")
+
+    assert not (tmp_path / "tenants" / "mallory").exists()
+    assert pool.create("mallory")
+    assert not pool.create("mallory")
+    assert _open(pool, "mallory").db_path.exists()
+
+
+def test_pool_reuses_open_database(pool):
+    """Verifica que o mesmo tenant reaproveita a instância aberta."""
+    pool.create("alice")
+    assert _open(pool, "alice") is _open(pool, "alice")
+
+
+def test_pool_evicts_least_recently_used(pool):
+    """Verifica que o LRU despeja o tenant usado há mais tempo."""
+    for tenant_id in ("alice", "bob", "carol"):
+        pool.create(tenant_id)
+    alice = _open(pool, "alice")
+    _open(pool, "bob")
+    _open(pool, "alice")
+    _open(pool, "carol")
+
+    assert pool.open_tenants() == ["alice", "carol"]
+    assert _open(pool, "alice") is alice
+
+
+def test_pool_never_closes_a_leased_database(pool):
+    """Verifica que o despejo espera o fim dos empréstimos."""
+    for tenant_id in ("alice", "bob", "carol"):
+        pool.create(tenant_id)
+
+    with pool.lease("alice") as alice:
+        _open(pool, "bob")
+        _open(pool, "carol")
+        # alice é a menos recente, mas está em uso: bob sai no lugar dela
+        assert pool.open_tenants() == ["alice", "carol"]
+        # Todos em uso: o pool passa do limite em vez de fechar algum
+        with pool.lease("bob"), pool.lease("carol"):
+            assert pool.open_tenants() == ["alice", "bob", "carol"]
+        # carol é devolvida primeiro e, ociosa, fecha para voltar ao limite
+        assert pool.open_tenants() == ["alice", "bob"]
+        alice.load_tasks()
+
+    assert pool.open_tenants() == ["alice", "bob"]
+
+
+def test_memory_backend_has_a_hard_limit(tmp_path):
+    """Verifica que o backend em memória recusa tenants além de max_open."""
+    pool = TenantDatabasePool(data_dir=str(tmp_path), max_open=2, backend="memory")
+    alice = _open(pool, "alice")
+    _open(pool, "bob")
+
+    with pytest.raises(TenantLimitError):
+        pool.acquire("carol")
+    assert _open(pool, "alice") is alice
+    assert pool.open_tenants() == ["bob", "alice"]
+    assert not (tmp_path / "tenants").exists()
+
+
+def test_pool_rejects_invalid_max_open(tmp_path):
+    """Verifica que max_open precisa ser positivo."""
+    with pytest.raises(ValueError):
+        TenantDatabasePool(data_dir=str(tmp_path), max_open=0)
+
+
+def test_api_routes_requests_by_tenant_header(client, pool):
+    """Verifica que o cabeçalho X-Tenant-ID isola os dados de cada tenant."""
+    payload = {
+        "title": "Revisar literatura",
+        "description": "",
+        "deadline": (date.today() + timedelta(days=3)).isoformat(),
+    }
+
+    pool.create("alice")
+    pool.create("bob")
+    response = client.post("/tasks", json=payload, headers={"X-Tenant-ID": "alice"})
+    assert response.status_code == 201
+
+    alice_tasks = client.get("/tasks", headers={"X-Tenant-ID": "alice"}).json()
+    bob_tasks = client.get("/tasks", headers={"X-Tenant-ID": "bob"}).json()
+    default_tasks = client.get("/tasks").json()
+
+    assert [t["title"] for t in alice_tasks] == ["Revisar literatura"]
+    assert bob_tasks == []
+    assert default_tasks == []
+
+
+def test_api_rejects_invalid_tenant_header(client):
+    """Verifica que um X-Tenant-ID inválido retorna 400."""
+    response = client.get("/tasks", headers={"X-Tenant-ID": "../other"})
+
+    assert response.status_code == 400
+
+
+def test_api_rejects_unknown_tenant(client, tmp_path):
+    """Verifica que um tenant não provisionado retorna 404, sem criar nada."""
+    response = client.get("/tasks", headers={"X-Tenant-ID": "ghost"})
+
+    assert response.status_code == 404
+    assert not (tmp_path / "tenants" / "ghost").exists()
@@ -0,0 +1,197 @@
+import random
+import sqlite3
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task, TaskStatus
+from phd_progress_tracker.utils import database
+from phd_progress_tracker.utils.database import Database
+from phd_progress_tracker.utils.memory_repository import MemoryRepository
+from phd_progress_tracker.utils.timeline import assign_lanes, build_timeline, task_span
+
+
+def _task(task_id, created, deadline, completed=None, category="Geral"):
+    """Tarefa criada em ``created``, com prazo e conclusão opcionais."""
+    return Task(
+        id=task_id,
+        title=task_id,
+        description="",
+        deadline=deadline,
+        status=TaskStatus.COMPLETED if completed else TaskStatus.TODO,
+        category=category,
+        created_at=created,
+        completed_at=completed,
+    )
+
+
+@pytest.fixture
+def repo(backend):
+    """Os dois backends com tarefas longas, curtas e fora da janela."""
+    backend.save_tasks(
+        [
+            # Começa antes da janela e termina depois
+            _task("long", datetime(2025, 12, 1), date(2026, 6, 30)),
+            _task("a", datetime(2026, 1, 5), date(2026, 1, 20)),
+            _task("b", datetime(2026, 1, 10), date(2026, 2, 10)),
+            # Concluída antes do prazo: a barra vai até a conclusão
+            _task(
+                "c",
+                datetime(2026, 1, 21),
+                date(2026, 3, 1),
+                datetime(2026, 1, 25),
+                category="Escrita",
+            ),
+            # Fora da janela
+            _task("old", datetime(2025, 6, 1), date(2025, 7, 1)),
+            _task("later", datetime(2026, 5, 1), date(2026, 5, 10)),
+        ]
+    )
+    backend.save_milestones(
+        [
+            Milestone("m1", "Qualificação", "", date(2026, 2, 15)),
+            Milestone("m2", "Defesa", "", date(2027, 1, 1)),
+        ]
+    )
+    return backend
+
+
+def test_task_span():
+    """Verifica o fim da barra: conclusão, prazo e nunca antes da criação."""
+    created = datetime(2026, 1, 10, 9)
+    done = _task("d", created, date(2026, 2, 1), datetime(2026, 1, 12))
+    late = _task("l", created, date(2026, 1, 1))
+
+    assert task_span(done) == (date(2026, 1, 10), date(2026, 1, 12))
+    assert task_span(late) == (date(2026, 1, 10), date(2026, 1, 10))
+
+
+def test_assign_lanes_uses_minimum():
+    """Verifica que o número de faixas é o máximo de barras simultâneas."""
+    d = date(2026, 1, 1)
+    spans = [
+        (d, d + timedelta(days=9)),
+        (d + timedelta(days=2), d + timedelta(days=4)),
+        (d + timedelta(days=5), d + timedelta(days=6)),
+        (d + timedelta(days=9), d + timedelta(days=12)),
+        (d + timedelta(days=10), d + timedelta(days=11)),
+    ]
+
+    lanes, count = assign_lanes(spans)
+
+    assert count == 2
+    assert lanes == [0, 1, 1, 1, 0]
+
+
+def test_assign_lanes_random_intervals_never_overlap():
+    """Verifica faixas sem sobreposição e no mínimo em intervalos aleatórios."""
+    rng = random.Random(5)
+    d = date(2026, 1, 1)
+    spans = sorted(
+        (d + timedelta(days=s), d + timedelta(days=s + rng.randrange(30)))
+        for s in (rng.randrange(365) for _ in range(300))
+    )
+
+    lanes, count = assign_lanes(spans)
+
+    by_lane = {}
+    for (start, end), lane in zip(spans, lanes):
+        assert all(end < s or e < start for s, e in by_lane.get(lane, []))
+        by_lane.setdefault(lane, []).append((start, end))
+    depth = max(
+        sum(s <= day <= e for s, e in spans)
+        for day in (d + timedelta(days=i) for i in range(400))
+    )
+    assert count == depth
+
+
+def test_bars_are_clipped(repo):
+    """Verifica o recorte na janela e as faixas por dia."""
+    timeline = build_timeline(repo, date(2026, 1, 1), date(2026, 1, 31), "day")
+
+    bars = {bar.task.id: bar for bar in timeline.bars}
+    assert list(bars) == ["long", "a", "b", "c"]
+    assert (bars["long"].start, bars["long"].end) == (
+        date(2026, 1, 1),
+        date(2026, 1, 31),
+    )
+    assert bars["long"].clipped_start and bars["long"].clipped_end
+    assert bars["b"].clipped_end and not bars["b"].clipped_start
+    assert bars["c"].end == date(2026, 1, 25)
+    # "c" começa depois do fim de "a" e reaproveita a faixa dela
+    assert bars["c"].lane == bars["a"].lane
+    assert timeline.lanes == 3
+    assert timeline.summaries == []
+
+
+def test_short_tasks_are_summarized_when_zoomed_out(repo):
+    """Verifica barras-resumo por mês para tarefas curtas."""
+    timeline = build_timeline(repo, date(2026, 1, 1), date(2026, 6, 30), "month")
+
+    assert [bar.task.id for bar in timeline.bars] == ["long", "b"]
+    (january,) = [s for s in timeline.summaries if s.start == date(2026, 1, 1)]
+    assert january.end == date(2026, 1, 31)
+    assert (january.count, january.completed) == (2, 1)
+    assert january.by_category == {"Escrita": 1, "Geral": 1}
+    assert [s.start for s in timeline.summaries] == [
+        date(2026, 1, 1),
+        date(2026, 5, 1),
+    ]
+
+
+def test_auto_resolution_and_milestones(repo):
+    """Verifica a resolução automática e os marcos da janela."""
+    short = build_timeline(repo, date(2026, 1, 1), date(2026, 3, 31))
+    long = build_timeline(repo, date(2023, 1, 1), date(2026, 12, 31))
+
+    assert short.resolution == "day"
+    assert [m.id for m in short.milestones] == ["m1"]
+    assert long.resolution == "month"
+
+
+def test_sqlite_matches_memory(tmp_path):
+    """Verifica a consulta indexada contra o filtro em Python."""
+    rng = random.Random(11)
+    tasks = []
+    for i in range(300):
+        created = datetime(2023, 1, 1) + timedelta(hours=rng.randrange(4 * 365 * 24))
+        deadline = created.date() + timedelta(days=rng.randrange(-10, 200))
+        completed = (
+            created + timedelta(days=rng.randrange(0, 100))
+            if rng.random() < 0.5
+            else None
+        )
+        tasks.append(_task(f"t{i}", created, deadline, completed))
+    db = Database(data_dir=str(tmp_path))
+    memory = MemoryRepository()
+    db.save_tasks(tasks)
+    memory.save_tasks(tasks)
+
+    for start, end in [
+        (date(2024, 3, 1), date(2024, 5, 31)),
+        (date(2026, 12, 1), date(2027, 3, 1)),
+        (date(2022, 1, 1), date(2022, 12, 31)),
+    ]:
+        assert db.tasks_overlapping(start, end) == memory.tasks_overlapping(start, end)
+
+
+def test_query_uses_span_end_index(tmp_path):
+    """Verifica que a consulta usa o índice do fim da barra."""
+    db = Database(data_dir=str(tmp_path))
+    with sqlite3.connect(db.db_path) as conn:
+        plan = conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT id FROM tasks "
+            f"WHERE {database._SPAN_END_SQL} >= ? AND created_at < ?",
+            ("2026-01-01", "2026-02-01"),
+        ).fetchall()
+
+    assert "idx_tasks_span_end" in " ".join(row[3] for row in plan)
+
+
+def test_invalid_arguments(repo):
+    """Verifica a validação da janela e da resolução."""
+    with pytest.raises(ValueError):
+        build_timeline(repo, date(2026, 2, 1), date(2026, 1, 1))
+    with pytest.raises(ValueError):
+        build_timeline(repo, date(2026, 1, 1), date(2026, 2, 1), "hour")
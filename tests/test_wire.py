@@ -0,0 +1,176 @@
+from datetime import date, datetime
+
+import pytest
+
+from phd_progress_tracker.models.milestone import Milestone
+from phd_progress_tracker.models.task import Task, TaskPriority, TaskStatus
+from phd_progress_tracker.utils import wire
+from phd_progress_tracker.utils.wire import decode_columns, encode_columns
+
+TASK_FIELDS = [
+    "id",
+    "title",
+    "description",
+    "deadline",
+    "status",
+    "priority",
+    "category",
+    "created_at",
+    "completed_at",
+]
+
+
+@pytest.fixture(params=["msgpack", "python"])
+def codec(request, monkeypatch):
+    """Roda cada teste com a extensão msgpack (se houver) e com o codec puro."""
+    if request.param == "msgpack" and not wire.HAS_MSGPACK:
+        pytest.skip("msgpack não instalado")
+    if request.param == "python":
+        monkeypatch.setattr(wire, "HAS_MSGPACK", False)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        False,
+        0,
+        127,
+        128,
+        -1,
+        -32,
+        -33,
+        -200,
+        70000,
+        -70000,
+        2**40,
+        -(2**40),
+        1.5,
+        "",
+        "á" * 40,
+        "x" * 70000,
+        b"\x00\x01",
+        list(range(20)),
+        {str(i): i for i in range(20)},
+        {"a": [1, {"b": None}]},
+    ],
+)
+def test_packb_roundtrip(codec, value):
+    """Verifica ida e volta dos tipos suportados."""
+    assert wire.unpackb(wire.packb(value)) == value
+
+
+# Um valor em cada lado dos limites de formato do MessagePack
+BOUNDARY_VALUES = [
+    *(n for limit in (0x80, 0x100, 0x10000, 2**32) for n in (limit - 1, limit)),
+    *(-n for limit in (32, 0x80, 0x8000, 2**31) for n in (limit, limit + 1)),
+    2**64 - 1,
+    -(2**63),
+    *("x" * n for n in (0, 31, 32, 255, 256, 65535, 65536)),
+    "ação",
+    *(b"\x00" * n for n in (0, 255, 256, 65535, 65536)),
+    *([None] * n for n in (15, 16, 65535, 65536)),
+    *({str(i): i for i in range(n)} for n in (15, 16, 65536)),
+    {"n": [0, -5, 300, 2**33, None, True], "s": "x" * 40, "f": 2.5},
+]
+
+
+@pytest.mark.skipif(not wire.HAS_MSGPACK, reason="msgpack não instalado")
+@pytest.mark.parametrize("value", BOUNDARY_VALUES, ids=range(len(BOUNDARY_VALUES)))
+def test_pure_python_codec_matches_msgpack(monkeypatch, value):
+    """Verifica que o codec puro gera os mesmos bytes que a extensão."""
+    expected = wire.packb(value)
+    monkeypatch.setattr(wire, "HAS_MSGPACK", False)
+
+    assert wire.packb(value) == expected
+    assert wire.unpackb(expected) == value
+
+
+@pytest.mark.skipif(not wire.HAS_MSGPACK, reason="msgpack não instalado")
+def test_pure_python_columns_match_msgpack(monkeypatch):
+    """Verifica que as colunas codificadas são idênticas com e sem a extensão."""
+    tasks = [
+        Task(
+            id=f"t{i}",
+            title=f"Tarefa {i}",
+            description="",
+            deadline=date(2026, 1, 1 + i % 28),
+            status=list(TaskStatus)[i % 4],
+            priority=list(TaskPriority)[i % 4],
+            category=("Escrita", "Pesquisa")[i % 2],
+            created_at=datetime(2026, 1, 1, 8, i % 60),
+            completed_at=datetime(2026, 2, 1) if i % 3 == 0 else None,
+        )
+        for i in range(300)
+    ]
+    expected = encode_columns(tasks, TASK_FIELDS)
+    monkeypatch.setattr(wire, "HAS_MSGPACK", False)
+
+    assert encode_columns(tasks, TASK_FIELDS) == expected
+
+
+def test_encode_tasks_roundtrip(codec):
+    """Verifica que tarefas voltam com datas, enums e categorias originais."""
+    tasks = [
+        Task(
+            id="t1",
+            title="Revisão",
+            description="",
+            deadline=date(2026, 3, 1),
+            status=TaskStatus.COMPLETED,
+            priority=TaskPriority.HIGH,
+            category="Escrita",
+            created_at=datetime(2026, 1, 2, 3, 4, 5, 6),
+            completed_at=datetime(2026, 2, 1, 8, 0),
+        ),
+        Task(
+            id="t2",
+            title="Coleta",
+            description="dados",
+            deadline=date(1969, 12, 31),
+            category="Pesquisa",
+            created_at=datetime(2026, 1, 3),
+        ),
+    ]
+
+    rows = decode_columns(encode_columns(tasks, TASK_FIELDS))
+
+    assert rows == [{f: getattr(t, f) for f in TASK_FIELDS} for t in tasks]
+
+
+def test_columns_are_compact(codec):
+    """Verifica datas como inteiros, enums como códigos e categorias em dicionário."""
+    tasks = [
+        Task(id=str(i), title="", description="", deadline=date(1970, 1, 11))
+        for i in range(3)
+    ]
+
+    message = wire.unpackb(encode_columns(tasks, ["deadline", "status", "category"]))
+
+    assert message["n"] == 3
+    assert message["columns"]["deadline"] == [10, 10, 10]
+    assert message["columns"]["status"] == [0, 0, 0]
+    assert message["columns"]["category"] == [0, 0, 0]
+    assert message["dicts"]["category"] == ["Geral"]
+
+
+def test_encode_dict_rows_and_milestones(codec):
+    """Verifica projeções em dicionário e marcos."""
+    milestone = Milestone(
+        id="m1", title="Qualificação", description="", target_date=date(2026, 6, 1)
+    )
+    rows = [{"id": "m1", "target_date": date(2026, 6, 1)}]
+
+    assert decode_columns(encode_columns(rows, ["id", "target_date"])) == rows
+    assert decode_columns(encode_columns([milestone], ["id", "is_achieved"])) == [
+        {"id": "m1", "is_achieved": False}
+    ]
+    assert decode_columns(encode_columns([], ["id"])) == []
+
+
+def test_decode_rejects_unknown_version(codec):
+    """Verifica erro para versão desconhecida do formato."""
+    with pytest.raises(ValueError):
+        decode_columns(wire.packb({"v": 99, "n": 0, "columns": {}, "dicts": {}}))
@@ -3,12 +3,11 @@
 import { useState, useEffect } from 'react';
 import Link from 'next/link';
 import { DashboardStats as DashboardStatsType } from '@/lib/types';
-import { dashboardApi } from '@/lib/api';
+import { bootstrapApi } from '@/lib/api';
 import DashboardStats from '@/components/DashboardStats';
 import Button from '@/components/Button';
 import Card, { CardHeader, CardTitle, CardContent } from '@/components/Card';
 import { Milestone } from '@/lib/types';
-import { milestonesApi } from '@/lib/api';
 import { formatDate, getRelativeTime } from '@/lib/utils';
 
 /**
@@ -24,12 +23,10 @@ export default function DashboardPage() {
     setIsLoading(true);
     setError(null);
     try {
-      const [statsData, milestonesData] = await Promise.all([
-        dashboardApi.getStats(),
-        milestonesApi.list(),
-      ]);
-      setStats(statsData);
-      setMilestones(milestonesData);
+      // One request, one snapshot: stats and milestones always agree
+      const data = await bootstrapApi.get();
+      setStats(data.dashboard);
+      setMilestones(data.milestones);
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Erro ao carregar dados');
     } finally {
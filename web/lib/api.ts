@@ -3,6 +3,7 @@
  */
 
 import {
+  Bootstrap,
   DashboardStats,
   Task,
   TaskCreate,
@@ -53,6 +54,15 @@ export const dashboardApi = {
   getStats: (): Promise<DashboardStats> => fetchApi<DashboardStats>('/dashboard'),
 };
 
+// Bootstrap API functions
+export const bootstrapApi = {
+  /**
+   * Fetch dashboard stats, the first page of tasks and the next open
+   * milestones from one consistent snapshot, in a single request.
+   */
+  get: (): Promise<Bootstrap> => fetchApi<Bootstrap>('/bootstrap'),
+};
+
 // Tasks API functions
 export const tasksApi = {
   /**
@@ -77,6 +77,15 @@ export interface DashboardStats {
   upcoming_deadlines: Task[];
 }
 
+// Bootstrap response: everything the dashboard page needs in one request
+export interface Bootstrap {
+  dashboard: DashboardStats;
+  tasks: Task[];
+  has_more_tasks: boolean;
+  milestones: Milestone[];
+  cursor: number; // storage revision of the snapshot
+}
+
 // API error response
 export interface ApiError {
   detail: string;